@@ -3,6 +3,7 @@ Application configuration — loaded from environment variables.
 """
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pathlib import Path
+from typing import Literal
 
 _BACKEND_DIR = Path(__file__).resolve().parent
 
@@ -14,16 +15,75 @@ class Settings(BaseSettings):
         extra="ignore",
     )
 
-    # Supabase
-    supabase_url: str
-    supabase_secret_key: str
+    # Supabase — required unless bible_repository is "sqlite"
+    supabase_url: str = ""
+    supabase_secret_key: str = ""
+
+    # Bible data access — "supabase" (PostgREST over HTTP), "asyncpg"
+    # (direct Postgres; database_url must be a direct or session-mode
+    # connection string, prepared statements do not survive transaction pooling)
+    # or "sqlite" (a corpus file from import_bible.py --sqlite, at sqlite_path)
+    bible_repository: Literal["supabase", "asyncpg", "sqlite"] = "supabase"
+    database_url: str = ""
+    database_pool_min_size: int = 1
+    database_pool_max_size: int = 10
+    sqlite_path: str = ""
 
     # JWT — Supabase signs JWTs with the project JWT secret
     supabase_jwt_secret: str = ""
+    # Verified tokens kept in memory (0 turns the cache off), and for how long
+    # at most — a rotated secret takes effect within jwt_cache_ttl_seconds
+    jwt_cache_size: int = 1024
+    jwt_cache_ttl_seconds: float = 300.0
+    # Asymmetric signing keys (ES256 / RS256) — the project's JWKS endpoint,
+    # https://<project>.supabase.co/auth/v1/.well-known/jwks.json. Refreshed in
+    # the background; cached keys stay in use for up to
+    # jwt_jwks_max_stale_seconds past expiry while the endpoint is unreachable.
+    jwt_jwks_url: str = ""
+    jwt_jwks_ttl_seconds: float = 600.0
+    jwt_jwks_max_stale_seconds: float = 86400.0
 
     # App
     app_env: str = "development"
     cors_origins: list[str] = ["http://localhost:5174", "http://localhost:3000"]
 
+    # Response compression — responses of at least compress_min_bytes are
+    # compressed per request (gzip level / Brotli quality)
+    compress_min_bytes: int = 1024
+    compress_gzip_level: int = 6
+    compress_brotli_quality: int = 4
+
+    # Prometheus metrics (metrics.py) on GET /metrics. Off by default: the
+    # endpoint has no auth, so turn it on only where the network keeps it
+    # from the public (scraped on an internal address). For several workers
+    # set PROMETHEUS_MULTIPROC_DIR to an empty directory before they start.
+    metrics_enabled: bool = False
+
+    # Request timing (server_timing.py) — spans per request, sent as a
+    # Server-Timing header (server_timing_header) and logged as JSON lines.
+    # Off by default: the header shows internals to any client.
+    server_timing: bool = False
+    server_timing_header: bool = True
+
+    # Reader bundle — seconds between active corpus version checks, and the
+    # number of assembled chapters kept in memory
+    corpus_version_ttl_seconds: float = 30.0
+    reader_cache_chapters: int = 256
+    # Reader bundles are compressed once per corpus version and chapter.
+    # Brotli 11 is ~12% smaller than 9 but takes seconds on the longest chapters.
+    precompress_gzip_level: int = 9
+    precompress_brotli_quality: int = 9
+
+    # On-demand profiler (profiling.py) — GET /admin/profile and signed
+    # ?__profile=1 requests, for tokens with profiler_role. Off by default:
+    # turn it on to investigate, and off again after. Set
+    # profiler_signing_key when running several workers (empty: a random
+    # key per process, so a link only works on the worker that signed it).
+    profiler_enabled: bool = False
+    profiler_role: str = "admin"
+    profiler_signing_key: str = ""
+    profiler_interval_ms: float = 1.0
+    profiler_max_seconds: int = 60
+
 
 settings = Settings()
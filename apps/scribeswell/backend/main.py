@@ -4,82 +4,142 @@ apps/scribeswell/backend/main.py — FastAPI application entry point
 Run locally:
     cd apps/scribeswell/backend
     uvicorn main:app --reload --port 8000
+    uvicorn main:create_app --factory --port 8000     # same app, built by uvicorn
 
 OpenAPI docs:
     http://localhost:8000/docs
     http://localhost:8000/redoc
+
+`main.app` is built by create_app() on first access, not at import; the
+--factory form has uvicorn call create_app() itself. Connections and client
+libraries are set up in the app's lifespan, not at import: the JWKS refresh
+starts, and the bible repository is created (importing supabase-py or
+asyncpg, whichever BIBLE_REPOSITORY names, and opening the asyncpg pool),
+then closed on shutdown.
 """
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
 from fastapi.exceptions import RequestValidationError
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
+from auth.jwt_optional import jwks, require_role
+from compression import CompressionMiddleware
 from config import settings
+from errors import error_response
+from metrics import MetricsMiddleware, metrics_endpoint
+from profiling import ProfileRequestMiddleware, profiler_router
+from server_timing import ServerTimingMiddleware
 
-# ── App ───────────────────────────────────────────────────────────────────────
+# ── Lifespan ──────────────────────────────────────────────────────────────────
 
-app = FastAPI(
-    title="Scribeswell API",
-    description="Hebrew Bible study API",
-    version="0.1.0",
-    docs_url="/docs",
-    redoc_url="/redoc",
-    openapi_url="/openapi.json",
-)
-
-# ── CORS ──────────────────────────────────────────────────────────────────────
-
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=settings.cors_origins,
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    from services.bible_repository import close_repository, get_repository
+
+    # Asymmetric tokens (JWT_JWKS_URL): fetch the key set now, refresh it in the background
+    if jwks is not None:
+        jwks.start()
+    get_repository()
+    yield
+    close_repository()
 
 # ── Error handlers ────────────────────────────────────────────────────────────
 
-@app.exception_handler(StarletteHTTPException)
 async def http_exception_handler(request: Request, exc: StarletteHTTPException):
-    return JSONResponse(
-        status_code=exc.status_code,
-        content={"error": str(exc.detail)},
-    )
+    return error_response(exc.status_code, str(exc.detail), request=request)
 
 
-@app.exception_handler(RequestValidationError)
 async def validation_exception_handler(request: Request, exc: RequestValidationError):
-    return JSONResponse(
-        status_code=422,
-        content={
-            "error": "Validation error",
-            "details": exc.errors(),
-        },
-    )
+    return error_response(422, "Validation error", details=exc.errors(), request=request)
 
 
-@app.exception_handler(Exception)
 async def unhandled_exception_handler(request: Request, exc: Exception):
-    return JSONResponse(
-        status_code=500,
-        content={"error": "Internal server error"},
-    )
+    return error_response(500, "Internal server error", request=request)
 
 # ── Health ────────────────────────────────────────────────────────────────────
 
-@app.get("/health", tags=["system"])
 async def health():
     """Liveness probe — returns 200 when the server is running."""
     return {"status": "ok", "env": settings.app_env}
 
 
-@app.get("/", tags=["system"])
 async def root():
     return {"message": "Scribeswell API", "docs": "/docs"}
 
-# ── Routers ───────────────────────────────────────────────────────────────────
+# ── App ───────────────────────────────────────────────────────────────────────
+
+def create_app() -> FastAPI:
+    app = FastAPI(
+        title="Scribeswell API",
+        description="Hebrew Bible study API",
+        version="0.1.0",
+        docs_url="/docs",
+        redoc_url="/redoc",
+        openapi_url="/openapi.json",
+        lifespan=lifespan,
+    )
+
+    # Profiler — added first, so innermost: a request profile covers the app, not the middleware
+    if settings.profiler_enabled:
+        app.add_middleware(
+            ProfileRequestMiddleware,
+            signing_key=settings.profiler_signing_key,
+            interval_ms=settings.profiler_interval_ms,
+        )
+        app.include_router(
+            profiler_router(
+                require_role(settings.profiler_role),
+                signing_key=settings.profiler_signing_key,
+                interval_ms=settings.profiler_interval_ms,
+                max_seconds=settings.profiler_max_seconds,
+            ),
+            prefix="/admin",
+            tags=["admin"],
+        )
+
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=settings.cors_origins,
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
+
+    # Server-Timing — inside compression: timings cover the app, not per-request compression
+    if settings.server_timing:
+        app.add_middleware(ServerTimingMiddleware, header=settings.server_timing_header)
+
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=settings.compress_min_bytes,
+        gzip_level=settings.compress_gzip_level,
+        brotli_quality=settings.compress_brotli_quality,
+    )
+
+    # Metrics — added last, so outermost: latency includes compression, sizes are as sent
+    if settings.metrics_enabled:
+        app.add_middleware(MetricsMiddleware)
+        app.add_route("/metrics", metrics_endpoint, include_in_schema=False)
+
+    app.add_exception_handler(StarletteHTTPException, http_exception_handler)
+    app.add_exception_handler(RequestValidationError, validation_exception_handler)
+    app.add_exception_handler(Exception, unhandled_exception_handler)
+
+    app.add_api_route("/health", health, methods=["GET"], tags=["system"])
+    app.add_api_route("/", root, methods=["GET"], tags=["system"])
+
+    from routers import bible as bible_router
+
+    app.include_router(bible_router.router, prefix="/api/bible", tags=["bible"])
+    return app
 
-from routers import bible as bible_router  # noqa: E402
 
-app.include_router(bible_router.router, prefix="/api/bible", tags=["bible"])
+def __getattr__(name: str) -> FastAPI:
+    """`main.app`, built by create_app() on first access (uvicorn main:app) and kept."""
+    if name != "app":
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    app = globals()["app"] = create_app()
+    return app
@@ -38,6 +38,7 @@ class WordRow(BaseModel):
     display_he: Optional[str] = None
     lemma_strong: Optional[str] = None
     morph_code: Optional[str] = None
+    book_id: int
 
 
 class MorphemeRow(BaseModel):
@@ -53,3 +54,4 @@ class MorphemeRow(BaseModel):
     verb_stem: Optional[str] = None
     verb_aspect: Optional[str] = None
     person: Optional[str] = None
+    book_id: int
@@ -2,28 +2,80 @@
 Bible router — public read-only endpoints.
 
 All endpoints are public (no auth required).
-Optional JWT is accepted for future user-settings features.
+Optional JWT is accepted for future user-settings features; it is only verified
+if a handler reads it (LazyOptionalUser).
+Responses are JSON, or MessagePack / CBOR per the Accept header (renderers.py),
+compressed per Accept-Encoding (compression.py).
+Handlers are plain `def`: the service layer blocks on the database, so FastAPI
+runs them on its threadpool and the event loop keeps serving other requests.
 
 Routes:
     GET /api/bible/books                          → list all books
     GET /api/bible/books/{osis_id}                → book + chapter list
     GET /api/bible/books/{osis_id}/chapters/{n}   → chapter + verse list
     GET /api/bible/books/{osis_id}/chapters/{n}/verses → verses with words
+        ?include=morphology                       → + decoded morphemes per word
+        ?include=gloss                            → + lexicon gloss/transliteration per word
+        ?format=columnar                          → parallel arrays per field + offsets
     GET /api/bible/words/{word_id}/morphology     → word + decoded morphemes
+    GET /api/bible/reader/{osis_id}/{n}           → reader bundle: book, navigation,
+                                                    verses with morphemes + glosses
 """
-from fastapi import APIRouter, Path
+import re
+from typing import Literal, Optional, Union
 
-from auth.jwt_optional import OptionalUser
+from fastapi import APIRouter, Path, Query, Request, Response
+
+from auth.jwt_optional import LazyOptionalUser
+from compression import precompressed_response
+from errors import BadRequestError
+from renderers import NegotiatedRoute, negotiate
 from schemas.bible_schemas import (
     BooksListResponse,
     BookWithChaptersResponse,
     ChapterWithVersesResponse,
+    ReaderBundleResponse,
+    VersesColumnarResponse,
     VersesListResponse,
     WordWithMorphologyResponse,
 )
 from services import bible_service
 
-router = APIRouter()
+router = APIRouter(route_class=NegotiatedRoute)
+
+VERSE_INCLUDES = {"morphology", "gloss"}
+
+# Browsers/CDNs may reuse a reader bundle this long; the ETag carries the
+# corpus version, so revalidation after a promote returns the new bundle.
+READER_MAX_AGE = 300
+
+# An entity tag in an If-None-Match list; group 1 is its opaque part
+_ENTITY_TAG = re.compile(r'(?:W/)?"([^"]*)"')
+
+
+def _parse_include(include: Optional[str], allowed: set[str]) -> set[str]:
+    """Split a comma-separated ?include= value, rejecting unknown names."""
+    requested = {part.strip() for part in (include or "").split(",") if part.strip()}
+    unknown = requested - allowed
+    if unknown:
+        raise BadRequestError(
+            f"Unknown include: {', '.join(sorted(unknown))} "
+            f"(allowed: {', '.join(sorted(allowed))})"
+        )
+    return requested
+
+
+def _etag_matches(if_none_match: Optional[str], opaque: str) -> bool:
+    """
+    Whether an If-None-Match header matches the entity tag whose opaque part
+    (between the quotes) is `opaque`: `*`, or any entity tag in its list equal
+    to it under weak comparison (W/ prefixes ignored).
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return opaque in _ENTITY_TAG.findall(if_none_match)
 
 
 @router.get(
@@ -32,7 +84,7 @@ router = APIRouter()
     summary="List all books",
     description="Returns all 39 Tanakh books ordered by canonical id.",
 )
-async def list_books(user: OptionalUser = None):
+def list_books(user: LazyOptionalUser = None):
     return bible_service.get_books()
 
 
@@ -42,9 +94,9 @@ async def list_books(user: OptionalUser = None):
     summary="Get book with chapters",
     description="Returns a book and its chapter list by OSIS id (e.g. Gen, Exod).",
 )
-async def get_book(
+def get_book(
     osis_id: str = Path(..., description="OSIS book id, e.g. 'Gen'"),
-    user: OptionalUser = None,
+    user: LazyOptionalUser = None,
 ):
     return bible_service.get_book(osis_id)
 
@@ -55,26 +107,44 @@ async def get_book(
     summary="Get chapter with verse list",
     description="Returns a chapter and its verse numbers.",
 )
-async def get_chapter(
+def get_chapter(
     osis_id: str = Path(..., description="OSIS book id"),
     chapter_num: int = Path(..., ge=1, description="Chapter number"),
-    user: OptionalUser = None,
+    user: LazyOptionalUser = None,
 ):
     return bible_service.get_chapter(osis_id, chapter_num)
 
 
 @router.get(
     "/books/{osis_id}/chapters/{chapter_num}/verses",
-    response_model=VersesListResponse,
+    response_model=Union[VersesListResponse, VersesColumnarResponse],
+    response_model_exclude_unset=True,
     summary="Get verses with words",
-    description="Returns all verses in a chapter, each with their Hebrew words.",
+    description=(
+        "Returns all verses in a chapter, each with their Hebrew words. "
+        "`include=morphology` adds each word's decoded morphemes; "
+        "`include=gloss` adds the gloss and transliteration of its lemma. "
+        "`format=columnar` returns the same data as parallel arrays per field "
+        "with verse/morpheme offsets, sending each field name once."
+    ),
 )
-async def get_verses(
+def get_verses(
     osis_id: str = Path(..., description="OSIS book id"),
     chapter_num: int = Path(..., ge=1, description="Chapter number"),
-    user: OptionalUser = None,
+    include: Optional[str] = Query(None, description="Comma-separated extras: morphology, gloss"),
+    response_format: Literal["rows", "columnar"] = Query(
+        "rows", alias="format", description="rows (one object per word) or columnar"
+    ),
+    user: LazyOptionalUser = None,
 ):
-    return bible_service.get_verses(osis_id, chapter_num)
+    includes = _parse_include(include, VERSE_INCLUDES)
+    return bible_service.get_verses(
+        osis_id,
+        chapter_num,
+        include_morphology="morphology" in includes,
+        include_gloss="gloss" in includes,
+        columnar=response_format == "columnar",
+    )
 
 
 @router.get(
@@ -87,8 +157,41 @@ async def get_verses(
         "verb stem, verb aspect, and person where applicable."
     ),
 )
-async def get_word_morphology(
+def get_word_morphology(
     word_id: int = Path(..., ge=1, description="Word id"),
-    user: OptionalUser = None,
+    user: LazyOptionalUser = None,
 ):
     return bible_service.get_word_morphology(word_id)
+
+
+@router.get(
+    "/reader/{osis_id}/{chapter_num}",
+    response_model=ReaderBundleResponse,
+    summary="Get reader bundle for a chapter",
+    description=(
+        "Everything the reader shows for one chapter in a single response: book header, "
+        "chapter count, previous/next chapter (across books), and verses whose words "
+        "carry decoded morphemes, gloss and transliteration. Cacheable — honours "
+        "If-None-Match against a weak ETag of the corpus version. Encoded and "
+        "gzip/Brotli-compressed once per corpus version."
+    ),
+    responses={304: {"description": "Not modified"}},
+)
+def get_reader_bundle(
+    request: Request,
+    osis_id: str = Path(..., description="OSIS book id"),
+    chapter_num: int = Path(..., ge=1, description="Chapter number"),
+    user: LazyOptionalUser = None,
+):
+    media_type = negotiate(request.headers.get("accept"))
+    version = bible_service.get_corpus_version()
+    # Only a chapter that exists gets an ETag (osis_id goes into it verbatim)
+    bible_service.check_reader_chapter(version, osis_id, chapter_num)
+    # One ETag per representation: the corpus version, the chapter and the media type
+    opaque = f"{version}-{osis_id}-{chapter_num}-{media_type.rpartition('/')[2]}"
+    headers = {"ETag": f'W/"{opaque}"', "Cache-Control": f"public, max-age={READER_MAX_AGE}"}
+    # Checked before the bundle is built, so revalidation costs no encoding or compression
+    if _etag_matches(request.headers.get("if-none-match"), opaque):
+        return Response(status_code=304, headers=headers)
+    payload = bible_service.get_reader_payload(version, osis_id, chapter_num, media_type)
+    return precompressed_response(payload, request, headers)
@@ -3,7 +3,7 @@ Bible API — Pydantic request/response schemas
 These are the shapes returned by the FastAPI endpoints (not raw DB rows).
 """
 from __future__ import annotations
-from typing import Optional
+from typing import Literal, Optional
 from pydantic import BaseModel
 
 
@@ -45,6 +45,7 @@ class MorphemeResponse(BaseModel):
     language: str
     part_of_speech: str
     pos_code: str
+    pos_type: Optional[str] = None
     gender: Optional[str] = None
     number: Optional[str] = None
     state: Optional[str] = None
@@ -60,6 +61,11 @@ class WordResponse(BaseModel):
     display_he: Optional[str] = None
     lemma_strong: Optional[str] = None
     morph_code: Optional[str] = None
+    # Only present when requested (?include=morphology on verses)
+    morphemes: Optional[list[MorphemeResponse]] = None
+    # Only present when requested (?include=gloss on verses)
+    gloss: Optional[str] = None
+    translit: Optional[str] = None
 
 
 class WordWithMorphologyResponse(WordResponse):
@@ -74,6 +80,22 @@ class VerseWithWordsResponse(BaseModel):
     words: list[WordResponse]
 
 
+class ChapterRef(BaseModel):
+    osis_id: str
+    chapter_num: int
+
+
+class ReaderBundleResponse(BaseModel):
+    corpus_version: int
+    book: BookResponse
+    chapter_num: int
+    chapter_count: int
+    prev: Optional[ChapterRef] = None
+    next: Optional[ChapterRef] = None
+    # Every word carries morphemes, gloss and translit
+    verses: list[VerseWithWordsResponse]
+
+
 # ── List wrappers ─────────────────────────────────────────────────────────────
 
 class BooksListResponse(BaseModel):
@@ -84,3 +106,54 @@ class BooksListResponse(BaseModel):
 class VersesListResponse(BaseModel):
     data: list[VerseWithWordsResponse]
     total: int
+
+
+# ── Columnar verses (?format=columnar) ────────────────────────────────────────
+# The same data as VersesListResponse as parallel arrays, one per field, so
+# field names are sent once per response instead of once per word. Words of
+# verse i are words[word_offsets[i]:word_offsets[i + 1]]; morphemes of word j
+# are morphemes[morpheme_offsets[j]:morpheme_offsets[j + 1]].
+
+class VerseColumns(BaseModel):
+    id: list[int]
+    verse_num: list[int]
+
+
+class WordColumns(BaseModel):
+    id: list[int]
+    position: list[int]
+    surface_he: list[str]
+    display_he: list[Optional[str]]
+    lemma_strong: list[Optional[str]]
+    morph_code: list[Optional[str]]
+    # Only present when requested (?include=gloss)
+    gloss: Optional[list[Optional[str]]] = None
+    translit: Optional[list[Optional[str]]] = None
+
+
+class MorphemeColumns(BaseModel):
+    segment_index: list[int]
+    language: list[str]
+    part_of_speech: list[str]
+    pos_code: list[str]
+    pos_type: list[Optional[str]]
+    gender: list[Optional[str]]
+    number: list[Optional[str]]
+    state: list[Optional[str]]
+    verb_stem: list[Optional[str]]
+    verb_aspect: list[Optional[str]]
+    person: list[Optional[str]]
+
+
+class VersesColumnarResponse(BaseModel):
+    format: Literal["columnar"]
+    total: int
+    # Every verse of a chapter shares these
+    book_id: int
+    chapter_num: int
+    verses: VerseColumns
+    word_offsets: list[int]            # len(verses) + 1
+    words: WordColumns
+    # Only present when requested (?include=morphology)
+    morpheme_offsets: Optional[list[int]] = None   # len(words) + 1
+    morphemes: Optional[MorphemeColumns] = None
@@ -0,0 +1,198 @@
+"""
+Request timing — spans, a Server-Timing header and a log line per request.
+
+Code under a request records what it spends time on:
+
+    with span("build"):
+        ...
+
+    @timed("db")
+    def fetch(...): ...
+
+    repo = TimedProxy(repo, "db")      # every method call is a "db" span
+
+ServerTimingMiddleware collects a request's spans, sums them per name and
+sends them in a `Server-Timing` header (browser devtools show it under
+Timing) together with:
+
+    serialize   from the end of the last span to the response — FastAPI's
+                response validation and encoding
+    total       the whole request inside the middleware
+
+Every request is also logged as one JSON line on the "server_timing" logger.
+
+Spans live in a ContextVar, which FastAPI copies into the threadpool that
+runs sync endpoints. With the middleware not installed there is nothing to
+collect: span() and timed() reduce to one ContextVar lookup.
+
+Vendored from platform/builder-cli/templates/backend/server_timing.py.
+"""
+import functools
+import json
+import logging
+import time
+from contextvars import ContextVar
+from typing import Any, Callable, NamedTuple, Optional
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+logger = logging.getLogger("server_timing")
+
+
+class Span(NamedTuple):
+    name: str
+    desc: Optional[str]
+    start: float               # time.perf_counter()
+    end: float
+
+
+# The current request's spans; None outside a timed request
+_spans: ContextVar[Optional[list[Span]]] = ContextVar("server_timing_spans", default=None)
+
+
+class span:
+    """Context manager recording its block as a span of the current request."""
+
+    __slots__ = ("name", "desc", "_spans", "_start")
+
+    def __init__(self, name: str, desc: Optional[str] = None):
+        self.name = name
+        self.desc = desc
+
+    def __enter__(self) -> "span":
+        self._spans = _spans.get()
+        if self._spans is not None:
+            self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        if self._spans is not None:
+            self._spans.append(Span(self.name, self.desc, self._start, time.perf_counter()))
+
+
+def timed(name: str, desc: Optional[str] = None) -> Callable[[Callable], Callable]:
+    """Decorator: each call is a span (desc defaults to the function name)."""
+
+    def decorate(fn: Callable) -> Callable:
+        label = desc or fn.__name__
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            spans = _spans.get()
+            if spans is None:
+                return fn(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                spans.append(Span(name, label, start, time.perf_counter()))
+
+        return wrapper
+
+    return decorate
+
+
+class TimedProxy:
+    """Wraps `target` so that every method call is a span named `name`."""
+
+    def __init__(self, target: Any, name: str):
+        self._target = target
+        self._name = name
+
+    def __getattr__(self, attr: str) -> Any:
+        value = getattr(self._target, attr)
+        if not callable(value):
+            return value
+        wrapped = timed(self._name, attr)(value)
+        setattr(self, attr, wrapped)  # looked up once per method
+        return wrapped
+
+
+def _metrics(spans: list[Span], start: float, end: float) -> dict[str, dict]:
+    """name → {ms, count, desc} for a request's spans, plus serialize and total."""
+    metrics: dict[str, dict] = {}
+    descs: dict[str, list[str]] = {}
+    for s in spans:
+        m = metrics.setdefault(s.name, {"ms": 0.0, "count": 0, "desc": None})
+        m["ms"] += (s.end - s.start) * 1000
+        m["count"] += 1
+        if s.desc and s.desc not in descs.setdefault(s.name, []):
+            descs[s.name].append(s.desc)
+    for name, labels in descs.items():
+        count = metrics[name]["count"]
+        metrics[name]["desc"] = ", ".join(labels) if count == 1 else f"{count} calls: {', '.join(labels)}"
+    if spans:
+        last = max(s.end for s in spans)
+        metrics["serialize"] = {"ms": (end - last) * 1000, "count": 1, "desc": None}
+    metrics["total"] = {"ms": (end - start) * 1000, "count": 1, "desc": None}
+    return metrics
+
+
+def format_server_timing(metrics: dict[str, dict]) -> str:
+    """A Server-Timing header value: `name;dur=1.23;desc="..."` entries."""
+    entries = []
+    for name, m in metrics.items():
+        entry = f"{name};dur={m['ms']:.2f}"
+        if m["desc"]:
+            desc = m["desc"].replace("\\", "\\\\").replace('"', '\\"')
+            entry += f';desc="{desc}"'
+        entries.append(entry)
+    return ", ".join(entries)
+
+
+class ServerTimingMiddleware:
+    """
+    Time each HTTP request; send its spans as `Server-Timing` (unless
+    header=False) and log them as JSON on the "server_timing" logger.
+    """
+
+    def __init__(self, app: ASGIApp, header: bool = True, log: bool = True) -> None:
+        self.app = app
+        self.header = header
+        self.log = log
+        if log and not logger.handlers:
+            # uvicorn configures only its own loggers
+            handler = logging.StreamHandler()
+            handler.setFormatter(logging.Formatter("%(message)s"))
+            logger.addHandler(handler)
+            logger.setLevel(logging.INFO)
+            logger.propagate = False
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        spans: list[Span] = []
+        token = _spans.set(spans)
+        start = time.perf_counter()
+        status = 500
+        metrics: Optional[dict[str, dict]] = None
+
+        async def send_timed(message: Message) -> None:
+            nonlocal status, metrics
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                metrics = _metrics(spans, start, time.perf_counter())
+                if self.header:
+                    MutableHeaders(scope=message).append("Server-Timing", format_server_timing(metrics))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_timed)
+        finally:
+            _spans.reset(token)
+            if self.log:
+                if metrics is None:  # unhandled error, no response sent from inside
+                    metrics = _metrics(spans, start, time.perf_counter())
+                logger.info(json.dumps({
+                    "event": "request",
+                    "method": scope["method"],
+                    "path": scope["path"],
+                    "status": status,
+                    "timings": {
+                        name: {k: round(v, 3) if k == "ms" else v for k, v in m.items() if v is not None}
+                        for name, m in metrics.items()
+                    },
+                }))
@@ -0,0 +1,437 @@
+"""
+Bible repository — row access for bible_service, behind one interface.
+
+Three implementations, chosen by settings.bible_repository:
+
+    "supabase"  SupabaseBibleRepository — PostgREST over HTTP via supabase-py
+                (the service-role client). Default.
+    "asyncpg"   AsyncpgBibleRepository — Postgres wire protocol via an asyncpg
+                pool (settings.database_url). No HTTP hop and no JSON between
+                Postgres and the API.
+    "sqlite"    SqliteBibleRepository — a single-file corpus written by
+                tools/py/import_bible.py --sqlite (settings.sqlite_path),
+                opened read-only. No network dependency at all.
+
+The Postgres ones read only the scribeswell.*_read views, so corpus
+versioning (promote / rollback) applies to either; a SQLite file carries one
+corpus and its version. All return plain dict rows with the same keys —
+bible_service builds its responses from those.
+
+The service layer is synchronous and runs on FastAPI's threadpool (the bible
+handlers are plain `def`); the asyncpg pool runs on its own event loop thread
+and each call waits for its result, as a supabase-py call waits for its HTTP
+response. Calls from concurrent requests overlap on the pool. Hot queries
+are module constants, so asyncpg prepares each one once per pooled
+connection (its statement cache) and from then on only binds and executes
+it. Prepared statements need a direct or session-mode connection
+— not Supabase's transaction-mode pooler (port 6543).
+
+supabase-py and asyncpg are imported by the repository that uses them, when
+it is created (main.py's lifespan), not with this module: importing the API
+does not pay for client libraries it is not configured to use.
+"""
+from __future__ import annotations
+import asyncio
+import json
+import sqlite3
+import threading
+from functools import lru_cache
+from typing import TYPE_CHECKING, Optional, Protocol
+
+from config import settings
+from metrics import UpstreamProxy
+from server_timing import TimedProxy
+
+if TYPE_CHECKING:
+    import asyncpg
+    from supabase import Client
+
+# Columns of a word row, as returned by every implementation
+WORD_COLUMNS = ("id", "verse_id", "position", "surface_he", "display_he", "lemma_strong", "morph_code")
+
+
+class BibleRepository(Protocol):
+    """Read access to the active corpus. Missing rows are None, never an error."""
+
+    def books(self) -> list[dict]:
+        """Every book (book_read.*), ordered by id."""
+
+    def book(self, osis_id: str) -> Optional[dict]:
+        """One book (book_read.*) by OSIS id."""
+
+    def chapters(self, book_id: int) -> list[dict]:
+        """id, chapter_num of a book's chapters, in order."""
+
+    def chapter(self, book_id: int, chapter_num: int) -> Optional[dict]:
+        """id, book_id, chapter_num of one chapter."""
+
+    def verse_summaries(self, chapter_id: int) -> list[dict]:
+        """id, verse_num of a chapter's verses, in order."""
+
+    def chapter_verses(self, book_id: int, chapter_num: int) -> list[dict]:
+        """id, verse_num, book_id, chapter_num of a chapter's verses, in order."""
+
+    def words_for_verses(self, verse_ids: list[int]) -> list[dict]:
+        """WORD_COLUMNS of every word of the given verses, by verse_id then position."""
+
+    def word(self, word_id: int) -> Optional[dict]:
+        """WORD_COLUMNS of one word."""
+
+    def lexicon(self) -> list[dict]:
+        """strong, gloss, translit of every lexicon entry."""
+
+    def morph_codes(self) -> list[dict]:
+        """code, segments (a list of dicts, as the importer decoded them) of every morph_code_dict entry."""
+
+    def chapter_counts(self) -> dict[int, int]:
+        """book_id → number of chapters."""
+
+    def active_corpus_version(self) -> int:
+        """Version of the active corpus (0 when none is recorded)."""
+
+
+# ── Supabase (PostgREST) ──────────────────────────────────────────────────────
+
+# PostgREST max_rows (supabase/config.toml)
+_PAGE_SIZE = 1000
+
+
+def _fetch_all(build_query) -> list[dict]:
+    """
+    Every row of a query, a page at a time. build_query() must return a fresh,
+    totally ordered query builder on each call.
+    """
+    rows: list[dict] = []
+    start = 0
+    while True:
+        page = build_query().range(start, start + _PAGE_SIZE - 1).execute().data
+        rows.extend(page)
+        if len(page) < _PAGE_SIZE:
+            return rows
+        start += _PAGE_SIZE
+
+
+class SupabaseBibleRepository:
+    """BibleRepository over PostgREST (one supabase-py client per process)."""
+
+    def __init__(self, client: Client):
+        self.sb = client
+        # sb.schema() builds a new PostgREST client, and with it a new HTTP
+        # connection pool, on every call — keep one for the process
+        self._scribeswell = client.schema("scribeswell")
+
+    def _table(self, name: str):
+        return self._scribeswell.table(name)
+
+    @staticmethod
+    def _one(resp) -> Optional[dict]:
+        return resp.data if resp and resp.data else None
+
+    def books(self) -> list[dict]:
+        return self._table("book_read").select("*").order("id").execute().data
+
+    def book(self, osis_id: str) -> Optional[dict]:
+        return self._one(self._table("book_read").select("*").eq("osis_id", osis_id).maybe_single().execute())
+
+    def chapters(self, book_id: int) -> list[dict]:
+        return (
+            self._table("chapter_read")
+            .select("id,chapter_num")
+            .eq("book_id", book_id)
+            .order("chapter_num")
+            .execute()
+            .data
+        )
+
+    def chapter(self, book_id: int, chapter_num: int) -> Optional[dict]:
+        return self._one(
+            self._table("chapter_read")
+            .select("id,book_id,chapter_num")
+            .eq("book_id", book_id)
+            .eq("chapter_num", chapter_num)
+            .maybe_single()
+            .execute()
+        )
+
+    def verse_summaries(self, chapter_id: int) -> list[dict]:
+        return (
+            self._table("verse_read")
+            .select("id,verse_num")
+            .eq("chapter_id", chapter_id)
+            .order("verse_num")
+            .execute()
+            .data
+        )
+
+    def chapter_verses(self, book_id: int, chapter_num: int) -> list[dict]:
+        return (
+            self._table("verse_read")
+            .select("id,verse_num,book_id,chapter_num")
+            .eq("book_id", book_id)
+            .eq("chapter_num", chapter_num)
+            .order("verse_num")
+            .execute()
+            .data
+        )
+
+    def words_for_verses(self, verse_ids: list[int]) -> list[dict]:
+        # Paged — a long chapter has more words than max_rows
+        return _fetch_all(
+            lambda: self._table("word_read")
+            .select(",".join(WORD_COLUMNS))
+            .in_("verse_id", verse_ids)
+            .order("verse_id")
+            .order("position")
+        )
+
+    def word(self, word_id: int) -> Optional[dict]:
+        return self._one(
+            self._table("word_read").select(",".join(WORD_COLUMNS)).eq("id", word_id).maybe_single().execute()
+        )
+
+    def lexicon(self) -> list[dict]:
+        return _fetch_all(lambda: self._table("lexicon_read").select("strong,gloss,translit").order("strong"))
+
+    def morph_codes(self) -> list[dict]:
+        return _fetch_all(lambda: self._table("morph_code_dict_read").select("code,segments").order("code"))
+
+    def chapter_counts(self) -> dict[int, int]:
+        rows = _fetch_all(
+            lambda: self._table("chapter_read").select("book_id,chapter_num").order("book_id").order("chapter_num")
+        )
+        counts: dict[int, int] = {}
+        for row in rows:
+            counts[row["book_id"]] = max(counts.get(row["book_id"], 0), row["chapter_num"])
+        return counts
+
+    def active_corpus_version(self) -> int:
+        resp = (
+            self._table("corpus_version_read")
+            .select("version")
+            .eq("status", "active")
+            .maybe_single()
+            .execute()
+        )
+        return resp.data["version"] if resp and resp.data else 0
+
+
+# ── asyncpg (Postgres wire protocol) ──────────────────────────────────────────
+
+_WORD_SELECT = f"SELECT {', '.join(WORD_COLUMNS)} FROM scribeswell.word_read"
+
+SQL_BOOKS = "SELECT * FROM scribeswell.book_read ORDER BY id"
+SQL_BOOK = "SELECT * FROM scribeswell.book_read WHERE osis_id = $1"
+SQL_CHAPTERS = "SELECT id, chapter_num FROM scribeswell.chapter_read WHERE book_id = $1 ORDER BY chapter_num"
+SQL_CHAPTER = "SELECT id, book_id, chapter_num FROM scribeswell.chapter_read WHERE book_id = $1 AND chapter_num = $2"
+SQL_VERSE_SUMMARIES = "SELECT id, verse_num FROM scribeswell.verse_read WHERE chapter_id = $1 ORDER BY verse_num"
+SQL_CHAPTER_VERSES = (
+    "SELECT id, verse_num, book_id, chapter_num FROM scribeswell.verse_read"
+    " WHERE book_id = $1 AND chapter_num = $2 ORDER BY verse_num"
+)
+SQL_WORDS_FOR_VERSES = f"{_WORD_SELECT} WHERE verse_id = ANY($1::int[]) ORDER BY verse_id, position"
+SQL_WORD = f"{_WORD_SELECT} WHERE id = $1"
+SQL_LEXICON = "SELECT strong, gloss, translit FROM scribeswell.lexicon_read"
+SQL_MORPH_CODES = "SELECT code, segments FROM scribeswell.morph_code_dict_read"
+SQL_CHAPTER_COUNTS = "SELECT book_id, max(chapter_num) AS chapters FROM scribeswell.chapter_read GROUP BY book_id"
+SQL_ACTIVE_VERSION = "SELECT version FROM scribeswell.corpus_version_read WHERE status = 'active'"
+
+
+class AsyncpgBibleRepository:
+    """BibleRepository over an asyncpg pool running on a dedicated event loop thread."""
+
+    def __init__(self, dsn: str, min_size: int = 1, max_size: int = 10):
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name="bible-asyncpg", daemon=True)
+        self._thread.start()
+        self._pool = self._run(self._create_pool(dsn, min_size, max_size))
+
+    @staticmethod
+    async def _create_pool(dsn: str, min_size: int, max_size: int) -> asyncpg.Pool:
+        import asyncpg
+
+        return await asyncpg.create_pool(dsn, min_size=min_size, max_size=max_size)
+
+    def _run(self, coro):
+        # Blocks the calling thread: a threadpool worker, never the server's event loop
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+
+    def _fetch(self, sql: str, *args) -> list[dict]:
+        return [dict(r) for r in self._run(self._pool.fetch(sql, *args))]
+
+    def _fetchrow(self, sql: str, *args) -> Optional[dict]:
+        row = self._run(self._pool.fetchrow(sql, *args))
+        return dict(row) if row is not None else None
+
+    def close(self) -> None:
+        self._run(self._pool.close())
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+
+    def books(self) -> list[dict]:
+        return self._fetch(SQL_BOOKS)
+
+    def book(self, osis_id: str) -> Optional[dict]:
+        return self._fetchrow(SQL_BOOK, osis_id)
+
+    def chapters(self, book_id: int) -> list[dict]:
+        return self._fetch(SQL_CHAPTERS, book_id)
+
+    def chapter(self, book_id: int, chapter_num: int) -> Optional[dict]:
+        return self._fetchrow(SQL_CHAPTER, book_id, chapter_num)
+
+    def verse_summaries(self, chapter_id: int) -> list[dict]:
+        return self._fetch(SQL_VERSE_SUMMARIES, chapter_id)
+
+    def chapter_verses(self, book_id: int, chapter_num: int) -> list[dict]:
+        return self._fetch(SQL_CHAPTER_VERSES, book_id, chapter_num)
+
+    def words_for_verses(self, verse_ids: list[int]) -> list[dict]:
+        return self._fetch(SQL_WORDS_FOR_VERSES, verse_ids)
+
+    def word(self, word_id: int) -> Optional[dict]:
+        return self._fetchrow(SQL_WORD, word_id)
+
+    def lexicon(self) -> list[dict]:
+        return self._fetch(SQL_LEXICON)
+
+    def morph_codes(self) -> list[dict]:
+        # asyncpg returns jsonb as text (no codec is registered on the pool)
+        return [{"code": row["code"], "segments": json.loads(row["segments"])} for row in self._fetch(SQL_MORPH_CODES)]
+
+    def chapter_counts(self) -> dict[int, int]:
+        return {row["book_id"]: row["chapters"] for row in self._fetch(SQL_CHAPTER_COUNTS)}
+
+    def active_corpus_version(self) -> int:
+        row = self._fetchrow(SQL_ACTIVE_VERSION)
+        return row["version"] if row else 0
+
+
+# ── SQLite (single-file corpus) ───────────────────────────────────────────────
+
+_SQLITE_WORD_SELECT = f"SELECT {', '.join(WORD_COLUMNS)} FROM word"
+
+SQLITE_BOOKS = "SELECT * FROM book ORDER BY id"
+SQLITE_BOOK = "SELECT * FROM book WHERE osis_id = ?"
+SQLITE_CHAPTERS = "SELECT id, chapter_num FROM chapter WHERE book_id = ? ORDER BY chapter_num"
+SQLITE_CHAPTER = "SELECT id, book_id, chapter_num FROM chapter WHERE book_id = ? AND chapter_num = ?"
+SQLITE_VERSE_SUMMARIES = "SELECT id, verse_num FROM verse WHERE chapter_id = ? ORDER BY verse_num"
+SQLITE_CHAPTER_VERSES = (
+    "SELECT id, verse_num, book_id, chapter_num FROM verse WHERE book_id = ? AND chapter_num = ? ORDER BY verse_num"
+)
+# One statement for any number of ids (a JSON array), so it stays in the statement cache
+SQLITE_WORDS_FOR_VERSES = (
+    f"{_SQLITE_WORD_SELECT} WHERE verse_id IN (SELECT value FROM json_each(?)) ORDER BY verse_id, position"
+)
+SQLITE_WORD = f"{_SQLITE_WORD_SELECT} WHERE id = ?"
+SQLITE_LEXICON = "SELECT strong, gloss, translit FROM lexicon"
+SQLITE_CHAPTER_COUNTS = "SELECT book_id, max(chapter_num) AS chapters FROM chapter GROUP BY book_id"
+SQLITE_VERSION = "SELECT version FROM corpus_version ORDER BY version DESC LIMIT 1"
+
+
+class SqliteBibleRepository:
+    """
+    BibleRepository over a read-only SQLite corpus file, one connection per
+    thread: the bible handlers are sync `def`, so FastAPI calls the service
+    layer from its threadpool, and a connection stays on the thread that
+    opened it.
+    """
+
+    def __init__(self, path: str):
+        # A missing file or one without a corpus fails here, with its own error
+        self._uri = f"file:{path}?mode=ro"
+        self._local = threading.local()
+        self._connect().execute(SQLITE_VERSION)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self._uri, uri=True)
+            self._local.conn = conn
+        return conn
+
+    def _fetch(self, sql: str, *args) -> list[dict]:
+        # Tuples, zipped with the column names once per query — cheaper than
+        # a row_factory, which reads cursor.description for every row
+        cursor = self._connect().execute(sql, args)
+        columns = [col[0] for col in cursor.description]
+        return [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+    def _fetchrow(self, sql: str, *args) -> Optional[dict]:
+        rows = self._fetch(sql, *args)
+        return rows[0] if rows else None
+
+    def books(self) -> list[dict]:
+        return self._fetch(SQLITE_BOOKS)
+
+    def book(self, osis_id: str) -> Optional[dict]:
+        return self._fetchrow(SQLITE_BOOK, osis_id)
+
+    def chapters(self, book_id: int) -> list[dict]:
+        return self._fetch(SQLITE_CHAPTERS, book_id)
+
+    def chapter(self, book_id: int, chapter_num: int) -> Optional[dict]:
+        return self._fetchrow(SQLITE_CHAPTER, book_id, chapter_num)
+
+    def verse_summaries(self, chapter_id: int) -> list[dict]:
+        return self._fetch(SQLITE_VERSE_SUMMARIES, chapter_id)
+
+    def chapter_verses(self, book_id: int, chapter_num: int) -> list[dict]:
+        return self._fetch(SQLITE_CHAPTER_VERSES, book_id, chapter_num)
+
+    def words_for_verses(self, verse_ids: list[int]) -> list[dict]:
+        return self._fetch(SQLITE_WORDS_FOR_VERSES, json.dumps(verse_ids))
+
+    def word(self, word_id: int) -> Optional[dict]:
+        return self._fetchrow(SQLITE_WORD, word_id)
+
+    def lexicon(self) -> list[dict]:
+        return self._fetch(SQLITE_LEXICON)
+
+    def morph_codes(self) -> list[dict]:
+        # A corpus file has no morph_code_dict (sqlite_corpus.py): every code is decoded on read
+        return []
+
+    def chapter_counts(self) -> dict[int, int]:
+        return {row["book_id"]: row["chapters"] for row in self._fetch(SQLITE_CHAPTER_COUNTS)}
+
+    def active_corpus_version(self) -> int:
+        row = self._fetchrow(SQLITE_VERSION)
+        return row["version"] if row else 0
+
+
+# ── Selection ─────────────────────────────────────────────────────────────────
+
+def _create_repository() -> BibleRepository:
+    if settings.bible_repository == "asyncpg":
+        return AsyncpgBibleRepository(
+            settings.database_url,
+            min_size=settings.database_pool_min_size,
+            max_size=settings.database_pool_max_size,
+        )
+    if settings.bible_repository == "sqlite":
+        return SqliteBibleRepository(settings.sqlite_path)
+    from supabase import create_client
+
+    return SupabaseBibleRepository(create_client(settings.supabase_url, settings.supabase_secret_key))
+
+
+@lru_cache(maxsize=1)
+def get_repository() -> BibleRepository:
+    """
+    The repository settings.bible_repository names, created on first use.
+    With settings.metrics_enabled each call is recorded as an upstream call
+    (metrics.py), with settings.server_timing as a "db" span (server_timing.py).
+    """
+    repo = _create_repository()
+    if settings.metrics_enabled:
+        repo = UpstreamProxy(repo, settings.bible_repository)
+    return TimedProxy(repo, "db") if settings.server_timing else repo
+
+
+def close_repository() -> None:
+    """Close the repository get_repository() created, if any (the asyncpg pool)."""
+    if get_repository.cache_info().currsize:
+        close = getattr(get_repository(), "close", None)
+        if close is not None:
+            close()
+        get_repository.cache_clear()
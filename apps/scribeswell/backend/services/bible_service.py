@@ -1,15 +1,49 @@
 """
-Bible service — data access layer for the bible schema.
-
-All queries use the Supabase service-role client (reads from bible.* tables).
-Bible data is public read-only reference data — no auth required for reads.
+Bible service — builds the bible API responses.
+
+Rows come from the configured BibleRepository (services/bible_repository.py:
+PostgREST via the Supabase service-role client, or asyncpg direct to
+Postgres). Bible data is public read-only reference data — no auth required
+for reads.
+
+Morphology comes from scribeswell.morph_code_dict — the importer's decoding
+of each distinct code — loaded once into an in-process map and looked up by
+word.morph_code. A code the dictionary lacks is decoded here instead
+(services/oshb_morph.py). Either way it is cached per distinct code; the
+morpheme table is only for SQL analytics.
+
+Glosses come from scribeswell.lexicon, loaded once into an in-process map
+(Strong's number → gloss, transliteration) on first use.
+
+The reader bundle is assembled from cached parts — the book/chapter index and
+each chapter's verses — keyed by the active corpus version, so a promote or
+rollback is picked up within settings.corpus_version_ttl_seconds. Encoded
+bundles are cached too, per wire format, with gzip and Brotli variants
+compressed once (compression.py) — serving a warm chapter costs no encoding
+or compression.
+
+With settings.metrics_enabled, cache lookups and misses are counted
+(metrics.py); otherwise the caches are plain lru_caches and nothing is
+recorded.
+
+With settings.server_timing, repository calls are "db" spans and response
+model construction "build" spans (server_timing.py); the reader bundle adds
+"encode" and "compress" when it is not cached.
 """
 from __future__ import annotations
-from typing import Optional
-from supabase import create_client, Client
+import re
+import threading
+import time
+from functools import lru_cache
+from typing import NamedTuple, Optional
 
+from compression import Precompressed, precompress
 from config import settings
 from errors import NotFoundError
+from renderers import render
+from server_timing import span
+from services.bible_repository import BibleRepository, get_repository
+from services.oshb_morph import MORPH_CACHE_SIZE, morpheme_fields, parse_morph_code
 from schemas.bible_schemas import (
     BookResponse,
     BookWithChaptersResponse,
@@ -22,196 +56,432 @@ from schemas.bible_schemas import (
     MorphemeResponse,
     BooksListResponse,
     VersesListResponse,
+    VersesColumnarResponse,
+    VerseColumns,
+    WordColumns,
+    MorphemeColumns,
+    ChapterRef,
+    ReaderBundleResponse,
 )
 
+if settings.metrics_enabled:
+    from metrics import counted_lru_cache, record_cache
+else:
+    def record_cache(cache: str, hit: bool) -> None:
+        """Metrics off: nothing to count."""
 
-def _get_client() -> Client:
-    return create_client(settings.supabase_url, settings.supabase_secret_key)
+    def counted_lru_cache(cache: str, maxsize: Optional[int] = 128):
+        """Metrics off: a plain functools.lru_cache."""
+        return lru_cache(maxsize=maxsize)
 
 
 # ── Books ─────────────────────────────────────────────────────────────────────
 
 def get_books() -> BooksListResponse:
     """Return all books ordered by testament + book_order."""
-    sb = _get_client()
-    resp = (
-        sb.schema("scribeswell")
-        .table("book_read")
-        .select("*")
-        .order("id")
-        .execute()
-    )
-    books = [BookResponse(**row) for row in resp.data]
-    return BooksListResponse(data=books, total=len(books))
+    rows = get_repository().books()
+    with span("build"):
+        books = [BookResponse(**row) for row in rows]
+        return BooksListResponse(data=books, total=len(books))
 
 
 def get_book(osis_id: str) -> BookWithChaptersResponse:
     """Return a single book with its chapter list."""
-    sb = _get_client()
-
-    book_resp = (
-        sb.schema("scribeswell")
-        .table("book_read")
-        .select("*")
-        .eq("osis_id", osis_id)
-        .single()
-        .execute()
-    )
-    if not book_resp.data:
+    repo = get_repository()
+    book = repo.book(osis_id)
+    if not book:
         raise NotFoundError("Book", osis_id)
 
-    ch_resp = (
-        sb.schema("scribeswell")
-        .table("chapter_read")
-        .select("id,chapter_num")
-        .eq("book_id", book_resp.data["id"])
-        .order("chapter_num")
-        .execute()
-    )
-
-    chapters = [ChapterSummary(**row) for row in ch_resp.data]
-    return BookWithChaptersResponse(**book_resp.data, chapters=chapters)
+    rows = repo.chapters(book["id"])
+    with span("build"):
+        chapters = [ChapterSummary(**row) for row in rows]
+        return BookWithChaptersResponse(**book, chapters=chapters)
 
 
 # ── Chapters ──────────────────────────────────────────────────────────────────
 
 def get_chapter(osis_id: str, chapter_num: int) -> ChapterWithVersesResponse:
     """Return a chapter with its verse list."""
-    sb = _get_client()
-
-    # Resolve book
-    book_resp = (
-        sb.schema("scribeswell")
-        .table("book_read")
-        .select("id")
-        .eq("osis_id", osis_id)
-        .single()
-        .execute()
-    )
-    if not book_resp.data:
-        raise NotFoundError("Book", osis_id)
+    repo = get_repository()
 
-    book_id = book_resp.data["id"]
+    book = repo.book(osis_id)
+    if not book:
+        raise NotFoundError("Book", osis_id)
 
-    ch_resp = (
-        sb.schema("scribeswell")
-        .table("chapter_read")
-        .select("id,book_id,chapter_num")
-        .eq("book_id", book_id)
-        .eq("chapter_num", chapter_num)
-        .single()
-        .execute()
-    )
-    if not ch_resp.data:
+    chapter = repo.chapter(book["id"], chapter_num)
+    if not chapter:
         raise NotFoundError("Chapter", f"{osis_id} {chapter_num}")
 
-    chapter_id = ch_resp.data["id"]
+    rows = repo.verse_summaries(chapter["id"])
+    with span("build"):
+        verses = [VerseSummary(**row) for row in rows]
+        return ChapterWithVersesResponse(**chapter, verses=verses)
 
-    v_resp = (
-        sb.schema("scribeswell")
-        .table("verse_read")
-        .select("id,verse_num")
-        .eq("chapter_id", chapter_id)
-        .order("verse_num")
-        .execute()
-    )
 
-    verses = [VerseSummary(**row) for row in v_resp.data]
-    return ChapterWithVersesResponse(**ch_resp.data, verses=verses)
+# ── Verses ────────────────────────────────────────────────────────────────────
 
+# Word row fields sent as columns (verse_id is implied by word_offsets)
+_COLUMNAR_WORD_FIELDS = ("id", "position", "surface_he", "display_he", "lemma_strong", "morph_code")
 
-# ── Verses ────────────────────────────────────────────────────────────────────
 
-def get_verses(osis_id: str, chapter_num: int) -> VersesListResponse:
-    """Return all verses with words for a given chapter."""
-    sb = _get_client()
-
-    # Resolve book
-    book_resp = (
-        sb.schema("scribeswell")
-        .table("book_read")
-        .select("id")
-        .eq("osis_id", osis_id)
-        .single()
-        .execute()
-    )
-    if not book_resp.data:
-        raise NotFoundError("Book", osis_id)
+def _chapter_rows(repo: BibleRepository, book_id: int, chapter_num: int) -> tuple[list[dict], list[dict]]:
+    """Verse rows and word rows of one chapter."""
+    verse_rows = repo.chapter_verses(book_id, chapter_num)
+    if not verse_rows:
+        return [], []
+    return verse_rows, repo.words_for_verses([row["id"] for row in verse_rows])
+
+
+def _build_verses(
+    verse_rows: list[dict],
+    word_rows: list[dict],
+    include_morphology: bool,
+    lexicon: Optional[dict[str, LexiconEntry]],
+) -> list[VerseWithWordsResponse]:
+    """Group word rows under their verses, adding morphemes / glosses when asked."""
+    words_by_verse: dict[int, list[WordResponse]] = {row["id"]: [] for row in verse_rows}
+    for w in word_rows:
+        vid = w["verse_id"]
+        if vid in words_by_verse:
+            extra = {}
+            if include_morphology:
+                extra["morphemes"] = _word_morphemes(w["morph_code"])
+            if lexicon is not None:
+                entry = lexicon.get(lexicon_key(w["lemma_strong"]))
+                extra["gloss"] = entry.gloss if entry else None
+                extra["translit"] = entry.translit if entry else None
+            words_by_verse[vid].append(WordResponse(**w, **extra))
+
+    return [
+        VerseWithWordsResponse(**row, words=words_by_verse[row["id"]])
+        for row in verse_rows
+    ]
+
 
-    book_id = book_resp.data["id"]
-
-    # Get verses for this chapter (using denorm columns for speed)
-    v_resp = (
-        sb.schema("scribeswell")
-        .table("verse_read")
-        .select("id,verse_num,book_id,chapter_num")
-        .eq("book_id", book_id)
-        .eq("chapter_num", chapter_num)
-        .order("verse_num")
-        .execute()
+def _build_columnar(
+    verse_rows: list[dict],
+    word_rows: list[dict],
+    include_morphology: bool,
+    lexicon: Optional[dict[str, LexiconEntry]],
+) -> VersesColumnarResponse:
+    """Same content as _build_verses, as parallel arrays plus offsets."""
+    words_by_verse: dict[int, list[dict]] = {row["id"]: [] for row in verse_rows}
+    for w in word_rows:
+        if w["verse_id"] in words_by_verse:
+            words_by_verse[w["verse_id"]].append(w)
+
+    word_offsets = [0]
+    ordered: list[dict] = []
+    for row in verse_rows:
+        ordered.extend(words_by_verse[row["id"]])
+        word_offsets.append(len(ordered))
+
+    words = {name: [w[name] for w in ordered] for name in _COLUMNAR_WORD_FIELDS}
+    if lexicon is not None:
+        entries = [lexicon.get(lexicon_key(w["lemma_strong"])) for w in ordered]
+        words["gloss"] = [e.gloss if e else None for e in entries]
+        words["translit"] = [e.translit if e else None for e in entries]
+
+    extra = {}
+    if include_morphology:
+        columns: dict[str, list] = {name: [] for name in MorphemeColumns.model_fields}
+        morpheme_offsets = [0]
+        for w in ordered:
+            morphemes = decode_morphology(w["morph_code"]) if w["morph_code"] else ()
+            for m in morphemes:
+                for name, values in columns.items():
+                    values.append(getattr(m, name))
+            morpheme_offsets.append(morpheme_offsets[-1] + len(morphemes))
+        extra = {"morpheme_offsets": morpheme_offsets, "morphemes": MorphemeColumns(**columns)}
+
+    return VersesColumnarResponse(
+        format="columnar",
+        total=len(verse_rows),
+        book_id=verse_rows[0]["book_id"],
+        chapter_num=verse_rows[0]["chapter_num"],
+        verses=VerseColumns(
+            id=[row["id"] for row in verse_rows],
+            verse_num=[row["verse_num"] for row in verse_rows],
+        ),
+        word_offsets=word_offsets,
+        words=WordColumns(**words),
+        **extra,
     )
 
-    if not v_resp.data:
+
+def get_verses(
+    osis_id: str,
+    chapter_num: int,
+    include_morphology: bool = False,
+    include_gloss: bool = False,
+    columnar: bool = False,
+) -> VersesListResponse | VersesColumnarResponse:
+    """
+    Return all verses with words for a given chapter.
+
+    With include_morphology, each word also carries its decoded morphemes
+    (decoded from morph_code — no extra query). With include_gloss, each word
+    carries the gloss and transliteration of its lemma from the in-process
+    lexicon (no extra query once loaded). With columnar, the same data comes
+    back as parallel arrays (VersesColumnarResponse).
+    """
+    repo = get_repository()
+
+    book = repo.book(osis_id)
+    if not book:
+        raise NotFoundError("Book", osis_id)
+
+    verse_rows, word_rows = _chapter_rows(repo, book["id"], chapter_num)
+    if not verse_rows:
         raise NotFoundError("Chapter", f"{osis_id} {chapter_num}")
 
-    verse_ids = [row["id"] for row in v_resp.data]
+    lexicon = _get_lexicon(repo) if include_gloss else None
+    with span("build"):
+        if columnar:
+            return _build_columnar(verse_rows, word_rows, include_morphology, lexicon)
+        verses = _build_verses(verse_rows, word_rows, include_morphology, lexicon)
+        return VersesListResponse(data=verses, total=len(verses))
 
-    # Fetch all words for these verses in one query
-    w_resp = (
-        sb.schema("scribeswell")
-        .table("word_read")
-        .select("id,verse_id,position,surface_he,display_he,lemma_strong,morph_code")
-        .in_("verse_id", verse_ids)
-        .order("position")
-        .execute()
-    )
 
-    # Group words by verse_id
-    words_by_verse: dict[int, list[WordResponse]] = {vid: [] for vid in verse_ids}
-    for w in w_resp.data:
-        vid = w["verse_id"]
-        if vid in words_by_verse:
-            words_by_verse[vid].append(WordResponse(**w))
+# ── Morphology decoding ───────────────────────────────────────────────────────
+
+# morph_code → decoded segments, from scribeswell.morph_code_dict (a few
+# thousand codes). Loaded on first use and kept for the life of the process:
+# a decoding never changes for a given code.
+_morph_dict: Optional[dict[str, tuple[MorphemeResponse, ...]]] = None
+_morph_dict_lock = threading.Lock()
+
+
+def _to_morphemes(segments: list[dict]) -> tuple[MorphemeResponse, ...]:
+    return tuple(MorphemeResponse(segment_index=idx, **seg) for idx, seg in enumerate(segments))
+
+
+def _get_morph_dict(repo: BibleRepository) -> dict[str, tuple[MorphemeResponse, ...]]:
+    """The whole morph code dictionary, loaded on first call."""
+    global _morph_dict
+    record_cache("morph_code_dict", hit=_morph_dict is not None)
+    if _morph_dict is not None:
+        return _morph_dict
+    with _morph_dict_lock:
+        if _morph_dict is None:
+            _morph_dict = {row["code"]: _to_morphemes(row["segments"]) for row in repo.morph_codes()}
+    return _morph_dict
+
+
+@lru_cache(maxsize=MORPH_CACHE_SIZE)
+def decode_morphology(morph_code: str) -> tuple[MorphemeResponse, ...]:
+    """
+    Decoded morphemes for an OSHB morph code: its morph_code_dict entry, or
+    the decoder's result for a code imported since the dictionary was loaded
+    (or a corpus without one, like a SQLite file).
+
+    Cached per code and shared between responses — callers must not mutate
+    the returned models.
+    """
+    stored = _get_morph_dict(get_repository()).get(morph_code)
+    if stored is not None:
+        return stored
+    return _to_morphemes([morpheme_fields(pm) for pm in parse_morph_code(morph_code)])
 
-    verses = [
-        VerseWithWordsResponse(
-            **row,
-            words=words_by_verse.get(row["id"], []),
-        )
-        for row in v_resp.data
-    ]
 
-    return VersesListResponse(data=verses, total=len(verses))
+def _word_morphemes(morph_code: Optional[str]) -> list[MorphemeResponse]:
+    return list(decode_morphology(morph_code)) if morph_code else []
+
+
+# ── Lexicon ───────────────────────────────────────────────────────────────────
+
+# Content lemma number of an OSHB lemma: last '/' segment, digits only
+_LEMMA_NUMBER_RE = re.compile(r"(\d+)[^/]*$")
+
+
+class LexiconEntry(NamedTuple):
+    gloss: Optional[str]
+    translit: Optional[str]
+
+
+# Strong's number → entry, ~8.7k entries. Loaded on first use and kept for
+# the life of the process — restart to pick up a re-imported lexicon.
+_lexicon: Optional[dict[str, LexiconEntry]] = None
+_lexicon_lock = threading.Lock()
+
+
+@lru_cache(maxsize=16384)
+def lexicon_key(lemma_strong: Optional[str]) -> Optional[str]:
+    """Lexicon key of a word's content lemma: "c/d/776" → "H776", "1254 a" → "H1254"."""
+    m = _LEMMA_NUMBER_RE.search(lemma_strong or "")
+    return f"H{int(m.group(1))}" if m else None
+
+
+def _get_lexicon(repo: BibleRepository) -> dict[str, LexiconEntry]:
+    """The whole lexicon, loaded on first call."""
+    global _lexicon
+    record_cache("lexicon", hit=_lexicon is not None)
+    if _lexicon is not None:
+        return _lexicon
+    with _lexicon_lock:
+        if _lexicon is None:
+            _lexicon = {
+                row["strong"]: LexiconEntry(row["gloss"], row["translit"]) for row in repo.lexicon()
+            }
+    return _lexicon
 
 
 # ── Word morphology ───────────────────────────────────────────────────────────
 
 def get_word_morphology(word_id: int) -> WordWithMorphologyResponse:
     """Return a word with its decoded morpheme breakdown."""
-    sb = _get_client()
-
-    w_resp = (
-        sb.schema("scribeswell")
-        .table("word_read")
-        .select("id,verse_id,position,surface_he,display_he,lemma_strong,morph_code")
-        .eq("id", word_id)
-        .single()
-        .execute()
-    )
-    if not w_resp.data:
+    word = get_repository().word(word_id)
+    if not word:
         raise NotFoundError("Word", word_id)
 
-    m_resp = (
-        sb.schema("scribeswell")
-        .table("morpheme_read")
-        .select(
-            "segment_index,language,part_of_speech,pos_code,"
-            "gender,number,state,verb_stem,verb_aspect,person"
-        )
-        .eq("word_id", word_id)
-        .order("segment_index")
-        .execute()
+    with span("build"):
+        morphemes = _word_morphemes(word["morph_code"])
+        return WordWithMorphologyResponse(**word, morphemes=morphemes)
+
+
+# ── Reader bundle ─────────────────────────────────────────────────────────────
+
+# (fetched at, version) of the active corpus
+_corpus_version: Optional[tuple[float, int]] = None
+
+
+def _active_corpus_version(repo: BibleRepository) -> int:
+    """Active corpus version, re-read at most every corpus_version_ttl_seconds."""
+    global _corpus_version
+    now = time.monotonic()
+    fresh = _corpus_version is not None and now - _corpus_version[0] < settings.corpus_version_ttl_seconds
+    record_cache("corpus_version", hit=fresh)
+    if fresh:
+        return _corpus_version[1]
+    version = repo.active_corpus_version()
+    _corpus_version = (now, version)
+    return version
+
+
+class _BookIndex(NamedTuple):
+    books: dict[str, BookResponse]       # osis_id → book
+    order: tuple[str, ...]               # osis_ids in canonical order
+    chapter_counts: dict[str, int]       # osis_id → number of chapters
+
+
+@counted_lru_cache("book_index", maxsize=2)
+def _book_index(version: int) -> _BookIndex:
+    """Every book and its chapter count, for navigation across book boundaries."""
+    repo = get_repository()
+    rows = repo.books()
+    counts_by_id = repo.chapter_counts()
+    with span("build"):
+        books = [BookResponse(**row) for row in rows]
+    return _BookIndex(
+        books={b.osis_id: b for b in books},
+        order=tuple(b.osis_id for b in books),
+        chapter_counts={b.osis_id: counts_by_id.get(b.id, 0) for b in books},
     )
 
-    morphemes = [MorphemeResponse(**row) for row in m_resp.data]
-    return WordWithMorphologyResponse(**w_resp.data, morphemes=morphemes)
+
+@counted_lru_cache("reader_chapter", maxsize=settings.reader_cache_chapters)
+def _reader_chapter(version: int, book_id: int, chapter_num: int) -> tuple[VerseWithWordsResponse, ...]:
+    """
+    One chapter's verses with morphemes and glosses on every word.
+
+    Cached per corpus version and shared between responses — callers must not
+    mutate the returned models.
+    """
+    repo = get_repository()
+    verse_rows, word_rows = _chapter_rows(repo, book_id, chapter_num)
+    lexicon = _get_lexicon(repo)
+    with span("build"):
+        return tuple(_build_verses(verse_rows, word_rows, True, lexicon))
+
+
+def _neighbours(index: _BookIndex, osis_id: str, chapter_num: int) -> tuple[Optional[ChapterRef], Optional[ChapterRef]]:
+    """Previous and next chapter, continuing into the adjacent books."""
+    pos = index.order.index(osis_id)
+    if chapter_num > 1:
+        prev = ChapterRef(osis_id=osis_id, chapter_num=chapter_num - 1)
+    elif pos > 0:
+        prev_id = index.order[pos - 1]
+        prev = ChapterRef(osis_id=prev_id, chapter_num=index.chapter_counts[prev_id])
+    else:
+        prev = None
+
+    if chapter_num < index.chapter_counts[osis_id]:
+        next_ = ChapterRef(osis_id=osis_id, chapter_num=chapter_num + 1)
+    elif pos + 1 < len(index.order):
+        next_ = ChapterRef(osis_id=index.order[pos + 1], chapter_num=1)
+    else:
+        next_ = None
+    return prev, next_
+
+
+def _reader_chapter_ref(version: int, osis_id: str, chapter_num: int) -> tuple[BookResponse, int]:
+    """(book, chapter count) of an existing chapter at `version`; NotFoundError otherwise."""
+    index = _book_index(version)
+
+    book = index.books.get(osis_id)
+    if book is None:
+        raise NotFoundError("Book", osis_id)
+    chapter_count = index.chapter_counts[osis_id]
+    if not 1 <= chapter_num <= chapter_count:
+        raise NotFoundError("Chapter", f"{osis_id} {chapter_num}")
+    return book, chapter_count
+
+
+def _reader_bundle(version: int, osis_id: str, chapter_num: int) -> ReaderBundleResponse:
+    book, chapter_count = _reader_chapter_ref(version, osis_id, chapter_num)
+    index = _book_index(version)
+
+    prev, next_ = _neighbours(index, osis_id, chapter_num)
+    verses = list(_reader_chapter(version, book.id, chapter_num))
+    with span("build"):
+        return ReaderBundleResponse(
+            corpus_version=version,
+            book=book,
+            chapter_num=chapter_num,
+            chapter_count=chapter_count,
+            prev=prev,
+            next=next_,
+            verses=verses,
+        )
+
+
+def get_reader_bundle(osis_id: str, chapter_num: int) -> ReaderBundleResponse:
+    """
+    Everything the reader needs for one chapter: book header, navigation and
+    verses with words, morphemes and glosses. Warm, it costs no queries beyond
+    the periodic corpus version check.
+    """
+    return _reader_bundle(_active_corpus_version(get_repository()), osis_id, chapter_num)
+
+
+@counted_lru_cache("reader_payload", maxsize=settings.reader_cache_chapters)
+def _reader_payload(version: int, osis_id: str, chapter_num: int, media_type: str) -> Precompressed:
+    """One chapter's bundle encoded as `media_type`, plus its gzip/Brotli variants."""
+    bundle = _reader_bundle(version, osis_id, chapter_num)
+    with span("encode", media_type):
+        body = render(bundle.model_dump(mode="json"), 200, media_type).body
+    with span("compress"):
+        return precompress(
+            body,
+            media_type,
+            gzip_level=settings.precompress_gzip_level,
+            brotli_quality=settings.precompress_brotli_quality,
+        )
+
+
+def get_corpus_version() -> int:
+    """The active corpus version — what reader bundle ETags are built from."""
+    return _active_corpus_version(get_repository())
+
+
+def check_reader_chapter(version: int, osis_id: str, chapter_num: int) -> None:
+    """
+    Raise NotFoundError unless the chapter exists at `version`. Served from
+    the cached book index, so it costs no query when warm.
+    """
+    _reader_chapter_ref(version, osis_id, chapter_num)
+
+
+def get_reader_payload(version: int, osis_id: str, chapter_num: int, media_type: str) -> Precompressed:
+    """One chapter's reader bundle at `version` (get_corpus_version()), encoded and precompressed."""
+    return _reader_payload(version, osis_id, chapter_num, media_type)
@@ -0,0 +1,456 @@
+"""
+OSHB Morphology Code Parser
+===========================
+Decodes Open Scriptures Hebrew Bible (OSHB) morphology codes into structured fields.
+
+Reference: https://hb.openscriptures.org/parsing/HebrewMorphologyCodes.html
+
+Format:  <language_prefix><segment>[/<segment>...]
+  - Language prefix: H (Hebrew) or A (Aramaic) — appears only on first segment
+  - Each segment: <POS_letter>[<feature_letters>...]
+
+Examples:
+  "HNcbsa"   → Hebrew, Noun common both singular absolute
+  "HC/Td"    → Hebrew, Conjunction / Article definite
+  "Vqp3ms"   → Verb qal perfect 3rd masculine singular
+  "Vqrmsa"   → Verb qal participle active masculine singular absolute
+
+Each part of speech has a position table (field + code map per letter),
+compiled once at import. Decoding walks the table for the segment's POS;
+segments and full codes are cached, so each distinct code is decoded once
+per process and every occurrence shares the same immutable objects.
+
+For whole-corpus work, decode_morph_codes() turns a sequence of codes into
+categorical NumPy columns (one entry per segment) plus per-code offsets.
+NumPy is only needed for that function.
+
+The one copy of the decoder: the API decodes with it, and the importer and
+benchmarks in tools/py import it from here (backend/ on sys.path), so a code
+is decoded the same way when it is stored and when it is served.
+"""
+
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import TYPE_CHECKING, Iterable, Optional
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+# ── Language ─────────────────────────────────────────────────────────────────
+
+LANGUAGE_MAP = {
+    "H": "hebrew",
+    "A": "aramaic",
+}
+
+# ── Part of Speech ────────────────────────────────────────────────────────────
+
+POS_MAP = {
+    "A": "adjective",
+    "C": "conjunction",
+    "D": "adverb",
+    "N": "noun",
+    "P": "pronoun",
+    "R": "preposition",
+    "S": "suffix",
+    "T": "particle",
+    "V": "verb",
+}
+
+# ── Sub-types (position 1 after POS) ─────────────────────────────────────────
+
+NOUN_TYPE_MAP = {
+    "c": "common",
+    "g": "gentilic",
+    "p": "proper",
+}
+
+ADJECTIVE_TYPE_MAP = {
+    "a": "adjective",
+    "c": "cardinal",
+    "g": "gentilic",
+    "o": "ordinal",
+}
+
+PRONOUN_TYPE_MAP = {
+    "d": "demonstrative",
+    "f": "indefinite",
+    "i": "interrogative",
+    "p": "personal",
+    "r": "relative",
+}
+
+PREPOSITION_TYPE_MAP = {
+    "d": "definite_article",
+}
+
+SUFFIX_TYPE_MAP = {
+    "d": "directional_he",
+    "h": "paragogic_he",
+    "n": "paragogic_nun",
+    "p": "pronominal",
+}
+
+PARTICLE_TYPE_MAP = {
+    "a": "affirmation",
+    "d": "definite_article",
+    "e": "exhortation",
+    "i": "interrogative",
+    "j": "interjection",
+    "m": "demonstrative",
+    "n": "negative",
+    "o": "direct_object",
+    "r": "relative",
+}
+
+# ── Gender ────────────────────────────────────────────────────────────────────
+
+GENDER_MAP = {
+    "b": "both",
+    "c": "common",
+    "f": "feminine",
+    "m": "masculine",
+    "u": "unknown",
+}
+
+# ── Number ────────────────────────────────────────────────────────────────────
+
+NUMBER_MAP = {
+    "d": "dual",
+    "p": "plural",
+    "s": "singular",
+    "u": "unknown",
+}
+
+# ── State ─────────────────────────────────────────────────────────────────────
+
+STATE_MAP = {
+    "a": "absolute",
+    "c": "construct",
+    "d": "determined",
+}
+
+# ── Person ────────────────────────────────────────────────────────────────────
+
+PERSON_MAP = {
+    "1": "first",
+    "2": "second",
+    "3": "third",
+}
+
+# ── Verb Stem ─────────────────────────────────────────────────────────────────
+# Stem letters mean different things in Hebrew and Aramaic (e.g. "q" is qal in
+# Hebrew, peal in Aramaic); the language prefix selects the table.
+
+VERB_STEM_MAP = {
+    "q": "qal",
+    "N": "niphal",
+    "p": "piel",
+    "P": "pual",
+    "h": "hiphil",
+    "H": "hophal",
+    "t": "hithpael",
+    "o": "polel",
+    "O": "polal",
+    "r": "hithpolel",
+    "m": "poel",
+    "M": "poal",
+    "k": "palel",
+    "K": "pulal",
+    "Q": "qal_passive",
+    "l": "pilpel",
+    "L": "polpal",
+    "f": "hithpalpel",
+    "D": "nithpael",
+    "j": "pealal",
+    "i": "pilel",
+    "u": "hothpaal",
+    "c": "tiphil",
+    "v": "hishtaphel",
+    "w": "nithpalel",
+    "y": "nithpoel",
+    "z": "hithpoel",
+}
+
+ARAMAIC_VERB_STEM_MAP = {
+    "q": "peal",
+    "Q": "peil",
+    "u": "hithpeel",
+    "p": "pael",
+    "P": "ithpaal",
+    "M": "hithpaal",
+    "a": "aphel",
+    "h": "haphel",
+    "s": "saphel",
+    "e": "shaphel",
+    "H": "hophal",
+    "i": "ithpeel",
+    "t": "hishtaphel",
+    "v": "ishtaphel",
+    "w": "hithaphel",
+    "o": "polel",
+    "z": "ithpoel",
+    "r": "hithpolel",
+    "f": "hithpalpel",
+    "b": "hephal",
+    "c": "tiphel",
+    "m": "poel",
+    "l": "palpel",
+    "L": "ithpalpel",
+    "O": "ithpolel",
+    "G": "ittaphal",
+}
+
+# ── Verb Aspect ───────────────────────────────────────────────────────────────
+
+VERB_ASPECT_MAP = {
+    "p": "perfect",
+    "q": "sequential_perfect",
+    "i": "imperfect",
+    "w": "sequential_imperfect",
+    "h": "cohortative",
+    "j": "jussive",
+    "v": "imperative",
+    "r": "participle_active",
+    "s": "participle_passive",
+    "a": "infinitive_absolute",
+    "c": "infinitive_construct",
+}
+
+
+# ── Position tables ───────────────────────────────────────────────────────────
+# Field decoded from each letter after the POS letter, per part of speech.
+# Letters missing from a table (e.g. "x" for "not applicable") decode to None.
+
+_NOMINAL = ("gender", GENDER_MAP), ("number", NUMBER_MAP), ("state", STATE_MAP)
+_PERSONAL = ("person", PERSON_MAP), ("gender", GENDER_MAP), ("number", NUMBER_MAP)
+
+_LAYOUTS: dict[str, tuple[tuple[str, dict], ...]] = {
+    "N": (("pos_type", NOUN_TYPE_MAP), *_NOMINAL),        # Ncmsa
+    "A": (("pos_type", ADJECTIVE_TYPE_MAP), *_NOMINAL),   # Aamsa, Acbpa
+    "P": (("pos_type", PRONOUN_TYPE_MAP), *_PERSONAL),    # Pp3ms, Pdxms
+    "S": (("pos_type", SUFFIX_TYPE_MAP), *_PERSONAL),     # Sp3ms, Sd
+    "T": (("pos_type", PARTICLE_TYPE_MAP),),              # Td, To, Tn
+    "R": (("pos_type", PREPOSITION_TYPE_MAP),),           # R, Rd
+    "C": (),
+    "D": (),
+}
+
+# Verbs: V<stem><aspect> then person/gender/number for finite forms,
+# gender/number/state for participles, nothing more for infinitives.
+_VERB_TAILS = {
+    "finite": _PERSONAL,
+    "participle": _NOMINAL,
+    "infinitive": (),
+}
+_VERB_FORM = {"r": "participle", "s": "participle", "a": "infinitive", "c": "infinitive"}
+
+
+def _compile_verb_layouts(stems: dict) -> dict[str, tuple[tuple[str, dict], ...]]:
+    head = (("verb_stem", stems), ("verb_aspect", VERB_ASPECT_MAP))
+    return {form: head + tail for form, tail in _VERB_TAILS.items()}
+
+
+_VERB_LAYOUTS = {
+    "hebrew": _compile_verb_layouts(VERB_STEM_MAP),
+    "aramaic": _compile_verb_layouts(ARAMAIC_VERB_STEM_MAP),
+}
+
+# Distinct codes in the OSHB number in the low thousands; this holds them all.
+MORPH_CACHE_SIZE = 16384
+
+
+@dataclass(frozen=True, slots=True)
+class ParsedMorpheme:
+    language: str              = "hebrew"
+    part_of_speech: str        = "unknown"
+    pos_code: str              = ""
+    pos_type: Optional[str]    = None
+    gender: Optional[str]      = None
+    number: Optional[str]      = None
+    state: Optional[str]       = None
+    verb_stem: Optional[str]   = None
+    verb_aspect: Optional[str] = None
+    person: Optional[str]      = None
+
+
+_UNKNOWN = (ParsedMorpheme(part_of_speech="unknown", pos_code=""),)
+
+
+def morpheme_fields(pm: ParsedMorpheme) -> dict[str, Optional[str]]:
+    """
+    A morpheme's fields by name: the shape of morph_code_dict segments,
+    morpheme rows (without pos_type) and MorphemeResponse.
+    """
+    # Built field by field: dataclasses.asdict deep-copies each value through
+    # its generic recursion, several times the cost for these flat records
+    return {
+        "language": pm.language,
+        "part_of_speech": pm.part_of_speech,
+        "pos_code": pm.pos_code,
+        "pos_type": pm.pos_type,
+        "gender": pm.gender,
+        "number": pm.number,
+        "state": pm.state,
+        "verb_stem": pm.verb_stem,
+        "verb_aspect": pm.verb_aspect,
+        "person": pm.person,
+    }
+
+
+@lru_cache(maxsize=MORPH_CACHE_SIZE)
+def _parse_segment(segment: str, language: str) -> ParsedMorpheme:
+    """Parse a single morpheme segment (after stripping language prefix)."""
+    if not segment:
+        return ParsedMorpheme(language=language, pos_code=segment)
+
+    pos_letter = segment[0]
+    if pos_letter == "V":
+        layout = _VERB_LAYOUTS[language][_VERB_FORM.get(segment[2:3], "finite")]
+    else:
+        layout = _LAYOUTS.get(pos_letter, ())
+
+    fields = {}
+    for (name, table), letter in zip(layout, segment[1:]):
+        value = table.get(letter)
+        if value is not None:
+            fields[name] = value
+
+    return ParsedMorpheme(
+        language=language,
+        part_of_speech=POS_MAP.get(pos_letter, "unknown"),
+        pos_code=segment,
+        **fields,
+    )
+
+
+@lru_cache(maxsize=MORPH_CACHE_SIZE)
+def parse_morph_code(morph_code: str) -> tuple[ParsedMorpheme, ...]:
+    """
+    Parse a full OSHB morph code string into ParsedMorpheme objects.
+
+    Results are cached per code string and the morphemes are immutable, so
+    repeated codes return the same shared objects.
+
+    Args:
+        morph_code: e.g. "HC/Td/Ncbsa" or "HVqp3ms"
+
+    Returns:
+        Tuple of ParsedMorpheme, one per '/' segment.
+        Returns (ParsedMorpheme(part_of_speech='unknown'),) on empty/None input.
+    """
+    if not morph_code:
+        return _UNKNOWN
+
+    code = morph_code.strip()
+
+    # Detect language prefix on first character
+    language = "hebrew"
+    if code and code[0] in LANGUAGE_MAP:
+        language = LANGUAGE_MAP[code[0]]
+        code = code[1:]  # strip language prefix
+
+    result = tuple(
+        _parse_segment(seg, language)
+        for seg in (s.strip() for s in code.split("/"))
+        if seg
+    )
+    return result or _UNKNOWN
+
+
+# ── Batch decoding ────────────────────────────────────────────────────────────
+
+def _categories(*maps: dict, extra: tuple[str, ...] = ()) -> tuple[str, ...]:
+    return tuple(dict.fromkeys(v for m in maps for v in m.values())) + extra
+
+
+# Fixed, spec-ordered categories: the integer codes are stable across runs, so
+# they can be stored (e.g. as Parquet dictionary columns) and compared directly.
+MORPH_CATEGORIES: dict[str, tuple[str, ...]] = {
+    "language": _categories(LANGUAGE_MAP),
+    "part_of_speech": _categories(POS_MAP, extra=("unknown",)),
+    "pos_type": _categories(
+        NOUN_TYPE_MAP, ADJECTIVE_TYPE_MAP, PRONOUN_TYPE_MAP,
+        PREPOSITION_TYPE_MAP, SUFFIX_TYPE_MAP, PARTICLE_TYPE_MAP,
+    ),
+    "verb_stem": _categories(VERB_STEM_MAP, ARAMAIC_VERB_STEM_MAP),
+    "verb_aspect": _categories(VERB_ASPECT_MAP),
+    "person": _categories(PERSON_MAP),
+    "gender": _categories(GENDER_MAP),
+    "number": _categories(NUMBER_MAP),
+    "state": _categories(STATE_MAP),
+}
+
+
+@dataclass(frozen=True)
+class MorphColumns:
+    """
+    Decoded morphology for a batch of codes, one array entry per segment.
+
+    Segments of code i are rows offsets[i]:offsets[i + 1]. Each column holds
+    int8 indexes into MORPH_CATEGORIES[name], -1 where the field is absent
+    (the pandas.Categorical.from_codes / pyarrow.DictionaryArray convention).
+    """
+    offsets: "np.ndarray"         # int64, len(codes) + 1
+    code_index: "np.ndarray"      # int64, input position of each segment
+    segment_index: "np.ndarray"   # int16, position within its code
+    columns: dict[str, "np.ndarray"]
+
+    def __len__(self) -> int:
+        return len(self.code_index)
+
+    def labels(self, name: str) -> "np.ndarray":
+        """Column `name` as an object array of strings / None."""
+        import numpy as np
+
+        lookup = np.array(MORPH_CATEGORIES[name] + (None,), dtype=object)
+        return lookup[self.columns[name]]  # -1 picks the trailing None
+
+
+def decode_morph_codes(codes: Iterable[Optional[str]]) -> MorphColumns:
+    """
+    Decode many morph codes at once into categorical columns.
+
+    Each distinct code is parsed once (through the parse_morph_code cache);
+    the results are then broadcast to every occurrence with array indexing.
+    Empty / None codes yield the single "unknown" segment, as in
+    parse_morph_code.
+
+    Args:
+        codes: any sequence or array of codes, e.g. every word.morph_code
+            in corpus order.
+    """
+    import numpy as np
+
+    arr = np.asarray([c or "" for c in codes], dtype=str)
+    distinct, inverse = np.unique(arr, return_inverse=True)
+    inverse = inverse.reshape(-1)
+
+    # Decode table: one row per segment of each distinct code
+    decoded = [parse_morph_code(code) for code in distinct.tolist()]
+    seg_counts = np.fromiter((len(d) for d in decoded), dtype=np.int64, count=len(decoded))
+    seg_starts = np.concatenate(([0], np.cumsum(seg_counts)[:-1])).astype(np.int64)
+    index = {name: {v: i for i, v in enumerate(cats)} for name, cats in MORPH_CATEGORIES.items()}
+    table = {
+        name: np.fromiter(
+            (lookup.get(getattr(m, name), -1) for d in decoded for m in d),
+            dtype=np.int8,
+        )
+        for name, lookup in index.items()
+    }
+
+    # Broadcast to the input: segment j of input code i reads table row
+    # seg_starts[inverse[i]] + (j - offsets[i])
+    counts = seg_counts[inverse]
+    offsets = np.concatenate(([0], np.cumsum(counts))).astype(np.int64)
+    code_index = np.repeat(np.arange(len(arr), dtype=np.int64), counts)
+    segment_index = np.arange(offsets[-1], dtype=np.int64) - offsets[code_index]
+    rows = seg_starts[inverse][code_index] + segment_index
+
+    return MorphColumns(
+        offsets=offsets,
+        code_index=code_index,
+        segment_index=segment_index.astype(np.int16),
+        columns={name: col[rows] for name, col in table.items()},
+    )
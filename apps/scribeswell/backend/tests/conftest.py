@@ -0,0 +1,65 @@
+"""
+Shared test setup: backend modules and tools/py importable, and settings
+that need no Supabase project (environment variables win over .env files).
+
+Run:
+    cd apps/scribeswell/backend
+    pip install -r requirements-dev.txt
+    python -m pytest -q
+"""
+import json
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+BACKEND = Path(__file__).resolve().parents[1]
+TOOLS = BACKEND.parent / "tools" / "py"
+sys.path[:0] = [str(BACKEND), str(TOOLS)]
+
+os.environ.update({
+    "SUPABASE_URL": "https://test.supabase.invalid",
+    "SUPABASE_SECRET_KEY": "test",
+    "SUPABASE_JWT_SECRET": "test-secret",
+    "JWT_JWKS_URL": "",
+    "BIBLE_REPOSITORY": "supabase",
+})
+
+
+@pytest.fixture(scope="session")
+def corpus_file(tmp_path_factory) -> Path:
+    """
+    A SQLite corpus file (version 7) of two synthetic books, Ruth and Jonah,
+    written by the importer exactly as import_bible.py --sqlite does.
+    """
+    from import_bible import BibleImporter
+    from synthetic_oshb import generate_corpus
+
+    root = tmp_path_factory.mktemp("corpus")
+    source = root / "hebrew.json"
+    source.write_text(json.dumps(generate_corpus(scale=0.2, seed=3, books=["Ruth", "Jonah"])))
+    path = root / "corpus.sqlite3"
+    BibleImporter("", "", sqlite_path=path).run(source, sqlite_version=7)
+    return path
+
+
+@pytest.fixture
+def client(corpus_file, monkeypatch):
+    """A TestClient (lifespan run) of the app serving `corpus_file`."""
+    from fastapi.testclient import TestClient
+
+    import main
+    from config import settings
+    from services import bible_repository, bible_service
+
+    monkeypatch.setattr(settings, "bible_repository", "sqlite")
+    monkeypatch.setattr(settings, "sqlite_path", str(corpus_file))
+    monkeypatch.setattr(bible_service, "_corpus_version", None)
+    monkeypatch.setattr(bible_service, "_morph_dict", None)
+    bible_service.decode_morphology.cache_clear()
+    bible_repository.get_repository.cache_clear()
+    with TestClient(main.create_app()) as client:
+        yield client
+    bible_service.decode_morphology.cache_clear()
+    bible_repository.get_repository.cache_clear()
@@ -0,0 +1,152 @@
+"""Response compression (compression.py): Accept-Encoding, precompressed reader bundles, the middleware."""
+import gzip
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse
+from fastapi.testclient import TestClient
+
+import compression
+from compression import choose_encoding, precompress
+from services import bible_service
+
+brotli = pytest.importorskip("brotli")
+
+READER = "/api/bible/reader/Ruth/1"
+VERSES = "/api/bible/books/Ruth/chapters/1/verses"
+
+
+def _raw(client, url: str, **headers):
+    """(response, body as sent): httpx would otherwise decode it."""
+    with client.stream("GET", url, headers=headers) as response:
+        return response, b"".join(response.iter_raw())
+
+
+@pytest.mark.parametrize("accept_encoding, expected", [
+    (None, None),
+    ("", None),
+    ("identity", None),
+    ("gzip", "gzip"),
+    ("gzip, deflate, br", "br"),  # Brotli wins a tie
+    ("br;q=0.5, gzip", "gzip"),
+    ("br;q=0", None),
+    ("br;q=0, gzip;q=0", None),
+    ("*", "br"),
+    ("GZIP;q=0.8", "gzip"),
+    ("br;q=x", None),  # malformed q: not acceptable
+    ("br;q=x, gzip;q=0.1", "gzip"),
+])
+def test_choose_encoding(accept_encoding, expected):
+    assert choose_encoding(accept_encoding) == expected
+
+
+def test_without_brotli_star_means_gzip(monkeypatch):
+    monkeypatch.setattr(compression, "brotli", None)
+
+    assert choose_encoding("br, *") == "gzip"
+    assert choose_encoding("br") is None
+
+
+def test_precompress_round_trips():
+    body = b'{"words": ["bereshit", "bara"]}' * 100
+    payload = precompress(body, "application/json")
+
+    assert payload.identity == body
+    assert gzip.decompress(payload.gzip) == body
+    assert brotli.decompress(payload.br) == body
+    assert precompress(body, "application/json").gzip == payload.gzip  # mtime=0: stable bytes
+
+
+# ── precompressed reader bundles ──────────────────────────────────────────────
+
+@pytest.mark.parametrize("accept_encoding, encoding, variant", [
+    ("br, gzip", "br", "br"),
+    ("gzip", "gzip", "gzip"),
+    ("identity", None, "identity"),
+])
+def test_reader_bundle_is_served_precompressed(client, accept_encoding, encoding, variant):
+    response, body = _raw(client, READER, **{"Accept-Encoding": accept_encoding})
+
+    payload = bible_service.get_reader_payload(7, "Ruth", 1, "application/json")
+    assert response.status_code == 200
+    assert response.headers.get("content-encoding") == encoding
+    assert body == getattr(payload, variant)  # the cached bytes, not compressed again
+    assert "Accept-Encoding" in response.headers["vary"]
+
+
+def test_reader_bundle_is_compressed_once(client, monkeypatch):
+    calls = []
+    real = bible_service.precompress
+    monkeypatch.setattr(bible_service, "precompress", lambda *a, **kw: calls.append(a[1]) or real(*a, **kw))
+
+    for accept_encoding in ("br", "gzip", "identity", "br"):
+        client.get("/api/bible/reader/Jonah/1", headers={"Accept-Encoding": accept_encoding})
+
+    assert calls == ["application/json"]
+
+
+def test_binary_bundle_has_its_own_variants(client):
+    response, body = _raw(client, READER, **{"Accept": "application/cbor", "Accept-Encoding": "gzip"})
+
+    payload = bible_service.get_reader_payload(7, "Ruth", 1, "application/cbor")
+    assert response.headers["content-type"] == "application/cbor"
+    assert body == payload.gzip
+
+
+def test_precompressed_falls_back_to_gzip_without_brotli(client, monkeypatch):
+    payload = bible_service.get_reader_payload(7, "Ruth", 1, "application/json")
+    monkeypatch.setattr(bible_service, "get_reader_payload", lambda *args: payload._replace(br=None))
+
+    response, body = _raw(client, READER, **{"Accept-Encoding": "br"})
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert body == payload.gzip
+
+
+# ── CompressionMiddleware on other responses ──────────────────────────────────
+
+def test_large_responses_are_compressed_per_request(client):
+    identity = client.get(VERSES, headers={"Accept-Encoding": "identity"})
+
+    response, body = _raw(client, VERSES, **{"Accept-Encoding": "gzip"})
+
+    assert len(identity.content) >= 1024
+    assert response.headers["content-encoding"] == "gzip"
+    assert int(response.headers["content-length"]) == len(body)
+    assert gzip.decompress(body) == identity.content
+    assert "Accept-Encoding" in response.headers["vary"]
+
+
+def test_small_responses_are_not_compressed(client):
+    response, body = _raw(client, "/health", **{"Accept-Encoding": "br, gzip"})
+
+    assert "content-encoding" not in response.headers
+    assert body.startswith(b"{")
+
+
+def test_small_responses_still_vary_on_accept_encoding(client):
+    response, _ = _raw(client, "/health", **{"Accept-Encoding": "identity"})
+
+    assert "Accept-Encoding" in response.headers["vary"]
+
+
+def test_identity_response_varies_on_accept_encoding(client):
+    response, body = _raw(client, VERSES, **{"Accept-Encoding": ""})
+
+    assert "content-encoding" not in response.headers
+    assert len(body) >= 1024
+    assert "Accept-Encoding" in response.headers["vary"]
+
+
+def test_no_transform_responses_are_passed_through():
+    app = FastAPI()
+    app.add_middleware(compression.CompressionMiddleware, minimum_size=16)
+
+    @app.get("/signed")
+    def signed():
+        return PlainTextResponse("x" * 4096, headers={"Cache-Control": "private, No-Transform"})
+
+    response, body = _raw(TestClient(app), "/signed", **{"Accept-Encoding": "gzip"})
+
+    assert "content-encoding" not in response.headers
+    assert body == b"x" * 4096
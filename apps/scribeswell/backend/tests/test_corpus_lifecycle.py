@@ -0,0 +1,99 @@
+"""Importer corpus lifecycle calls (tools/py/import_bible.py): which RPCs are replayed, and how a lost promote is confirmed."""
+import pytest
+
+from import_bible import BibleImporter
+
+
+class Result:
+    def __init__(self, data):
+        self.data = data
+
+    def execute(self):
+        return self
+
+
+class FakeScribeswell:
+    """The scribeswell schema over PostgREST: rpc() and corpus_version_read, with scripted failures."""
+
+    def __init__(self, active: int = 3):
+        self.active = active
+        self.calls: list[str] = []
+        self.lose_response: set[str] = set()  # commit, then drop the response
+        self.fail: dict[str, BaseException] = {}
+
+    def rpc(self, fn, params):
+        self.calls.append(fn)
+        if fn in self.fail:
+            raise self.fail.pop(fn)
+        if fn == "promote_staging":
+            self.active += 1
+        elif fn == "rollback_corpus":
+            self.active -= 1
+        if fn in self.lose_response:
+            self.lose_response.discard(fn)
+            raise TimeoutError("read timed out")
+        return Result(self.active if fn in ("promote_staging", "rollback_corpus") else None)
+
+    def table(self, name):
+        assert name == "corpus_version_read"
+        return self
+
+    def select(self, columns):
+        return self
+
+    def eq(self, column, value):
+        return Result([{"version": self.active}])
+
+
+@pytest.fixture
+def importer():
+    importer = BibleImporter("", "", dry_run=True, max_retries=3)
+    importer.writer.base_delay = 0.0
+    importer._clients["scribeswell"] = FakeScribeswell()
+    yield importer
+    importer.writer.close()
+
+
+def _db(importer) -> FakeScribeswell:
+    return importer._clients["scribeswell"]
+
+
+@pytest.mark.parametrize("method, fn, expected", [
+    ("promote", "promote_staging", 4),
+    ("rollback", "rollback_corpus", 2),
+])
+def test_lost_response_of_a_committed_switch_is_not_replayed(importer, method, fn, expected):
+    _db(importer).lose_response.add(fn)
+
+    assert getattr(importer, method)() == expected
+    assert _db(importer).calls == [fn]
+    assert _db(importer).active == expected
+
+
+@pytest.mark.parametrize("method, fn", [
+    ("promote", "promote_staging"),
+    ("rollback", "rollback_corpus"),
+])
+def test_switch_that_did_not_commit_raises(importer, method, fn):
+    _db(importer).fail[fn] = ConnectionError("connection reset")
+
+    with pytest.raises(ConnectionError):
+        getattr(importer, method)()
+    assert _db(importer).calls == [fn]
+    assert _db(importer).active == 3
+
+
+def test_create_staging_is_sent_once(importer):
+    _db(importer).fail["create_staging"] = TimeoutError("read timed out")
+
+    with pytest.raises(TimeoutError):
+        importer._rpc("create_staging", retry=False)
+    assert _db(importer).calls == ["create_staging"]
+
+
+def test_idempotent_calls_are_retried(importer):
+    _db(importer).fail["pending_staging_indexes"] = TimeoutError("read timed out")
+
+    importer._rpc("pending_staging_indexes")
+
+    assert _db(importer).calls == ["pending_staging_indexes"] * 2
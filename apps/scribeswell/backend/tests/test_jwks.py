@@ -0,0 +1,182 @@
+"""JWKSCache and asymmetric token verification against the local JWKS stand-in (tools/py/fake_jwks.py)."""
+import hashlib
+import hmac
+import json
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+from jose import jwt
+from jose.utils import base64url_encode
+
+from auth import jwks as jwks_module
+from auth import jwt_optional
+from auth.jwks import JWKSCache
+from fake_jwks import JWKS_PATH, FakeJwks
+
+
+def _wait_for(condition, timeout: float = 5.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.01)
+    return condition()
+
+
+@pytest.fixture
+def stand_in():
+    keys = FakeJwks(max_age=600)
+    server = keys.serve()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    keys.url = f"http://127.0.0.1:{server.server_port}{JWKS_PATH}"
+    keys.server = server
+    yield keys
+    server.shutdown()
+    server.server_close()
+
+
+def _kid(token: str) -> str:
+    return jwt.get_unverified_header(token)["kid"]
+
+
+@pytest.mark.parametrize("alg", ["ES256", "RS256"])
+def test_get_returns_the_key_for_a_kid(stand_in, alg):
+    cache = JWKSCache(stand_in.url)
+    cache.refresh()
+    token = stand_in.token(alg=alg)
+
+    key, key_alg = cache.get(_kid(token))
+
+    assert key_alg == alg
+    assert jwt.decode(token, key, algorithms=[alg], options={"verify_aud": False})["sub"]
+
+
+def test_unknown_kid_is_none(stand_in):
+    cache = JWKSCache(stand_in.url)
+    cache.refresh()
+
+    assert cache.get("not-a-kid") is None
+    assert cache.get(None) is None
+
+
+def test_max_age_sets_expiry(stand_in):
+    stand_in.max_age = 120
+    cache = JWKSCache(stand_in.url, ttl_seconds=600)
+    cache.refresh()
+
+    assert cache.expires_at - cache.fetched_at == 120
+
+
+def test_rotated_kid_is_refetched(stand_in):
+    cache = JWKSCache(stand_in.url, min_refresh_seconds=0)
+    cache.start()
+    assert _wait_for(lambda: cache.fetched_at > 0)
+    old_kid = _kid(stand_in.token())
+
+    stand_in.rotate()
+    token = stand_in.token()
+    new_kid = _kid(token)
+
+    assert cache.get(new_kid) is None  # not fetched yet; wakes the refresh thread
+    assert _wait_for(lambda: cache.get(new_kid) is not None)
+    key, alg = cache.get(new_kid)
+    assert jwt.decode(token, key, algorithms=[alg], options={"verify_aud": False})
+    assert cache.get(old_kid) is not None  # still published after the rotation
+
+
+def test_early_refresh_is_rate_limited(stand_in):
+    cache = JWKSCache(stand_in.url, min_refresh_seconds=3600)
+    cache.start()
+    assert _wait_for(lambda: cache.fetched_at > 0)
+    fetched_at = cache.fetched_at
+
+    cache.get("unknown-1")  # wakes the thread once...
+    assert _wait_for(lambda: cache.fetched_at > fetched_at)
+    stand_in.rotate()
+    new_kid = _kid(stand_in.token())
+    cache.get(new_kid)  # ...and not again within min_refresh_seconds
+    time.sleep(0.2)
+
+    assert cache.get(new_kid) is None
+
+
+def test_stale_keys_are_served_while_the_endpoint_is_down(stand_in, monkeypatch):
+    cache = JWKSCache(stand_in.url, max_stale_seconds=3600)
+    cache.refresh()
+    kid = _kid(stand_in.token())
+    stand_in.server.shutdown()
+    stand_in.server.server_close()
+
+    with pytest.raises(OSError):
+        cache.refresh()
+    now = cache.expires_at + 1800  # expired, but within max_stale
+    monkeypatch.setattr(jwks_module, "time", SimpleNamespace(time=lambda: now, monotonic=time.monotonic))
+
+    assert cache.get(kid) is not None
+
+
+def test_keys_past_max_stale_are_dropped(stand_in, monkeypatch):
+    cache = JWKSCache(stand_in.url, max_stale_seconds=60)
+    cache.refresh()
+    kid = _kid(stand_in.token())
+    now = cache.expires_at + 61
+    monkeypatch.setattr(jwks_module, "time", SimpleNamespace(time=lambda: now, monotonic=time.monotonic))
+
+    assert cache.get(kid) is None
+
+
+def test_refresh_thread_keeps_serving_after_a_failure(stand_in):
+    stand_in.max_age = 0  # due for a refresh every min_refresh_seconds
+    cache = JWKSCache(stand_in.url, min_refresh_seconds=0.05)
+    cache.start()
+    assert _wait_for(lambda: cache.fetched_at > 0)
+    kid = _kid(stand_in.token())
+
+    stand_in.server.shutdown()
+    stand_in.server.server_close()
+
+    assert _wait_for(lambda: cache.last_error is not None)
+    assert cache.get(kid) is not None
+
+
+# ── verification through auth/jwt_optional.py ─────────────────────────────────
+
+@pytest.fixture
+def verifier(stand_in, monkeypatch):
+    cache = JWKSCache(stand_in.url)
+    cache.refresh()
+    monkeypatch.setattr(jwt_optional, "jwks", cache)
+    monkeypatch.setattr(jwt_optional, "_verified", type(jwt_optional._verified)())
+    return stand_in
+
+
+@pytest.mark.parametrize("alg", ["ES256", "RS256"])
+def test_asymmetric_tokens_verify(verifier, alg):
+    claims = jwt_optional._decode_token(verifier.token(sub="user-1", roles=("admin",), alg=alg))
+
+    assert claims["sub"] == "user-1"
+    assert claims["user_roles"] == ["admin"]
+
+
+def test_hs256_token_signed_with_a_public_key_is_rejected(verifier):
+    kid = _kid(verifier.token(alg="ES256"))
+    public_pem = jwt_optional.jwks.get(kid)[0].to_pem()
+    # The algorithm-confusion forgery: HMAC keyed with the published public key
+    # (built by hand, as jose refuses to sign it)
+    signing_input = b".".join(
+        base64url_encode(json.dumps(part).encode())
+        for part in ({"alg": "HS256", "typ": "JWT", "kid": kid}, {"sub": "attacker"})
+    )
+    signature = base64url_encode(hmac.new(public_pem, signing_input, hashlib.sha256).digest())
+    forged = (signing_input + b"." + signature).decode()
+
+    assert jwt_optional._decode_token(forged) is None
+
+
+def test_token_of_an_unknown_key_is_rejected(verifier):
+    other = FakeJwks()
+
+    assert jwt_optional._decode_token(other.token()) is None
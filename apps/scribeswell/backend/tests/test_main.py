@@ -0,0 +1,24 @@
+"""main.py at import: no app built, no client library loaded; main.app built once on first access."""
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+BACKEND = Path(__file__).resolve().parents[1]
+
+PROBE = """
+import sys
+import main
+assert "app" not in vars(main), "main.app built at import"
+loaded = [name for name in ("jose", "supabase", "asyncpg") if name in sys.modules]
+assert not loaded, loaded
+app = main.app
+assert main.app is app
+"""
+
+
+def test_importing_main_builds_no_app():
+    # A fresh interpreter: the test session has already imported main and jose
+    proc = subprocess.run([sys.executable, "-c", PROBE], cwd=BACKEND, env=os.environ, capture_output=True, text=True)
+
+    assert proc.returncode == 0, proc.stderr
@@ -0,0 +1,56 @@
+"""Prometheus metrics (metrics.py): route labels, and nothing recorded with metrics off."""
+import pytest
+from fastapi.testclient import TestClient
+from prometheus_client import REGISTRY
+
+import main
+import metrics
+from config import settings
+from services import bible_service
+
+
+def _requests(route: str) -> float:
+    return REGISTRY.get_sample_value(
+        "http_request_duration_seconds_count", {"method": "GET", "route": route, "status": "200"}
+    ) or 0.0
+
+
+@pytest.fixture
+def metered(client, monkeypatch):
+    """`client`'s app, rebuilt with metrics_enabled."""
+    monkeypatch.setattr(settings, "metrics_enabled", True)
+    with TestClient(main.create_app()) as metered:
+        yield metered
+
+
+@pytest.mark.parametrize("url, route", [
+    ("/api/bible/books/Ruth", "/api/bible/books/{osis_id}"),  # included with a prefix
+    ("/health", "/health"),
+])
+def test_requests_are_labelled_with_the_full_route_template(metered, url, route):
+    before = _requests(route)
+
+    assert metered.get(url).status_code == 200
+    assert _requests(route) == before + 1
+
+
+def test_unmatched_paths_share_one_label(metered):
+    before = REGISTRY.get_sample_value(
+        "http_request_duration_seconds_count", {"method": "GET", "route": metrics.UNMATCHED_ROUTE, "status": "404"}
+    ) or 0.0
+
+    metered.get("/no/such/path")
+
+    assert REGISTRY.get_sample_value(
+        "http_request_duration_seconds_count", {"method": "GET", "route": metrics.UNMATCHED_ROUTE, "status": "404"}
+    ) == before + 1
+
+
+def test_caches_are_not_counted_with_metrics_off(client):
+    assert not settings.metrics_enabled
+    before = REGISTRY.get_sample_value("cache_requests_total", {"cache": "reader_payload"})
+
+    client.get("/api/bible/reader/Ruth/1")
+
+    assert bible_service.record_cache is not metrics.record_cache
+    assert REGISTRY.get_sample_value("cache_requests_total", {"cache": "reader_payload"}) == before
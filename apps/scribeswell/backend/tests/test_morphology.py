@@ -0,0 +1,63 @@
+"""Word morphology: scribeswell.morph_code_dict first, the decoder for codes it lacks."""
+import pytest
+
+from services import bible_repository, bible_service
+from services.oshb_morph import parse_morph_code
+
+
+class DictRepository:
+    """Serves only morph_codes(): one stored decoding that differs from the decoder's."""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.loads = 0
+
+    def morph_codes(self):
+        self.loads += 1
+        return self.rows
+
+
+@pytest.fixture
+def repo(monkeypatch):
+    repo = DictRepository([{
+        "code": "HNcbsa",
+        "segments": [{"language": "hebrew", "part_of_speech": "noun", "pos_code": "Nc", "pos_type": "stored"}],
+    }])
+    monkeypatch.setattr(bible_service, "get_repository", lambda: repo)
+    monkeypatch.setattr(bible_service, "_morph_dict", None)
+    bible_service.decode_morphology.cache_clear()
+    yield repo
+    bible_service.decode_morphology.cache_clear()
+
+
+def test_stored_decoding_is_served(repo):
+    (morpheme,) = bible_service.decode_morphology("HNcbsa")
+
+    assert morpheme.pos_type == "stored"
+    assert morpheme.segment_index == 0
+
+
+def test_code_missing_from_the_dictionary_is_decoded(repo):
+    morphemes = bible_service.decode_morphology("HC/Vqw3ms")
+
+    assert [m.segment_index for m in morphemes] == [0, 1]
+    assert [m.pos_code for m in morphemes] == [pm.pos_code for pm in parse_morph_code("HC/Vqw3ms")]
+    assert morphemes[1].verb_stem == "qal"
+
+
+def test_dictionary_is_loaded_once(repo):
+    for code in ("HNcbsa", "HC/Vqw3ms", "HNcmpa", "HNcbsa"):
+        bible_service.decode_morphology(code)
+
+    assert repo.loads == 1
+
+
+def test_sqlite_corpus_decodes_every_code(client):
+    word = client.get("/api/bible/books/Ruth/chapters/1/verses").json()["data"][0]["words"][0]
+
+    response = client.get(f"/api/bible/words/{word['id']}/morphology")
+
+    assert response.status_code == 200
+    morphemes = response.json()["morphemes"]
+    assert [m["pos_code"] for m in morphemes] == [pm.pos_code for pm in parse_morph_code(word["morph_code"])]
+    assert bible_repository.get_repository().morph_codes() == []
@@ -0,0 +1,138 @@
+"""The table-driven OSHB decoder (services/oshb_morph.py): one case per position layout."""
+import dataclasses
+
+import pytest
+
+from services.oshb_morph import MORPH_CATEGORIES, ParsedMorpheme, morpheme_fields, parse_morph_code
+
+
+def _one(code: str) -> ParsedMorpheme:
+    (morpheme,) = parse_morph_code(code)
+    return morpheme
+
+
+@pytest.mark.parametrize("code, expected", [
+    # Nominal: type, gender, number, state
+    ("HNcmsa", dict(part_of_speech="noun", pos_type="common", gender="masculine", number="singular", state="absolute")),
+    ("HNpfsc", dict(part_of_speech="noun", pos_type="proper", gender="feminine", number="singular", state="construct")),
+    ("HAcbpa", dict(part_of_speech="adjective", pos_type="cardinal", gender="both", number="plural", state="absolute")),
+    ("HAofsd", dict(part_of_speech="adjective", pos_type="ordinal", gender="feminine", number="singular", state="determined")),
+    # Personal: type, person, gender, number
+    ("HPp3ms", dict(part_of_speech="pronoun", pos_type="personal", person="third", gender="masculine", number="singular")),
+    ("HSp2fp", dict(part_of_speech="suffix", pos_type="pronominal", person="second", gender="feminine", number="plural")),
+    ("HSd", dict(part_of_speech="suffix", pos_type="directional_he", person=None)),
+    # "x" (not applicable) decodes to None without shifting later positions
+    ("HPdxms", dict(part_of_speech="pronoun", pos_type="demonstrative", person=None, gender="masculine", number="singular")),
+    # Type only
+    ("HTo", dict(part_of_speech="particle", pos_type="direct_object")),
+    ("HRd", dict(part_of_speech="preposition", pos_type="definite_article")),
+    ("HR", dict(part_of_speech="preposition", pos_type=None)),
+    # No fields
+    ("HC", dict(part_of_speech="conjunction", pos_type=None, gender=None)),
+    ("HD", dict(part_of_speech="adverb")),
+])
+def test_non_verb_layouts(code, expected):
+    morpheme = _one(code)
+
+    assert morpheme.language == "hebrew"
+    assert morpheme.pos_code == code[1:]
+    for field, value in expected.items():
+        assert getattr(morpheme, field) == value, field
+
+
+@pytest.mark.parametrize("code, expected", [
+    # Finite: stem, aspect, person, gender, number
+    ("HVqp3ms", dict(verb_stem="qal", verb_aspect="perfect", person="third", gender="masculine", number="singular")),
+    ("HVNw1cp", dict(verb_stem="niphal", verb_aspect="sequential_imperfect", person="first", gender="common", number="plural")),
+    ("HVhv2fs", dict(verb_stem="hiphil", verb_aspect="imperative", person="second", gender="feminine", number="singular")),
+    # Participle: stem, aspect, gender, number, state
+    ("HVqrmsa", dict(verb_stem="qal", verb_aspect="participle_active", person=None, gender="masculine", number="singular", state="absolute")),
+    ("HVPsfpc", dict(verb_stem="pual", verb_aspect="participle_passive", gender="feminine", number="plural", state="construct")),
+    # Infinitive: stem and aspect only
+    ("HVqc", dict(verb_stem="qal", verb_aspect="infinitive_construct", person=None, gender=None)),
+    ("HVpa", dict(verb_stem="piel", verb_aspect="infinitive_absolute")),
+])
+def test_verb_layouts(code, expected):
+    morpheme = _one(code)
+
+    assert morpheme.part_of_speech == "verb"
+    for field, value in expected.items():
+        assert getattr(morpheme, field) == value, field
+
+
+@pytest.mark.parametrize("code, hebrew, aramaic", [
+    ("Vqp3ms", "qal", "peal"),
+    ("Vhp3ms", "hiphil", "haphel"),
+    ("VHp3ms", "hophal", "hophal"),
+    ("Vtp3ms", "hithpael", "hishtaphel"),
+])
+def test_stem_letters_follow_the_language(code, hebrew, aramaic):
+    hebrew_form = _one(f"H{code}")
+
+    assert hebrew_form.verb_stem == hebrew
+    assert _one(f"A{code}") == dataclasses.replace(hebrew_form, language="aramaic", verb_stem=aramaic)
+
+
+def test_segments_share_the_language_prefix():
+    conj, article, noun = parse_morph_code("AC/Td/Ncmsd")
+
+    assert [m.language for m in (conj, article, noun)] == ["aramaic"] * 3
+    assert [m.part_of_speech for m in (conj, article, noun)] == ["conjunction", "particle", "noun"]
+    assert noun.state == "determined"
+
+
+def test_prefixed_and_suffixed_word():
+    parts = parse_morph_code("HC/Vqw3ms/Sp3fs")
+
+    assert [m.part_of_speech for m in parts] == ["conjunction", "verb", "suffix"]
+    assert parts[2].person == "third" and parts[2].gender == "feminine"
+
+
+@pytest.mark.parametrize("code", ["", None, "H", "/", "H//"])
+def test_empty_codes_are_one_unknown_segment(code):
+    assert parse_morph_code(code) == (ParsedMorpheme(part_of_speech="unknown", pos_code=""),)
+
+
+def test_unknown_letters_are_unknown_not_errors():
+    morpheme = _one("HXzz")
+
+    assert morpheme.part_of_speech == "unknown"
+    assert morpheme.pos_code == "Xzz"
+
+
+def test_repeated_codes_share_one_decoding():
+    assert parse_morph_code("HNcmsa") is parse_morph_code("HNcmsa")
+    assert parse_morph_code("HC/Ncmsa")[1] is parse_morph_code("HR/Ncmsa")[1]
+
+
+def test_morpheme_fields_has_every_field():
+    for pm in parse_morph_code("HC/Vqw3ms/Sp3fs"):
+        assert morpheme_fields(pm) == dataclasses.asdict(pm)
+
+
+def test_importer_rows_come_from_the_same_fields():
+    from import_bible import decode_morph_code, morph_dict_row
+
+    code = "HC/Vqw3ms"
+    row = morph_dict_row(code)
+
+    assert row["segment_count"] == 2
+    assert row["segments"] == [morpheme_fields(pm) for pm in parse_morph_code(code)]
+    assert list(decode_morph_code(code)) == [
+        {k: v for k, v in seg.items() if k != "pos_type"} for seg in row["segments"]
+    ]
+
+
+def test_batch_columns_match_the_per_code_decoding():
+    pytest.importorskip("numpy")
+    from services.oshb_morph import decode_morph_codes
+
+    codes = ["HC/Vqw3ms", "HNcmsa", None, "HC/Vqw3ms", "AVqp3ms"]
+    columns = decode_morph_codes(codes)
+
+    assert columns.offsets.tolist() == [0, 2, 3, 4, 6, 7]
+    assert columns.code_index.tolist() == [0, 0, 1, 2, 3, 3, 4]
+    assert columns.segment_index.tolist() == [0, 1, 0, 0, 0, 1, 0]
+    expected = [m for code in codes for m in parse_morph_code(code)]
+    for name in MORPH_CATEGORIES:
+        assert columns.labels(name).tolist() == [getattr(m, name) for m in expected], name
@@ -0,0 +1,97 @@
+"""Signed ?__profile links (profiling.py): bound to method, path, query, format and expiry."""
+from urllib.parse import urlencode
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+import profiling
+from profiling import ProfileRequestMiddleware, sign_profile_query
+
+KEY = "test-signing-key"
+
+
+@pytest.fixture
+def client():
+    app = FastAPI()
+    app.add_middleware(ProfileRequestMiddleware, signing_key=KEY)
+
+    @app.get("/items/{item}")
+    def item(item: str, page: int = 1):
+        return {"item": item, "page": page}
+
+    @app.post("/items/{item}")
+    def update(item: str):
+        return {"updated": item}
+
+    return TestClient(app)
+
+
+def _flags(query: str) -> str:
+    """The __profile parameters of a signed query, without the endpoint's own."""
+    return "&".join(part for part in query.split("&") if part.startswith(profiling.PROFILE_PARAM))
+
+
+def test_signed_request_is_profiled(client):
+    query = sign_profile_query(KEY, "/items/a?page=2")
+
+    response = client.get(f"/items/a?{query}")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert response.headers["x-profiled-status"] == "200"
+
+
+def test_parameter_order_does_not_matter(client):
+    query = sign_profile_query(KEY, "/items/a?page=2&extra=x")
+
+    response = client.get(f"/items/a?{_flags(query)}&extra=x&page=2")
+
+    assert response.status_code == 200
+
+
+@pytest.mark.parametrize("request_path", [
+    "/items/a?page=3",           # another query
+    "/items/a",                  # the query dropped
+    "/items/a?page=2&page=3",    # a parameter added
+    "/items/b?page=2",           # another path
+])
+def test_link_does_not_transfer_to_another_request(client, request_path):
+    query = _flags(sign_profile_query(KEY, "/items/a?page=2"))
+    sep = "&" if "?" in request_path else "?"
+
+    response = client.get(f"{request_path}{sep}{query}")
+
+    assert response.status_code == 403
+
+
+def test_link_is_bound_to_the_method(client):
+    get_query = sign_profile_query(KEY, "/items/a")
+    post_query = sign_profile_query(KEY, "/items/a", method="POST")
+
+    assert client.post(f"/items/a?{get_query}").status_code == 403
+    assert client.post(f"/items/a?{post_query}").status_code == 200
+
+
+def test_link_is_bound_to_the_format(client):
+    query = sign_profile_query(KEY, "/items/a").replace(f"{profiling.PROFILE_PARAM}=1", f"{profiling.PROFILE_PARAM}=svg")
+
+    assert client.get(f"/items/a?{query}").status_code == 403
+
+
+def test_expired_or_unsigned_link_is_rejected(client, monkeypatch):
+    query = sign_profile_query(KEY, "/items/a", ttl=60)
+    monkeypatch.setattr(profiling.time, "time", lambda: 10**12)
+
+    assert client.get(f"/items/a?{query}").status_code == 403
+    assert client.get(f"/items/a?{urlencode({profiling.PROFILE_PARAM: 1})}").status_code == 403
+
+
+def test_other_key_is_rejected(client):
+    query = sign_profile_query("another-key", "/items/a")
+
+    assert client.get(f"/items/a?{query}").status_code == 403
+
+
+def test_request_without_the_flag_is_untouched(client):
+    assert client.get("/items/a?page=4").json() == {"item": "a", "page": 4}
@@ -0,0 +1,83 @@
+"""GET /api/bible/reader/{osis_id}/{n}: per-representation ETags and If-None-Match."""
+import pytest
+
+from routers.bible import _etag_matches
+from services import bible_service
+
+READER = "/api/bible/reader/Ruth/1"
+
+
+def test_bundle_has_a_versioned_etag(client):
+    response = client.get(READER)
+
+    assert response.status_code == 200
+    assert response.headers["etag"] == 'W/"7-Ruth-1-json"'
+    assert response.headers["cache-control"] == "public, max-age=300"
+    assert response.json()["book"]["osis_id"] == "Ruth"
+
+
+@pytest.mark.parametrize("accept, tag", [
+    ("application/json", "json"),
+    ("application/msgpack", "msgpack"),
+    ("application/cbor", "cbor"),
+])
+def test_each_media_type_has_its_own_etag(client, accept, tag):
+    response = client.get(READER, headers={"Accept": accept})
+
+    assert response.headers["etag"] == f'W/"7-Ruth-1-{tag}"'
+    assert "Accept" in response.headers["vary"]
+
+
+def test_matching_if_none_match_is_304(client):
+    etag = client.get(READER).headers["etag"]
+
+    response = client.get(READER, headers={"If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert response.headers["etag"] == etag
+    assert response.content == b""
+
+
+def test_etag_of_another_representation_is_not_a_match(client):
+    json_etag = client.get(READER).headers["etag"]
+
+    response = client.get(READER, headers={"If-None-Match": json_etag, "Accept": "application/msgpack"})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/msgpack"
+
+
+def test_304_does_not_build_the_bundle(client, monkeypatch):
+    etag = client.get("/api/bible/reader/Jonah/2").headers["etag"]
+
+    def fail(*args):
+        raise AssertionError("bundle built for a 304")
+
+    monkeypatch.setattr(bible_service, "get_reader_payload", fail)
+    response = client.get("/api/bible/reader/Jonah/2", headers={"If-None-Match": etag})
+
+    assert response.status_code == 304
+
+
+@pytest.mark.parametrize("header, matches", [
+    ('W/"7-Ruth-1-json"', True),
+    ('"7-Ruth-1-json"', True),                              # weak comparison: W/ ignored
+    ('W/"6-Ruth-1-json", W/"7-Ruth-1-json"', True),         # any tag in the list
+    ('  W/"x" ,W/"7-Ruth-1-json"  ', True),
+    ("*", True),
+    ('W/"7-Ruth-1-json-old"', False),                       # not a substring test
+    ('W/"7-Ruth-1"', False),
+    ('W/"17-Ruth-1-json"', False),
+    ("", False),
+    (None, False),
+])
+def test_etag_matches(header, matches):
+    assert _etag_matches(header, "7-Ruth-1-json") is matches
+
+
+@pytest.mark.parametrize("path", ["/api/bible/reader/Ge%22n/1", "/api/bible/reader/Nope/1", "/api/bible/reader/Ruth/99"])
+def test_unknown_chapter_is_404_without_an_etag(client, path):
+    response = client.get(path, headers={"If-None-Match": 'W/"7-Ruth-1-json"'})
+
+    assert response.status_code == 404
+    assert "etag" not in response.headers
@@ -0,0 +1,60 @@
+"""Content negotiation (renderers.py): JSON, MessagePack or CBOR per the Accept header."""
+import cbor2
+import msgpack
+import pytest
+
+from renderers import CBOR_MEDIA_TYPE, JSON_MEDIA_TYPE, MSGPACK_MEDIA_TYPE, negotiate
+
+VERSES = "/api/bible/books/Ruth/chapters/1/verses"
+
+
+@pytest.mark.parametrize("accept, expected", [
+    (None, JSON_MEDIA_TYPE),
+    ("", JSON_MEDIA_TYPE),
+    ("*/*", JSON_MEDIA_TYPE),
+    ("application/*", JSON_MEDIA_TYPE),
+    ("text/html", JSON_MEDIA_TYPE),  # nothing we produce: JSON anyway
+    ("application/msgpack", MSGPACK_MEDIA_TYPE),
+    ("application/vnd.msgpack", MSGPACK_MEDIA_TYPE),
+    ("application/x-msgpack", MSGPACK_MEDIA_TYPE),
+    ("Application/CBOR", CBOR_MEDIA_TYPE),
+    ("application/cbor, application/msgpack", CBOR_MEDIA_TYPE),  # tie: listed first wins
+    ("application/json;q=0.5, application/msgpack", MSGPACK_MEDIA_TYPE),
+    ("application/msgpack;q=0.2, application/cbor;q=0.8", CBOR_MEDIA_TYPE),
+    ("application/msgpack ; q=0.9, */*;q=0.1", MSGPACK_MEDIA_TYPE),
+    ("application/msgpack;q=0", JSON_MEDIA_TYPE),  # q=0: not acceptable
+    ("application/msgpack;q=oops", JSON_MEDIA_TYPE),
+])
+def test_negotiate(accept, expected):
+    assert negotiate(accept) == expected
+
+
+def test_json_by_default(client):
+    response = client.get(VERSES)
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == JSON_MEDIA_TYPE
+    assert "Accept" in response.headers["vary"]
+
+
+@pytest.mark.parametrize("media_type, decode", [
+    (MSGPACK_MEDIA_TYPE, lambda body: msgpack.unpackb(body, raw=False)),
+    (CBOR_MEDIA_TYPE, cbor2.loads),
+])
+def test_binary_formats_carry_the_json_body(client, media_type, decode):
+    expected = client.get(VERSES).json()
+
+    response = client.get(VERSES, headers={"Accept": media_type})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == media_type
+    assert "Accept" in response.headers["vary"]
+    assert decode(response.content) == expected
+
+
+def test_errors_are_negotiated_too(client):
+    response = client.get("/api/bible/books/Nope", headers={"Accept": MSGPACK_MEDIA_TYPE})
+
+    assert response.status_code == 404
+    assert response.headers["content-type"] == MSGPACK_MEDIA_TYPE
+    assert msgpack.unpackb(response.content)["error"]
@@ -0,0 +1,245 @@
+"""WriteScheduler (tools/py/write_scheduler.py): retries with backoff, batch splits, adaptive sizing."""
+import threading
+
+import pytest
+
+import write_scheduler
+from write_scheduler import WriteError, WriteScheduler, is_throttle, is_transient
+
+
+class ApiError(Exception):
+    """Stand-in for postgrest.APIError: carries an HTTP status or SQLSTATE in .code."""
+
+    def __init__(self, code: str):
+        self.code = code
+        super().__init__(code)
+
+
+class Upserts:
+    """A send() that records batches and fails the ones `fail` says to."""
+
+    def __init__(self, fail=None):
+        self.fail = fail or (lambda rows, attempt: None)
+        self.calls: list[list[dict]] = []
+        self.written: list[dict] = []
+        self._attempts: dict[tuple, int] = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, table, rows, on_conflict, returning):
+        key = tuple(r["id"] for r in rows)
+        with self._lock:
+            self.calls.append(rows)
+            attempt = self._attempts[key] = self._attempts.get(key, 0) + 1
+        exc = self.fail(rows, attempt)
+        if exc is not None:
+            raise exc
+        with self._lock:
+            self.written.extend(rows)
+        if returning:
+            return [{"id": r["id"]} for r in rows]
+        return None
+
+
+def _rows(n: int) -> list[dict]:
+    return [{"id": i, "text": f"row {i}"} for i in range(n)]
+
+
+@pytest.fixture
+def scheduler_for():
+    made = []
+
+    def make(send, **kwargs):
+        kwargs.setdefault("base_delay", 0.0)
+        kwargs.setdefault("concurrency", 1)
+        scheduler = WriteScheduler(send, **kwargs)
+        made.append(scheduler)
+        return scheduler
+
+    yield make
+    for scheduler in made:
+        scheduler.close()
+
+
+@pytest.mark.parametrize("exc, transient, throttle", [
+    (TimeoutError(), True, True),
+    (ConnectionError(), True, False),
+    (ApiError("429"), True, True),
+    (ApiError("502"), True, False),
+    (ApiError("57014"), True, True),
+    (ApiError("23505"), False, False),  # unique_violation
+    (ValueError("bad row"), False, False),
+])
+def test_error_classification(exc, transient, throttle):
+    assert is_transient(exc) is transient
+    assert is_throttle(exc) is throttle
+
+
+def test_rows_are_written_in_batches(scheduler_for):
+    send = Upserts()
+    scheduler = scheduler_for(send, batch_size=100, concurrency=4)
+
+    scheduler.write("word", _rows(950), on_conflict="id")
+
+    assert sorted(r["id"] for r in send.written) == list(range(950))
+    assert max(len(c) for c in send.calls) <= scheduler.max_batch_size
+    assert scheduler.stats["word"].rows == 950
+
+
+def test_returning_collects_echoed_rows(scheduler_for):
+    scheduler = scheduler_for(Upserts(), batch_size=10, concurrency=3)
+
+    echoed = scheduler.write("verse", _rows(45), on_conflict="id", returning="id")
+
+    assert sorted(r["id"] for r in echoed) == list(range(45))
+
+
+def test_transient_failure_is_retried(scheduler_for):
+    send = Upserts(fail=lambda rows, attempt: ApiError("502") if attempt < 3 else None)
+    scheduler = scheduler_for(send, batch_size=10)
+
+    scheduler.write("word", _rows(10), on_conflict="id")
+
+    stats = scheduler.stats["word"]
+    assert len(send.calls) == 3
+    assert stats.retries == 2
+    assert stats.splits == 0
+    assert stats.rows == 10
+
+
+def test_retry_delay_grows_exponentially_with_full_jitter(scheduler_for, monkeypatch):
+    bounds = []
+    monkeypatch.setattr(write_scheduler.random, "uniform", lambda lo, hi: bounds.append((lo, hi)) or 0.0)
+    send = Upserts(fail=lambda rows, attempt: ApiError("503") if attempt <= 4 else None)
+    scheduler = scheduler_for(send, base_delay=0.5, max_delay=3.0, max_retries=5, batch_size=10)
+
+    scheduler.write("word", _rows(10), on_conflict="id")
+
+    assert bounds == [(0, 1.0), (0, 2.0), (0, 3.0), (0, 3.0)]
+
+
+def test_retry_sleeps_for_the_backoff_delay(scheduler_for, monkeypatch):
+    slept = []
+    monkeypatch.setattr(write_scheduler.random, "uniform", lambda lo, hi: hi)
+    monkeypatch.setattr(write_scheduler.time, "sleep", slept.append)
+    send = Upserts(fail=lambda rows, attempt: TimeoutError() if attempt == 1 else None)
+    scheduler = scheduler_for(send, base_delay=0.25, batch_size=10)
+
+    scheduler.write("word", _rows(10), on_conflict="id")
+
+    assert slept == [0.5]
+
+
+def test_statement_timeout_splits_the_batch(scheduler_for):
+    # Any batch of more than two rows times out on the server; smaller ones succeed.
+    send = Upserts(fail=lambda rows, attempt: ApiError("57014") if len(rows) > 2 else None)
+    scheduler = scheduler_for(send, batch_size=8, min_batch_size=1)
+
+    scheduler.write("word", _rows(8), on_conflict="id")
+
+    stats = scheduler.stats["word"]
+    assert sorted(r["id"] for r in send.written) == list(range(8))
+    assert stats.splits == 3  # 8 → 4 + 4, each 4 → 2 + 2
+    assert stats.retries == 0
+    assert [len(c) for c in send.calls] == [8, 4, 2, 2, 4, 2, 2]
+
+
+def test_halves_inherit_the_remaining_retries(scheduler_for):
+    send = Upserts(fail=lambda rows, attempt: ApiError("413") if len(rows) > 1 else ApiError("503"))
+    scheduler = scheduler_for(send, batch_size=64, max_retries=3)
+
+    with pytest.raises(WriteError):
+        scheduler.write("word", _rows(64), on_conflict="id")
+
+    # 64 → 32 → 16 → 8: three splits spend the budget, the 8-row batch is the last try
+    assert [len(c) for c in send.calls] == [64, 32, 16, 8]
+
+
+@pytest.mark.parametrize("code", ["503", "57014", "413"])
+def test_always_failing_send_is_bounded(scheduler_for, code):
+    send = Upserts(fail=lambda rows, attempt: ApiError(code))
+    scheduler = scheduler_for(send, batch_size=500, max_retries=5)
+
+    with pytest.raises(WriteError) as raised:
+        scheduler.write("word", _rows(500), on_conflict="id")
+
+    assert len(send.calls) == 6  # the first send and max_retries retries, never a bisection
+    assert raised.value.cause.code == code
+
+
+def test_transient_error_that_does_not_split_is_resent_whole(scheduler_for):
+    send = Upserts(fail=lambda rows, attempt: TimeoutError() if attempt <= 2 else None)
+    scheduler = scheduler_for(send, batch_size=8)
+
+    scheduler.write("word", _rows(8), on_conflict="id")
+
+    assert [len(c) for c in send.calls] == [8, 8, 8]
+    assert scheduler.stats["word"].splits == 0
+
+
+@pytest.mark.parametrize("exc", [ApiError("23505"), ApiError("400"), ValueError("bad row")])
+def test_permanent_error_aborts_at_once(scheduler_for, exc):
+    send = Upserts(fail=lambda rows, attempt: exc)
+    scheduler = scheduler_for(send, batch_size=4)
+
+    with pytest.raises(WriteError) as raised:
+        scheduler.write("word", _rows(4), on_conflict="id")
+
+    assert len(send.calls) == 1
+    assert raised.value.table == "word"
+    assert [r["id"] for r in raised.value.rows] == [0, 1, 2, 3]
+    assert raised.value.cause is exc
+    assert scheduler.stats["word"].retries == scheduler.stats["word"].splits == 0
+
+
+def test_throttle_halves_the_batch_size(scheduler_for):
+    sizes = []
+
+    def fail(rows, attempt):
+        sizes.append(scheduler.stats["word"].batch_size)
+        return ApiError("429") if attempt == 1 else None
+
+    scheduler = scheduler_for(Upserts(fail=fail), batch_size=100, min_batch_size=10)
+
+    scheduler.write("word", _rows(100), on_conflict="id")
+
+    assert scheduler.stats["word"].throttles == 1
+    assert sizes == [100, 50]  # halved before the retry went out
+
+
+def test_slow_batches_shrink_and_fast_full_batches_grow(scheduler_for):
+    scheduler = scheduler_for(Upserts(), batch_size=100, min_batch_size=10, target_latency=1.0)
+    stats = write_scheduler.TableWriteStats(batch_size=100)
+
+    scheduler._on_success(stats, write_scheduler._Batch(_rows(100)), latency=2.0)
+    assert stats.batch_size == 50
+    scheduler._on_success(stats, write_scheduler._Batch(_rows(50)), latency=0.1)
+    assert stats.batch_size == 63
+    scheduler._on_success(stats, write_scheduler._Batch(_rows(10)), latency=0.1)
+    assert stats.batch_size == 63  # a short tail batch says nothing about capacity
+
+
+def test_batches_stay_under_the_payload_cap(scheduler_for):
+    send = Upserts()
+    rows = [{"id": i, "text": "x" * 1000} for i in range(50)]
+    scheduler = scheduler_for(send, batch_size=500, max_payload_bytes=10_000)
+
+    scheduler.write("word", rows, on_conflict="id")
+
+    assert max(len(c) for c in send.calls) <= 9
+
+
+def test_call_retries_transient_errors_only(scheduler_for):
+    attempts = []
+
+    def flaky():
+        attempts.append(1)
+        if len(attempts) < 3:
+            raise ConnectionError()
+        return "ids"
+
+    scheduler = scheduler_for(Upserts())
+
+    assert scheduler.call(flaky) == "ids"
+    assert len(attempts) == 3
+    with pytest.raises(ValueError):
+        scheduler.call(lambda: (_ for _ in ()).throw(ValueError("no")))
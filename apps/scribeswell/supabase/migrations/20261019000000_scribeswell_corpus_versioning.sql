@@ -0,0 +1,222 @@
+-- ============================================================
+-- Corpus versioning — staged import + atomic promote
+-- The importer loads a full corpus into scribeswell_staging while the API
+-- keeps reading the active version through the *_read views. Promote
+-- renames staging to scribeswell_v<N> and repoints the views in one
+-- transaction; the previous version schema is kept for instant rollback.
+--
+-- The base tables in `scribeswell` are version 0 and double as the
+-- DDL template for staging (CREATE TABLE ... LIKE). Column changes made to
+-- the base tables apply to the next staged import, not to versions already
+-- promoted.
+-- ============================================================
+
+-- ── corpus_version ──────────────────────────────────────────
+CREATE TABLE scribeswell.corpus_version (
+    version       INT         PRIMARY KEY,
+    schema_name   TEXT        NOT NULL UNIQUE,
+    status        TEXT        NOT NULL CHECK (status IN ('active','retired','rolled_back')),
+    created_at    TIMESTAMPTZ NOT NULL DEFAULT now(),
+    promoted_at   TIMESTAMPTZ
+);
+
+-- Exactly one active version at a time
+CREATE UNIQUE INDEX idx_corpus_version_active
+    ON scribeswell.corpus_version(status) WHERE status = 'active';
+
+INSERT INTO scribeswell.corpus_version (version, schema_name, status, promoted_at)
+VALUES (0, 'scribeswell', 'active', now());
+
+CREATE OR REPLACE VIEW scribeswell.corpus_version_read AS
+    SELECT version, schema_name, status, created_at, promoted_at
+    FROM scribeswell.corpus_version;
+
+ALTER TABLE scribeswell.corpus_version ENABLE ROW LEVEL SECURITY;
+
+CREATE POLICY "scribeswell.corpus_version: public read"
+    ON scribeswell.corpus_version FOR SELECT TO anon, authenticated USING (true);
+
+GRANT SELECT ON scribeswell.corpus_version TO anon;
+GRANT SELECT ON scribeswell.corpus_version_read TO anon, authenticated;
+
+-- ── _point_read_views ───────────────────────────────────────
+-- Repoint every *_read view at the tables of the given schema.
+CREATE OR REPLACE FUNCTION scribeswell._point_read_views(p_schema TEXT)
+RETURNS void
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = ''
+AS $$
+DECLARE
+    t TEXT;
+BEGIN
+    FOREACH t IN ARRAY ARRAY['book','chapter','verse','word','morpheme'] LOOP
+        EXECUTE format(
+            'CREATE OR REPLACE VIEW scribeswell.%I AS SELECT * FROM %I.%I',
+            t || '_read', p_schema, t
+        );
+    END LOOP;
+END;
+$$;
+
+-- ── create_staging ──────────────────────────────────────────
+-- (Re)create an empty scribeswell_staging schema mirroring the base tables.
+CREATE OR REPLACE FUNCTION scribeswell.create_staging()
+RETURNS void
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = ''
+AS $$
+DECLARE
+    t TEXT;
+BEGIN
+    DROP SCHEMA IF EXISTS scribeswell_staging CASCADE;
+    CREATE SCHEMA scribeswell_staging;
+
+    -- INCLUDING ALL copies defaults, CHECKs, PK/UNIQUE and indexes; FKs are not
+    -- copied by LIKE and are added below against the staging tables.
+    FOREACH t IN ARRAY ARRAY['book','chapter','verse','word','morpheme'] LOOP
+        EXECUTE format(
+            'CREATE TABLE scribeswell_staging.%I (LIKE scribeswell.%I INCLUDING ALL)', t, t
+        );
+        EXECUTE format('ALTER TABLE scribeswell_staging.%I ENABLE ROW LEVEL SECURITY', t);
+    END LOOP;
+
+    ALTER TABLE scribeswell_staging.chapter
+        ADD FOREIGN KEY (book_id) REFERENCES scribeswell_staging.book(id);
+    ALTER TABLE scribeswell_staging.verse
+        ADD FOREIGN KEY (chapter_id) REFERENCES scribeswell_staging.chapter(id),
+        ADD FOREIGN KEY (book_id) REFERENCES scribeswell_staging.book(id);
+    ALTER TABLE scribeswell_staging.word
+        ADD FOREIGN KEY (verse_id) REFERENCES scribeswell_staging.verse(id);
+    ALTER TABLE scribeswell_staging.morpheme
+        ADD FOREIGN KEY (word_id) REFERENCES scribeswell_staging.word(id);
+
+    GRANT USAGE ON SCHEMA scribeswell_staging TO service_role;
+    GRANT SELECT, INSERT, UPDATE, DELETE
+        ON ALL TABLES IN SCHEMA scribeswell_staging TO service_role;
+
+    NOTIFY pgrst, 'reload schema';
+END;
+$$;
+
+-- ── promote_staging ─────────────────────────────────────────
+-- Rename staging to scribeswell_v<N>, repoint the *_read views and mark it
+-- active — all in one transaction, so readers see the old corpus or the new
+-- one, never a mix. Returns the new version number.
+CREATE OR REPLACE FUNCTION scribeswell.promote_staging()
+RETURNS INT
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = ''
+AS $$
+DECLARE
+    v_version INT;
+    v_schema  TEXT;
+    t         TEXT;
+BEGIN
+    IF to_regnamespace('scribeswell_staging') IS NULL THEN
+        RAISE EXCEPTION 'No staged corpus to promote — run create_staging() and import first';
+    END IF;
+
+    -- Serialise concurrent promote/rollback calls
+    LOCK TABLE scribeswell.corpus_version IN EXCLUSIVE MODE;
+
+    SELECT coalesce(max(version), 0) + 1 INTO v_version FROM scribeswell.corpus_version;
+    v_schema := 'scribeswell_v' || v_version;
+
+    -- Fresh planner statistics before the first reader hits the new tables
+    FOREACH t IN ARRAY ARRAY['book','chapter','verse','word','morpheme'] LOOP
+        EXECUTE format('ANALYZE scribeswell_staging.%I', t);
+    END LOOP;
+
+    EXECUTE format('ALTER SCHEMA scribeswell_staging RENAME TO %I', v_schema);
+    EXECUTE format('REVOKE INSERT, UPDATE, DELETE ON ALL TABLES IN SCHEMA %I FROM service_role', v_schema);
+    PERFORM scribeswell._point_read_views(v_schema);
+
+    UPDATE scribeswell.corpus_version SET status = 'retired' WHERE status = 'active';
+    INSERT INTO scribeswell.corpus_version (version, schema_name, status, promoted_at)
+    VALUES (v_version, v_schema, 'active', now());
+
+    NOTIFY pgrst, 'reload schema';
+    RETURN v_version;
+END;
+$$;
+
+-- ── rollback_corpus ─────────────────────────────────────────
+-- Repoint the *_read views at the most recent retired version that still
+-- exists. Returns the version now active.
+CREATE OR REPLACE FUNCTION scribeswell.rollback_corpus()
+RETURNS INT
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = ''
+AS $$
+DECLARE
+    v_active   scribeswell.corpus_version;
+    v_previous scribeswell.corpus_version;
+BEGIN
+    LOCK TABLE scribeswell.corpus_version IN EXCLUSIVE MODE;
+
+    SELECT * INTO v_active FROM scribeswell.corpus_version WHERE status = 'active';
+
+    SELECT * INTO v_previous
+    FROM scribeswell.corpus_version
+    WHERE status = 'retired'
+      AND version < v_active.version
+      AND to_regnamespace(schema_name) IS NOT NULL
+    ORDER BY version DESC
+    LIMIT 1;
+
+    IF v_previous.version IS NULL THEN
+        RAISE EXCEPTION 'No retained corpus version to roll back to';
+    END IF;
+
+    PERFORM scribeswell._point_read_views(v_previous.schema_name);
+
+    UPDATE scribeswell.corpus_version SET status = 'rolled_back' WHERE version = v_active.version;
+    UPDATE scribeswell.corpus_version
+        SET status = 'active', promoted_at = now()
+        WHERE version = v_previous.version;
+
+    NOTIFY pgrst, 'reload schema';
+    RETURN v_previous.version;
+END;
+$$;
+
+-- ── drop_corpus_version ─────────────────────────────────────
+-- Free the storage of an inactive version. Version 0 (the base tables) and
+-- the active version are never dropped.
+CREATE OR REPLACE FUNCTION scribeswell.drop_corpus_version(p_version INT)
+RETURNS void
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = ''
+AS $$
+DECLARE
+    v_row scribeswell.corpus_version;
+BEGIN
+    SELECT * INTO v_row FROM scribeswell.corpus_version WHERE version = p_version;
+    IF v_row.version IS NULL THEN
+        RAISE EXCEPTION 'Unknown corpus version %', p_version;
+    END IF;
+    IF v_row.status = 'active' OR v_row.schema_name = 'scribeswell' THEN
+        RAISE EXCEPTION 'Corpus version % cannot be dropped', p_version;
+    END IF;
+
+    EXECUTE format('DROP SCHEMA IF EXISTS %I CASCADE', v_row.schema_name);
+    DELETE FROM scribeswell.corpus_version WHERE version = p_version;
+END;
+$$;
+
+-- ── Function access — import pipeline only ──────────────────
+REVOKE EXECUTE ON FUNCTION scribeswell._point_read_views(TEXT)      FROM PUBLIC, anon, authenticated;
+REVOKE EXECUTE ON FUNCTION scribeswell.create_staging()             FROM PUBLIC, anon, authenticated;
+REVOKE EXECUTE ON FUNCTION scribeswell.promote_staging()            FROM PUBLIC, anon, authenticated;
+REVOKE EXECUTE ON FUNCTION scribeswell.rollback_corpus()            FROM PUBLIC, anon, authenticated;
+REVOKE EXECUTE ON FUNCTION scribeswell.drop_corpus_version(INT)     FROM PUBLIC, anon, authenticated;
+
+GRANT EXECUTE ON FUNCTION scribeswell.create_staging()         TO service_role;
+GRANT EXECUTE ON FUNCTION scribeswell.promote_staging()        TO service_role;
+GRANT EXECUTE ON FUNCTION scribeswell.rollback_corpus()        TO service_role;
+GRANT EXECUTE ON FUNCTION scribeswell.drop_corpus_version(INT) TO service_role;
@@ -0,0 +1,194 @@
+-- ============================================================
+-- Deferred index build for staged bulk loads
+-- `import_bible.py --staged --defer-indexes` loads scribeswell_staging with
+-- no secondary indexes and no UNIQUE / FK constraints, so rows are appended
+-- without per-row index maintenance or constraint checks. Afterwards every
+-- index is rebuilt (one RPC per index, so several build at once) and the
+-- foreign keys are re-added and validated in a single pass per table.
+--
+-- Primary keys are kept: the importer needs the generated ids echoed back.
+-- ============================================================
+
+-- ── staging_deferred_ddl ────────────────────────────────────
+-- Definitions captured before dropping, replayed by the build functions.
+CREATE TABLE scribeswell.staging_deferred_ddl (
+    object_name   TEXT        PRIMARY KEY,
+    table_name    TEXT        NOT NULL,
+    kind          TEXT        NOT NULL CHECK (kind IN ('index','unique','foreign_key')),
+    ddl           TEXT        NOT NULL
+);
+
+ALTER TABLE scribeswell.staging_deferred_ddl ENABLE ROW LEVEL SECURITY;
+REVOKE ALL ON scribeswell.staging_deferred_ddl FROM anon, authenticated;
+
+-- ── defer_staging_indexes ───────────────────────────────────
+-- Record and drop every FK, UNIQUE constraint and non-PK index on the staging
+-- tables. Returns the index/constraint names to pass to build_staging_index().
+CREATE OR REPLACE FUNCTION scribeswell.defer_staging_indexes()
+RETURNS TEXT[]
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = ''
+AS $$
+DECLARE
+    r RECORD;
+BEGIN
+    IF to_regnamespace('scribeswell_staging') IS NULL THEN
+        RAISE EXCEPTION 'No staging schema — run create_staging() first';
+    END IF;
+
+    DELETE FROM scribeswell.staging_deferred_ddl;
+
+    -- Foreign keys first: the unique indexes they reference cannot be dropped
+    -- while they exist. Re-added NOT VALID, then validated in finish_staging_load().
+    FOR r IN
+        SELECT c.conname, t.relname, pg_get_constraintdef(c.oid) AS def
+        FROM pg_constraint c
+        JOIN pg_class t ON t.oid = c.conrelid
+        WHERE t.relnamespace = 'scribeswell_staging'::regnamespace
+          AND c.contype = 'f'
+    LOOP
+        INSERT INTO scribeswell.staging_deferred_ddl (object_name, table_name, kind, ddl)
+        VALUES (r.conname, r.relname, 'foreign_key',
+                format('ALTER TABLE scribeswell_staging.%I ADD CONSTRAINT %I %s NOT VALID',
+                       r.relname, r.conname, r.def));
+        EXECUTE format('ALTER TABLE scribeswell_staging.%I DROP CONSTRAINT %I', r.relname, r.conname);
+    END LOOP;
+
+    FOR r IN
+        SELECT c.conname, t.relname, pg_get_constraintdef(c.oid) AS def
+        FROM pg_constraint c
+        JOIN pg_class t ON t.oid = c.conrelid
+        WHERE t.relnamespace = 'scribeswell_staging'::regnamespace
+          AND c.contype = 'u'
+    LOOP
+        INSERT INTO scribeswell.staging_deferred_ddl (object_name, table_name, kind, ddl)
+        VALUES (r.conname, r.relname, 'unique',
+                format('ALTER TABLE scribeswell_staging.%I ADD CONSTRAINT %I %s',
+                       r.relname, r.conname, r.def));
+        EXECUTE format('ALTER TABLE scribeswell_staging.%I DROP CONSTRAINT %I', r.relname, r.conname);
+    END LOOP;
+
+    -- Plain secondary indexes (PK indexes back a constraint and are kept)
+    FOR r IN
+        SELECT i.relname AS indexname, t.relname, pg_get_indexdef(i.oid) AS def
+        FROM pg_index x
+        JOIN pg_class i ON i.oid = x.indexrelid
+        JOIN pg_class t ON t.oid = x.indrelid
+        WHERE t.relnamespace = 'scribeswell_staging'::regnamespace
+          AND NOT EXISTS (SELECT 1 FROM pg_constraint c WHERE c.conindid = x.indexrelid)
+    LOOP
+        INSERT INTO scribeswell.staging_deferred_ddl (object_name, table_name, kind, ddl)
+        VALUES (r.indexname, r.relname, 'index', r.def);
+        EXECUTE format('DROP INDEX scribeswell_staging.%I', r.indexname);
+    END LOOP;
+
+    RETURN scribeswell.pending_staging_indexes();
+END;
+$$;
+
+-- ── pending_staging_indexes ─────────────────────────────────
+CREATE OR REPLACE FUNCTION scribeswell.pending_staging_indexes()
+RETURNS TEXT[]
+LANGUAGE sql
+STABLE
+SECURITY DEFINER
+SET search_path = ''
+AS $$
+    SELECT coalesce(array_agg(object_name ORDER BY table_name, object_name), '{}')
+    FROM scribeswell.staging_deferred_ddl
+    WHERE kind IN ('index','unique');
+$$;
+
+-- ── build_staging_index ─────────────────────────────────────
+-- Rebuild one deferred index or UNIQUE constraint. Called concurrently by the
+-- importer; each btree build may also use parallel maintenance workers.
+CREATE OR REPLACE FUNCTION scribeswell.build_staging_index(p_name TEXT)
+RETURNS void
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = ''
+SET max_parallel_maintenance_workers = 4
+SET maintenance_work_mem = '256MB'
+AS $$
+DECLARE
+    v_ddl TEXT;
+BEGIN
+    SELECT ddl INTO v_ddl
+    FROM scribeswell.staging_deferred_ddl
+    WHERE object_name = p_name AND kind IN ('index','unique');
+
+    IF v_ddl IS NULL THEN
+        RAISE EXCEPTION 'No deferred index or constraint named %', p_name;
+    END IF;
+
+    EXECUTE v_ddl;
+    DELETE FROM scribeswell.staging_deferred_ddl WHERE object_name = p_name;
+END;
+$$;
+
+-- ── finish_staging_load ─────────────────────────────────────
+-- Re-add foreign keys (NOT VALID, then VALIDATE — one scan per constraint
+-- without blocking reads) and refresh planner statistics.
+CREATE OR REPLACE FUNCTION scribeswell.finish_staging_load()
+RETURNS void
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = ''
+AS $$
+DECLARE
+    r RECORD;
+    t TEXT;
+BEGIN
+    IF cardinality(scribeswell.pending_staging_indexes()) > 0 THEN
+        RAISE EXCEPTION 'Deferred indexes not yet built: %', scribeswell.pending_staging_indexes();
+    END IF;
+
+    FOR r IN
+        SELECT * FROM scribeswell.staging_deferred_ddl WHERE kind = 'foreign_key'
+    LOOP
+        EXECUTE r.ddl;
+        EXECUTE format('ALTER TABLE scribeswell_staging.%I VALIDATE CONSTRAINT %I',
+                       r.table_name, r.object_name);
+    END LOOP;
+    DELETE FROM scribeswell.staging_deferred_ddl;
+
+    FOREACH t IN ARRAY ARRAY['book','chapter','verse','word','morpheme'] LOOP
+        EXECUTE format('ANALYZE scribeswell_staging.%I', t);
+    END LOOP;
+END;
+$$;
+
+-- ── analyze_corpus ──────────────────────────────────────────
+-- Refresh planner statistics after an in-place (non-staged) import.
+CREATE OR REPLACE FUNCTION scribeswell.analyze_corpus(p_schema TEXT DEFAULT 'scribeswell')
+RETURNS void
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = ''
+AS $$
+DECLARE
+    t TEXT;
+BEGIN
+    IF p_schema NOT IN ('scribeswell', 'scribeswell_staging') AND p_schema !~ '^scribeswell_v[0-9]+$' THEN
+        RAISE EXCEPTION 'Not a corpus schema: %', p_schema;
+    END IF;
+
+    FOREACH t IN ARRAY ARRAY['book','chapter','verse','word','morpheme'] LOOP
+        EXECUTE format('ANALYZE %I.%I', p_schema, t);
+    END LOOP;
+END;
+$$;
+
+-- ── Function access — import pipeline only ──────────────────
+REVOKE EXECUTE ON FUNCTION scribeswell.defer_staging_indexes()     FROM PUBLIC, anon, authenticated;
+REVOKE EXECUTE ON FUNCTION scribeswell.pending_staging_indexes()   FROM PUBLIC, anon, authenticated;
+REVOKE EXECUTE ON FUNCTION scribeswell.build_staging_index(TEXT)   FROM PUBLIC, anon, authenticated;
+REVOKE EXECUTE ON FUNCTION scribeswell.finish_staging_load()       FROM PUBLIC, anon, authenticated;
+REVOKE EXECUTE ON FUNCTION scribeswell.analyze_corpus(TEXT)        FROM PUBLIC, anon, authenticated;
+
+GRANT EXECUTE ON FUNCTION scribeswell.defer_staging_indexes()   TO service_role;
+GRANT EXECUTE ON FUNCTION scribeswell.pending_staging_indexes() TO service_role;
+GRANT EXECUTE ON FUNCTION scribeswell.build_staging_index(TEXT) TO service_role;
+GRANT EXECUTE ON FUNCTION scribeswell.finish_staging_load()     TO service_role;
+GRANT EXECUTE ON FUNCTION scribeswell.analyze_corpus(TEXT)      TO service_role;
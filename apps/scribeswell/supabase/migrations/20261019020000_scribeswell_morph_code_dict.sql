@@ -0,0 +1,50 @@
+-- ============================================================
+-- Morph code dictionary
+-- The OSHB uses a few thousand distinct morph codes across ~300k words, so
+-- decoded morphology is stored once per code instead of once per word
+-- segment. Words reference their entry through word.morph_code.
+--
+-- A decoding is a pure function of the code, so the dictionary lives in
+-- `scribeswell` and is shared by every corpus version; the importer upserts
+-- the codes it has seen before promoting a staged corpus.
+-- ============================================================
+
+-- ── morph_code_dict ─────────────────────────────────────────
+CREATE TABLE scribeswell.morph_code_dict (
+    code           TEXT        PRIMARY KEY,      -- raw OSHB morph string e.g. "HC/Td/Ncbsa"
+    segment_count  SMALLINT    NOT NULL,
+    segments       JSONB       NOT NULL          -- one object per '/' segment, morpheme columns + pos_type
+);
+
+ALTER TABLE scribeswell.morph_code_dict ENABLE ROW LEVEL SECURITY;
+
+CREATE POLICY "scribeswell.morph_code_dict: public read"
+    ON scribeswell.morph_code_dict FOR SELECT TO anon, authenticated USING (true);
+
+CREATE OR REPLACE VIEW scribeswell.morph_code_dict_read AS
+    SELECT code, segment_count, segments FROM scribeswell.morph_code_dict;
+
+-- ── word_morpheme_read ──────────────────────────────────────
+-- Per-segment morphology of every word in the active corpus, expanded from
+-- the dictionary. Same columns as morpheme_read (plus pos_type), so SQL
+-- analytics work without one stored row per segment.
+CREATE OR REPLACE VIEW scribeswell.word_morpheme_read AS
+    SELECT
+        w.id                                  AS word_id,
+        (s.ord - 1)::SMALLINT                 AS segment_index,
+        s.seg ->> 'language'                  AS language,
+        s.seg ->> 'part_of_speech'            AS part_of_speech,
+        s.seg ->> 'pos_code'                  AS pos_code,
+        s.seg ->> 'pos_type'                  AS pos_type,
+        s.seg ->> 'gender'                    AS gender,
+        s.seg ->> 'number'                    AS number,
+        s.seg ->> 'state'                     AS state,
+        s.seg ->> 'verb_stem'                 AS verb_stem,
+        s.seg ->> 'verb_aspect'               AS verb_aspect,
+        s.seg ->> 'person'                    AS person
+    FROM scribeswell.word_read w
+    JOIN scribeswell.morph_code_dict d ON d.code = w.morph_code
+    CROSS JOIN LATERAL jsonb_array_elements(d.segments) WITH ORDINALITY AS s(seg, ord);
+
+GRANT SELECT ON scribeswell.morph_code_dict TO anon;
+GRANT SELECT ON scribeswell.morph_code_dict_read, scribeswell.word_morpheme_read TO anon, authenticated;
@@ -0,0 +1,96 @@
+-- ============================================================
+-- Morphology filter indexes
+-- Direct SQL / PostgREST queries filter morphemes by feature ("qal perfect
+-- verbs", "feminine plural nouns"), usually within one book. Those scanned
+-- the whole morpheme table: there was no book on word/morpheme and no index
+-- on any feature column.
+--
+--   - book_id is denormalised onto word and morpheme (like verse.book_id).
+--     It cannot be a GENERATED column — those may only read their own row —
+--     so the importer writes it and NOT NULL enforces it.
+--   - Partial covering indexes per research filter; each INCLUDEs word_id so
+--     the filter is answered by an index-only scan once the table has been
+--     vacuumed.
+--
+-- Applied to the base tables (the staging template) and to every corpus
+-- version schema that still exists, so any version can be promoted or
+-- rolled back to with identical *_read view columns.
+--
+-- Query plans before/after: docs/morphology-query-plans.md
+-- ============================================================
+
+DO $$
+DECLARE
+    s TEXT;
+BEGIN
+    FOR s IN
+        SELECT schema_name FROM scribeswell.corpus_version
+        WHERE to_regnamespace(schema_name) IS NOT NULL
+    LOOP
+        -- ── word.book_id ────────────────────────────────────
+        EXECUTE format('ALTER TABLE %I.word ADD COLUMN book_id SMALLINT', s);
+        EXECUTE format(
+            'UPDATE %I.word w SET book_id = v.book_id FROM %I.verse v WHERE v.id = w.verse_id', s, s
+        );
+        EXECUTE format('ALTER TABLE %I.word ALTER COLUMN book_id SET NOT NULL', s);
+
+        -- ── morpheme.book_id ────────────────────────────────
+        EXECUTE format('ALTER TABLE %I.morpheme ADD COLUMN book_id SMALLINT', s);
+        EXECUTE format(
+            'UPDATE %I.morpheme m SET book_id = w.book_id FROM %I.word w WHERE w.id = m.word_id', s, s
+        );
+        EXECUTE format('ALTER TABLE %I.morpheme ALTER COLUMN book_id SET NOT NULL', s);
+
+        -- ── indexes ─────────────────────────────────────────
+        -- Verbs by stem / aspect, optionally within a book
+        EXECUTE format(
+            'CREATE INDEX idx_morpheme_verb ON %I.morpheme (verb_stem, verb_aspect, book_id)
+                 INCLUDE (word_id) WHERE part_of_speech = %L', s, 'verb'
+        );
+        -- Nouns / adjectives by gender, number, state, optionally within a book.
+        -- part_of_speech leads so "nouns only" stays an index-only scan.
+        EXECUTE format(
+            'CREATE INDEX idx_morpheme_nominal ON %I.morpheme (part_of_speech, gender, number, state, book_id)
+                 INCLUDE (word_id) WHERE part_of_speech IN (%L, %L)', s, 'noun', 'adjective'
+        );
+        -- Any part of speech within a book
+        EXECUTE format(
+            'CREATE INDEX idx_morpheme_book_pos ON %I.morpheme (book_id, part_of_speech)
+                 INCLUDE (word_id)', s
+        );
+        -- Concordance: occurrences of a lemma, optionally within a book
+        EXECUTE format(
+            'CREATE INDEX idx_word_lemma ON %I.word (lemma_strong, book_id)
+                 INCLUDE (verse_id, position)', s
+        );
+
+        EXECUTE format('ANALYZE %I.word', s);
+        EXECUTE format('ANALYZE %I.morpheme', s);
+    END LOOP;
+
+    -- Expose the new columns through the *_read views of the active version
+    PERFORM scribeswell._point_read_views(
+        (SELECT schema_name FROM scribeswell.corpus_version WHERE status = 'active')
+    );
+END;
+$$;
+
+-- ── word_morpheme_read: + book_id ───────────────────────────
+CREATE OR REPLACE VIEW scribeswell.word_morpheme_read AS
+    SELECT
+        w.id                                  AS word_id,
+        (s.ord - 1)::SMALLINT                 AS segment_index,
+        s.seg ->> 'language'                  AS language,
+        s.seg ->> 'part_of_speech'            AS part_of_speech,
+        s.seg ->> 'pos_code'                  AS pos_code,
+        s.seg ->> 'pos_type'                  AS pos_type,
+        s.seg ->> 'gender'                    AS gender,
+        s.seg ->> 'number'                    AS number,
+        s.seg ->> 'state'                     AS state,
+        s.seg ->> 'verb_stem'                 AS verb_stem,
+        s.seg ->> 'verb_aspect'               AS verb_aspect,
+        s.seg ->> 'person'                    AS person,
+        w.book_id                             AS book_id
+    FROM scribeswell.word_read w
+    JOIN scribeswell.morph_code_dict d ON d.code = w.morph_code
+    CROSS JOIN LATERAL jsonb_array_elements(d.segments) WITH ORDINALITY AS s(seg, ord);
@@ -0,0 +1,32 @@
+-- ============================================================
+-- Strong's Hebrew lexicon
+-- One row per Strong's number, loaded by `import_bible.py --lexicon`.
+-- word.lemma_strong references an entry through the number of its content
+-- lemma ("c/d/776" → H776, "1254 a" → H1254).
+--
+-- Like morph_code_dict, the lexicon does not depend on the corpus, so it
+-- lives in `scribeswell` and is shared by every corpus version.
+-- ============================================================
+
+-- ── lexicon ─────────────────────────────────────────────────
+CREATE TABLE scribeswell.lexicon (
+    strong         TEXT        PRIMARY KEY,      -- "H430"
+    lemma          TEXT        NOT NULL,         -- pointed headword "אֱלֹהִים"
+    translit       TEXT,                         -- "ʼĕlôhîym"
+    pronunciation  TEXT,                         -- "el-o-heem'"
+    gloss          TEXT,                         -- short English gloss "gods in the ordinary sense"
+    definition     TEXT,                         -- full Strong's definition
+    kjv_usage      TEXT                          -- KJV renderings
+);
+
+ALTER TABLE scribeswell.lexicon ENABLE ROW LEVEL SECURITY;
+
+CREATE POLICY "scribeswell.lexicon: public read"
+    ON scribeswell.lexicon FOR SELECT TO anon, authenticated USING (true);
+
+CREATE OR REPLACE VIEW scribeswell.lexicon_read AS
+    SELECT strong, lemma, translit, pronunciation, gloss, definition, kjv_usage
+    FROM scribeswell.lexicon;
+
+GRANT SELECT ON scribeswell.lexicon TO anon;
+GRANT SELECT ON scribeswell.lexicon_read TO anon, authenticated;
@@ -0,0 +1,61 @@
+-- ============================================================
+-- Duplicate removal before a deferred UNIQUE rebuild
+-- With --defer-indexes, staging rows are written by plain INSERT: there are
+-- no UNIQUE constraints to upsert against. A batch that committed but whose
+-- response was lost (a timeout) is sent again by the importer's retry, or
+-- again in halves after a split, and its rows land twice. The UNIQUE rebuild
+-- in build_staging_index() would then fail and the staged load be lost.
+--
+-- dedupe_staging() removes those duplicates first. Of the rows sharing a
+-- deferred UNIQUE key, the one with the highest id is kept: a resend runs
+-- after the attempt it repeats, so its ids are higher, and its response is
+-- the one whose ids the importer used for child rows. The lower-id copies
+-- have no children. Every PostgREST write is one statement, so a batch is
+-- either fully committed or not at all.
+-- ============================================================
+
+-- ── dedupe_staging ──────────────────────────────────────────
+-- Delete duplicate rows under every deferred UNIQUE constraint of p_tables
+-- (the tables the importer retried writes to). Returns the rows deleted.
+CREATE OR REPLACE FUNCTION scribeswell.dedupe_staging(p_tables TEXT[])
+RETURNS INT
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = ''
+AS $$
+DECLARE
+    r       RECORD;
+    v_cols  TEXT;
+    v_count INT;
+    v_total INT := 0;
+BEGIN
+    FOR r IN
+        SELECT table_name, ddl
+        FROM scribeswell.staging_deferred_ddl
+        WHERE kind = 'unique' AND table_name = ANY (p_tables)
+        ORDER BY table_name, object_name
+    LOOP
+        -- "... ADD CONSTRAINT x UNIQUE (verse_id, "position")" → the key columns
+        v_cols := (regexp_match(r.ddl, 'UNIQUE \((.*)\)'))[1];
+        IF v_cols IS NULL THEN
+            RAISE EXCEPTION 'Cannot read the key of %: %', r.table_name, r.ddl;
+        END IF;
+        EXECUTE format(
+            'DELETE FROM scribeswell_staging.%1$I WHERE id IN ('
+            '  SELECT id FROM ('
+            '    SELECT id, row_number() OVER (PARTITION BY %2$s ORDER BY id DESC) AS n'
+            '    FROM scribeswell_staging.%1$I'
+            '  ) ranked WHERE n > 1'
+            ')',
+            r.table_name, v_cols
+        );
+        GET DIAGNOSTICS v_count = ROW_COUNT;
+        v_total := v_total + v_count;
+    END LOOP;
+    RETURN v_total;
+END;
+$$;
+
+-- ── Function access — import pipeline only ──────────────────
+REVOKE EXECUTE ON FUNCTION scribeswell.dedupe_staging(TEXT[]) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION scribeswell.dedupe_staging(TEXT[]) TO service_role;
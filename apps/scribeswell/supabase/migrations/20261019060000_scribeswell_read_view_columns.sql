@@ -0,0 +1,116 @@
+-- ============================================================
+-- Read views with a fixed column list + a permanent staging schema
+--
+-- _point_read_views() repointed each *_read view with CREATE OR REPLACE VIEW
+-- ... SELECT *, so a view took the columns of whichever version it pointed
+-- at. A version promoted before a column was added to the base tables has
+-- fewer columns, and rolling back to it failed with "cannot drop columns
+-- from view". The views are now built from the base tables' column list,
+-- in base-table order; a column the target version predates reads as NULL.
+-- CREATE OR REPLACE keeps the views' grants and the views built on them
+-- (word_morpheme_read), which a DROP VIEW + CREATE VIEW would not.
+--
+-- scribeswell_staging is listed in api.schemas (supabase/config.toml) so the
+-- importer can write to it through PostgREST, but promote_staging() renamed
+-- it away, leaving the API configured with a schema that did not exist
+-- between imports. It now always exists: empty (no tables) between imports,
+-- filled by create_staging(), and recreated empty by promote_staging() when
+-- it renames the loaded one to scribeswell_v<N>. Only service_role has
+-- USAGE on it; anon and authenticated see nothing through the API.
+-- ============================================================
+
+-- ── _point_read_views ───────────────────────────────────────
+-- Repoint every *_read view at the tables of the given schema, with the
+-- columns of the base tables in `scribeswell`.
+CREATE OR REPLACE FUNCTION scribeswell._point_read_views(p_schema TEXT)
+RETURNS void
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = ''
+AS $$
+DECLARE
+    t      TEXT;
+    v_cols TEXT;
+BEGIN
+    FOREACH t IN ARRAY ARRAY['book','chapter','verse','word','morpheme'] LOOP
+        IF to_regclass(format('%I.%I', p_schema, t)) IS NULL THEN
+            RAISE EXCEPTION 'No table %.% to point scribeswell.%_read at', p_schema, t, t;
+        END IF;
+        SELECT string_agg(
+                   CASE WHEN v.attname IS NULL
+                        THEN format('NULL::%s AS %I', format_type(b.atttypid, b.atttypmod), b.attname)
+                        ELSE quote_ident(b.attname)
+                   END,
+                   ', ' ORDER BY b.attnum)
+        INTO v_cols
+        FROM pg_attribute b
+        LEFT JOIN pg_attribute v
+               ON v.attrelid = to_regclass(format('%I.%I', p_schema, t))
+              AND v.attname = b.attname
+              AND v.attnum > 0 AND NOT v.attisdropped
+        WHERE b.attrelid = to_regclass(format('scribeswell.%I', t))
+          AND b.attnum > 0 AND NOT b.attisdropped;
+
+        EXECUTE format(
+            'CREATE OR REPLACE VIEW scribeswell.%I AS SELECT %s FROM %I.%I',
+            t || '_read', v_cols, p_schema, t
+        );
+    END LOOP;
+END;
+$$;
+
+-- ── promote_staging ─────────────────────────────────────────
+-- As before, plus: a staged corpus is one with tables, and an empty
+-- scribeswell_staging is left in place of the one renamed.
+CREATE OR REPLACE FUNCTION scribeswell.promote_staging()
+RETURNS INT
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = ''
+AS $$
+DECLARE
+    v_version INT;
+    v_schema  TEXT;
+    t         TEXT;
+BEGIN
+    IF to_regclass('scribeswell_staging.book') IS NULL THEN
+        RAISE EXCEPTION 'No staged corpus to promote — run create_staging() and import first';
+    END IF;
+
+    -- Serialise concurrent promote/rollback calls
+    LOCK TABLE scribeswell.corpus_version IN EXCLUSIVE MODE;
+
+    SELECT coalesce(max(version), 0) + 1 INTO v_version FROM scribeswell.corpus_version;
+    v_schema := 'scribeswell_v' || v_version;
+
+    -- Fresh planner statistics before the first reader hits the new tables
+    FOREACH t IN ARRAY ARRAY['book','chapter','verse','word','morpheme'] LOOP
+        EXECUTE format('ANALYZE scribeswell_staging.%I', t);
+    END LOOP;
+
+    EXECUTE format('ALTER SCHEMA scribeswell_staging RENAME TO %I', v_schema);
+    EXECUTE format('REVOKE INSERT, UPDATE, DELETE ON ALL TABLES IN SCHEMA %I FROM service_role', v_schema);
+    PERFORM scribeswell._point_read_views(v_schema);
+
+    CREATE SCHEMA scribeswell_staging;
+    GRANT USAGE ON SCHEMA scribeswell_staging TO service_role;
+
+    UPDATE scribeswell.corpus_version SET status = 'retired' WHERE status = 'active';
+    INSERT INTO scribeswell.corpus_version (version, schema_name, status, promoted_at)
+    VALUES (v_version, v_schema, 'active', now());
+
+    NOTIFY pgrst, 'reload schema';
+    RETURN v_version;
+END;
+$$;
+
+-- ── scribeswell_staging, empty until the next create_staging() ──
+CREATE SCHEMA IF NOT EXISTS scribeswell_staging;
+GRANT USAGE ON SCHEMA scribeswell_staging TO service_role;
+
+-- Existing views: same columns, now listed rather than *
+SELECT scribeswell._point_read_views(
+    (SELECT schema_name FROM scribeswell.corpus_version WHERE status = 'active')
+);
+
+NOTIFY pgrst, 'reload schema';
@@ -0,0 +1,131 @@
+-- ============================================================
+-- Deferred-load dedupe by row content and child references; replayable
+-- build_staging_index()
+--
+-- dedupe_staging() (20261019050000) kept the highest id of the rows sharing
+-- a deferred UNIQUE key, assuming a resend always lands after the attempt it
+-- repeats. It need not: an original insert that timed out on the client can
+-- commit after its retry, and the importer wrote child rows with the ids of
+-- whichever attempt answered. Keeping the highest id then deleted the parent
+-- the children point at, and the foreign key validation failed.
+--
+-- Duplicates are now chosen by what they are, not by id order:
+--   - rows sharing a key must be the same row apart from id (a resend);
+--     different content under one key is a real conflict and raises;
+--   - the copy that child rows reference is kept; when none is referenced
+--     (a leaf table, or a resend of rows without children yet) the lowest id;
+--   - two referenced copies of one key cannot be reconciled and raise.
+--
+-- build_staging_index() goes through the importer's retry. A call whose
+-- response was lost has already built the object and removed its DDL row, so
+-- the replay raised "No deferred index or constraint named ...". A name
+-- whose object already exists in scribeswell_staging is now a no-op.
+-- ============================================================
+
+-- ── dedupe_staging ──────────────────────────────────────────
+-- Delete resent duplicate rows under every deferred UNIQUE constraint of
+-- p_tables (the tables the importer retried writes to). Returns the rows deleted.
+CREATE OR REPLACE FUNCTION scribeswell.dedupe_staging(p_tables TEXT[])
+RETURNS INT
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = ''
+AS $$
+DECLARE
+    r            RECORD;
+    v_cols       TEXT;
+    v_referenced TEXT;
+    v_conflicts  INT;
+    v_count      INT;
+    v_total      INT := 0;
+BEGIN
+    FOR r IN
+        SELECT table_name, ddl
+        FROM scribeswell.staging_deferred_ddl
+        WHERE kind = 'unique' AND table_name = ANY (p_tables)
+        ORDER BY table_name, object_name
+    LOOP
+        -- "... ADD CONSTRAINT x UNIQUE (verse_id, "position")" → the key columns
+        v_cols := (regexp_match(r.ddl, 'UNIQUE \((.*)\)'))[1];
+        IF v_cols IS NULL THEN
+            RAISE EXCEPTION 'Cannot read the key of %: %', r.table_name, r.ddl;
+        END IF;
+
+        -- "t.id IN (SELECT verse_id FROM scribeswell_staging.word) OR ..." over
+        -- the deferred foreign keys that reference this table
+        SELECT coalesce(string_agg(
+                   format('t.id IN (SELECT %I FROM scribeswell_staging.%I)', m[1], f.table_name),
+                   ' OR '), 'false')
+        INTO v_referenced
+        FROM scribeswell.staging_deferred_ddl f,
+             regexp_match(f.ddl, 'FOREIGN KEY \((\w+)\) REFERENCES scribeswell_staging\.(\w+)\(') m
+        WHERE f.kind = 'foreign_key' AND m[2] = r.table_name;
+
+        EXECUTE format(
+            'SELECT count(*) FROM ('
+            '  SELECT 1 FROM scribeswell_staging.%1$I t GROUP BY %2$s'
+            '  HAVING count(*) > 1'
+            '     AND (count(DISTINCT to_jsonb(t) - ''id'') > 1 OR count(*) FILTER (WHERE %3$s) > 1)'
+            ') conflicting',
+            r.table_name, v_cols, v_referenced
+        ) INTO v_conflicts;
+        IF v_conflicts > 0 THEN
+            RAISE EXCEPTION '% keys of scribeswell_staging.% (%) have conflicting copies (different content, or several with child rows)',
+                v_conflicts, r.table_name, v_cols;
+        END IF;
+
+        EXECUTE format(
+            'DELETE FROM scribeswell_staging.%1$I WHERE id IN ('
+            '  SELECT id FROM ('
+            '    SELECT t.id, row_number() OVER (PARTITION BY %2$s ORDER BY (%3$s) DESC, t.id) AS n'
+            '    FROM scribeswell_staging.%1$I t'
+            '  ) ranked WHERE n > 1'
+            ')',
+            r.table_name, v_cols, v_referenced
+        );
+        GET DIAGNOSTICS v_count = ROW_COUNT;
+        v_total := v_total + v_count;
+    END LOOP;
+    RETURN v_total;
+END;
+$$;
+
+-- ── build_staging_index ─────────────────────────────────────
+-- As before; a name already built (a replayed call) is a no-op.
+CREATE OR REPLACE FUNCTION scribeswell.build_staging_index(p_name TEXT)
+RETURNS void
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = ''
+SET max_parallel_maintenance_workers = 4
+SET maintenance_work_mem = '256MB'
+AS $$
+DECLARE
+    v_ddl TEXT;
+BEGIN
+    SELECT ddl INTO v_ddl
+    FROM scribeswell.staging_deferred_ddl
+    WHERE object_name = p_name AND kind IN ('index','unique');
+
+    IF v_ddl IS NULL THEN
+        -- A UNIQUE constraint is backed by an index of the same name
+        IF to_regclass(format('scribeswell_staging.%I', p_name)) IS NOT NULL THEN
+            RETURN;
+        END IF;
+        RAISE EXCEPTION 'No deferred index or constraint named %', p_name;
+    END IF;
+
+    BEGIN
+        EXECUTE v_ddl;
+    EXCEPTION WHEN duplicate_table OR duplicate_object THEN
+        -- Built by a call still in flight when this replay started
+        NULL;
+    END;
+    DELETE FROM scribeswell.staging_deferred_ddl WHERE object_name = p_name;
+END;
+$$;
+
+REVOKE EXECUTE ON FUNCTION scribeswell.dedupe_staging(TEXT[])    FROM PUBLIC, anon, authenticated;
+REVOKE EXECUTE ON FUNCTION scribeswell.build_staging_index(TEXT) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION scribeswell.dedupe_staging(TEXT[])    TO service_role;
+GRANT EXECUTE ON FUNCTION scribeswell.build_staging_index(TEXT) TO service_role;
@@ -0,0 +1,214 @@
+"""
+bench_cold_start.py — backend cold start: import time per service, budgets, regressions
+=====================================================================================
+Times `import main; main.app` (module imports plus create_app(), what
+`uvicorn main:app` loads) for each FastAPI
+service in fresh interpreters — what a new worker, a reload or a scaled-out
+container pays before it can serve:
+
+    scribeswell      apps/scribeswell/backend
+    app-directory    services/app-directory
+    platform         platform/backend
+
+Each service is imported --repeat times (after one untimed run that writes
+the bytecode caches); the median, minus the median of a bare interpreter
+start, is its cold start. One more run under `python -X importtime` gives
+where that time goes: self time per top-level package, largest first.
+
+Lifespan work (JWKS fetch, repository and client creation) is not counted:
+it needs the network, and it runs before the first request either way. The
+report does list any package imported at import time that the services
+defer to their lifespan or first use (DEFERRED) — one showing up means a
+module-level import crept back in.
+
+A service over its budget (BUDGETS_MS, or --budget name=ms) fails the run,
+as does a deferred package. --save-baseline writes the results as JSON;
+--baseline compares a run against one and exits 1 on any service whose cold
+start grew by more than --threshold percent. Compare runs from the same
+machine (the baseline records it).
+
+The services are imported with placeholder Supabase settings and the
+profiler, metrics and JWKS URL as the environment has them.
+
+Usage:
+    python tools/py/bench_cold_start.py [--service scribeswell ...] [--repeat 7] [--top 12]
+        [--budget scribeswell=600 ...]
+        [--save-baseline cold_start.json] [--baseline cold_start.json [--threshold 15]]
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+
+REPO = Path(__file__).resolve().parents[4]
+
+SERVICES = {
+    "scribeswell": REPO / "apps" / "scribeswell" / "backend",
+    "app-directory": REPO / "services" / "app-directory",
+    "platform": REPO / "platform" / "backend",
+}
+
+# Cold-start budgets, ms over a bare interpreter (see docs/scribeswell.md)
+BUDGETS_MS = {
+    "scribeswell": 750,
+    "app-directory": 650,
+    "platform": 700,
+}
+
+# main.app is built on first access: time the import and the build
+LOAD = "import main; main.app"
+
+# Imported in lifespan or on first use, never while loading main.app
+DEFERRED = ("asyncpg", "supabase", "postgrest", "jose", "cryptography")
+
+PLACEHOLDER_ENV = {
+    "SUPABASE_URL": "https://bench.supabase.invalid",
+    "SUPABASE_SECRET_KEY": "bench",
+    "SUPABASE_JWT_SECRET": "bench",
+}
+
+
+def _run(args: list[str], cwd: Path, env: dict) -> tuple[float, str]:
+    """Seconds to run `python args` to completion, and its stderr."""
+    t0 = time.perf_counter()
+    proc = subprocess.run([sys.executable, *args], cwd=cwd, env=env, capture_output=True, text=True)
+    seconds = time.perf_counter() - t0
+    if proc.returncode:
+        raise SystemExit(f"❌ python {' '.join(args)} failed in {cwd}:\n{proc.stderr.strip()}")
+    return seconds, proc.stderr
+
+
+def parse_importtime(stderr: str) -> tuple[Counter, float]:
+    """Self µs per top-level package, and the cumulative µs of `main`."""
+    packages: Counter = Counter()
+    main_us = 0.0
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        self_us, cumulative_us, name = (part.strip() for part in line[len("import time:"):].split("|"))
+        if not self_us.isdigit():
+            continue  # the header line
+        packages[name.split(".")[0]] += int(self_us)
+        if name == "main":
+            main_us = int(cumulative_us)
+    return packages, main_us
+
+
+def measure(path: Path, repeat: int, bare: float, env: dict) -> dict:
+    _run(["-c", LOAD], path, env)  # bytecode caches
+    seconds = [_run(["-c", LOAD], path, env)[0] for _ in range(repeat)]
+    _, stderr = _run(["-X", "importtime", "-c", LOAD], path, env)
+    packages, main_us = parse_importtime(stderr)
+    return {
+        "cold_start_ms": round((statistics.median(seconds) - bare) * 1000, 1),
+        "best_ms": round((min(seconds) - bare) * 1000, 1),
+        "importtime_main_ms": round(main_us / 1000, 1),
+        "packages_ms": {name: round(us / 1000, 1) for name, us in packages.most_common()},
+        "deferred_loaded": sorted(name for name in DEFERRED if name in packages),
+    }
+
+
+def print_results(results: dict[str, dict], budgets: dict[str, float], top: int) -> None:
+    print(f"\n   {'service':14} {'cold ms':>9} {'best ms':>9} {'budget':>8} {'importtime':>11}")
+    for name, r in results.items():
+        over = r["cold_start_ms"] > budgets[name]
+        print(f"   {name:14} {r['cold_start_ms']:>9.1f} {r['best_ms']:>9.1f} {budgets[name]:>8g} "
+              f"{r['importtime_main_ms']:>11.1f}{'  ❌' if over else ''}")
+    for name, r in results.items():
+        print(f"\n── {name}: self time by package (python -X importtime) ───────────")
+        for package, ms in list(r["packages_ms"].items())[:top]:
+            print(f"   {package:28} {ms:>8.1f} ms")
+        if r["deferred_loaded"]:
+            print(f"   ❌ imported at import time, should be deferred: {', '.join(r['deferred_loaded'])}")
+
+
+def compare(baseline: dict, current: dict, threshold: float) -> list[str]:
+    """Print current vs baseline; return the regressions."""
+    print(f"\n── vs baseline {baseline['meta']['created']} (threshold {threshold:g}%) ──────────────────")
+    regressions = []
+    for name, r in current["services"].items():
+        base = baseline["services"].get(name)
+        if base is None:
+            print(f"   {name:14} {'(new)':>9}")
+            continue
+        change = (r["cold_start_ms"] / base["cold_start_ms"] - 1) * 100
+        flagged = change > threshold
+        if flagged:
+            regressions.append(f"{name}: cold start {change:+.1f}%")
+        print(f"   {name:14} {base['cold_start_ms']:>8.1f} → {r['cold_start_ms']:>8.1f} ms "
+              f"{change:>+7.1f}%{'  ❌' if flagged else ''}")
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the backends' cold start (import main)")
+    parser.add_argument("--service", action="append", help="Service to time (repeatable; default: all)")
+    parser.add_argument("--repeat", type=int, default=7, help="Timed imports per service (the median is kept)")
+    parser.add_argument("--top", type=int, default=12, help="Packages to list per service")
+    parser.add_argument("--budget", action="append", default=[], metavar="SERVICE=MS",
+                        help="Override a service's cold-start budget")
+    parser.add_argument("--save-baseline", type=Path, help="Write the results as a JSON baseline")
+    parser.add_argument("--baseline", type=Path, help="Compare against a JSON baseline; exit 1 on regressions")
+    parser.add_argument("--threshold", type=float, default=15.0, help="Allowed cold-start growth, in percent")
+    args = parser.parse_args()
+
+    unknown = set(args.service or ()) - set(SERVICES)
+    if unknown:
+        raise SystemExit(f"❌ Unknown service(s): {', '.join(sorted(unknown))} — choose from {', '.join(SERVICES)}")
+    budgets = dict(BUDGETS_MS)
+    for item in args.budget:
+        name, _, ms = item.partition("=")
+        if name not in SERVICES or not ms:
+            raise SystemExit(f"❌ --budget takes SERVICE=MS with SERVICE one of {', '.join(SERVICES)}")
+        budgets[name] = float(ms)
+
+    env = {**os.environ, **PLACEHOLDER_ENV}
+    _run(["-c", "pass"], REPO, env)
+    bare = statistics.median(_run(["-c", "pass"], REPO, env)[0] for _ in range(args.repeat))
+    print(f"🐍 Python {platform.python_version()}: bare interpreter start {bare * 1000:.1f} ms")
+
+    results = {}
+    for name in args.service or SERVICES:
+        print(f"⏱  {name}...")
+        results[name] = measure(SERVICES[name], args.repeat, bare, env)
+
+    report = {
+        "meta": {
+            "created": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            "repeat": args.repeat,
+            "bare_ms": round(bare * 1000, 1),
+            "python": platform.python_version(),
+            "machine": f"{platform.system()} {platform.machine()}",
+        },
+        "budgets_ms": {name: budgets[name] for name in results},
+        "services": results,
+    }
+    print_results(results, budgets, args.top)
+
+    failures = [f"{name}: {r['cold_start_ms']:.1f} ms over its {budgets[name]:g} ms budget"
+                for name, r in results.items() if r["cold_start_ms"] > budgets[name]]
+    failures += [f"{name}: {', '.join(r['deferred_loaded'])} imported at import time"
+                 for name, r in results.items() if r["deferred_loaded"]]
+
+    if args.save_baseline:
+        args.save_baseline.write_text(json.dumps(report, indent=2) + "\n")
+        print(f"\n   ✓ Baseline written to {args.save_baseline}")
+    if args.baseline:
+        failures += compare(json.loads(args.baseline.read_text()), report, args.threshold)
+    if failures:
+        print(f"\n❌ {len(failures)} failure(s):")
+        for f in failures:
+            print(f"   ❌ {f}")
+        sys.exit(1)
+    print("\n   ✓ Every service within budget")
+
+
+if __name__ == "__main__":
+    main()
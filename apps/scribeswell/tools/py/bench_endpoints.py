@@ -0,0 +1,351 @@
+"""
+bench_endpoints.py — API load test: throughput and p50/p95/p99 per endpoint
+===========================================================================
+Runs the API under uvicorn against a local corpus and drives scripted
+workloads through it over HTTP, all on localhost — no network, no Supabase
+project. Client, API and data server are separate processes, and the API is
+restarted for each workload, so every workload starts with cold caches.
+
+    1. Corpus: a small sample cut from an OSHB hebrew.json (--book, default
+       Ruth and Psalms) is written to a SQLite file with import_bible.py
+       --sqlite, at a fixed corpus version so runs are comparable. Or pass
+       an existing file with --sqlite.
+    2. Data: with --backend rest (default) the API reads through
+       SupabaseBibleRepository from fake_postgrest.py serving that file,
+       so the PostgREST round trips and JSON decoding are measured;
+       --latency-ms adds a per-request delay for a hosted database. With
+       --backend sqlite it reads the file directly.
+    3. Workloads (--workload, repeatable; default all three):
+         sequential    one reader paging through every chapter in order:
+                       GET .../verses?include=morphology,gloss and GET /reader
+         random-words  --concurrency clients, random GET /words/{id}/morphology
+         burst         --concurrency clients requesting the longest chapter
+                       at once (verses and reader bundle)
+
+The report has requests, errors, throughput and p50/p95/p99/max latency per
+workload and endpoint. --save-baseline writes it as JSON; --baseline diffs a
+run against one and flags p95 or throughput changes beyond --tolerance
+(exit status 1 with --fail-on-regression). Latencies are client-side, from
+sending the request to reading the whole body.
+
+Usage:
+    python tools/py/bench_endpoints.py --source scripts/hebrew.json [--book Ruth --book Psalms]
+        [--backend rest|sqlite] [--latency-ms 0] [--workers 1] [--concurrency 8]
+        [--requests 500] [--workload sequential --workload random-words --workload burst]
+        [--save-baseline baseline.json] [--baseline baseline.json [--tolerance 10] [--fail-on-regression]]
+    python tools/py/bench_endpoints.py --sqlite corpus.sqlite3 ...
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import socket
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Optional
+
+import httpx
+
+TOOLS_DIR = Path(__file__).resolve().parent
+BACKEND_DIR = TOOLS_DIR.parents[1] / "backend"
+SOURCE_FILE = TOOLS_DIR.parents[1] / "scripts" / "hebrew.json"
+
+CORPUS_VERSION = 1
+API = "/api/bible"
+VERSES = f"{API}/books/{{osis_id}}/chapters/{{chapter_num}}/verses"
+READER = f"{API}/reader/{{osis_id}}/{{chapter_num}}"
+MORPHOLOGY = f"{API}/words/{{word_id}}/morphology"
+
+WORKLOADS = ("sequential", "random-words", "burst")
+
+# One timed request: (endpoint template, status, latency ms)
+Sample = tuple[str, int, float]
+
+
+# ── Corpus and servers ────────────────────────────────────────────────────────
+
+def build_sample_corpus(source: Path, books: list[str], path: Path) -> None:
+    """Write `books` of an OSHB hebrew.json to a SQLite corpus file."""
+    with open(source, encoding="utf-8") as f:
+        data = json.load(f)
+    missing = [b for b in books if b not in data]
+    if missing:
+        raise SystemExit(f"❌ Not in {source}: {', '.join(missing)} (books are keyed by English name)")
+    sample = path.with_name("sample.json")
+    with open(sample, "w", encoding="utf-8") as f:
+        json.dump({b: data[b] for b in books}, f, ensure_ascii=False)
+    subprocess.run(
+        [sys.executable, str(TOOLS_DIR / "import_bible.py"), "--source", str(sample),
+         "--sqlite", str(path), "--sqlite-version", str(CORPUS_VERSION)],
+        check=True, stdout=subprocess.DEVNULL,
+    )
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def wait_until_up(proc: subprocess.Popen, url: str, what: str) -> None:
+    """Wait until `url` answers (any status), or fail if `proc` exits first."""
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        if proc.poll() is not None:
+            raise SystemExit(f"❌ The {what} exited during startup")
+        try:
+            httpx.get(url)
+            return
+        except httpx.TransportError:
+            time.sleep(0.1)
+    proc.terminate()
+    raise SystemExit(f"❌ The {what} did not answer within 30 s")
+
+
+def start_data_server(corpus: Path, latency_ms: float) -> tuple[subprocess.Popen, str]:
+    """fake_postgrest.py serving `corpus` on a free port."""
+    port = free_port()
+    proc = subprocess.Popen(
+        [sys.executable, str(TOOLS_DIR / "fake_postgrest.py"), str(corpus),
+         "--port", str(port), "--latency-ms", str(latency_ms)],
+        stdout=subprocess.DEVNULL,
+    )
+    url = f"http://127.0.0.1:{port}"
+    wait_until_up(proc, f"{url}/rest/v1/corpus_version_read", "fake PostgREST")
+    return proc, url
+
+
+def start_api(env: dict[str, str], workers: int) -> tuple[subprocess.Popen, str]:
+    """uvicorn serving backend/main.py on a free port."""
+    port = free_port()
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--port", str(port),
+         "--workers", str(workers), "--log-level", "warning", "--no-access-log"],
+        cwd=BACKEND_DIR, env={**os.environ, **env},
+    )
+    url = f"http://127.0.0.1:{port}"
+    wait_until_up(proc, f"{url}/health", "API")
+    return proc, url
+
+
+def stop(proc: subprocess.Popen) -> None:
+    proc.terminate()
+    proc.wait()
+
+
+# ── Workloads ─────────────────────────────────────────────────────────────────
+
+def corpus_facts(path: Path) -> dict:
+    """What the workloads request: chapters in order, word ids, the longest chapter."""
+    conn = sqlite3.connect(f"{path.resolve().as_uri()}?mode=ro", uri=True)
+    chapters = conn.execute(
+        "SELECT b.osis_id, c.chapter_num FROM chapter c JOIN book b ON b.id = c.book_id"
+        " ORDER BY b.id, c.chapter_num"
+    ).fetchall()
+    max_word_id = conn.execute("SELECT max(id) FROM word").fetchone()[0]
+    longest = conn.execute(
+        "SELECT b.osis_id, v.chapter_num FROM word w JOIN verse v ON v.id = w.verse_id"
+        " JOIN book b ON b.id = v.book_id GROUP BY v.book_id, v.chapter_num ORDER BY count(*) DESC LIMIT 1"
+    ).fetchone()
+    conn.close()
+    return {"chapters": chapters, "max_word_id": max_word_id, "longest_chapter": longest}
+
+
+def timed_get(client: httpx.Client, endpoint: str, **path_params) -> Sample:
+    url = endpoint.format(**path_params)
+    t0 = time.perf_counter()
+    resp = client.get(url, params={"include": "morphology,gloss"} if endpoint == VERSES else None)
+    resp.read()
+    return endpoint, resp.status_code, (time.perf_counter() - t0) * 1000
+
+
+def run_clients(base_url: str, concurrency: int, jobs: list[Callable[[httpx.Client], Sample]]) -> list[Sample]:
+    """Run `jobs` on `concurrency` keep-alive clients, all starting together."""
+    start = threading.Barrier(concurrency)
+    queue = iter(jobs)
+    lock = threading.Lock()
+
+    def client_loop() -> list[Sample]:
+        samples = []
+        with httpx.Client(base_url=base_url, headers={"Accept-Encoding": "gzip, br"}, timeout=60) as client:
+            start.wait()
+            while True:
+                with lock:
+                    job = next(queue, None)
+                if job is None:
+                    return samples
+                samples.append(job(client))
+
+    with ThreadPoolExecutor(concurrency) as pool:
+        return [s for samples in pool.map(lambda _: client_loop(), range(concurrency)) for s in samples]
+
+
+def workload_jobs(name: str, facts: dict, requests: int, seed: int) -> tuple[int, list]:
+    """(concurrency override or 0, jobs) for one workload."""
+    if name == "sequential":
+        jobs = []
+        for osis_id, chapter_num in facts["chapters"]:
+            for endpoint in (VERSES, READER):
+                jobs.append(lambda c, e=endpoint, o=osis_id, n=chapter_num: timed_get(c, e, osis_id=o, chapter_num=n))
+        return 1, jobs
+    if name == "random-words":
+        rng = random.Random(seed)
+        return 0, [
+            lambda c, w=rng.randint(1, facts["max_word_id"]): timed_get(c, MORPHOLOGY, word_id=w)
+            for _ in range(requests)
+        ]
+    osis_id, chapter_num = facts["longest_chapter"]
+    return 0, [
+        lambda c, e=(VERSES, READER)[i % 2]: timed_get(c, e, osis_id=osis_id, chapter_num=chapter_num)
+        for i in range(requests)
+    ]
+
+
+# ── Report and baseline ───────────────────────────────────────────────────────
+
+def percentile(sorted_ms: list[float], p: float) -> float:
+    """Nearest-rank percentile of an ascending list."""
+    return sorted_ms[max(0, min(len(sorted_ms) - 1, round(p / 100 * len(sorted_ms)) - 1))]
+
+
+def summarize(samples: list[Sample], wall_s: float) -> dict[str, dict]:
+    by_endpoint: dict[str, list[Sample]] = {}
+    for s in samples:
+        by_endpoint.setdefault(s[0], []).append(s)
+    out = {}
+    for endpoint, rows in by_endpoint.items():
+        ms = sorted(r[2] for r in rows)
+        out[endpoint] = {
+            "requests": len(rows),
+            "errors": sum(1 for r in rows if r[1] >= 400),
+            "rps": round(len(rows) / wall_s, 1),
+            "p50_ms": round(percentile(ms, 50), 2),
+            "p95_ms": round(percentile(ms, 95), 2),
+            "p99_ms": round(percentile(ms, 99), 2),
+            "max_ms": round(ms[-1], 2),
+        }
+    return out
+
+
+def print_report(results: dict[str, dict]) -> None:
+    print(f"\n   {'workload':13} {'endpoint':52} {'reqs':>6} {'errs':>5} {'req/s':>8} "
+          f"{'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'max ms':>8}")
+    for workload, endpoints in results.items():
+        for endpoint, r in endpoints.items():
+            print(f"   {workload:13} {endpoint:52} {r['requests']:>6,} {r['errors']:>5} {r['rps']:>8,.1f} "
+                  f"{r['p50_ms']:>8.2f} {r['p95_ms']:>8.2f} {r['p99_ms']:>8.2f} {r['max_ms']:>8.2f}")
+
+
+def compare(baseline: dict, current: dict, tolerance: float) -> int:
+    """Print current vs baseline per endpoint; return the number of regressions."""
+    changed = [k for k in ("backend", "workers", "concurrency", "requests", "latency_ms", "books")
+               if baseline["meta"].get(k) != current["meta"].get(k)]
+    if changed:
+        print(f"\n   ⚠ Baseline was run with different {', '.join(changed)} — deltas are not like for like")
+    print(f"\n── vs baseline {baseline['meta']['created']} (tolerance {tolerance:g}%) ──────────────────")
+    print(f"   {'workload':13} {'endpoint':52} {'p50':>8} {'p95':>8} {'p99':>8} {'req/s':>8}")
+    regressions = 0
+    for workload, endpoints in current["results"].items():
+        for endpoint, r in endpoints.items():
+            base = baseline["results"].get(workload, {}).get(endpoint)
+            if base is None:
+                print(f"   {workload:13} {endpoint:52} {'(new)':>8}")
+                continue
+            delta = {k: (r[k] - base[k]) / base[k] * 100 if base[k] else 0.0
+                     for k in ("p50_ms", "p95_ms", "p99_ms", "rps")}
+            regressed = delta["p95_ms"] > tolerance or delta["rps"] < -tolerance or r["errors"] > base["errors"]
+            regressions += regressed
+            print(f"   {workload:13} {endpoint:52} {delta['p50_ms']:>+7.1f}% {delta['p95_ms']:>+7.1f}% "
+                  f"{delta['p99_ms']:>+7.1f}% {delta['rps']:>+7.1f}%{'  ⚠ regression' if regressed else ''}")
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Load-test the bible API against a local corpus")
+    parser.add_argument("--source", type=Path, default=SOURCE_FILE, help="OSHB hebrew.json to cut the sample from")
+    parser.add_argument("--book", action="append", help="Book of the sample, by source key (repeatable; default: Ruth, Psalms)")
+    parser.add_argument("--sqlite", type=Path, help="Use this corpus file instead of building a sample")
+    parser.add_argument("--backend", choices=["rest", "sqlite"], default="rest",
+                        help="rest: Supabase repository via fake_postgrest.py; sqlite: read the file directly")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Delay per fake PostgREST request (rest)")
+    parser.add_argument("--workers", type=int, default=1, help="uvicorn worker processes")
+    parser.add_argument("--concurrency", type=int, default=8, help="Concurrent clients (random-words, burst)")
+    parser.add_argument("--requests", type=int, default=500, help="Requests per workload (random-words, burst)")
+    parser.add_argument("--workload", action="append", choices=WORKLOADS, help="Workload to run (repeatable; default: all)")
+    parser.add_argument("--seed", type=int, default=1, help="Seed for random word ids")
+    parser.add_argument("--save-baseline", type=Path, help="Write the results as a JSON baseline")
+    parser.add_argument("--baseline", type=Path, help="Compare against a JSON baseline")
+    parser.add_argument("--tolerance", type=float, default=10.0, help="Allowed p95 / throughput change, in percent")
+    parser.add_argument("--fail-on-regression", action="store_true", help="Exit 1 when --baseline finds a regression")
+    args = parser.parse_args()
+    books = args.book or ["Ruth", "Psalms"]
+
+    with tempfile.TemporaryDirectory(prefix="scribeswell-bench-") as tmp:
+        corpus = args.sqlite
+        if corpus is None:
+            corpus = Path(tmp) / "corpus.sqlite3"
+            print(f"📖 Building the sample corpus ({', '.join(books)}) from {args.source}...")
+            build_sample_corpus(args.source, books, corpus)
+        facts = corpus_facts(corpus)
+
+        env = {"SERVER_TIMING": "false", "APP_ENV": "bench"}
+        data_server: Optional[subprocess.Popen] = None
+        if args.backend == "rest":
+            data_server, data_url = start_data_server(corpus, args.latency_ms)
+            env.update(BIBLE_REPOSITORY="supabase", SUPABASE_URL=data_url, SUPABASE_SECRET_KEY="bench")
+        else:
+            env.update(BIBLE_REPOSITORY="sqlite", SQLITE_PATH=str(corpus.resolve()))
+
+        results: dict[str, dict] = {}
+        try:
+            for name in args.workload or WORKLOADS:
+                concurrency, jobs = workload_jobs(name, facts, args.requests, args.seed)
+                concurrency = concurrency or args.concurrency
+                print(f"🏃 {name}: {len(jobs):,} requests, {concurrency} client(s)...")
+                api, base_url = start_api(env, args.workers)
+                try:
+                    t0 = time.perf_counter()
+                    samples = run_clients(base_url, concurrency, jobs)
+                    results[name] = summarize(samples, time.perf_counter() - t0)
+                finally:
+                    stop(api)
+        finally:
+            if data_server is not None:
+                stop(data_server)
+
+    report = {
+        "meta": {
+            "created": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            "backend": args.backend,
+            "latency_ms": args.latency_ms,
+            "workers": args.workers,
+            "concurrency": args.concurrency,
+            "requests": args.requests,
+            "books": books if args.sqlite is None else str(args.sqlite),
+            "python": platform.python_version(),
+            "machine": f"{platform.system()} {platform.machine()}, {os.cpu_count()} CPUs",
+        },
+        "results": results,
+    }
+    print(f"\n── {args.backend} backend, {args.workers} worker(s) ──────────────────────────────────")
+    print_report(results)
+
+    if args.save_baseline:
+        args.save_baseline.write_text(json.dumps(report, indent=2) + "\n")
+        print(f"\n   ✓ Baseline written to {args.save_baseline}")
+    if args.baseline:
+        regressions = compare(json.loads(args.baseline.read_text()), report, args.tolerance)
+        if regressions and args.fail_on_regression:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
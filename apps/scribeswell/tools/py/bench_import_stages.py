@@ -0,0 +1,296 @@
+"""
+bench_import_stages.py — import CPU hot paths: ops/s, allocations, regressions
+==============================================================================
+Times the CPU stages of every import over one corpus — by default a
+synthetic one shaped like the OSHB (synthetic_oshb.py), so runs need no
+source file and are identical everywhere:
+
+    parse cold          parse_morph_code, corpus order, empty caches
+    parse warm          parse_morph_code, corpus order, every code cached
+    parse uncached      parse_morph_code on each distinct code, caches cleared
+    decode cold         decode_morph_code (the importer's row dicts), empty caches
+    morph dict rows     morph_dict_row for each distinct code
+    book rows           BibleImporter._iter_book_rows over every book
+    import_book         the whole per-book transform of a real import, with
+                        the writes replaced by ids assigned in memory
+
+Timings are calibrated: a sample repeats a stage until it has run for at
+least --min-time seconds, so the sub-millisecond stages are not timer
+noise. --repeat rounds take one sample of every stage in turn, so a slow
+spell on the machine lands on all stages rather than on whichever ran
+then. The best sample gives ops/s; the median and the noise (median
+absolute deviation over the median, %) show how far a run can be trusted.
+Each stage then runs once more under tracemalloc for its allocation peak
+and the memory it leaves behind (caches).
+
+--save-baseline writes the results as JSON; --baseline compares a run
+against one and exits 1, listing every stage whose allocation peak grew by
+more than --threshold percent, or whose best and median ops/s both fell by
+more than its allowance: --threshold, or NOISE_FACTOR times the noise of
+the noisier of the two runs if that is larger. Compare runs from the same
+machine and corpus (the baseline records both).
+
+Usage:
+    python tools/py/bench_import_stages.py [--scale 1.0 --seed 1 | --source <path/to/hebrew.json>]
+        [--stage "parse cold" ...] [--repeat 7] [--min-time 0.1]
+        [--save-baseline stages.json] [--baseline stages.json [--threshold 10]]
+"""
+
+import argparse
+import gc
+import json
+import math
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from collections import Counter
+from pathlib import Path
+from typing import Callable, NamedTuple
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from import_bible import BibleImporter, decode_morph_code, morph_dict_row  # noqa: E402
+from services import oshb_morph  # noqa: E402  (import_bible puts backend/ on sys.path)
+from services.oshb_morph import parse_morph_code  # noqa: E402
+from synthetic_oshb import describe, generate_corpus  # noqa: E402
+
+# A slowdown within this many times the measured noise is not a regression
+NOISE_FACTOR = 3
+
+
+class InMemoryImporter(BibleImporter):
+    """
+    A real import (not a dry run) whose writes assign ids in memory and echo
+    the rows back, as PostgREST would: every transform loop runs, no I/O.
+    """
+
+    def __init__(self):
+        super().__init__("", "", dry_run=True)  # no Supabase client
+        self.dry_run = False
+        self._next_id: Counter = Counter()
+
+    def _upsert(self, table: str, rows: list[dict], on_conflict: str, returning=None) -> list[dict]:
+        start = self._next_id[table]
+        for i, row in enumerate(rows, start + 1):
+            row["id"] = i
+        self._next_id[table] = start + len(rows)
+        return rows if returning else []
+
+    def close(self) -> None:
+        self.writer.close()
+        self.metrics.close()
+
+
+def clear_caches() -> None:
+    parse_morph_code.cache_clear()
+    oshb_morph._parse_segment.cache_clear()
+    decode_morph_code.cache_clear()
+
+
+class Stage(NamedTuple):
+    ops: int                       # units of work per run (codes, words)
+    unit: str
+    setup: Callable[[], None]      # before each run, untimed
+    run: Callable[[], None]
+
+
+def stages(corpus: dict) -> dict[str, Stage]:
+    codes = [w[2] for book in corpus.values() for chapter in book for verse in chapter for w in verse if len(w) > 2 and w[2]]
+    distinct = sorted(set(codes))
+    words = sum(len(verse) for book in corpus.values() for chapter in book for verse in chapter)
+    warm = lambda: [parse_morph_code(c) for c in distinct]  # noqa: E731
+    importer: list[InMemoryImporter] = []
+
+    def fresh_importer() -> None:
+        clear_caches()
+        for old in importer:
+            old.close()
+        importer[:] = [InMemoryImporter()]
+
+    def parse_uncached() -> None:
+        for code in distinct:
+            clear_caches()
+            parse_morph_code(code)
+
+    def book_rows() -> None:
+        for book_id, (name, book) in enumerate(corpus.items(), 1):
+            for _ in importer[0]._iter_book_rows(book_id, name, book):
+                pass
+
+    def import_books() -> None:
+        for name, book in corpus.items():
+            importer[0].import_book(name, book)
+
+    return {
+        "parse cold": Stage(len(codes), "codes", clear_caches, lambda: [parse_morph_code(c) for c in codes]),
+        "parse warm": Stage(len(codes), "codes", warm, lambda: [parse_morph_code(c) for c in codes]),
+        "parse uncached": Stage(len(distinct), "codes", clear_caches, parse_uncached),
+        "decode cold": Stage(len(codes), "codes", clear_caches, lambda: [decode_morph_code(c) for c in codes]),
+        "morph dict rows": Stage(len(distinct), "codes", warm, lambda: [morph_dict_row(c) for c in distinct]),
+        "book rows": Stage(words, "words", fresh_importer, book_rows),
+        "import_book": Stage(words, "words", fresh_importer, import_books),
+    }
+
+
+def _sample(stage: Stage, loops: int) -> float:
+    """Seconds per run, averaged over `loops` runs (setup untimed)."""
+    gc.collect()
+    total = 0.0
+    for _ in range(loops):
+        stage.setup()
+        t0 = time.perf_counter()
+        stage.run()
+        total += time.perf_counter() - t0
+    return total / loops
+
+
+def calibrate(stage: Stage, min_time: float) -> int:
+    """Runs per sample for a sample to last at least `min_time` seconds."""
+    _sample(stage, 1)  # warm-up
+    once = _sample(stage, 1)
+    return max(1, math.ceil(min_time / once)) if once > 0 else 1
+
+
+def noise_pct(seconds: list[float]) -> float:
+    """Median absolute deviation of the samples, as a percentage of their median."""
+    median = statistics.median(seconds)
+    return 100 * statistics.median(abs(s - median) for s in seconds) / median if median else 0.0
+
+
+def measure(selected: dict[str, Stage], repeat: int, min_time: float) -> dict[str, dict]:
+    """Calibrated samples of every stage, `repeat` interleaved rounds, then one traced run each."""
+    loops = {}
+    for name, stage in selected.items():
+        loops[name] = calibrate(stage, min_time)
+        print(f"⏱  {name}: {loops[name]:,} run(s) per sample")
+    seconds: dict[str, list[float]] = {name: [] for name in selected}
+    for _ in range(repeat):
+        for name, stage in selected.items():
+            seconds[name].append(_sample(stage, loops[name]))
+
+    results = {}
+    for name, stage in selected.items():
+        stage.setup()
+        gc.collect()
+        tracemalloc.start()
+        before, _ = tracemalloc.get_traced_memory()
+        stage.run()
+        after, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        best = min(seconds[name])
+        results[name] = {
+            "ops": stage.ops,
+            "unit": stage.unit,
+            "ops_per_s": round(stage.ops / best, 1),
+            "median_ops_per_s": round(stage.ops / statistics.median(seconds[name]), 1),
+            "best_s": round(best, 6),
+            "median_s": round(statistics.median(seconds[name]), 6),
+            "noise_pct": round(noise_pct(seconds[name]), 2),
+            "loops": loops[name],
+            "peak_kib": round((peak - before) / 1024, 1),
+            "retained_kib": round((after - before) / 1024, 1),
+        }
+    return results
+
+
+def print_results(results: dict[str, dict]) -> None:
+    print(f"\n   {'stage':16} {'ops':>9} {'ops/s':>13} {'best s':>9} {'median s':>9} {'noise':>7} "
+          f"{'peak KiB':>10} {'B/op':>7} {'kept KiB':>9}")
+    for name, r in results.items():
+        per_op = r["peak_kib"] * 1024 / r["ops"] if r["ops"] else 0
+        print(f"   {name:16} {r['ops']:>9,} {r['ops_per_s']:>13,.0f} {r['best_s']:>9.4f} {r['median_s']:>9.4f} "
+              f"{r['noise_pct']:>6.1f}% {r['peak_kib']:>10,.1f} {per_op:>7,.0f} {r['retained_kib']:>9,.1f}")
+
+
+def compare(baseline: dict, current: dict, threshold: float) -> list[str]:
+    """Print current vs baseline; return the regressions."""
+    if baseline["meta"]["corpus"] != current["meta"]["corpus"]:
+        print("\n   ⚠ The baseline was measured on a different corpus — deltas are not like for like")
+    print(f"\n── vs baseline {baseline['meta']['created']} (threshold {threshold:g}%, "
+          f"or {NOISE_FACTOR}× the noise) ──────────────────")
+    print(f"   {'stage':16} {'best':>9} {'median':>9} {'allowed':>9} {'peak':>9}")
+    regressions = []
+    for name, r in current["stages"].items():
+        base = baseline["stages"].get(name)
+        if base is None:
+            print(f"   {name:16} {'(new)':>9}")
+            continue
+        # Older baselines have no median ops/s or noise: fall back to the best run and no noise
+        best = (r["ops_per_s"] / base["ops_per_s"] - 1) * 100
+        median = (r["median_ops_per_s"] / base.get("median_ops_per_s", base["ops_per_s"]) - 1) * 100
+        allowed = max(threshold, NOISE_FACTOR * max(r["noise_pct"], base.get("noise_pct", 0.0)))
+        memory = (r["peak_kib"] / base["peak_kib"] - 1) * 100 if base["peak_kib"] else 0.0
+        flags = []
+        if best < -allowed and median < -allowed:
+            flags.append(f"ops/s {best:+.1f}% (median {median:+.1f}%, allowed -{allowed:.1f}%)")
+        if memory > threshold:
+            flags.append(f"peak {memory:+.1f}%")
+        regressions += [f"{name}: {f}" for f in flags]
+        print(f"   {name:16} {best:>+8.1f}% {median:>+8.1f}% {-allowed:>+8.1f}% {memory:>+8.1f}%"
+              f"{'  ❌' if flags else ''}")
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the importer's CPU stages")
+    parser.add_argument("--source", type=Path, help="OSHB hebrew.json (default: a synthetic corpus)")
+    parser.add_argument("--scale", type=float, default=1.0, help="Synthetic corpus size, 1.0 ≈ the OSHB")
+    parser.add_argument("--seed", type=int, default=1, help="Synthetic corpus seed")
+    parser.add_argument("--stage", action="append", help="Stage to run (repeatable; default: all)")
+    parser.add_argument("--repeat", type=int, default=7, help="Samples per stage, one per round (best is kept)")
+    parser.add_argument("--min-time", type=float, default=0.1, help="Seconds a sample runs a stage for, at least")
+    parser.add_argument("--save-baseline", type=Path, help="Write the results as a JSON baseline")
+    parser.add_argument("--baseline", type=Path, help="Compare against a JSON baseline; exit 1 on regressions")
+    parser.add_argument("--threshold", type=float, default=10.0,
+                        help="Allowed ops/s drop or allocation peak growth, in percent")
+    args = parser.parse_args()
+
+    if args.source:
+        with open(args.source, encoding="utf-8") as f:
+            corpus = json.load(f)
+        origin = str(args.source)
+    else:
+        corpus = generate_corpus(args.scale, args.seed)
+        origin = f"synthetic scale={args.scale:g} seed={args.seed}"
+    facts = describe(corpus)
+    print(f"📖 {origin}: {facts['words']:,} words, {facts['segments']:,} segments, "
+          f"{facts['distinct_codes']:,} distinct codes")
+
+    available = stages(corpus)
+    unknown = set(args.stage or ()) - set(available)
+    if unknown:
+        raise SystemExit(f"❌ Unknown stage(s): {', '.join(sorted(unknown))} — choose from {', '.join(available)}")
+    results = measure({name: available[name] for name in args.stage or available}, args.repeat, args.min_time)
+    clear_caches()
+
+    report = {
+        "meta": {
+            "created": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            "corpus": {"origin": origin, **facts},
+            "repeat": args.repeat,
+            "min_time_s": args.min_time,
+            "python": platform.python_version(),
+            "machine": f"{platform.system()} {platform.machine()}",
+        },
+        "stages": results,
+    }
+    print_results(results)
+
+    if args.save_baseline:
+        args.save_baseline.write_text(json.dumps(report, indent=2) + "\n")
+        print(f"\n   ✓ Baseline written to {args.save_baseline}")
+    if args.baseline:
+        regressions = compare(json.loads(args.baseline.read_text()), report, args.threshold)
+        if regressions:
+            print(f"\n❌ {len(regressions)} regression(s) beyond the allowance:")
+            for r in regressions:
+                print(f"   ❌ {r}")
+            sys.exit(1)
+        print("\n   ✓ No regressions beyond the allowance")
+
+
+if __name__ == "__main__":
+    main()
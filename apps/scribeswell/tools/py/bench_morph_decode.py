@@ -0,0 +1,126 @@
+"""
+bench_morph_decode.py — OSHB morph decoder benchmark
+====================================================
+Decodes every morph code in an OSHB hebrew.json, in corpus order, and reports
+throughput for a cold run (empty caches), a warm run (every code cached), an
+uncached run over the distinct codes and — when NumPy is installed — the
+batch decode_morph_codes() columns. Also lists segments the decoder could
+not fully resolve, as a coverage check against the OSHB code spec.
+
+Usage:
+    python tools/py/bench_morph_decode.py --source <path/to/hebrew.json> [--repeat 5]
+"""
+
+import argparse
+import json
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "backend"))
+
+from services import oshb_morph
+from services.oshb_morph import decode_morph_codes, parse_morph_code
+
+
+def corpus_codes(source: Path) -> list[str]:
+    """Every non-empty morph code in the source, in corpus order."""
+    with open(source, encoding="utf-8") as f:
+        data = json.load(f)
+    return [
+        word[2]
+        for book in data.values()
+        for chapter in book
+        for verse in chapter
+        for word in verse
+        if isinstance(word, list) and len(word) > 2 and word[2]
+    ]
+
+
+def clear_caches() -> None:
+    parse_morph_code.cache_clear()
+    oshb_morph._parse_segment.cache_clear()
+
+
+def timed(fn, codes: list[str], repeat: int) -> float:
+    """Best-of-`repeat` seconds for one pass of fn over codes."""
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        for code in codes:
+            fn(code)
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def uncached(code: str):
+    clear_caches()
+    return parse_morph_code(code)
+
+
+def unresolved_segments(codes: set[str]) -> Counter:
+    """Segments with an unknown POS or a verb without stem/aspect."""
+    issues: Counter = Counter()
+    for code in codes:
+        for m in parse_morph_code(code):
+            if m.part_of_speech == "unknown":
+                issues[f"unknown POS: {m.pos_code!r}"] += 1
+            elif m.part_of_speech == "verb" and (m.verb_stem is None or m.verb_aspect is None):
+                issues[f"{m.language} verb stem/aspect: {m.pos_code!r}"] += 1
+    return issues
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the OSHB morph decoder")
+    parser.add_argument("--source", required=True, help="Path to hebrew.json (OSHB format)")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per measurement (best is kept)")
+    args = parser.parse_args()
+
+    codes = corpus_codes(Path(args.source))
+    distinct = sorted(set(codes))
+    print(f"📖 {len(codes):,} morph codes, {len(distinct):,} distinct")
+
+    cold = float("inf")
+    for _ in range(args.repeat):
+        clear_caches()
+        cold = min(cold, timed(parse_morph_code, codes, 1))
+    warm = timed(parse_morph_code, codes, args.repeat)
+    info = parse_morph_code.cache_info()
+    segments = oshb_morph._parse_segment.cache_info().currsize
+    raw = timed(uncached, distinct, args.repeat)
+    runs = [
+        ("cold (corpus order, empty cache)", len(codes), cold),
+        ("warm (corpus order, cached)", len(codes), warm),
+        ("uncached (distinct codes)", len(distinct), raw),
+    ]
+    try:
+        import numpy  # noqa: F401
+    except ImportError:
+        print("   (numpy not installed — skipping batch decode)")
+    else:
+        batch = float("inf")
+        for _ in range(args.repeat):
+            clear_caches()
+            t0 = time.perf_counter()
+            decode_morph_codes(codes)
+            batch = min(batch, time.perf_counter() - t0)
+        runs.append(("batch columns (empty cache)", len(codes), batch))
+
+    print("\n── Decode throughput ────────────────────────────────────")
+    print(f"   {'run':32} {'seconds':>9} {'codes/s':>12}")
+    for label, n, seconds in runs:
+        print(f"   {label:32} {seconds:>9.4f} {n / seconds if seconds else 0:>12,.0f}")
+
+    print(f"\n   cache: {info.currsize:,} codes / {segments:,} segments (maxsize {info.maxsize:,})")
+
+    issues = unresolved_segments(set(distinct))
+    print("\n── Coverage ─────────────────────────────────────────────")
+    if not issues:
+        print("   ✓ every segment decoded to a known part of speech")
+    for issue, count in issues.most_common(20):
+        print(f"   ⚠ {issue} ({count})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+bench_repository.py — Supabase REST vs asyncpg vs SQLite for the hot bible queries
+==================================================================================
+Times the BibleRepository calls behind the API's hot paths, through each
+implementation in backend/services/bible_repository.py:
+
+    chapter verses      chapter_verses(book_id, chapter)
+    chapter words       words_for_verses(<that chapter's verse ids>)
+    word by id          word(word_id)
+    chapter (both)      what GET .../verses costs in queries
+
+Connection settings come from backend/.env like the API's own:
+SUPABASE_URL / SUPABASE_SECRET_KEY for "supabase", DATABASE_URL for "asyncpg",
+SQLITE_PATH (or --sqlite) for "sqlite". Point the first two at the same
+database, and build the SQLite file from the same source
+(import_bible.py --sqlite), for a like-for-like comparison.
+
+Usage:
+    python tools/py/bench_repository.py [--backend supabase --backend asyncpg --backend sqlite] \\
+        [--sqlite corpus.sqlite3] [--book Ps --chapter 119 --word-id 1] [--iterations 200]
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parents[2] / "backend"
+sys.path.insert(0, str(BACKEND_DIR))
+
+from supabase import create_client  # noqa: E402
+
+from config import settings  # noqa: E402
+from services.bible_repository import (  # noqa: E402
+    AsyncpgBibleRepository,
+    SqliteBibleRepository,
+    SupabaseBibleRepository,
+)
+
+
+def open_repository(backend: str, sqlite_path: str):
+    if backend == "sqlite":
+        if not sqlite_path:
+            raise SystemExit("❌ SQLITE_PATH is not set (or pass --sqlite)")
+        return SqliteBibleRepository(sqlite_path)
+    if backend == "asyncpg":
+        if not settings.database_url:
+            raise SystemExit("❌ DATABASE_URL is not set")
+        return AsyncpgBibleRepository(settings.database_url)
+    return SupabaseBibleRepository(create_client(settings.supabase_url, settings.supabase_secret_key))
+
+
+def timings_ms(fn, iterations: int) -> list[float]:
+    fn()  # warm: connection, prepared statement
+    out = []
+    for _ in range(iterations):
+        t0 = time.perf_counter()
+        fn()
+        out.append((time.perf_counter() - t0) * 1000)
+    return out
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare BibleRepository implementations")
+    parser.add_argument("--backend", action="append", choices=["supabase", "asyncpg", "sqlite"],
+                        help="Backend to time (repeatable; default: supabase and asyncpg)")
+    parser.add_argument("--sqlite", default=settings.sqlite_path, help="Corpus file for the sqlite backend")
+    parser.add_argument("--book", default="Ps", help="OSIS id of the book")
+    parser.add_argument("--chapter", type=int, default=119, help="Chapter number")
+    parser.add_argument("--word-id", type=int, default=1, help="Word id for the point lookup")
+    parser.add_argument("--iterations", type=int, default=200, help="Timed calls per query")
+    args = parser.parse_args()
+
+    print(f"\n── {args.book} {args.chapter}, {args.iterations} calls per query ──────────────────────────")
+    print(f"   {'backend':9} {'query':16} {'rows':>6} {'p50 ms':>8} {'p95 ms':>8} {'mean ms':>8}")
+    for backend in args.backend or ["supabase", "asyncpg"]:
+        repo = open_repository(backend, args.sqlite)
+        book = repo.book(args.book)
+        if book is None:
+            raise SystemExit(f"❌ {backend}: book {args.book} not found")
+        verse_ids = [v["id"] for v in repo.chapter_verses(book["id"], args.chapter)]
+        queries = {
+            "chapter verses": lambda: repo.chapter_verses(book["id"], args.chapter),
+            "chapter words": lambda: repo.words_for_verses(verse_ids),
+            "word by id": lambda: [repo.word(args.word_id)],
+            "chapter (both)": lambda: repo.chapter_verses(book["id"], args.chapter)
+            + repo.words_for_verses(verse_ids),
+        }
+        for name, fn in queries.items():
+            rows = len(fn())
+            ms = sorted(timings_ms(fn, args.iterations))
+            p95 = ms[min(len(ms) - 1, int(len(ms) * 0.95))]
+            print(f"   {backend:9} {name:16} {rows:>6,} {statistics.median(ms):>8.2f} {p95:>8.2f} "
+                  f"{statistics.fmean(ms):>8.2f}")
+        if hasattr(repo, "close"):
+            repo.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""
+bench_verse_payload.py — verses payload size and parse time, rows vs columnar
+=============================================================================
+Builds one chapter's GET .../verses response from an OSHB hebrew.json with
+the backend's own builders, in the default row format and in
+?format=columnar, each with and without ?include=morphology. Reports the
+JSON size (raw and gzip) and JSON parse time — in Python, and in Node
+(the browser's JSON.parse) when `node` is on PATH.
+
+Usage:
+    python tools/py/bench_verse_payload.py --source <path/to/hebrew.json> \\
+        [--book Psalms --chapter 119] [--repeat 50]
+"""
+
+import argparse
+import gzip
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parents[2] / "backend"
+sys.path.insert(0, str(BACKEND_DIR))
+
+# Only the response builders are used — no Supabase connection is made.
+os.environ.setdefault("SUPABASE_URL", "http://localhost")
+os.environ.setdefault("SUPABASE_SECRET_KEY", "unused")
+
+from schemas.bible_schemas import VersesListResponse  # noqa: E402
+from services.bible_service import _build_columnar, _build_verses  # noqa: E402
+
+
+def chapter_rows(source: Path, book: str, chapter_num: int) -> tuple[list[dict], list[dict]]:
+    """verse_read / word_read rows for one chapter, as the API would fetch them."""
+    with open(source, encoding="utf-8") as f:
+        verses = json.load(f)[book][chapter_num - 1]
+    verse_rows, word_rows = [], []
+    word_id = 1
+    for verse_num, verse in enumerate(verses, 1):
+        verse_rows.append({"id": verse_num, "verse_num": verse_num, "book_id": 1, "chapter_num": chapter_num})
+        for position, word in enumerate(verse, 1):
+            surface = word[0]
+            word_rows.append({
+                "id": word_id,
+                "verse_id": verse_num,
+                "position": position,
+                "surface_he": surface,
+                "display_he": surface.replace("/", ""),
+                "lemma_strong": word[1] if len(word) > 1 else None,
+                "morph_code": word[2] if len(word) > 2 else None,
+            })
+            word_id += 1
+    return verse_rows, word_rows
+
+
+def best_of(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def node_parse_ms(payloads: dict[str, bytes], repeat: int) -> dict[str, float]:
+    """Best-of-`repeat` JSON.parse time per payload in Node, or {} without node."""
+    node = shutil.which("node")
+    if not node:
+        return {}
+    script = (
+        "const fs = require('fs'); const out = {};"
+        "for (const [name, path] of Object.entries(JSON.parse(process.argv[1]))) {"
+        "  const text = fs.readFileSync(path, 'utf8'); let best = Infinity;"
+        f"  for (let i = 0; i < {repeat}; i++) {{"
+        "    const t0 = process.hrtime.bigint(); JSON.parse(text);"
+        "    best = Math.min(best, Number(process.hrtime.bigint() - t0) / 1e6); }"
+        "  out[name] = best; }"
+        "console.log(JSON.stringify(out));"
+    )
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = {}
+        for name, body in payloads.items():
+            paths[name] = str(Path(tmp) / f"{len(paths)}.json")
+            Path(paths[name]).write_bytes(body)
+        result = subprocess.run(
+            [node, "-e", script, json.dumps(paths)], capture_output=True, text=True, check=True
+        )
+    return json.loads(result.stdout)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare row vs columnar verses payloads")
+    parser.add_argument("--source", required=True, help="Path to hebrew.json (OSHB format)")
+    parser.add_argument("--book", default="Psalms", help="Book name as keyed in the source")
+    parser.add_argument("--chapter", type=int, default=119, help="Chapter number")
+    parser.add_argument("--repeat", type=int, default=50, help="Runs per timing (best is kept)")
+    args = parser.parse_args()
+
+    verse_rows, word_rows = chapter_rows(Path(args.source), args.book, args.chapter)
+    print(f"📖 {args.book} {args.chapter}: {len(verse_rows)} verses, {len(word_rows):,} words")
+
+    payloads: dict[str, bytes] = {}
+    for morphology in (False, True):
+        suffix = " +morphology" if morphology else ""
+        rows = VersesListResponse(data=_build_verses(verse_rows, word_rows, morphology, None), total=len(verse_rows))
+        columnar = _build_columnar(verse_rows, word_rows, morphology, None)
+        payloads[f"rows{suffix}"] = rows.model_dump_json(exclude_unset=True).encode()
+        payloads[f"columnar{suffix}"] = columnar.model_dump_json(exclude_unset=True).encode()
+
+    node_ms = node_parse_ms(payloads, args.repeat)
+
+    print("\n── Payload ──────────────────────────────────────────────────────────")
+    print(f"   {'format':22} {'bytes':>10} {'gzip':>9} {'py parse ms':>12} {'node parse ms':>14}")
+    for name, body in payloads.items():
+        py_ms = best_of(lambda: json.loads(body), args.repeat) * 1000
+        node = f"{node_ms[name]:>14.3f}" if name in node_ms else f"{'—':>14}"
+        print(f"   {name:22} {len(body):>10,} {len(gzip.compress(body)):>9,} {py_ms:>12.3f} {node}")
+
+    for suffix in ("", " +morphology"):
+        rows, columnar = payloads[f"rows{suffix}"], payloads[f"columnar{suffix}"]
+        print(f"   columnar vs rows{suffix}: raw {len(columnar) / len(rows) - 1:+.0%}, "
+              f"gzip {len(gzip.compress(columnar)) / len(gzip.compress(rows)) - 1:+.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+bench_wire_formats.py — JSON vs MessagePack vs CBOR for verses payloads
+=======================================================================
+Builds one chapter's GET .../verses response from an OSHB hebrew.json with
+the backend's own builders (rows and ?format=columnar, each with and without
+?include=morphology) and, for every wire format the backend can negotiate
+(backend/renderers.py), reports:
+
+    encode ms   what the server does: JSON via pydantic-core dump_json (FastAPI's
+                path); MessagePack / CBOR via the JSON-mode dump + packer
+    decode ms   what a Python client does: json.loads / msgpack.unpackb / cbor2.loads
+    bytes, gzip response size
+
+Usage:
+    python tools/py/bench_wire_formats.py --source <path/to/hebrew.json> \\
+        [--book Psalms --chapter 119] [--repeat 30]
+"""
+
+import argparse
+import gzip
+import json
+import os
+import sys
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parents[2] / "backend"
+sys.path.insert(0, str(BACKEND_DIR))
+
+# Only the response builders are used — no Supabase connection is made.
+os.environ.setdefault("SUPABASE_URL", "http://localhost")
+os.environ.setdefault("SUPABASE_SECRET_KEY", "unused")
+
+from bench_verse_payload import best_of, chapter_rows  # noqa: E402
+from renderers import CBOR_MEDIA_TYPE, MSGPACK_MEDIA_TYPE, cbor2, msgpack  # noqa: E402
+from schemas.bible_schemas import VersesListResponse  # noqa: E402
+from services.bible_service import _build_columnar, _build_verses  # noqa: E402
+
+
+def wire_formats() -> dict:
+    """name → (encode(model) -> bytes, decode(bytes)) for each available format."""
+    formats = {
+        "json": (
+            lambda model: model.model_dump_json(exclude_unset=True).encode(),
+            json.loads,
+        ),
+    }
+    if msgpack is not None:
+        formats["msgpack"] = (
+            lambda model: msgpack.packb(model.model_dump(mode="json", exclude_unset=True), use_bin_type=True),
+            msgpack.unpackb,
+        )
+    else:
+        print(f"⚠️  msgpack not installed — {MSGPACK_MEDIA_TYPE} skipped")
+    if cbor2 is not None:
+        formats["cbor"] = (
+            lambda model: cbor2.dumps(model.model_dump(mode="json", exclude_unset=True)),
+            cbor2.loads,
+        )
+    else:
+        print(f"⚠️  cbor2 not installed — {CBOR_MEDIA_TYPE} skipped")
+    return formats
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare JSON / MessagePack / CBOR verses payloads")
+    parser.add_argument("--source", required=True, help="Path to hebrew.json (OSHB format)")
+    parser.add_argument("--book", default="Psalms", help="Book name as keyed in the source")
+    parser.add_argument("--chapter", type=int, default=119, help="Chapter number")
+    parser.add_argument("--repeat", type=int, default=30, help="Runs per timing (best is kept)")
+    args = parser.parse_args()
+
+    verse_rows, word_rows = chapter_rows(Path(args.source), args.book, args.chapter)
+    print(f"📖 {args.book} {args.chapter}: {len(verse_rows)} verses, {len(word_rows):,} words")
+
+    payloads = {}
+    for morphology in (False, True):
+        suffix = " +morphology" if morphology else ""
+        payloads[f"rows{suffix}"] = VersesListResponse(
+            data=_build_verses(verse_rows, word_rows, morphology, None), total=len(verse_rows)
+        )
+        payloads[f"columnar{suffix}"] = _build_columnar(verse_rows, word_rows, morphology, None)
+
+    formats = wire_formats()
+    print("\n── Wire formats ─────────────────────────────────────────────────────────────")
+    print(f"   {'payload':22} {'format':8} {'bytes':>10} {'gzip':>9} {'encode ms':>10} {'decode ms':>10}")
+    for payload_name, model in payloads.items():
+        for format_name, (encode, decode) in formats.items():
+            body = encode(model)
+            encode_ms = best_of(lambda: encode(model), args.repeat) * 1000
+            decode_ms = best_of(lambda: decode(body), args.repeat) * 1000
+            print(f"   {payload_name:22} {format_name:8} {len(body):>10,} {len(gzip.compress(body)):>9,} "
+                  f"{encode_ms:>10.2f} {decode_ms:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
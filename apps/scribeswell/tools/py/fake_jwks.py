@@ -0,0 +1,155 @@
+"""
+fake_jwks.py — local stand-in for Supabase Auth's signing keys
+==============================================================
+Serves a JWKS the way a project with asymmetric signing keys does, and
+mints tokens signed with its keys, over HTTP on localhost. Point
+JWT_JWKS_URL at it to run a backend's ES256 / RS256 verification
+(auth/jwks.py) with no Supabase project:
+
+    GET  /auth/v1/.well-known/jwks.json   the public keys (Cache-Control: max-age)
+    GET  /token?sub=..&role=admin&alg=ES256&ttl=3600
+                                          a token signed with the current key
+                                          for alg (ES256 or RS256)
+    POST /rotate                          a new key per algorithm; the old ones
+                                          stay published (as after a rotation)
+
+Each run generates fresh keys. --max-age sets the Cache-Control lifetime the
+backend refreshes by. Stop the server to see the backend keep serving its
+cached keys (stale-while-revalidate).
+
+Usage:
+    python tools/py/fake_jwks.py [--port 54340] [--max-age 600]
+"""
+
+import argparse
+import json
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec, rsa
+from jose import jwt
+from jose.utils import long_to_base64
+
+JWKS_PATH = "/auth/v1/.well-known/jwks.json"
+
+
+def _b64(n: int, size: int = 0) -> str:
+    return long_to_base64(n, size=size).decode()
+
+
+class FakeJwks:
+    """ES256 and RS256 signing keys, their JWKS, and tokens signed with them."""
+
+    def __init__(self, max_age: int = 600):
+        self.max_age = max_age
+        self.public: list[dict] = []
+        self.current: dict[str, tuple[str, bytes]] = {}  # alg → (kid, private PEM)
+        self._lock = threading.Lock()
+        self.rotate()
+
+    def rotate(self) -> None:
+        """A new current key per algorithm; earlier keys stay in the JWKS."""
+        keys = {"ES256": ec.generate_private_key(ec.SECP256R1()), "RS256": rsa.generate_private_key(65537, 2048)}
+        with self._lock:
+            for alg, key in keys.items():
+                kid = str(uuid.uuid4())
+                numbers = key.public_key().public_numbers()
+                if alg == "ES256":
+                    jwk = {"kty": "EC", "crv": "P-256", "x": _b64(numbers.x, 32), "y": _b64(numbers.y, 32)}
+                else:
+                    jwk = {"kty": "RSA", "n": _b64(numbers.n), "e": _b64(numbers.e)}
+                self.public.append({**jwk, "kid": kid, "alg": alg, "use": "sig"})
+                pem = key.private_bytes(
+                    serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption()
+                )
+                self.current[alg] = (kid, pem)
+
+    def jwks(self) -> dict:
+        with self._lock:
+            return {"keys": list(self.public)}
+
+    def token(self, sub: str = "00000000-0000-0000-0000-000000000001", roles: tuple[str, ...] = (),
+              alg: str = "ES256", ttl: int = 3600) -> str:
+        """A Supabase-shaped access token signed with the current `alg` key."""
+        with self._lock:
+            kid, pem = self.current[alg]
+        now = int(time.time())
+        claims = {
+            "sub": sub,
+            "role": "authenticated",
+            "aud": "authenticated",
+            "iat": now,
+            "exp": now + ttl,
+            "user_roles": list(roles),
+        }
+        return jwt.encode(claims, pem, algorithm=alg, headers={"kid": kid})
+
+    def serve(self, host: str = "127.0.0.1", port: int = 0) -> ThreadingHTTPServer:
+        """An HTTP server for these keys (port 0 picks a free one); call serve_forever()."""
+        keys = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def do_GET(self) -> None:
+                url = urlsplit(self.path)
+                if url.path == JWKS_PATH:
+                    return self._send(200, keys.jwks(), {"Cache-Control": f"public, max-age={keys.max_age}"})
+                if url.path == "/token":
+                    q = {k: v[-1] for k, v in parse_qs(url.query).items()}
+                    alg = q.get("alg", "ES256")
+                    if alg not in keys.current:
+                        return self._send(400, {"message": f"alg must be one of {', '.join(keys.current)}"})
+                    roles = [r for r in q.get("role", "").split(",") if r]
+                    token = keys.token(q.get("sub", "00000000-0000-0000-0000-000000000001"), roles, alg,
+                                       int(q.get("ttl", 3600)))
+                    return self._send(200, {"access_token": token, "token_type": "bearer"})
+                return self._send(404, {"message": "not found"})
+
+            def do_POST(self) -> None:
+                if urlsplit(self.path).path == "/rotate":
+                    keys.rotate()
+                    return self._send(200, keys.jwks())
+                return self._send(404, {"message": "not found"})
+
+            def _send(self, status: int, body: dict, headers: dict = None) -> None:
+                data = json.dumps(body).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, format: str, *args) -> None:
+                pass
+
+        return ThreadingHTTPServer((host, port), Handler)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Serve a JWKS and mint tokens signed with its keys")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=54340,
+                        help="Port (clear of the 54320-54329 range a local Supabase uses)")
+    parser.add_argument("--max-age", type=int, default=600, help="Cache-Control max-age of the JWKS, seconds")
+    args = parser.parse_args()
+
+    server = FakeJwks(args.max_age).serve(args.host, args.port)
+    base = f"http://{args.host}:{server.server_port}"
+    print(f"🔑 JWT_JWKS_URL={base}{JWKS_PATH}")
+    print(f"   token: curl '{base}/token?role=admin&alg=ES256'")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,187 @@
+"""
+fake_postgrest.py — local PostgREST stand-in over a SQLite corpus file
+======================================================================
+Serves the scribeswell *_read views that SupabaseBibleRepository queries
+from a corpus file written by import_bible.py --sqlite, over HTTP on
+localhost. Point SUPABASE_URL at it and the API runs its real Supabase code
+path (supabase-py, HTTP, JSON) with no network and no Supabase project —
+for benchmarks (bench_endpoints.py) and offline development.
+
+Only the PostgREST subset the repository uses is implemented:
+
+    GET /rest/v1/<view>?select=a,b&col=eq.X&col=in.(1,2)&order=a.asc,b.desc
+        &offset=N&limit=M
+
+Unknown views or columns get PostgREST's 404 / 400 error shape. Requests
+for a single object (Accept: application/vnd.pgrst.object+json, as sent by
+.single()) get the row itself, or 406 unless exactly one row matched.
+
+--latency-ms adds a fixed delay per request, to stand in for the round trip
+to a hosted database.
+
+Usage:
+    python tools/py/fake_postgrest.py corpus.sqlite3 [--port 54321] [--latency-ms 0]
+"""
+
+import argparse
+import json
+import re
+import sqlite3
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Optional
+from urllib.parse import parse_qsl, urlsplit
+
+# View → table (or subquery) in the SQLite file
+VIEWS = {
+    "book_read": "book",
+    "chapter_read": "chapter",
+    "verse_read": "verse",
+    "word_read": "word",
+    "lexicon_read": "lexicon",
+    # A file carries one corpus, which is the active one
+    "corpus_version_read": "(SELECT version, 'active' AS status FROM corpus_version)",
+}
+
+OBJECT_MEDIA_TYPE = "application/vnd.pgrst.object+json"
+
+_IN_LIST = re.compile(r"^\((.*)\)$")
+
+
+class QueryError(Exception):
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+class FakePostgrest:
+    """Translate PostgREST GETs into SQL on a read-only SQLite corpus file."""
+
+    def __init__(self, path: Path, latency_ms: float = 0.0):
+        self.uri = f"{Path(path).resolve().as_uri()}?mode=ro"
+        self.latency_s = latency_ms / 1000
+        self._local = threading.local()
+        self.columns = {
+            view: [d[0] for d in self._connect().execute(f"SELECT * FROM {source} LIMIT 0").description]
+            for view, source in VIEWS.items()
+        }
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._local.conn = sqlite3.connect(self.uri, uri=True)
+        return conn
+
+    def _column(self, view: str, name: str) -> str:
+        if name not in self.columns[view]:
+            raise QueryError(400, f"column {view}.{name} does not exist")
+        return name
+
+    def query(self, view: str, params: list[tuple[str, str]]) -> list[dict]:
+        """Rows of `view` for PostgREST query-string `params`."""
+        if view not in VIEWS:
+            raise QueryError(404, f"relation scribeswell.{view} does not exist")
+        select, where, args, order = "*", [], [], []
+        limit, offset = -1, 0
+        for key, value in params:
+            if key == "select":
+                select = ", ".join(self._column(view, c) for c in value.split(",")) if value != "*" else "*"
+            elif key == "order":
+                for term in value.split(","):
+                    column, _, direction = term.partition(".")
+                    direction = direction.split(".")[0] or "asc"
+                    if direction not in ("asc", "desc"):
+                        raise QueryError(400, f"bad order direction {direction!r}")
+                    order.append(f"{self._column(view, column)} {direction.upper()}")
+            elif key == "limit":
+                limit = int(value)
+            elif key == "offset":
+                offset = int(value)
+            else:
+                op, _, operand = value.partition(".")
+                column = self._column(view, key)
+                if op == "eq":
+                    where.append(f"{column} = ?")
+                    args.append(operand)
+                elif op == "in" and (m := _IN_LIST.match(operand)):
+                    items = [v.strip().strip('"') for v in m.group(1).split(",") if v.strip()]
+                    where.append(f"{column} IN ({', '.join('?' * len(items))})" if items else "0")
+                    args.extend(items)
+                else:
+                    raise QueryError(400, f"unsupported filter {key}={value}")
+        sql = f"SELECT {select} FROM {VIEWS[view]}"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        if order:
+            sql += " ORDER BY " + ", ".join(order)
+        sql += f" LIMIT {limit} OFFSET {offset}"
+        cursor = self._connect().execute(sql, args)
+        names = [d[0] for d in cursor.description]
+        return [dict(zip(names, row)) for row in cursor.fetchall()]
+
+    def serve(self, host: str = "127.0.0.1", port: int = 0) -> ThreadingHTTPServer:
+        """An HTTP server for this corpus (port 0 picks a free one); call serve_forever()."""
+        api = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # keep-alive, as PostgREST behind Kong
+            disable_nagle_algorithm = True  # headers and body are separate writes
+
+            def do_GET(self) -> None:
+                url = urlsplit(self.path)
+                if api.latency_s:
+                    time.sleep(api.latency_s)
+                if not url.path.startswith("/rest/v1/"):
+                    return self._send(404, {"message": "not found"})
+                try:
+                    rows = api.query(url.path[len("/rest/v1/"):], parse_qsl(url.query))
+                except (QueryError, ValueError, sqlite3.Error) as e:
+                    status = e.status if isinstance(e, QueryError) else 400
+                    return self._send(status, {"message": getattr(e, "message", str(e))})
+                if OBJECT_MEDIA_TYPE in self.headers.get("Accept", ""):
+                    if len(rows) != 1:
+                        return self._send(406, {
+                            "code": "PGRST116",
+                            "message": "JSON object requested, multiple (or no) rows returned",
+                            "details": f"The result contains {len(rows)} rows",
+                        })
+                    return self._send(200, rows[0])
+                return self._send(200, rows, content_range=len(rows))
+
+            def _send(self, status: int, body, content_range: Optional[int] = None) -> None:
+                data = json.dumps(body, ensure_ascii=False).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json; charset=utf-8")
+                self.send_header("Content-Length", str(len(data)))
+                if content_range is not None:
+                    self.send_header("Content-Range", f"0-{content_range - 1}/*" if content_range else "*/*")
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, format: str, *args) -> None:
+                pass
+
+        return ThreadingHTTPServer((host, port), Handler)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Serve a SQLite corpus file as the scribeswell PostgREST views")
+    parser.add_argument("sqlite", type=Path, help="Corpus file written by import_bible.py --sqlite")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=54321, help="Port (Supabase's local API port by default)")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Delay added to every request")
+    args = parser.parse_args()
+
+    server = FakePostgrest(args.sqlite, args.latency_ms).serve(args.host, args.port)
+    print(f"📡 {args.sqlite} on http://{args.host}:{server.server_port} — SUPABASE_URL for the API")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -5,6 +5,27 @@ Reads the OSHB hebrew.json source file and populates the scribeswell schema in S
 
 Usage:
     python tools/py/import_bible.py --source <path/to/hebrew.json> [--dry-run] [--book Gen]
+        [--batch-size 500] [--concurrency 4] [--max-retries 5]
+        [--staged [--no-promote] [--defer-indexes]] [--skip-morphemes]
+        [--metrics-jsonl metrics.jsonl] [--profile import.prof]
+        [--lexicon <path/to/strongs-hebrew-dictionary.js>]
+    python tools/py/import_bible.py --lexicon <path/to/strongs-hebrew-dictionary.js>
+    python tools/py/import_bible.py --rollback
+    python tools/py/import_bible.py --source <path/to/hebrew.json> --sqlite corpus.sqlite3
+        [--lexicon <path/to/strongs-hebrew-dictionary.js>] [--sqlite-version N]
+
+Staged imports (--staged) load into the scribeswell_staging schema while the
+API keeps reading the active corpus, then promote_staging() swaps the *_read
+views to the new version in one transaction. The previous version is kept;
+--rollback swaps back to it. With --defer-indexes the staging tables are
+loaded with plain INSERTs and no secondary indexes or UNIQUE/FK constraints;
+those are rebuilt (concurrently) and validated after the load, before promote.
+
+Every run ends with a time-by-stage table (parse, decode, serialize, network,
+server per table — see import_metrics.py); --metrics-jsonl also writes each
+request, book and the summary as JSON lines. --profile saves a cProfile of
+the main thread (parse/decode, and all work in --dry-run) and prints the top
+functions by cumulative time.
 
 Requirements:
     pip install supabase python-dotenv tqdm
@@ -15,40 +36,71 @@ Environment variables (from .env or environment):
 
 JSON shape expected (OSHB format):
     {
-      "Gen": {
-        "1": {
-          "1": [
-            { "w": "בְּ", "morph": "HR/Sp3ms", "strong": "H0" },
+      "Genesis": [                       # book, keyed by English name
+        [                                # chapter 1
+          [                              # verse 1
+            ["בְּ/רֵאשִׁ֖ית", "b/7225", "HR/Ncfsa"],
             ...
           ]
-        }
-      },
+        ]
+      ],
       ...
     }
 
-Each word object may have:
-    w      — surface Hebrew text (required)
-    morph  — OSHB morph code (optional)
-    strong — Strong's number (optional)
-    x      — alternate/display form (optional)
+Each word is a list of:
+    [0] surface Hebrew text, '/' between morphemes (required)
+    [1] lemma / Strong's number (optional)
+    [2] OSHB morph code (optional)
+
+Each book is walked once; verse, word and morpheme rows are emitted together
+and the run ends with a morphology accounting report.
+
+Every distinct morph code seen is upserted into scribeswell.morph_code_dict
+(decoded once per code, shared by all corpus versions); the scribeswell API
+serves morphology from it. The per-segment morpheme table is still written
+by default: platform/backend reads morpheme_read, and the morphology filter
+indexes (20261019030000_scribeswell_morphology_indexes.sql) are on it —
+word_morpheme_read expands the dictionary into the same shape, but per query
+and without those indexes. --skip-morphemes leaves the table empty, for a
+corpus that only the scribeswell API reads.
+
+--lexicon upserts a Strong's Hebrew dictionary (see strongs_lexicon.py) into
+scribeswell.lexicon, shared by all corpus versions like morph_code_dict. On
+its own it imports just the lexicon; with --source, before the corpus.
+
+--sqlite writes the corpus (and --lexicon) to a single SQLite file instead —
+no Supabase connection or credentials. The backend serves it with
+BIBLE_REPOSITORY=sqlite (see sqlite_corpus.py). The file's version is
+--sqlite-version, or the build time in Unix seconds.
 """
 
 import argparse
+import cProfile
+import functools
 import json
 import os
+import pstats
 import re
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 
 from dotenv import load_dotenv
 
 # ── Path setup ────────────────────────────────────────────────────────────────
 REPO_ROOT = Path(__file__).resolve().parents[2]
+# The OSHB decoder is the API's own (backend/services/oshb_morph.py)
+sys.path.insert(0, str(REPO_ROOT / "backend"))
 sys.path.insert(0, str(Path(__file__).parent))
 
-from oshb_morph import parse_morph_code
+from import_metrics import ImportMetrics
+from services.oshb_morph import morpheme_fields, parse_morph_code
+from sqlite_corpus import SqliteCorpusWriter
+from strongs_lexicon import load_lexicon
+from write_scheduler import WriteScheduler, is_transient
 
 # ── Load env ──────────────────────────────────────────────────────────────────
 load_dotenv(REPO_ROOT / ".env")
@@ -122,20 +174,80 @@ def is_lexical(text):
 
 # ── Batch helpers ─────────────────────────────────────────────────────────────
 
+# Starting size only — WriteScheduler adapts it per table during the run.
 BATCH_SIZE = 500
+CONCURRENCY = 4
+MAX_RETRIES = 5
+
+# PostgREST max_rows (supabase/config.toml) — caps rows echoed back per write.
+PAGE_SIZE = 1000
+
+# Staged imports load here, then promote_staging() swaps the *_read views.
+LIVE_SCHEMA = "scribeswell"
+STAGING_SCHEMA = "scribeswell_staging"
+
+# Not versioned with the corpus — always written to LIVE_SCHEMA.
+SHARED_TABLES = {"morph_code_dict", "lexicon"}
+
+
+# ── Morph decoding ────────────────────────────────────────────────────────────
+
+@functools.lru_cache(maxsize=None)
+def decode_morph_code(morph_code: str) -> tuple[dict, ...]:
+    """
+    Memoized parse_morph_code → morpheme column values, one dict per segment.
+
+    The OSHB has a few thousand distinct codes across ~300k words, so each
+    code is decoded once per run. Callers must copy before mutating.
+    """
+    segments = []
+    for pm in parse_morph_code(morph_code):
+        fields = morpheme_fields(pm)
+        del fields["pos_type"]  # morph_code_dict only; the morpheme table has no such column
+        segments.append(fields)
+    return tuple(segments)
+
 
+def morph_dict_row(morph_code: str) -> dict:
+    """scribeswell.morph_code_dict row: every decoded field of every segment."""
+    segments = [morpheme_fields(pm) for pm in parse_morph_code(morph_code)]
+    return {"code": morph_code, "segment_count": len(segments), "segments": segments}
 
-def chunked(lst: list, size: int):
-    for i in range(0, len(lst), size):
-        yield lst[i : i + size]
+
+def count_morph_segments(morph_code: str) -> int:
+    """Number of non-empty '/' segments in a raw morph code (decoder-independent)."""
+    return sum(1 for seg in morph_code.split("/") if seg.strip()) or 1
 
 
 # ── Importer ──────────────────────────────────────────────────────────────────
 
 class BibleImporter:
-    def __init__(self, supabase_url: str, secret_key: str, dry_run: bool = False):
+    def __init__(
+        self,
+        supabase_url: str,
+        secret_key: str,
+        dry_run: bool = False,
+        batch_size: int = BATCH_SIZE,
+        concurrency: int = CONCURRENCY,
+        max_retries: int = MAX_RETRIES,
+        staged: bool = False,
+        defer_indexes: bool = False,
+        skip_morphemes: bool = False,
+        metrics_path: Optional[Path] = None,
+        sqlite_path: Optional[Path] = None,
+    ):
+        if defer_indexes and not staged:
+            raise ValueError("defer_indexes requires a staged import (empty target tables)")
+        if sqlite_path and (staged or dry_run):
+            raise ValueError("a SQLite corpus file is written directly — not staged, not a dry run")
         self.dry_run = dry_run
-        if not dry_run:
+        self.staged = staged
+        self.defer_indexes = defer_indexes
+        # The SQLite file has no morpheme table
+        self.skip_morphemes = skip_morphemes or sqlite_path is not None
+        self.schema = STAGING_SCHEMA if staged else LIVE_SCHEMA
+        self.sqlite = SqliteCorpusWriter(sqlite_path) if sqlite_path else None
+        if not dry_run and self.sqlite is None:
             try:
                 from supabase import create_client
                 self.sb = create_client(supabase_url, secret_key)
@@ -148,17 +260,131 @@ class BibleImporter:
         self.stats = {
             "books": 0, "chapters": 0, "verses": 0,
             "words": 0, "morphemes": 0, "errors": 0,
+            "words_with_morph": 0, "morphemes_expected": 0,
+            "morphemes_unresolved": 0, "morph_codes": 0, "lexicon": 0,
         }
+        self.morph_codes: set[str] = set()
+
+        self.metrics = ImportMetrics(metrics_path)
+        self._clients: dict[str, object] = {}
+        self._clients_lock = threading.Lock()
+        self._decode_s = 0.0  # decode time of the book being walked
+
+        self.writer = WriteScheduler(
+            self._send_batch,
+            batch_size=batch_size,
+            concurrency=concurrency,
+            max_retries=max_retries,
+        )
 
     # ── upsert helpers ────────────────────────────────────────────────────────
 
-    def _upsert(self, table: str, rows: list[dict], on_conflict: str) -> None:
+    def _client(self, schema: str):
+        # sb.schema() builds a new PostgREST client (and HTTP connection pool)
+        # per call — keep one per schema, instrumented for stage timing.
+        with self._clients_lock:
+            if schema not in self._clients:
+                client = self.sb.schema(schema)
+                session = getattr(client, "session", None)
+                if session is not None:
+                    self.metrics.instrument_http(session)
+                self._clients[schema] = client
+            return self._clients[schema]
+
+    def _table(self, table: str):
+        schema = LIVE_SCHEMA if table in SHARED_TABLES else self.schema
+        return self._client(schema).table(table)
+
+    def _rpc(self, fn: str, params: Optional[dict] = None, *, retry: bool = True):
+        """
+        Call a corpus lifecycle function (always in the scribeswell schema).
+        retry=False sends it once: for functions that are not safe to replay
+        when a response is lost (create_staging, promote_staging, rollback_corpus).
+        """
+        def call():
+            self.metrics.begin_request()
+            try:
+                data = self._client("scribeswell").rpc(fn, params or {}).execute().data
+            except Exception as e:
+                self.metrics.end_request(f"{fn}()", error=e)
+                raise
+            self.metrics.end_request(f"{fn}()")
+            return data
+
+        return self.writer.call(call) if retry else call()
+
+    def _active_version(self) -> Optional[int]:
+        """The active corpus version, from corpus_version_read."""
+        rows = self.writer.call(
+            lambda: self._client("scribeswell").table("corpus_version_read")
+            .select("version").eq("status", "active").execute().data
+        )
+        return rows[0]["version"] if rows else None
+
+    def _switch_version(self, fn: str) -> int:
+        """
+        promote_staging() / rollback_corpus(), sent once. If the call fails
+        without an answer, corpus_version_read tells whether it committed:
+        a replay would promote an empty staging schema, or roll back twice.
+        """
+        before = self._active_version()
+        try:
+            return self._rpc(fn, retry=False)
+        except Exception as e:
+            if not is_transient(e):
+                raise
+            after = self._active_version()
+            if after is None or after == before:
+                raise
+            print(f"   ⚠ {fn}() response lost ({e!r}); it committed — version {after} is active")
+            return after
+
+    def _send_batch(
+        self, table: str, batch: list[dict], on_conflict: str, returning: Optional[str]
+    ) -> Optional[list[dict]]:
+        from postgrest import ReturnMethod
+
+        self.metrics.begin_request()
+        try:
+            method = ReturnMethod.representation if returning else ReturnMethod.minimal
+            if self.defer_indexes and table not in SHARED_TABLES and on_conflict != "id":
+                # Staging starts empty and has no UNIQUE constraints to conflict on (the
+                # primary key is kept); a resent batch's duplicates go in dedupe_staging()
+                query = self._table(table).insert(batch, returning=method)
+            else:
+                query = self._table(table).upsert(batch, on_conflict=on_conflict, returning=method)
+            if returning:
+                query = query.select(returning)
+            echoed = query.execute().data
+        except Exception as e:
+            self.metrics.end_request(table, len(batch), error=e)
+            raise
+        self.metrics.end_request(table, len(batch))
+        if returning and len(echoed) != len(batch):
+            raise RuntimeError(
+                f"{table}: {len(batch)} rows written but {len(echoed)} echoed back"
+            )
+        return echoed
+
+    def _upsert(
+        self, table: str, rows: list[dict], on_conflict: str, returning: Optional[str] = None
+    ) -> list[dict]:
+        """
+        Write rows; with `returning`, return those columns for every row so
+        ids can be mapped without a follow-up select (or a secondary index).
+        """
         if self.dry_run or not rows:
-            return
-        for batch in chunked(rows, BATCH_SIZE):
-            self.sb.schema("scribeswell").table(table).upsert(
-                batch, on_conflict=on_conflict
-            ).execute()
+            return []
+        if self.sqlite is not None:
+            # Local and synchronous: the whole write is the "server" stage
+            with self.metrics.stage("server", table, len(rows)):
+                return self.sqlite.insert(table, rows)
+        return self.writer.write(
+            table, rows, on_conflict,
+            returning=returning,
+            # PostgREST caps echoed rows at max_rows
+            max_batch_size=PAGE_SIZE if returning else None,
+        )
 
     # ── seed books ────────────────────────────────────────────────────────────
 
@@ -169,6 +395,86 @@ class BibleImporter:
         self.stats["books"] = len(BOOK_METADATA)
         print(f"   ✓ {len(BOOK_METADATA)} books")
 
+    # ── row emitter ───────────────────────────────────────────────────────────
+
+    def _iter_book_rows(
+        self, book_id: int, book_name: str, book_data: list
+    ) -> Iterator[tuple[str, tuple, dict]]:
+        """
+        Walk a book once, yielding ("verse" | "word" | "morpheme", key, row).
+
+        Keys are source coordinates — (chapter, verse) for verses and
+        (chapter, verse, position) for words and morphemes — used to attach
+        database ids once the parent rows exist. Time spent decoding morph
+        codes is recorded as the "decode" stage once the book is exhausted.
+        """
+        decode_s = 0.0
+        for ch_idx, ch_data in enumerate(book_data, start=1):
+            for v_idx, v_words in enumerate(ch_data, start=1):
+                yield "verse", (ch_idx, v_idx), {
+                    "chapter_id": None,
+                    "verse_num": v_idx,
+                    "book_id": book_id,
+                    "chapter_num": ch_idx,
+                }
+
+                if not isinstance(v_words, list):
+                    continue
+
+                for pos_idx, word_obj in enumerate(v_words, start=1):
+                    where = f"{book_name} {ch_idx}:{v_idx} pos {pos_idx}"
+                    if not isinstance(word_obj, list) or len(word_obj) < 2:
+                        raise ValueError(f"   ⚠ Unexpected word object format at {where}: {word_obj}")
+
+                    # OSHB words are [text, lemma, morph]; some sources swap
+                    # text and lemma, so pick whichever carries Hebrew.
+                    surface = ""
+                    strong = None
+                    if word_obj[0] and is_hebrew(word_obj[0]):
+                        surface, strong = word_obj[0], word_obj[1]
+                    elif word_obj[1] and is_hebrew(word_obj[1]):
+                        surface, strong = word_obj[1], word_obj[0]
+                    if not surface and strong:
+                        raise ValueError(f"   ⚠ Missing Hebrew surface text at {where}: {word_obj}")
+
+                    morph_code: Optional[str] = word_obj[2] if len(word_obj) > 2 else None
+
+                    yield "word", (ch_idx, v_idx, pos_idx), {
+                        "verse_id": None,
+                        "position": pos_idx,
+                        "surface_he": surface,
+                        "display_he": surface.replace("/", ""),
+                        "lemma_strong": strong,
+                        "morph_code": morph_code,
+                        "book_id": book_id,
+                    }
+
+                    if not morph_code:
+                        continue
+
+                    self.stats["morphemes_expected"] += count_morph_segments(morph_code)
+                    t0 = time.perf_counter()
+                    try:
+                        decoded = decode_morph_code(morph_code)
+                    except Exception as e:
+                        self.stats["errors"] += 1
+                        if self.dry_run:
+                            print(f"   ⚠ morph parse error for {morph_code!r}: {e}")
+                        continue
+                    finally:
+                        decode_s += time.perf_counter() - t0
+                    self.morph_codes.add(morph_code)
+
+                    for seg_idx, fields in enumerate(decoded):
+                        yield "morpheme", (ch_idx, v_idx, pos_idx), {
+                            "word_id": None,
+                            "segment_index": seg_idx,
+                            **fields,
+                            "book_id": book_id,
+                        }
+
+        self._decode_s = decode_s
+
     # ── import one book ───────────────────────────────────────────────────────
 
     def import_book(self, book_name: str, book_data: list) -> None:
@@ -178,192 +484,200 @@ class BibleImporter:
             return
 
         book_id = meta["id"]
-        chapter_rows: list[dict] = []
-        verse_rows: list[dict] = []
-        word_rows: list[dict] = []
-        morpheme_rows: list[dict] = []
+        chapter_rows: list[dict] = [
+            {"book_id": book_id, "chapter_num": idx}
+            for idx in range(1, len(book_data) + 1)
+        ]
+
+        # ── single pass over the source: verse, word and morpheme rows ────────
+        # Foreign keys are not known until the parent rows are upserted, so rows
+        # are collected alongside their source coordinates and resolved below.
+        verse_rows: list[tuple[tuple[int, int], dict]] = []
+        word_rows: list[tuple[tuple[int, int, int], dict]] = []
+        morpheme_rows: list[tuple[tuple[int, int, int], dict]] = []
+
+        t0 = time.perf_counter()
+        for kind, key, row in self._iter_book_rows(book_id, book_name, book_data):
+            if kind == "verse":
+                verse_rows.append((key, row))
+            elif kind == "word":
+                word_rows.append((key, row))
+                if row["morph_code"]:
+                    self.stats["words_with_morph"] += 1
+            else:
+                morpheme_rows.append((key, row))
+        walk_s = time.perf_counter() - t0
+        self.metrics.add("decode", "morpheme", self._decode_s, len(morpheme_rows))
+        self.metrics.add("parse", "(source)", walk_s - self._decode_s, len(word_rows))
 
         # ── chapters ──────────────────────────────────────────────────────────
-        for idx, ch_data in enumerate(book_data, start=1):
-            chapter_rows.append({"book_id": book_id, "chapter_num": idx})
-
-        # Upsert chapters and fetch back IDs
         if not self.dry_run:
-            self._upsert("chapter", chapter_rows, on_conflict="book_id,chapter_num")
-            ch_resp = (
-                self.sb.schema("scribeswell")
-                .table("chapter")
-                .select("id,chapter_num")
-                .eq("book_id", book_id)
-                .execute()
+            ch_rows = self._upsert(
+                "chapter", chapter_rows,
+                on_conflict="book_id,chapter_num",
+                returning="id,chapter_num",
             )
             chapter_id_map: dict[int, int] = {
-                row["chapter_num"]: row["id"] for row in ch_resp.data
+                row["chapter_num"]: row["id"] for row in ch_rows
             }
         else:
-            chapter_id_map = {int(k): -(int(k)) for k in book_data.keys()}
+            chapter_id_map = {row["chapter_num"]: -row["chapter_num"] for row in chapter_rows}
 
         self.stats["chapters"] += len(chapter_rows)
 
         # ── verses ────────────────────────────────────────────────────────────
-        for ch_idx, ch_data in enumerate(book_data, start=1):
-            for v_idx, v_words in enumerate(ch_data, start=1):
-                verse_rows.append({
-                    "chapter_id": chapter_id_map.get(ch_idx),
-                    "verse_num": v_idx,
-                    "book_id": book_id,
-                    "chapter_num": ch_idx,
-                })
+        for (ch_idx, _), row in verse_rows:
+            row["chapter_id"] = chapter_id_map.get(ch_idx)
 
-        # Upsert verses and fetch back IDs
         if not self.dry_run:
-            self._upsert("verse", verse_rows, on_conflict="chapter_id,verse_num")
-            # Fetch all verse IDs for this book at once
-            v_resp = (
-                self.sb.schema("scribeswell")
-                .table("verse")
-                .select("id,chapter_id,verse_num")
-                .eq("book_id", book_id)
-                .execute()
+            v_rows = self._upsert(
+                "verse",
+                [row for _, row in verse_rows if row["chapter_id"] is not None],
+                on_conflict="chapter_id,verse_num",
+                returning="id,chapter_num,verse_num",
             )
             verse_id_map: dict[tuple[int, int], int] = {
-                (row["chapter_id"], row["verse_num"]): row["id"]
-                for row in v_resp.data
+                (row["chapter_num"], row["verse_num"]): row["id"]
+                for row in v_rows
             }
         else:
             verse_id_map = {}
 
         self.stats["verses"] += len(verse_rows)
 
-        # ── words + morphemes ─────────────────────────────────────────────────
-        for ch_idx, ch_data in enumerate(book_data, start=1):
-            chapter_id = chapter_id_map.get(ch_idx)
-            if chapter_id is None:
-                continue
-
-            for v_idx, v_words in enumerate(ch_data, start=1):
-                verse_id = verse_id_map.get((chapter_id, v_idx))
-                if verse_id is None and not self.dry_run:
-                    continue
-
-                if not isinstance(v_words, list):
+        # ── words ─────────────────────────────────────────────────────────────
+        if not self.dry_run and word_rows:
+            resolved_words = []
+            for (ch_idx, v_idx, _), row in word_rows:
+                verse_id = verse_id_map.get((ch_idx, v_idx))
+                if verse_id is None:
                     continue
+                row["verse_id"] = verse_id
+                resolved_words.append(row)
 
-                for pos_idx, word_obj in enumerate(v_words, start=1):
-                    if not isinstance(word_obj, list) and len(word_obj) != 3:
-                        err_msg = f"   ⚠ Unexpected word object format at {book_name} {ch_idx+1}:{v_idx+1} pos {pos_idx+1}: {word_obj}"
-                        raise ValueError(err_msg)
-
-                    surface = None
-                    strong = None
-                    if word_obj[0] and is_hebrew(word_obj[0]):
-                        surface = word_obj[0]
-                        strong = word_obj[1]
-                    elif word_obj[1] and is_hebrew(word_obj[1]):
-                        surface = word_obj[1]
-                        strong = word_obj[0]
-                    surface = word_obj[0] if is_hebrew(word_obj[0]) else word_obj[1] if is_hebrew(word_obj[1]) else ""
-                    if not surface and strong:
-                        err_msg = f"   ⚠ Missing Hebrew surface text at {book_name} {ch_idx+1}:{v_idx+1} pos {pos_idx+1}: {word_obj}"
-                        raise ValueError(err_msg)
-
-                    morph_code: Optional[str] = word_obj[2]
-                    strong: Optional[str] = strong
-                    display: Optional[str] = surface.replace("/", "")
-
-                    word_rows.append({
-                        "verse_id": verse_id if verse_id else 0,
-                        "position": pos_idx,
-                        "surface_he": surface,
-                        "display_he": display,
-                        "lemma_strong": strong,
-                        "morph_code": morph_code,
-                    })
-
-        # Upsert words and fetch back IDs
-        if not self.dry_run and word_rows:
-            self._upsert("word", word_rows, on_conflict="verse_id,position")
-            # Fetch word IDs for this book's verses
-            verse_ids = list(verse_id_map.values())
-            # Fetch in batches to avoid URL length limits
-            word_id_map: dict[tuple[int, int], int] = {}
-            for id_batch in chunked(verse_ids, 200):
-                w_resp = (
-                    self.sb.schema("scribeswell")
-                    .table("word")
-                    .select("id,verse_id,position")
-                    .in_("verse_id", id_batch)
-                    .execute()
-                )
-                for row in w_resp.data:
-                    word_id_map[(row["verse_id"], row["position"])] = row["id"]
+            w_rows = self._upsert(
+                "word", resolved_words,
+                on_conflict="verse_id,position",
+                returning="id,verse_id,position",
+            )
+            word_id_map: dict[tuple[int, int], int] = {
+                (row["verse_id"], row["position"]): row["id"] for row in w_rows
+            }
         else:
             word_id_map = {}
 
         self.stats["words"] += len(word_rows)
 
         # ── morphemes ─────────────────────────────────────────────────────────
-        for ch_idx, ch_data in enumerate(book_data, start=1):
-            chapter_id = chapter_id_map.get(ch_idx)
-            if chapter_id is None:
-                continue
-
-            for v_idx, v_words in enumerate(ch_data, start=1):
-                verse_id = verse_id_map.get((chapter_id, v_idx))
-                if verse_id is None and not self.dry_run:
-                    continue
-
-                if not isinstance(v_words, list):
+        if not self.dry_run and morpheme_rows and not self.skip_morphemes:
+            resolved_morphemes = []
+            for (ch_idx, v_idx, pos_idx), row in morpheme_rows:
+                verse_id = verse_id_map.get((ch_idx, v_idx))
+                word_id = word_id_map.get((verse_id, pos_idx))
+                if word_id is None:
+                    self.stats["morphemes_unresolved"] += 1
                     continue
+                row["word_id"] = word_id
+                resolved_morphemes.append(row)
 
-                for pos_idx, word_obj in enumerate(v_words, start=1):
-                    if not isinstance(word_obj, dict):
-                        continue
-
-                    surface = word_obj.get("w") or word_obj.get("text") or ""
-                    if not surface:
-                        continue
+            self._upsert("morpheme", resolved_morphemes, on_conflict="word_id,segment_index")
+            self.stats["morphemes"] += len(resolved_morphemes)
+        else:
+            self.stats["morphemes"] += len(morpheme_rows)
+
+        self.metrics.emit(
+            "book",
+            book=meta["osis_id"],
+            chapters=len(chapter_rows),
+            verses=len(verse_rows),
+            words=len(word_rows),
+            morphemes=len(morpheme_rows),
+            parse_s=round(walk_s - self._decode_s, 6),
+            decode_s=round(self._decode_s, 6),
+            write_s=round(time.perf_counter() - t0 - walk_s, 6),
+        )
 
-                    morph_code = word_obj.get("morph") or word_obj.get("m")
-
-                    word_id = word_id_map.get((verse_id, pos_idx)) if verse_id else None
-
-                    if morph_code and (word_id or self.dry_run):
-                        try:
-                            parsed_morphemes = parse_morph_code(morph_code)
-                            for seg_idx, pm in enumerate(parsed_morphemes):
-                                morpheme_rows.append({
-                                    "word_id": word_id if word_id else 0,
-                                    "segment_index": seg_idx,
-                                    "language": pm.language,
-                                    "part_of_speech": pm.part_of_speech,
-                                    "pos_code": pm.pos_code,
-                                    "gender": pm.gender,
-                                    "number": pm.number,
-                                    "state": pm.state,
-                                    "verb_stem": pm.verb_stem,
-                                    "verb_aspect": pm.verb_aspect,
-                                    "person": pm.person,
-                                })
-                        except Exception as e:
-                            self.stats["errors"] += 1
-                            if self.dry_run:
-                                print(f"   ⚠ morph parse error for {morph_code!r}: {e}")
-
-        if not self.dry_run and morpheme_rows:
-            self._upsert("morpheme", morpheme_rows, on_conflict="word_id,segment_index")
-
-        self.stats["morphemes"] += len(morpheme_rows)
+    # ── morph code dictionary ─────────────────────────────────────────────────
+
+    def write_morph_dict(self) -> None:
+        """Upsert the decoding of every distinct morph code seen in this run."""
+        rows = [morph_dict_row(code) for code in sorted(self.morph_codes)]
+        print(f"🔤 Writing {len(rows):,} morph codes to morph_code_dict...")
+        self._upsert("morph_code_dict", rows, on_conflict="code")
+        self.stats["morph_codes"] = len(rows)
+
+    # ── lexicon ───────────────────────────────────────────────────────────────
+
+    def import_lexicon(self, lexicon_path: Path) -> None:
+        """Upsert a Strong's Hebrew dictionary into scribeswell.lexicon."""
+        print(f"📕 Loading lexicon {lexicon_path}...")
+        with self.metrics.stage("parse", "lexicon"):
+            rows = load_lexicon(lexicon_path)
+        print(f"   Writing {len(rows):,} entries to lexicon...")
+        self._upsert("lexicon", rows, on_conflict="strong")
+        self.stats["lexicon"] = len(rows)
+        print(f"   ✓ {len(rows):,} lexicon entries")
+
+    # ── accounting ────────────────────────────────────────────────────────────
+
+    def report_accounting(self) -> bool:
+        """
+        Cross-check morpheme output against word input.
+
+        Every word with a morph code yields at least one morpheme, and the
+        total must equal the segment count of those codes. Returns True when
+        the numbers reconcile.
+        """
+        cache = decode_morph_code.cache_info()
+        expected = self.stats["morphemes_expected"]
+        written = self.stats["morphemes"] + self.stats["morphemes_unresolved"]
+
+        print("\n── Morphology accounting ────────────────────────────────")
+        print(f"   words with morph   : {self.stats['words_with_morph']:,} "
+              f"of {self.stats['words']:,}")
+        print(f"   morphemes expected : {expected:,}")
+        print(f"   morphemes emitted  : {written:,}")
+        print(f"   distinct codes     : {cache.currsize:,} "
+              f"({cache.hits:,} cache hits, {cache.misses:,} decodes)")
+
+        ok = True
+        if written != expected:
+            print(f"   ⚠ morpheme count mismatch: {written - expected:+,}")
+            ok = False
+        if expected < self.stats["words_with_morph"]:
+            print("   ⚠ fewer morphemes than words carrying a morph code")
+            ok = False
+        if self.stats["morphemes_unresolved"]:
+            print(f"   ⚠ {self.stats['morphemes_unresolved']:,} morphemes "
+                  f"dropped — parent word id not found")
+            ok = False
+        if ok:
+            print("   ✓ morpheme counts reconcile with word counts")
+        return ok
 
     # ── run ───────────────────────────────────────────────────────────────────
 
-    def run(self, source_path: Path, only_book: Optional[str] = None) -> None:
+    def run(
+        self,
+        source_path: Path,
+        only_book: Optional[str] = None,
+        promote: bool = True,
+        sqlite_version: Optional[int] = None,
+    ) -> None:
         print(f"📖 Loading {source_path}...")
-        with open(source_path, encoding="utf-8") as f:
+        with open(source_path, encoding="utf-8") as f, self.metrics.stage("parse", "(source)"):
             data = json.load(f)
 
         print(f"   Found {len(data)} book(s) in source file.")
 
+        if self.staged and not self.dry_run:
+            print(f"🧱 Creating empty {STAGING_SCHEMA} schema...")
+            # Not retried: a replay would drop a staging schema already being loaded
+            self._rpc("create_staging", retry=False)
+            if self.defer_indexes:
+                deferred = self._rpc("defer_staging_indexes")
+                print(f"   Deferred {len(deferred)} indexes/constraints until after the load")
+
         self.seed_books()
 
         books_to_import = (
@@ -375,17 +689,96 @@ class BibleImporter:
         total = len(books_to_import)
         for idx, (book_name, book_data) in enumerate(books_to_import.items(), 1):
             print(f"[{idx:2}/{total}] Importing {book_name}...")
-            t0 = time.time()
+            t0 = time.perf_counter()
             self.import_book(book_name, book_data)
-            elapsed = time.time() - t0
+            elapsed = time.perf_counter() - t0
             print(f"         ✓ done in {elapsed:.1f}s")
 
+        self.write_morph_dict()
+
+        if not self.dry_run and self.sqlite is None:
+            if self.defer_indexes:
+                self.build_deferred_indexes()
+            elif not self.staged:
+                # Staged loads are analyzed by promote_staging()
+                self._rpc("analyze_corpus", {"p_schema": self.schema})
+
         print("\n── Import complete ──────────────────────────────────────")
-        for k, v in self.stats.items():
-            print(f"   {k:12}: {v:,}")
+        for k in ("books", "chapters", "verses", "words", "morphemes", "morph_codes", "errors"):
+            print(f"   {k:12}: {self.stats[k]:,}")
+        reconciled = self.report_accounting()
+        self.writer.report()
+        self.metrics.report()
+
+        if self.staged and not self.dry_run:
+            if not promote:
+                print(f"\n   Staged corpus left in {STAGING_SCHEMA} (not promoted)")
+            elif not reconciled or self.stats["errors"]:
+                print("\n   ⚠ Accounting did not reconcile — staged corpus NOT promoted")
+            else:
+                version = self.promote()
+                print(f"\n   ✓ Promoted staged corpus as version {version}")
+
+        if self.sqlite is not None:
+            version = self.sqlite.close(sqlite_version, source=source_path.name)
+            size_mb = self.sqlite.path.stat().st_size / 1e6
+            print(f"\n   ✓ Wrote {self.sqlite.path} ({size_mb:.1f} MB) as corpus version {version}")
+
+        self.writer.close()
+        self.metrics.close()
         if self.dry_run:
             print("\n   (DRY RUN — no data written to database)")
 
+    # ── deferred indexes ──────────────────────────────────────────────────────
+
+    def build_deferred_indexes(self) -> None:
+        """
+        Rebuild the indexes and constraints dropped by defer_staging_indexes().
+
+        Tables the writer retried or split a batch for are deduplicated first
+        (dedupe_staging()): without UNIQUE constraints, a batch that committed
+        before its response was lost is inserted again by the retry. Of the
+        copies, the one child rows were written against is kept.
+
+        Each index is built by its own RPC call so several run at once —
+        CREATE INDEX on different tables (or the same table) does not block,
+        and each build may also use parallel maintenance workers. Foreign keys
+        are then re-validated and the staging tables analyzed. A replayed
+        build_staging_index() of an object already built is a no-op.
+        """
+        # A batch may have committed before its retry (or split) sent it again
+        resent = sorted(
+            table for table, s in self.writer.stats.items()
+            if (s.retries or s.splits) and table not in SHARED_TABLES
+        )
+        if resent:
+            removed = self._rpc("dedupe_staging", {"p_tables": resent})
+            print(f"🧹 Removed {removed:,} duplicate rows from resent batches ({', '.join(resent)})")
+
+        pending = self._rpc("pending_staging_indexes")
+        print(f"🏗  Building {len(pending)} deferred indexes/constraints...")
+        t0 = time.time()
+        with ThreadPoolExecutor(max_workers=self.writer.concurrency) as pool:
+            futures = {
+                pool.submit(self._rpc, "build_staging_index", {"p_name": name}): name
+                for name in pending
+            }
+            for fut in as_completed(futures):
+                fut.result()
+                print(f"   ✓ {futures[fut]}")
+        self._rpc("finish_staging_load")
+        print(f"   ✓ constraints validated, tables analyzed in {time.time() - t0:.1f}s")
+
+    # ── corpus versions ───────────────────────────────────────────────────────
+
+    def promote(self) -> int:
+        """Atomically swap the *_read views to the staged corpus."""
+        return self._switch_version("promote_staging")
+
+    def rollback(self) -> int:
+        """Swap the *_read views back to the previous retained version."""
+        return self._switch_version("rollback_corpus")
+
 
 # ── CLI ───────────────────────────────────────────────────────────────────────
 
@@ -394,8 +787,8 @@ def main() -> None:
         description="Import full Tanakh from OSHB hebrew.json into Supabase scribeswell schema"
     )
     parser.add_argument(
-        "--source", required=True,
-        help="Path to hebrew.json (OSHB format)"
+        "--source", default=None,
+        help="Path to hebrew.json (OSHB format); required unless --rollback or --lexicon"
     )
     parser.add_argument(
         "--dry-run", action="store_true",
@@ -405,14 +798,84 @@ def main() -> None:
         "--book", default=None,
         help="Import only one book by OSIS id (e.g. Gen, Exod)"
     )
+    parser.add_argument(
+        "--staged", action="store_true",
+        help=f"Load into {STAGING_SCHEMA} and promote atomically when the accounting reconciles"
+    )
+    parser.add_argument(
+        "--no-promote", action="store_true",
+        help="With --staged: leave the loaded corpus in staging for inspection"
+    )
+    parser.add_argument(
+        "--defer-indexes", action="store_true",
+        help="With --staged: drop secondary indexes and UNIQUE/FK constraints for the load, rebuild after"
+    )
+    parser.add_argument(
+        "--skip-morphemes", action="store_true",
+        help="Do not populate the per-segment morpheme table (the scribeswell API reads morph_code_dict; "
+             "platform/backend and the morphology filter indexes need the table)"
+    )
+    parser.add_argument(
+        "--lexicon", default=None,
+        help="Path to a Strong's Hebrew dictionary (.js or .json) to upsert into scribeswell.lexicon"
+    )
+    parser.add_argument(
+        "--rollback", action="store_true",
+        help="Point the *_read views back at the previous corpus version and exit"
+    )
+    parser.add_argument(
+        "--sqlite", default=None,
+        help="Write the corpus to this SQLite file (offline backend) instead of Supabase"
+    )
+    parser.add_argument(
+        "--sqlite-version", type=int, default=None,
+        help="With --sqlite: corpus version recorded in the file (default: build time, Unix seconds)"
+    )
+    parser.add_argument(
+        "--batch-size", type=int, default=BATCH_SIZE,
+        help=f"Initial upsert batch size; adapts to latency (default {BATCH_SIZE})"
+    )
+    parser.add_argument(
+        "--concurrency", type=int, default=CONCURRENCY,
+        help=f"Maximum upsert batches in flight (default {CONCURRENCY})"
+    )
+    parser.add_argument(
+        "--max-retries", type=int, default=MAX_RETRIES,
+        help=f"Retries per batch, shared by the halves of a split batch (default {MAX_RETRIES})"
+    )
+    parser.add_argument(
+        "--metrics-jsonl", default=None,
+        help="Write per-request, per-book and summary stage timings as JSON lines to this file"
+    )
+    parser.add_argument(
+        "--profile", default=None,
+        help="Save a cProfile of the run to this file (view with pstats or snakeviz)"
+    )
     args = parser.parse_args()
 
-    source = Path(args.source)
-    if not source.exists():
-        print(f"❌ Source file not found: {source}")
+    if args.defer_indexes and not args.staged:
+        print("❌ --defer-indexes requires --staged (the load must start from empty tables)")
+        sys.exit(1)
+
+    if args.staged and args.book:
+        print("❌ --staged imports the whole corpus; it cannot be combined with --book")
+        sys.exit(1)
+
+    if args.sqlite and (args.staged or args.rollback or args.dry_run or not args.source):
+        print("❌ --sqlite needs --source and cannot be combined with --staged, --rollback or --dry-run")
         sys.exit(1)
 
-    if not args.dry_run:
+    if not args.rollback:
+        if not args.source and not args.lexicon:
+            print("❌ --source (or --lexicon) is required")
+            sys.exit(1)
+        for path in filter(None, (args.source, args.lexicon)):
+            if not Path(path).exists():
+                print(f"❌ Source file not found: {path}")
+                sys.exit(1)
+        source = Path(args.source) if args.source else None
+
+    if not args.dry_run and not args.sqlite:
         if not SUPABASE_URL:
             print("❌ SUPABASE_URL not set in environment")
             sys.exit(1)
@@ -424,8 +887,52 @@ def main() -> None:
         supabase_url=SUPABASE_URL,
         secret_key=SUPABASE_SECRET_KEY,
         dry_run=args.dry_run,
+        batch_size=args.batch_size,
+        concurrency=args.concurrency,
+        max_retries=args.max_retries,
+        staged=args.staged,
+        defer_indexes=args.defer_indexes,
+        skip_morphemes=args.skip_morphemes,
+        metrics_path=Path(args.metrics_jsonl) if args.metrics_jsonl else None,
+        sqlite_path=Path(args.sqlite) if args.sqlite else None,
     )
-    importer.run(source_path=source, only_book=args.book)
+
+    if args.rollback:
+        if args.dry_run:
+            print("❌ --rollback cannot be combined with --dry-run")
+            sys.exit(1)
+        version = importer.rollback()
+        importer.writer.close()
+        importer.metrics.close()
+        print(f"✓ Rolled back — corpus version {version} is active")
+        return
+
+    if args.lexicon:
+        importer.import_lexicon(Path(args.lexicon))
+        if source is None:
+            importer.writer.close()
+            importer.metrics.close()
+            if args.dry_run:
+                print("\n   (DRY RUN — no data written to database)")
+            return
+
+    if not args.profile:
+        importer.run(
+            source_path=source, only_book=args.book, promote=not args.no_promote,
+            sqlite_version=args.sqlite_version,
+        )
+        return
+
+    # cProfile sees the main thread only: parse/decode and request setup.
+    # Worker-thread upserts show up in the stage table instead.
+    with cProfile.Profile() as profiler:
+        importer.run(
+            source_path=source, only_book=args.book, promote=not args.no_promote,
+            sqlite_version=args.sqlite_version,
+        )
+    profiler.dump_stats(args.profile)
+    print(f"\n── Profile (top 25 by cumulative time) → {args.profile} ──")
+    pstats.Stats(profiler).sort_stats("cumulative").print_stats(25)
 
 
 if __name__ == "__main__":
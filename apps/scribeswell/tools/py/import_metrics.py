@@ -0,0 +1,186 @@
+"""
+Per-stage import metrics
+========================
+Where does an import spend its time? Each stage is timed per table:
+
+    parse      walking the source JSON and building rows (+ json.load)
+    decode     morph code → morpheme columns (decode_morph_code)
+    serialize  building the PostgREST request, JSON-encoding the batch
+    network    request sent → response parsed, minus server time
+    server     time PostgREST reports in its Server-Timing header
+               (only when PostgREST runs with server-timing-enabled)
+
+    metrics = ImportMetrics(jsonl_path=Path("import-metrics.jsonl"))
+    metrics.instrument_http(postgrest_client.session)
+    with metrics.stage("parse", "(source)"):
+        data = json.load(f)
+    metrics.begin_request()
+    ...execute()...
+    metrics.end_request("word", rows=500)
+    metrics.report()
+
+Every batch, book and the final summary is also written as one JSON object
+per line to `jsonl_path`, for later analysis.
+
+Stage times are summed across worker threads, so with concurrent writes the
+network/server columns can exceed wall-clock time. The CPU vs wait split in
+the report is what tells a CPU-bound run (parse/decode/serialize) from a
+network-bound one.
+"""
+
+import json
+import re
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterator, Optional
+
+STAGES = ("parse", "decode", "serialize", "network", "server")
+CPU_STAGES = ("parse", "decode", "serialize")
+
+_DUR_RE = re.compile(r"dur=([0-9.]+)")
+
+
+def parse_server_timing(header: Optional[str]) -> Optional[float]:
+    """Sum the `dur=` entries (milliseconds) of a Server-Timing header, in seconds."""
+    if not header:
+        return None
+    durations = [float(d) for d in _DUR_RE.findall(header)]
+    return sum(durations) / 1000.0 if durations else None
+
+
+@dataclass
+class StageTotal:
+    seconds: float = 0.0
+    calls: int = 0
+    rows: int = 0
+
+
+class ImportMetrics:
+    def __init__(self, jsonl_path: Optional[Path] = None):
+        self.totals: dict[tuple[str, str], StageTotal] = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._out = open(jsonl_path, "w", encoding="utf-8") if jsonl_path else None
+        self._t0 = time.perf_counter()
+
+    # ── recording ─────────────────────────────────────────────────────────────
+
+    def add(self, stage: str, table: str, seconds: float, rows: int = 0) -> None:
+        with self._lock:
+            total = self.totals.setdefault((stage, table), StageTotal())
+            total.seconds += seconds
+            total.calls += 1
+            total.rows += rows
+
+    @contextmanager
+    def stage(self, stage: str, table: str, rows: int = 0) -> Iterator[None]:
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(stage, table, time.perf_counter() - t0, rows)
+
+    def emit(self, event: str, **fields) -> None:
+        """Write one JSON line (no-op without a jsonl_path)."""
+        if self._out is None:
+            return
+        record = {"event": event, "t": round(time.perf_counter() - self._t0, 4), **fields}
+        line = json.dumps(record, ensure_ascii=False, default=str)
+        with self._lock:
+            self._out.write(line + "\n")
+
+    # ── HTTP requests ─────────────────────────────────────────────────────────
+
+    def instrument_http(self, session) -> None:
+        """
+        Hook an httpx.Client so requests made on this thread can be split into
+        serialize / network / server time. Clients without event hooks (test
+        doubles) are left alone and their requests count as network time.
+        """
+        hooks = getattr(session, "event_hooks", None)
+        if hooks is None:
+            return
+        session.event_hooks = {
+            "request": [*hooks.get("request", []), self._on_request],
+            "response": [*hooks.get("response", []), self._on_response],
+        }
+
+    def begin_request(self) -> None:
+        self._local.start = time.perf_counter()
+        self._local.sent = None
+        self._local.server = None
+
+    def end_request(self, table: str, rows: int = 0, error: Optional[BaseException] = None) -> None:
+        end = time.perf_counter()
+        start = self._local.start
+        sent = self._local.sent or start
+        server = self._local.server
+
+        serialize = sent - start
+        network = end - sent
+        if server is not None:
+            network = max(0.0, network - server)
+
+        self.add("serialize", table, serialize, rows)
+        self.add("network", table, network, rows)
+        if server is not None:
+            self.add("server", table, server, rows)
+
+        fields = {
+            "table": table,
+            "rows": rows,
+            "serialize_s": round(serialize, 6),
+            "network_s": round(network, 6),
+            "server_s": round(server, 6) if server is not None else None,
+        }
+        if error is not None:
+            fields["error"] = repr(error)
+        self.emit("request", **fields)
+
+    def _on_request(self, request) -> None:
+        # httpx calls request hooks once the body is encoded, just before sending
+        self._local.sent = time.perf_counter()
+
+    def _on_response(self, response) -> None:
+        self._local.server = parse_server_timing(response.headers.get("server-timing"))
+
+    # ── reporting ─────────────────────────────────────────────────────────────
+
+    def summary(self) -> dict[str, dict[str, float]]:
+        """{table: {stage: seconds}}"""
+        out: dict[str, dict[str, float]] = {}
+        with self._lock:
+            for (stage, table), total in self.totals.items():
+                out.setdefault(table, {})[stage] = total.seconds
+        return out
+
+    def report(self) -> None:
+        summary = self.summary()
+        if not summary:
+            return
+        wall = time.perf_counter() - self._t0
+        stage_totals = {s: sum(t.get(s, 0.0) for t in summary.values()) for s in STAGES}
+
+        print("\n── Time by stage (seconds, summed across threads) ───────")
+        print(f"   {'table':26}" + "".join(f" {s:>9}" for s in STAGES))
+        for table, stages in summary.items():
+            cells = "".join(
+                f" {stages[s]:>9.2f}" if s in stages else f" {'—':>9}" for s in STAGES
+            )
+            print(f"   {table:26}{cells}")
+        print(f"   {'total':26}" + "".join(f" {stage_totals[s]:>9.2f}" for s in STAGES))
+
+        cpu = sum(stage_totals[s] for s in CPU_STAGES)
+        waiting = stage_totals["network"] + stage_totals["server"]
+        bound = "CPU" if cpu > waiting else "network/server"
+        print(f"   wall {wall:.1f}s — CPU {cpu:.1f}s vs waiting {waiting:.1f}s → {bound}-bound")
+
+        self.emit("summary", wall_s=round(wall, 3), stages=stage_totals, tables=summary)
+
+    def close(self) -> None:
+        if self._out is not None:
+            self._out.close()
+            self._out = None
@@ -0,0 +1,141 @@
+"""
+sqlite_corpus.py — single-file SQLite corpus for the offline bible backend
+==========================================================================
+import_bible.py --sqlite <path> writes the corpus here instead of Supabase.
+The backend's SqliteBibleRepository (BIBLE_REPOSITORY=sqlite) serves every
+bible endpoint from the file with no network dependency — for local
+development, benchmarks, and read replicas shipped as one file.
+
+Tables mirror the scribeswell ones the API reads (book, chapter, verse, word,
+lexicon) plus corpus_version, one row naming the file's version. Ids are
+assigned here, in source order, so a file is reproducible from its source.
+The per-segment morpheme table and morph_code_dict are not written: the API
+decodes morphology from word.morph_code.
+
+The file is built as <path>.tmp (no journal, indexes created after the load)
+and renamed over <path> on close, so a server reading the old file never
+sees a half-written one.
+"""
+
+import os
+import sqlite3
+import time
+from pathlib import Path
+from typing import Optional
+
+SCHEMA = """
+CREATE TABLE book (
+    id            INTEGER PRIMARY KEY,
+    osis_id       TEXT    NOT NULL UNIQUE,
+    name_en       TEXT    NOT NULL,
+    name_he       TEXT    NOT NULL,
+    testament     TEXT    NOT NULL,
+    division      TEXT    NOT NULL,
+    book_order    INTEGER NOT NULL
+);
+CREATE TABLE chapter (
+    id            INTEGER PRIMARY KEY,
+    book_id       INTEGER NOT NULL REFERENCES book(id),
+    chapter_num   INTEGER NOT NULL
+);
+CREATE TABLE verse (
+    id            INTEGER PRIMARY KEY,
+    chapter_id    INTEGER NOT NULL REFERENCES chapter(id),
+    verse_num     INTEGER NOT NULL,
+    book_id       INTEGER NOT NULL REFERENCES book(id),
+    chapter_num   INTEGER NOT NULL
+);
+CREATE TABLE word (
+    id            INTEGER PRIMARY KEY,
+    verse_id      INTEGER NOT NULL REFERENCES verse(id),
+    position      INTEGER NOT NULL,
+    surface_he    TEXT    NOT NULL,
+    display_he    TEXT,
+    lemma_strong  TEXT,
+    morph_code    TEXT,
+    book_id       INTEGER NOT NULL REFERENCES book(id)
+);
+CREATE TABLE lexicon (
+    strong        TEXT    PRIMARY KEY,
+    lemma         TEXT    NOT NULL,
+    translit      TEXT,
+    pronunciation TEXT,
+    gloss         TEXT,
+    definition    TEXT,
+    kjv_usage     TEXT
+);
+CREATE TABLE corpus_version (
+    version       INTEGER PRIMARY KEY,
+    source        TEXT,
+    created_at    TEXT    NOT NULL
+);
+"""
+
+# Built after the load. Word ids follow (verse_id, position) order, so a
+# chapter's words found through idx_word_verse_position sit together in the table.
+INDEXES = """
+CREATE UNIQUE INDEX idx_chapter_book_num ON chapter(book_id, chapter_num);
+CREATE UNIQUE INDEX idx_verse_chapter_num ON verse(chapter_id, verse_num);
+CREATE INDEX idx_verse_book_chapter ON verse(book_id, chapter_num, verse_num);
+CREATE UNIQUE INDEX idx_word_verse_position ON word(verse_id, position);
+"""
+
+CORPUS_TABLES = ("book", "chapter", "verse", "word", "lexicon")
+
+# Tables whose ids the writer assigns (book ids are canonical, lexicon is keyed by strong)
+_SERIAL_TABLES = ("chapter", "verse", "word")
+
+
+class SqliteCorpusWriter:
+    """Write corpus rows to a new SQLite file; it replaces `path` on close()."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._tmp = self.path.with_name(self.path.name + ".tmp")
+        self._tmp.unlink(missing_ok=True)
+        self.conn = sqlite3.connect(self._tmp)
+        self.conn.executescript("PRAGMA journal_mode = OFF; PRAGMA synchronous = OFF;" + SCHEMA)
+        self.columns = {
+            table: [row[1] for row in self.conn.execute(f"PRAGMA table_info({table})")]
+            for table in CORPUS_TABLES
+        }
+        self._next_id = {table: 1 for table in _SERIAL_TABLES}
+
+    def insert(self, table: str, rows: list[dict]) -> list[dict]:
+        """
+        Insert rows (re-inserting a key replaces it, like an upsert) and return
+        them with their ids. Tables the file does not carry are ignored.
+        """
+        columns = self.columns.get(table)
+        if columns is None:
+            return []
+        if table in _SERIAL_TABLES:
+            next_id = self._next_id[table]
+            for row in rows:
+                row["id"] = next_id
+                next_id += 1
+            self._next_id[table] = next_id
+        self.conn.executemany(
+            f"INSERT OR REPLACE INTO {table} ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})",
+            [tuple(row.get(c) for c in columns) for row in rows],
+        )
+        return rows
+
+    def close(self, version: Optional[int] = None, source: Optional[str] = None) -> int:
+        """
+        Index, stamp and publish the file. `version` defaults to the build
+        time in Unix seconds, so every build of a replica gets a new version
+        (and new ETags). Returns the version.
+        """
+        version = version if version is not None else int(time.time())
+        self.conn.executescript(INDEXES)
+        self.conn.execute(
+            "INSERT INTO corpus_version (version, source, created_at) VALUES (?, ?, ?)",
+            (version, source, time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())),
+        )
+        self.conn.commit()
+        self.conn.execute("ANALYZE")
+        self.conn.execute("VACUUM")
+        self.conn.close()
+        os.replace(self._tmp, self.path)
+        return version
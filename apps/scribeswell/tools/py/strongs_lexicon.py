@@ -0,0 +1,72 @@
+"""
+Strong's Hebrew lexicon reader
+==============================
+Reads the Open Scriptures Strong's Hebrew dictionary
+(strongs-hebrew-dictionary.js, or the same object saved as .json) into
+scribeswell.lexicon rows:
+
+    var strongsHebrewDictionary = {
+      "H430": {"lemma": "אֱלֹהִים", "xlit": "ʼĕlôhîym", "pron": "el-o-heem'",
+               "derivation": "plural of H433;",
+               "strongs_def": "gods in the ordinary sense; but specifically ...",
+               "kjv_def": "angels, X exceeding, God (gods) (-dess, -ly), ..."},
+      ...
+    };
+
+Other Strong's/BDB-style sources can be converted to this shape. An entry may
+carry its own short "gloss"; otherwise one is cut from strongs_def.
+"""
+
+import json
+import re
+from pathlib import Path
+from typing import Optional
+
+STRONG_KEY_RE = re.compile(r"^H0*(\d+)$")
+GLOSS_MAX_LEN = 60
+
+
+def strong_key(key: str) -> str:
+    """Normalise a Strong's key: "H0430" / "h430" → "H430"."""
+    m = STRONG_KEY_RE.match(key.strip().upper())
+    if not m:
+        raise ValueError(f"not a Hebrew Strong's number: {key!r}")
+    return f"H{m.group(1)}"
+
+
+def short_gloss(definition: Optional[str]) -> Optional[str]:
+    """First phrase of a Strong's definition: "{gods in the ordinary sense; ..." → "gods in the ordinary sense"."""
+    if not definition:
+        return None
+    text = re.sub(r"\([^)]*\)|[{}]", "", definition)
+    gloss = " ".join(re.split(r"[;,:]", text, maxsplit=1)[0].split()).rstrip(".")
+    if len(gloss) > GLOSS_MAX_LEN:
+        gloss = gloss[:GLOSS_MAX_LEN].rsplit(" ", 1)[0] + "…"
+    return gloss or None
+
+
+def _read_object(path: Path) -> dict:
+    """The dictionary object from a .json file or a `var x = {...};` .js file."""
+    text = path.read_text(encoding="utf-8")
+    start, end = text.find("{"), text.rfind("}")
+    if start < 0 or end < start:
+        raise ValueError(f"{path}: no JSON object found")
+    return json.loads(text[start:end + 1])
+
+
+def load_lexicon(path: Path) -> list[dict]:
+    """scribeswell.lexicon rows, ordered by Strong's number."""
+    rows = []
+    for key, entry in _read_object(path).items():
+        definition = (entry.get("strongs_def") or "").strip() or None
+        rows.append({
+            "strong": strong_key(key),
+            "lemma": entry["lemma"],
+            "translit": entry.get("xlit") or None,
+            "pronunciation": entry.get("pron") or None,
+            "gloss": entry.get("gloss") or short_gloss(definition),
+            "definition": definition,
+            "kjv_usage": (entry.get("kjv_def") or "").strip() or None,
+        })
+    rows.sort(key=lambda r: int(r["strong"][1:]))
+    return rows
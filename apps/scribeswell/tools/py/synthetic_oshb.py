@@ -0,0 +1,277 @@
+"""
+synthetic_oshb.py — synthetic corpus in the OSHB hebrew.json format
+===================================================================
+A stand-in for the OSHB source when it is not at hand (CI, a fresh laptop)
+or must not be redistributed: every book of BOOK_METADATA at its real
+chapter count, words shaped like OSHB words, from a fixed seed.
+
+    ["וַ/יֹּ֥אמֶר", "c/559", "HC/Vqw3ms"]
+
+Only the shape is real — the Hebrew is random letters and points. Morph
+codes are drawn from a word model whose proportions follow the OSHB: part of
+speech, prefixes (conjunction, preposition, article), pronominal suffixes,
+verb stem and aspect, gender/number/state/person, and Aramaic for the
+Aramaic chapters of Daniel and Ezra. The full-scale corpus (--scale 1) has
+about 300k words, 23k verses and a few thousand distinct codes, like the
+OSHB, so decoder caches and row builders see a realistic load. Strong's
+numbers follow a Zipf distribution.
+
+Usage:
+    python tools/py/synthetic_oshb.py --out synthetic.json [--scale 1.0] [--seed 1]
+
+    from synthetic_oshb import generate_corpus
+    data = generate_corpus(scale=0.1)           # {"Genesis": [[[word, ...], ...], ...], ...}
+"""
+
+import argparse
+import json
+import random
+from collections import Counter
+from pathlib import Path
+from typing import Callable
+
+# Real chapter counts (Hebrew numbering), canonical order; names as in hebrew.json
+CHAPTERS = {
+    "Genesis": 50, "Exodus": 40, "Leviticus": 27, "Numbers": 36, "Deuteronomy": 34,
+    "Joshua": 24, "Judges": 21, "I Samuel": 31, "II Samuel": 24, "I Kings": 22, "II Kings": 25,
+    "Isaiah": 66, "Jeremiah": 52, "Ezekiel": 48, "Hosea": 14, "Joel": 4, "Amos": 9,
+    "Obadiah": 1, "Jonah": 4, "Micah": 7, "Nahum": 3, "Habakkuk": 3, "Zephaniah": 3,
+    "Haggai": 2, "Zechariah": 14, "Malachi": 3,
+    "Psalms": 150, "Proverbs": 31, "Job": 42, "Song of Solomon": 8, "Ruth": 4,
+    "Lamentations": 5, "Ecclesiastes": 12, "Esther": 10, "Daniel": 12, "Ezra": 10,
+    "Nehemiah": 13, "I Chronicles": 29, "II Chronicles": 36,
+}
+
+# Chapters written (mostly) in Aramaic
+ARAMAIC_CHAPTERS = {("Daniel", n) for n in range(2, 8)} | {("Ezra", n) for n in (4, 5, 6, 7)}
+
+VERSES_PER_CHAPTER = 25.0     # OSHB: 23,213 verses / 929 chapters
+WORDS_PER_VERSE = 13.2        # OSHB: ~305k words / 23,213 verses
+STRONG_MAX = 8674             # Strong's Hebrew numbers
+
+# ── Word model ────────────────────────────────────────────────────────────────
+# Weights are per word (not per segment) and approximate OSHB counts.
+
+MAIN_POS = {
+    "Nc": 28.0, "Np": 10.5, "V": 23.0, "R": 7.0, "C": 2.2, "D": 2.0,
+    "Aa": 3.0, "Ac": 2.4, "Ag": 0.4, "Ao": 0.2,
+    "Pp": 1.7, "Pd": 0.9, "Pr": 1.8, "Pi": 0.3, "Pf": 0.05,
+    "To": 3.6, "Tn": 2.0, "Ti": 0.4, "Tj": 0.5, "Tm": 0.4, "Ta": 0.1, "Te": 0.05, "Tr": 0.05,
+}
+NOMINAL = {"Nc", "Np", "Aa", "Ac", "Ag", "Ao"}
+
+VERB_STEMS = {"q": 69.0, "h": 13.0, "p": 9.0, "N": 5.5, "t": 1.4, "P": 0.6, "H": 0.5,
+              "o": 0.3, "Q": 0.2, "r": 0.2, "l": 0.1, "O": 0.05, "m": 0.05, "v": 0.05}
+ARAMAIC_VERB_STEMS = {"q": 70.0, "h": 10.0, "p": 8.0, "a": 4.0, "u": 3.0, "Q": 2.0, "s": 1.0,
+                      "M": 1.0, "t": 0.5, "H": 0.5}
+VERB_ASPECTS = {"p": 25.0, "i": 21.0, "w": 20.5, "r": 10.0, "c": 9.0, "q": 6.0, "v": 5.5,
+                "a": 1.0, "s": 1.2, "j": 1.0, "h": 0.5}
+
+PERSON = {"3": 65.0, "2": 21.0, "1": 14.0}
+GENDER = {"m": 62.0, "f": 33.0, "b": 5.0}
+PERSONAL_GENDER = {"m": 76.0, "f": 12.0, "c": 12.0}
+NUMBER = {"s": 73.0, "p": 25.0, "d": 2.0}
+PERSONAL_NUMBER = {"s": 72.0, "p": 28.0}
+STATE = {"a": 56.0, "c": 44.0}
+PROPER_TYPE = {"m": 55.0, "l": 36.0, "f": 5.0, "t": 4.0}
+
+# Prefix and suffix rates, per word of the main part of speech
+CONJUNCTION_PREFIX = 0.17
+PREPOSITION_PREFIX = {"nominal": 0.22, "Vc": 0.55, "Pp": 0.05, "Pd": 0.05}
+ARTICLE = {"nominal": 0.16, "participle": 0.12, "Pd": 0.45}    # ...without a preposition prefix
+PREFIX_ARTICLE = 0.35                                          # R → Rd
+SUFFIX = {"Nc": 0.20, "R": 0.30, "To": 0.22, "Vc": 0.35, "finite": 0.07, "Tm": 0.15, "Tn": 0.02}
+DIRECTIONAL_HE = 0.012
+
+CONSONANTS = "אבגדהוזחטיכלמנסעפצקרשת"
+FINALS = {"כ": "ך", "מ": "ם", "נ": "ן", "פ": "ף", "צ": "ץ"}
+VOWELS = [chr(c) for c in range(0x05B0, 0x05BC)]        # sheva .. qubuts
+ACCENTS = [chr(c) for c in range(0x0591, 0x05AE)]
+DAGESH = "ּ"
+PREFIX_LETTERS = {"C": ("c", "ו"), "Td": ("d", "ה")}
+PREPOSITION_LETTERS = [("b", "ב"), ("l", "ל"), ("k", "כ"), ("m", "מ")]
+
+
+def _picker(weights: dict[str, float]) -> Callable[[random.Random], str]:
+    keys = list(weights)
+    cum, total = [], 0.0
+    for k in keys:
+        total += weights[k]
+        cum.append(total)
+    return lambda rng: rng.choices(keys, cum_weights=cum)[0]
+
+
+_main_pos = _picker(MAIN_POS)
+_stem = {"H": _picker(VERB_STEMS), "A": _picker(ARAMAIC_VERB_STEMS)}
+_aspect = _picker(VERB_ASPECTS)
+_person = _picker(PERSON)
+_gender = _picker(GENDER)
+_personal_gender = _picker(PERSONAL_GENDER)
+_number = _picker(NUMBER)
+_personal_number = _picker(PERSONAL_NUMBER)
+_state = _picker(STATE)
+_proper = _picker(PROPER_TYPE)
+
+
+def _pgn(rng: random.Random) -> str:
+    """person, gender, number of a finite verb, pronoun or suffix."""
+    person = _person(rng)
+    gender = "c" if person == "1" else _personal_gender(rng)
+    return person + gender + _personal_number(rng)
+
+
+def _main_segment(rng: random.Random, pos: str, language: str) -> str:
+    if pos == "V":
+        aspect = _aspect(rng)
+        head = "V" + _stem[language](rng) + aspect
+        if aspect in "rs":
+            return head + _gender(rng).replace("b", "m") + _number(rng).replace("d", "p") + _state(rng)
+        return head if aspect in "ac" else head + _pgn(rng)
+    if pos == "Np":
+        return "Np" + _proper(rng)
+    if pos in NOMINAL:
+        return pos + _gender(rng) + _number(rng) + _state(rng)
+    if pos == "Pp":
+        return "Pp" + _pgn(rng)
+    if pos == "Pd":
+        return "Pdx" + _personal_gender(rng) + _personal_number(rng)
+    return pos
+
+
+def _morph_code(rng: random.Random, language: str) -> tuple[list[str], int]:
+    """Segments of one word's morph code (no language prefix), and the main segment's index."""
+    pos = _main_pos(rng)
+    main = _main_segment(rng, pos, language)
+    kind = ("Vc" if main.startswith("V") and main[3:4] == "c"
+            else "participle" if main.startswith("V") and main[3:4] in ("r", "s")
+            else "finite" if main.startswith("V")
+            else "nominal" if pos in NOMINAL else pos)
+    segments = []
+    if rng.random() < CONJUNCTION_PREFIX:
+        segments.append("C")
+    if rng.random() < PREPOSITION_PREFIX.get(kind, 0.0):
+        segments.append("Rd" if kind == "nominal" and rng.random() < PREFIX_ARTICLE else "R")
+    elif rng.random() < ARTICLE.get(kind, 0.0):
+        segments.append("Td")
+    if main.startswith(("Nc", "Aa")) and segments and segments[-1] in ("Rd", "Td"):
+        main = main[:-1] + "a"  # an article goes with the absolute state
+    main_index = len(segments)
+    segments.append(main)
+    definite = main_index and segments[main_index - 1] in ("Rd", "Td")
+    if not definite and rng.random() < SUFFIX.get(kind if kind in SUFFIX else pos, 0.0):
+        if main.startswith("Nc"):
+            segments[-1] = main[:-1] + "c"  # a suffix goes with the construct state
+        segments.append("Sp" + _pgn(rng))
+    elif pos in ("Nc", "Np") and rng.random() < DIRECTIONAL_HE:
+        segments.append("Sd")
+    return segments, main_index
+
+
+def _hebrew(rng: random.Random, letters: int, accent: bool) -> str:
+    out = []
+    for i in range(letters):
+        c = rng.choice(CONSONANTS)
+        if i == letters - 1:
+            c = FINALS.get(c, c)
+        out.append(c)
+        if rng.random() < 0.15:
+            out.append(DAGESH)
+        if rng.random() < 0.8:
+            out.append(rng.choice(VOWELS))
+    if accent:
+        out.insert(rng.randrange(1, len(out) + 1), rng.choice(ACCENTS))
+    return "".join(out)
+
+
+class _Strongs:
+    """Zipf-distributed Strong's numbers: a few lemmas carry most of the text."""
+
+    def __init__(self, rng: random.Random, exponent: float = 1.05):
+        self.numbers = list(range(1, STRONG_MAX + 1))
+        rng.shuffle(self.numbers)
+        total, self.cum = 0.0, []
+        for rank in range(1, STRONG_MAX + 1):
+            total += rank ** -exponent
+            self.cum.append(total)
+
+    def __call__(self, rng: random.Random) -> str:
+        number = rng.choices(self.numbers, cum_weights=self.cum)[0]
+        return f"{number} {rng.choice('ab')}" if number % 11 == 0 else str(number)
+
+
+def _word(rng: random.Random, strongs: _Strongs, language: str) -> list[str]:
+    segments, main_index = _morph_code(rng, language)
+    surface, lemma = [], []
+    for i, seg in enumerate(segments):
+        if i < main_index:
+            # One-letter prefixes carry a letter code in the lemma, not a number
+            code, letter = PREFIX_LETTERS.get(seg) or rng.choice(PREPOSITION_LETTERS)
+            lemma.append(code)
+            surface.append(letter + rng.choice(VOWELS))
+        elif i > main_index:
+            surface.append(_hebrew(rng, rng.randint(1, 2), accent=False))  # suffix: no lemma
+        else:
+            lemma.append(strongs(rng))
+            surface.append(_hebrew(rng, rng.randint(2, 5), accent=rng.random() < 0.7))
+    return ["/".join(surface), "/".join(lemma), language + "/".join(segments)]
+
+
+def _count(rng: random.Random, mean: float) -> int:
+    return max(1, round(rng.gammavariate(4.0, mean / 4.0)))
+
+
+def generate_corpus(scale: float = 1.0, seed: int = 1, books: list[str] | None = None) -> dict:
+    """
+    Book name → chapters → verses → words, in hebrew.json shape. `scale`
+    multiplies verses per chapter (1.0 ≈ the OSHB's size); `books` limits
+    the corpus to those names. The same arguments give the same corpus.
+    """
+    rng = random.Random(seed)
+    strongs = _Strongs(rng)
+    corpus = {}
+    for name, chapters in CHAPTERS.items():
+        if books and name not in books:
+            continue
+        book = []
+        for chapter_num in range(1, chapters + 1):
+            language = "A" if (name, chapter_num) in ARAMAIC_CHAPTERS else "H"
+            book.append([
+                [_word(rng, strongs, language) for _ in range(_count(rng, WORDS_PER_VERSE))]
+                for _ in range(_count(rng, VERSES_PER_CHAPTER * scale))
+            ])
+        corpus[name] = book
+    return corpus
+
+
+def describe(corpus: dict) -> dict:
+    """Size of a corpus and the spread of its morph codes."""
+    codes = Counter(w[2] for book in corpus.values() for chapter in book for verse in chapter for w in verse)
+    words = sum(codes.values())
+    return {
+        "books": len(corpus),
+        "chapters": sum(len(book) for book in corpus.values()),
+        "verses": sum(len(chapter) for book in corpus.values() for chapter in book),
+        "words": words,
+        "segments": sum(n * (code.count("/") + 1) for code, n in codes.items()),
+        "distinct_codes": len(codes),
+        "top_10_share": round(sum(n for _, n in codes.most_common(10)) / words, 3) if words else 0.0,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Write a synthetic corpus in OSHB hebrew.json format")
+    parser.add_argument("--out", type=Path, required=True, help="Output path (hebrew.json shape)")
+    parser.add_argument("--scale", type=float, default=1.0, help="1.0 ≈ the OSHB's size")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--book", action="append", help="Only this book, by English name (repeatable)")
+    args = parser.parse_args()
+
+    corpus = generate_corpus(args.scale, args.seed, args.book)
+    with open(args.out, "w", encoding="utf-8") as f:
+        json.dump(corpus, f, ensure_ascii=False)
+    stats = describe(corpus)
+    print(f"✓ {args.out}: " + ", ".join(f"{k} {v:,}" for k, v in stats.items()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,307 @@
+"""
+Adaptive write scheduler for PostgREST bulk upserts
+===================================================
+Replaces fixed-size `chunked(rows, 500)` writes in the importer.
+
+    scheduler = WriteScheduler(send, concurrency=4)
+    scheduler.write("word", rows, on_conflict="verse_id,position")
+    ids = scheduler.write("verse", rows, on_conflict="...", returning="id,verse_num")
+    scheduler.report()
+
+Behaviour:
+  - Batch size adapts per table: grows while batches come back fast, halves
+    when latency exceeds the target or the server throttles, and is capped so
+    a batch's JSON payload stays under `max_payload_bytes`.
+  - Up to `concurrency` batches are in flight at once (thread pool — the
+    Supabase client is synchronous).
+  - Transient failures (5xx, 429, timeouts, dropped connections) retry with
+    exponential backoff and full jitter, up to `max_retries` times per batch.
+    A batch too large for the server (413, statement_timeout) is retried as
+    two halves instead, which inherit the batch's remaining retries. Any other
+    error, or a batch out of retries, aborts the run with WriteError — so an
+    outage costs at most max_retries + 1 sends per batch, not a bisection.
+  - With `returning`, the rows echoed back by every batch are collected and
+    returned from `write()` (order across batches is not preserved).
+  - `report()` prints rows/s, retries, splits and throttling events per table.
+"""
+
+import json
+import random
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Callable, Optional, TypeVar
+
+T = TypeVar("T")
+
+# HTTP statuses and Postgres SQLSTATEs worth retrying.
+TRANSIENT_CODES = {
+    "408", "429", "500", "502", "503", "504",
+    "40001",     # serialization_failure
+    "40P01",     # deadlock_detected
+    "53300",     # too_many_connections
+    "57014",     # query_canceled (statement_timeout)
+    "PGRST003",  # timed out acquiring a pool connection
+}
+
+# Subset of the above that signals the server asking us to slow down.
+THROTTLE_CODES = {"429", "503", "53300", "57014", "PGRST003"}
+
+# Errors a smaller batch can fix: retried as two halves, not resent whole.
+SPLIT_CODES = {
+    "413",       # payload too large
+    "57014",     # query_canceled (statement_timeout)
+}
+
+
+class WriteError(Exception):
+    """A batch failed with a permanent error, or ran out of retries."""
+
+    def __init__(self, table: str, rows: list[dict], cause: BaseException):
+        self.table = table
+        self.rows = rows
+        self.cause = cause
+        super().__init__(
+            f"{table}: batch of {len(rows)} row(s) could not be written ({cause!r}); first row: {rows[0]}"
+        )
+
+
+def _error_code(exc: BaseException) -> Optional[str]:
+    code = getattr(exc, "code", None)
+    if code is not None:
+        return str(code)
+    response = getattr(exc, "response", None)
+    status = getattr(response, "status_code", None)
+    return str(status) if status is not None else None
+
+
+def is_transient(exc: BaseException) -> bool:
+    """True for errors a retry can plausibly fix (network, overload, 5xx)."""
+    if isinstance(exc, (TimeoutError, ConnectionError)):
+        return True
+    # httpx.TimeoutException / httpx.TransportError without importing httpx
+    if any(cls.__name__ in ("TimeoutException", "TransportError") for cls in type(exc).__mro__):
+        return True
+    return _error_code(exc) in TRANSIENT_CODES
+
+
+def is_split(exc: BaseException) -> bool:
+    """True for errors that say the batch was too large to write in one go."""
+    return _error_code(exc) in SPLIT_CODES
+
+
+def is_throttle(exc: BaseException) -> bool:
+    if isinstance(exc, TimeoutError):
+        return True
+    if any(cls.__name__ == "TimeoutException" for cls in type(exc).__mro__):
+        return True
+    return _error_code(exc) in THROTTLE_CODES
+
+
+@dataclass
+class TableWriteStats:
+    rows: int = 0
+    batches: int = 0
+    retries: int = 0
+    splits: int = 0
+    throttles: int = 0
+    seconds: float = 0.0
+    batch_size: int = 0
+
+    @property
+    def rows_per_sec(self) -> float:
+        return self.rows / self.seconds if self.seconds else 0.0
+
+
+@dataclass
+class _Batch:
+    rows: list
+    attempt: int = 0
+    delay: float = 0.0
+
+
+class WriteScheduler:
+    def __init__(
+        self,
+        send: Callable[[str, list[dict], str, Optional[str]], Optional[list[dict]]],
+        *,
+        batch_size: int = 500,
+        min_batch_size: int = 25,
+        max_batch_size: int = 5000,
+        max_payload_bytes: int = 4 * 1024 * 1024,
+        target_latency: float = 2.0,
+        concurrency: int = 4,
+        max_retries: int = 5,
+        base_delay: float = 0.5,
+        max_delay: float = 30.0,
+    ):
+        """
+        Args:
+            send: performs one upsert — send(table, rows, on_conflict, returning)
+                and returns the echoed rows when `returning` names columns.
+            batch_size: starting batch size for every table.
+            target_latency: seconds per batch above which the size shrinks.
+            concurrency: maximum batches in flight.
+            max_retries: retries per batch, shared with the halves of a split.
+        """
+        self.send = send
+        self.initial_batch_size = batch_size
+        self.min_batch_size = min_batch_size
+        self.max_batch_size = max_batch_size
+        self.max_payload_bytes = max_payload_bytes
+        self.target_latency = target_latency
+        self.concurrency = max(1, concurrency)
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+        self.stats: dict[str, TableWriteStats] = {}
+        self._lock = threading.Lock()
+        self._pool = ThreadPoolExecutor(max_workers=self.concurrency)
+
+    # ── public API ────────────────────────────────────────────────────────────
+
+    def write(
+        self,
+        table: str,
+        rows: list[dict],
+        on_conflict: str,
+        returning: Optional[str] = None,
+        max_batch_size: Optional[int] = None,
+    ) -> list[dict]:
+        """
+        Upsert all rows into table; returns once every row is written.
+
+        Args:
+            returning: comma-separated columns to echo back, e.g. "id,position".
+            max_batch_size: hard cap for this call (e.g. the server's max_rows
+                when rows are echoed back).
+        """
+        results: list[dict] = []
+        if not rows:
+            return results
+
+        stats = self.stats.setdefault(
+            table, TableWriteStats(batch_size=self.initial_batch_size)
+        )
+        payload_cap = self._payload_cap(rows)
+        retry_queue: deque[_Batch] = deque()
+        in_flight: dict[Future, _Batch] = {}
+        cursor = 0
+        t0 = time.perf_counter()
+
+        try:
+            while cursor < len(rows) or retry_queue or in_flight:
+                while len(in_flight) < self.concurrency and (retry_queue or cursor < len(rows)):
+                    if retry_queue:
+                        batch = retry_queue.popleft()
+                    else:
+                        size = max(1, min(stats.batch_size, payload_cap, max_batch_size or stats.batch_size))
+                        batch = _Batch(rows[cursor : cursor + size])
+                        cursor += len(batch.rows)
+                    in_flight[self._pool.submit(self._send, table, batch, on_conflict, returning)] = batch
+
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for fut in done:
+                    batch = in_flight.pop(fut)
+                    exc = fut.exception()
+                    if exc is None:
+                        latency, echoed = fut.result()
+                        if echoed:
+                            results.extend(echoed)
+                        self._on_success(stats, batch, latency)
+                    else:
+                        self._on_failure(table, stats, batch, exc, retry_queue)
+        finally:
+            # Let any still-running batches finish before surfacing an error.
+            wait(in_flight)
+            stats.seconds += time.perf_counter() - t0
+        return results
+
+    def call(self, fn: Callable[[], T]) -> T:
+        """Run a read (e.g. an id fetch) with the same retry/backoff policy."""
+        attempt = 0
+        while True:
+            try:
+                return fn()
+            except Exception as exc:
+                if not is_transient(exc) or attempt >= self.max_retries:
+                    raise
+                attempt += 1
+                time.sleep(self._backoff(attempt))
+
+    def report(self) -> None:
+        if not self.stats:
+            return
+        print("\n── Write throughput ─────────────────────────────────────")
+        print(f"   {'table':10} {'rows':>9} {'rows/s':>9} {'batches':>8} "
+              f"{'retries':>8} {'splits':>7} {'throttle':>9} {'batch':>6}")
+        for table, s in self.stats.items():
+            print(f"   {table:10} {s.rows:>9,} {s.rows_per_sec:>9,.0f} {s.batches:>8,} "
+                  f"{s.retries:>8,} {s.splits:>7,} {s.throttles:>9,} {s.batch_size:>6,}")
+
+    def close(self) -> None:
+        self._pool.shutdown(wait=True)
+
+    # ── internals ─────────────────────────────────────────────────────────────
+
+    def _send(
+        self, table: str, batch: _Batch, on_conflict: str, returning: Optional[str]
+    ) -> tuple[float, Optional[list[dict]]]:
+        if batch.delay:
+            time.sleep(batch.delay)
+        t0 = time.perf_counter()
+        echoed = self.send(table, batch.rows, on_conflict, returning)
+        return time.perf_counter() - t0, echoed
+
+    def _payload_cap(self, rows: list[dict]) -> int:
+        """Rows per batch that keep the JSON body under max_payload_bytes."""
+        sample = rows[:50]
+        bytes_per_row = len(json.dumps(sample, ensure_ascii=False).encode("utf-8")) / len(sample)
+        return max(1, int(self.max_payload_bytes // max(bytes_per_row, 1)))
+
+    def _backoff(self, attempt: int) -> float:
+        # Exponential backoff with full jitter.
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+
+    def _on_success(self, stats: TableWriteStats, batch: _Batch, latency: float) -> None:
+        with self._lock:
+            stats.rows += len(batch.rows)
+            stats.batches += 1
+            if latency > self.target_latency:
+                stats.batch_size = max(self.min_batch_size, stats.batch_size // 2)
+            elif latency < self.target_latency / 2 and len(batch.rows) >= stats.batch_size:
+                stats.batch_size = min(self.max_batch_size, int(stats.batch_size * 1.25) + 1)
+
+    def _on_failure(
+        self,
+        table: str,
+        stats: TableWriteStats,
+        batch: _Batch,
+        exc: BaseException,
+        retry_queue: "deque[_Batch]",
+    ) -> None:
+        with self._lock:
+            if is_throttle(exc):
+                stats.throttles += 1
+                stats.batch_size = max(self.min_batch_size, stats.batch_size // 2)
+
+            if (is_transient(exc) or is_split(exc)) and batch.attempt < self.max_retries:
+                attempt = batch.attempt + 1
+                delay = self._backoff(attempt)
+                if is_split(exc) and len(batch.rows) > 1:
+                    # Too large for the server: two halves, each with what is
+                    # left of this batch's retries
+                    stats.splits += 1
+                    mid = len(batch.rows) // 2
+                    retry_queue.appendleft(_Batch(batch.rows[mid:], attempt, delay))
+                    retry_queue.appendleft(_Batch(batch.rows[:mid], attempt, delay))
+                    return
+                stats.retries += 1
+                batch.attempt, batch.delay = attempt, delay
+                retry_queue.append(batch)
+                return
+
+        raise WriteError(table, batch.rows, exc) from exc
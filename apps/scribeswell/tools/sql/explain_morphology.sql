@@ -0,0 +1,36 @@
+-- ============================================================
+-- Morphology filter query plans
+-- The research filters from docs/morphology-query-plans.md, against the
+-- active corpus (*_read views). Run after an import + VACUUM ANALYZE:
+--
+--   psql "$DATABASE_URL" -f tools/sql/explain_morphology.sql
+-- ============================================================
+
+\echo '── Q1: qal perfect verbs in Genesis'
+EXPLAIN (ANALYZE, BUFFERS, COSTS OFF)
+SELECT m.word_id
+FROM scribeswell.morpheme_read m
+WHERE m.part_of_speech = 'verb'
+  AND m.verb_stem = 'qal' AND m.verb_aspect = 'perfect'
+  AND m.book_id = 1;
+
+\echo '── Q2: feminine plural construct nouns, whole corpus'
+EXPLAIN (ANALYZE, BUFFERS, COSTS OFF)
+SELECT count(*)
+FROM scribeswell.morpheme_read m
+WHERE m.part_of_speech = 'noun'
+  AND m.gender = 'feminine' AND m.number = 'plural' AND m.state = 'construct';
+
+\echo '── Q3: verbs per stem in Psalms'
+EXPLAIN (ANALYZE, BUFFERS, COSTS OFF)
+SELECT m.verb_stem, count(*)
+FROM scribeswell.morpheme_read m
+WHERE m.part_of_speech = 'verb' AND m.book_id = 27
+GROUP BY m.verb_stem;
+
+\echo '── Q4: concordance of a lemma in Isaiah, in reading order'
+EXPLAIN (ANALYZE, BUFFERS, COSTS OFF)
+SELECT w.verse_id, w.position
+FROM scribeswell.word_read w
+WHERE w.lemma_strong = 'H430' AND w.book_id = 12
+ORDER BY w.verse_id, w.position;
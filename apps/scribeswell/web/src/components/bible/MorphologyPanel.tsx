@@ -31,6 +31,14 @@ export function MorphologyPanel({ word, onClose }: MorphologyPanelProps) {
           >
             {word.display_he}
           </p>
+          {word.gloss && (
+            <p className="text-sm text-stone-600">
+              {word.gloss}
+              {word.translit && (
+                <span className="text-stone-400 italic"> · {word.translit}</span>
+              )}
+            </p>
+          )}
           {word.lemma_strong && (
             <p className="text-xs text-stone-400 font-mono">
               {word.lemma_strong}
@@ -8,12 +8,14 @@ import {
   getBook,
   getVerses,
   getWordMorphology,
+  getReaderBundle,
 } from "@/lib/api-client";
 import type {
   BooksListResponse,
   BookWithChaptersResponse,
   VersesListResponse,
   WordWithMorphologyResponse,
+  ReaderBundleResponse,
 } from "@/schemas/bible.schema";
 
 // ── Generic async hook ────────────────────────────────────────────────────────
@@ -72,7 +74,7 @@ export function useVerses(osisId: string | null, chapterNum: number | null) {
   return useAsync<VersesListResponse | null>(
     () =>
       osisId && chapterNum
-        ? getVerses(osisId, chapterNum)
+        ? getVerses(osisId, chapterNum, undefined, [], "columnar")
         : Promise.resolve(null),
     [osisId, chapterNum]
   );
@@ -84,3 +86,13 @@ export function useWordMorphology(wordId: number | null) {
     [wordId]
   );
 }
+
+export function useReaderBundle(osisId: string | null, chapterNum: number | null) {
+  return useAsync<ReaderBundleResponse | null>(
+    () =>
+      osisId && chapterNum
+        ? getReaderBundle(osisId, chapterNum)
+        : Promise.resolve(null),
+    [osisId, chapterNum]
+  );
+}
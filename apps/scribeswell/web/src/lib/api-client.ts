@@ -9,12 +9,18 @@ import {
   BooksListResponseSchema,
   BookWithChaptersResponseSchema,
   ChapterWithVersesResponseSchema,
+  ReaderBundleResponseSchema,
+  VersesColumnarResponseSchema,
   VersesListResponseSchema,
   WordWithMorphologyResponseSchema,
   type BooksListResponse,
   type BookWithChaptersResponse,
   type ChapterWithVersesResponse,
+  type Morpheme,
+  type ReaderBundleResponse,
+  type VersesColumnarResponse,
   type VersesListResponse,
+  type WordResponse,
   type WordWithMorphologyResponse,
 } from "@/schemas/bible.schema";
 
@@ -78,18 +84,83 @@ export async function getChapter(
 
 // ── Verses ────────────────────────────────────────────────────────────────────
 
+export type VerseInclude = "morphology" | "gloss";
+
+/** "columnar" sends each field name once per response instead of per word. */
+export type VerseFormat = "rows" | "columnar";
+
+/** Rebuild the row-shaped response from a ?format=columnar payload. */
+export function decodeColumnarVerses(c: VersesColumnarResponse): VersesListResponse {
+  const w = c.words;
+  const m = c.morphemes;
+  const mo = c.morpheme_offsets;
+
+  const morphemesOf = (j: number): Morpheme[] => {
+    const out: Morpheme[] = [];
+    if (!m || !mo) return out;
+    for (let k = mo[j]; k < mo[j + 1]; k++) {
+      out.push({
+        segment_index: m.segment_index[k],
+        language: m.language[k],
+        part_of_speech: m.part_of_speech[k],
+        pos_code: m.pos_code[k],
+        pos_type: m.pos_type[k],
+        gender: m.gender[k],
+        number: m.number[k],
+        state: m.state[k],
+        verb_stem: m.verb_stem[k],
+        verb_aspect: m.verb_aspect[k],
+        person: m.person[k],
+      });
+    }
+    return out;
+  };
+
+  const data = c.verses.id.map((id, i) => {
+    const words: WordResponse[] = [];
+    for (let j = c.word_offsets[i]; j < c.word_offsets[i + 1]; j++) {
+      const word: WordResponse = {
+        id: w.id[j],
+        position: w.position[j],
+        surface_he: w.surface_he[j],
+        display_he: w.display_he[j],
+        lemma_strong: w.lemma_strong[j],
+        morph_code: w.morph_code[j],
+      };
+      if (mo) word.morphemes = morphemesOf(j);
+      if (w.gloss) word.gloss = w.gloss[j];
+      if (w.translit) word.translit = w.translit[j];
+      words.push(word);
+    }
+    return {
+      id,
+      verse_num: c.verses.verse_num[i],
+      book_id: c.book_id,
+      chapter_num: c.chapter_num,
+      words,
+    };
+  });
+
+  return { data, total: c.total };
+}
+
 export async function getVerses(
   osisId: string,
   chapterNum: number,
-  token?: string
+  token?: string,
+  include: VerseInclude[] = [],
+  format: VerseFormat = "rows"
 ): Promise<VersesListResponse> {
-  var result = await apiFetch(
-    `${BASE}/books/${encodeURIComponent(osisId)}/chapters/${chapterNum}/verses`,
-    VersesListResponseSchema,
-    token
-  );
-  console.log("getVerses: result", result);
-  return result;
+  const params: string[] = [];
+  if (include.length) params.push(`include=${include.join(",")}`);
+  if (format === "columnar") params.push("format=columnar");
+  const query = params.length ? `?${params.join("&")}` : "";
+  const url = `${BASE}/books/${encodeURIComponent(osisId)}/chapters/${chapterNum}/verses${query}`;
+
+  if (format === "columnar") {
+    return decodeColumnarVerses(await apiFetch(url, VersesColumnarResponseSchema, token));
+  }
+  return apiFetch(url, VersesListResponseSchema, token);
 }
 
 // ── Morphology ────────────────────────────────────────────────────────────────
@@ -104,3 +175,17 @@ export async function getWordMorphology(
     token
   );
 }
+
+// ── Reader bundle ─────────────────────────────────────────────────────────────
+
+export async function getReaderBundle(
+  osisId: string,
+  chapterNum: number,
+  token?: string
+): Promise<ReaderBundleResponse> {
+  return apiFetch(
+    `${BASE}/reader/${encodeURIComponent(osisId)}/${chapterNum}`,
+    ReaderBundleResponseSchema,
+    token
+  );
+}
@@ -9,13 +9,16 @@
  * └─────────────────────────────────────────────────────┘
  *
  * Navigation state lives in URL search params: ?book=Gen&chapter=1
+ *
+ * The chapter comes from one reader bundle request (verses, morphemes and
+ * glosses); selecting a word needs no further request.
  */
 import { useState } from "react";
 import { useSearchParams } from "react-router-dom";
 import { BookChapterSelector } from "@/components/bible/book-chapter-selector";
 import { VerseReader } from "@/components/bible/VerseReader";
 import { MorphologyPanel } from "@/components/bible/MorphologyPanel";
-import { useBooks, useVerses, useWordMorphology } from "@/hooks/useBible";
+import { useBooks, useReaderBundle } from "@/hooks/useBible";
 import type { WordResponse } from "@/schemas/bible.schema";
 
 // Default navigation state — Genesis 1.
@@ -34,8 +37,7 @@ export function ReaderPage() {
     DEFAULT_CHAPTER;
 
   const books = useBooks();
-  const verses = useVerses(selectedOsisId, selectedChapter);
-  const morphology = useWordMorphology(selectedWord?.id ?? null);
+  const bundle = useReaderBundle(selectedOsisId, selectedChapter);
 
   function handleSelect(osisId: string, chapterNum: number) {
     setSelectedWord(null);
@@ -75,19 +77,19 @@ export function ReaderPage() {
       <div className="flex gap-6 flex-1">
         {/* Main content */}
         <main className="flex-1 min-w-0">
-          {verses.loading && (
+          {bundle.loading && (
             <div className="space-y-3 animate-pulse">
               {[...Array(5)].map((_, i) => (
                 <div key={i} className="h-8 bg-stone-200 rounded w-full" />
               ))}
             </div>
           )}
-          {verses.error && (
-            <p className="text-sm text-red-500">Error: {verses.error}</p>
+          {bundle.error && (
+            <p className="text-sm text-red-500">Error: {bundle.error}</p>
           )}
-          {verses.data && (
+          {bundle.data && (
             <VerseReader
-              verses={verses.data.data}
+              verses={bundle.data.verses}
               selectedWordId={selectedWord?.id ?? null}
               onWordClick={handleWordClick}
             />
@@ -97,25 +99,10 @@ export function ReaderPage() {
         {/* Morphology panel (conditional) */}
         {selectedWord && (
           <aside className="w-72 shrink-0">
-            {morphology.loading && (
-              <div className="bg-white border border-stone-200 rounded-xl p-4 animate-pulse">
-                <div className="h-8 bg-stone-200 rounded w-24 mb-3" />
-                <div className="space-y-2">
-                  {[...Array(3)].map((_, i) => (
-                    <div key={i} className="h-4 bg-stone-100 rounded" />
-                  ))}
-                </div>
-              </div>
-            )}
-            {morphology.error && (
-              <p className="text-sm text-red-500">Error: {morphology.error}</p>
-            )}
-            {morphology.data && (
-              <MorphologyPanel
-                word={morphology.data}
-                onClose={() => setSelectedWord(null)}
-              />
-            )}
+            <MorphologyPanel
+              word={{ ...selectedWord, morphemes: selectedWord.morphemes ?? [] }}
+              onClose={() => setSelectedWord(null)}
+            />
           </aside>
         )}
       </div>
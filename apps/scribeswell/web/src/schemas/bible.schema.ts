@@ -44,6 +44,24 @@ export const BookWithChaptersResponseSchema = BookResponseSchema.extend({
 
 export type BookWithChaptersResponse = z.infer<typeof BookWithChaptersResponseSchema>;
 
+// ── Morphology ────────────────────────────────────────────────────────────────
+
+export const MorphemeSchema = z.object({
+  segment_index: z.number().int(),
+  language: z.string(),
+  part_of_speech: z.string(),
+  pos_code: z.string(),
+  pos_type: z.string().nullable().optional(),
+  gender: z.string().nullable().optional(),
+  number: z.string().nullable().optional(),
+  state: z.string().nullable().optional(),
+  verb_stem: z.string().nullable().optional(),
+  verb_aspect: z.string().nullable().optional(),
+  person: z.string().nullable().optional(),
+});
+
+export type Morpheme = z.infer<typeof MorphemeSchema>;
+
 // ── Verse / Word ──────────────────────────────────────────────────────────────
 
 export const WordResponseSchema = z.object({
@@ -53,6 +71,11 @@ export const WordResponseSchema = z.object({
   display_he: z.string().nullable(),
   lemma_strong: z.string().nullable(),
   morph_code: z.string().nullable(),
+  // Present only when requested with ?include=morphology
+  morphemes: z.array(MorphemeSchema).optional(),
+  // Present only when requested with ?include=gloss
+  gloss: z.string().nullable().optional(),
+  translit: z.string().nullable().optional(),
 });
 
 export type WordResponse = z.infer<typeof WordResponseSchema>;
@@ -81,6 +104,54 @@ export const VersesListResponseSchema = z.object({
 
 export type VersesListResponse = z.infer<typeof VersesListResponseSchema>;
 
+// ?format=columnar — parallel arrays per field. Words of verse i are
+// words[word_offsets[i] .. word_offsets[i + 1]); morphemes of word j likewise
+// via morpheme_offsets. decodeColumnarVerses() (api-client) turns it back
+// into a VersesListResponse.
+
+const column = <T extends z.ZodTypeAny>(item: T) => z.array(item);
+const nullableStrings = column(z.string().nullable());
+
+export const VersesColumnarResponseSchema = z.object({
+  format: z.literal("columnar"),
+  total: z.number().int(),
+  book_id: z.number().int(),
+  chapter_num: z.number().int(),
+  verses: z.object({
+    id: column(z.number().int()),
+    verse_num: column(z.number().int()),
+  }),
+  word_offsets: column(z.number().int()),
+  words: z.object({
+    id: column(z.number().int()),
+    position: column(z.number().int()),
+    surface_he: column(z.string()),
+    display_he: nullableStrings,
+    lemma_strong: nullableStrings,
+    morph_code: nullableStrings,
+    gloss: nullableStrings.optional(),
+    translit: nullableStrings.optional(),
+  }),
+  morpheme_offsets: column(z.number().int()).optional(),
+  morphemes: z
+    .object({
+      segment_index: column(z.number().int()),
+      language: column(z.string()),
+      part_of_speech: column(z.string()),
+      pos_code: column(z.string()),
+      pos_type: nullableStrings,
+      gender: nullableStrings,
+      number: nullableStrings,
+      state: nullableStrings,
+      verb_stem: nullableStrings,
+      verb_aspect: nullableStrings,
+      person: nullableStrings,
+    })
+    .optional(),
+});
+
+export type VersesColumnarResponse = z.infer<typeof VersesColumnarResponseSchema>;
+
 export const ChapterWithVersesResponseSchema = z.object({
   id: z.number().int(),
   book_id: z.number().int(),
@@ -90,22 +161,7 @@ export const ChapterWithVersesResponseSchema = z.object({
 
 export type ChapterWithVersesResponse = z.infer<typeof ChapterWithVersesResponseSchema>;
 
-// ── Morphology ────────────────────────────────────────────────────────────────
-
-export const MorphemeSchema = z.object({
-  segment_index: z.number().int(),
-  language: z.string(),
-  part_of_speech: z.string(),
-  pos_code: z.string(),
-  gender: z.string().nullable().optional(),
-  number: z.string().nullable().optional(),
-  state: z.string().nullable().optional(),
-  verb_stem: z.string().nullable().optional(),
-  verb_aspect: z.string().nullable().optional(),
-  person: z.string().nullable().optional(),
-});
-
-export type Morpheme = z.infer<typeof MorphemeSchema>;
+// ── Word morphology ───────────────────────────────────────────────────────────
 
 export const WordWithMorphologyResponseSchema = z.object({
   id: z.number().int(),
@@ -115,6 +171,31 @@ export const WordWithMorphologyResponseSchema = z.object({
   lemma_strong: z.string().nullable(),
   morph_code: z.string().nullable(),
   morphemes: z.array(MorphemeSchema),
+  // Present on words taken from a reader bundle
+  gloss: z.string().nullable().optional(),
+  translit: z.string().nullable().optional(),
+});
+
+export type WordWithMorphologyResponse = z.infer<typeof WordWithMorphologyResponseSchema>;
+
+// ── Reader bundle ─────────────────────────────────────────────────────────────
+
+export const ChapterRefSchema = z.object({
+  osis_id: z.string(),
+  chapter_num: z.number().int(),
+});
+
+export type ChapterRef = z.infer<typeof ChapterRefSchema>;
+
+export const ReaderBundleResponseSchema = z.object({
+  corpus_version: z.number().int(),
+  book: BookResponseSchema,
+  chapter_num: z.number().int(),
+  chapter_count: z.number().int(),
+  prev: ChapterRefSchema.nullable(),
+  next: ChapterRefSchema.nullable(),
+  // Every word carries morphemes, gloss and translit
+  verses: z.array(VerseWithWordsResponseSchema),
 });
 
-export type WordWithMorphologyResponse = z.infer<typeof WordWithMorphologyResponseSchema>;
\ No newline at end of file
+export type ReaderBundleResponse = z.infer<typeof ReaderBundleResponseSchema>;
@@ -0,0 +1,135 @@
+"""
+JWKS key cache — the public keys for asymmetric (ES256 / RS256) tokens.
+
+Usage:
+    keys = JWKSCache("https://<project>.supabase.co/auth/v1/.well-known/jwks.json")
+    keys.start()                         # fetch now, then refresh in the background
+    entry = keys.get(kid)                # (key, alg) or None — a dict lookup, no I/O
+
+The key set is fetched by a daemon thread: once at start(), then again when
+80% of its lifetime has passed (the endpoint's Cache-Control max-age, or
+ttl_seconds without one). Requests never wait on the network.
+
+When a refresh fails, the keys already held keep being served
+(stale-while-revalidate) while the thread retries with backoff, 5 s up to
+60 s. Keys more than max_stale_seconds past their expiry are no longer
+served, and asymmetric tokens fail until the endpoint is back.
+
+A token whose `kid` is not in the set (a key rotated in since the last
+fetch) fails and wakes the thread for an early refresh, at most once per
+min_refresh_seconds.
+
+Vendored from platform/builder-cli/templates/backend/auth/jwks.py.
+"""
+from __future__ import annotations
+import json
+import logging
+import re
+import threading
+import time
+import urllib.request
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    from jose.backends.base import Key
+
+logger = logging.getLogger("jwks")
+
+# Algorithm per key type, for keys published without "alg"
+ALGORITHMS = {"EC": "ES256", "RSA": "RS256"}
+SUPPORTED = frozenset(ALGORITHMS.values())
+
+_MAX_AGE = re.compile(r"max-age=(\d+)")
+
+
+class JWKSCache:
+    """Keys of a JWKS endpoint by `kid`, kept fresh by a background thread."""
+
+    def __init__(
+        self,
+        url: str,
+        ttl_seconds: float = 600.0,
+        max_stale_seconds: float = 86400.0,
+        min_refresh_seconds: float = 30.0,
+        timeout: float = 5.0,
+    ):
+        self.url = url
+        self.ttl = ttl_seconds
+        self.max_stale = max_stale_seconds
+        self.min_refresh = min_refresh_seconds
+        self.timeout = timeout
+        self._keys: dict[str, tuple[Key, str]] = {}
+        self.fetched_at = 0.0
+        self.expires_at = 0.0
+        self.last_error: Optional[str] = None
+        self._wake = threading.Event()
+        self._last_wake = 0.0
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+
+    def get(self, kid: Optional[str]) -> Optional[tuple[Key, str]]:
+        """(key, alg) for `kid`, or None — unknown kids trigger an early refresh."""
+        entry = self._keys.get(kid) if kid else None
+        if entry is None:
+            self.refresh_soon()
+            return None
+        if time.time() > self.expires_at + self.max_stale:
+            return None
+        return entry
+
+    def start(self) -> None:
+        """Start the refresh thread (once); it fetches the key set right away."""
+        with self._start_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="jwks-refresh", daemon=True)
+                self._thread.start()
+
+    def refresh_soon(self) -> None:
+        """Wake the refresh thread, unless it was woken less than min_refresh_seconds ago."""
+        if self._thread is None:
+            self.start()
+            return
+        now = time.monotonic()
+        if now - self._last_wake >= self.min_refresh:
+            self._last_wake = now
+            self._wake.set()
+
+    def refresh(self) -> None:
+        """Fetch the key set now, replacing the cached one (raises on failure)."""
+        from jose import jwk
+
+        request = urllib.request.Request(self.url, headers={"Accept": "application/json"})
+        with urllib.request.urlopen(request, timeout=self.timeout) as response:
+            body = json.load(response)
+            max_age = _MAX_AGE.search(response.headers.get("Cache-Control") or "")
+        keys: dict[str, tuple[Key, str]] = {}
+        for data in body.get("keys", []):
+            alg = data.get("alg") or ALGORITHMS.get(data.get("kty"))
+            if alg not in SUPPORTED or data.get("use", "sig") != "sig" or not data.get("kid"):
+                continue
+            try:
+                keys[data["kid"]] = (jwk.construct(data, alg), alg)
+            except Exception as e:
+                logger.warning("Skipping JWKS key %s: %s", data["kid"], e)
+        self._keys = keys  # one assignment: readers see the old set or the new one
+        self.fetched_at = time.time()
+        self.expires_at = self.fetched_at + (int(max_age.group(1)) if max_age else self.ttl)
+        self.last_error = None
+
+    def _run(self) -> None:
+        backoff = 5.0
+        while True:
+            try:
+                self.refresh()
+                backoff = 5.0
+                wait = max((self.expires_at - self.fetched_at) * 0.8, self.min_refresh)
+            except Exception as e:
+                self.last_error = f"{type(e).__name__}: {e}"
+                logger.warning(
+                    "JWKS refresh from %s failed (%s); serving %d cached key(s), retrying in %.0f s",
+                    self.url, self.last_error, len(self._keys), backoff,
+                )
+                wait = backoff
+                backoff = min(backoff * 2, 60.0)
+            self._wake.wait(wait)
+            self._wake.clear()
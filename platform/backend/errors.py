@@ -41,3 +41,8 @@ class NotFoundError(HTTPException):
 class UnauthorizedError(HTTPException):
     def __init__(self, message: str = "Unauthorized"):
         super().__init__(status_code=401, detail=message)
+
+
+class ForbiddenError(HTTPException):
+    def __init__(self, message: str = "Forbidden"):
+        super().__init__(status_code=403, detail=message)
@@ -4,43 +4,47 @@ platform/backend/main.py — FastAPI application entry point
 Run locally:
     cd platform/backend
     uvicorn main:app --reload --port 8000
+    uvicorn main:create_app --factory --port 8000     # same app, built by uvicorn
 
 OpenAPI docs:
     http://localhost:8000/docs
     http://localhost:8000/redoc
+
+`main.app` is built by create_app() on first access, not at import; the
+--factory form has uvicorn call create_app() itself. Connections and client
+libraries are set up in the app's lifespan, not at import: the JWKS refresh
+starts, and the supabase client the bible service queries with is created
+(importing supabase-py).
 """
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from fastapi.exceptions import RequestValidationError
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
+from auth.jwt_optional import jwks, require_role
 from config import settings
+from metrics import MetricsMiddleware, metrics_endpoint
+from profiling import ProfileRequestMiddleware, profiler_router
 
-# ── App ───────────────────────────────────────────────────────────────────────
+# ── Lifespan ──────────────────────────────────────────────────────────────────
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    from services.bible_service import get_client
 
-app = FastAPI(
-    title="Symposia API",
-    description="Symposia Platform — FastAPI backend",
-    version="0.1.0",
-    docs_url="/docs",
-    redoc_url="/redoc",
-    openapi_url="/openapi.json",
-)
-
-# ── CORS ──────────────────────────────────────────────────────────────────────
-
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=settings.cors_origins,
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+    # Asymmetric tokens (JWT_JWKS_URL): fetch the key set now, refresh it in the background
+    if jwks is not None:
+        jwks.start()
+    get_client()
+    yield
+    get_client.cache_clear()
 
 # ── Error handlers ────────────────────────────────────────────────────────────
 
-@app.exception_handler(StarletteHTTPException)
 async def http_exception_handler(request: Request, exc: StarletteHTTPException):
     return JSONResponse(
         status_code=exc.status_code,
@@ -48,7 +52,6 @@ async def http_exception_handler(request: Request, exc: StarletteHTTPException):
     )
 
 
-@app.exception_handler(RequestValidationError)
 async def validation_exception_handler(request: Request, exc: RequestValidationError):
     return JSONResponse(
         status_code=422,
@@ -59,7 +62,6 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
     )
 
 
-@app.exception_handler(Exception)
 async def unhandled_exception_handler(request: Request, exc: Exception):
     return JSONResponse(
         status_code=500,
@@ -68,20 +70,76 @@ async def unhandled_exception_handler(request: Request, exc: Exception):
 
 # ── Health ────────────────────────────────────────────────────────────────────
 
-@app.get("/health", tags=["system"])
 async def health():
     """Liveness probe — returns 200 when the server is running."""
     return {"status": "ok", "env": settings.app_env}
 
 
-@app.get("/", tags=["system"])
 async def root():
     return {"message": "Symposia API", "docs": "/docs"}
 
-# ── Routers ───────────────────────────────────────────────────────────────────
-# Routers are registered here as they are built.
-# Each router is prefixed and tagged for OpenAPI grouping.
+# ── App ───────────────────────────────────────────────────────────────────────
+
+def create_app() -> FastAPI:
+    app = FastAPI(
+        title="Symposia API",
+        description="Symposia Platform — FastAPI backend",
+        version="0.1.0",
+        docs_url="/docs",
+        redoc_url="/redoc",
+        openapi_url="/openapi.json",
+        lifespan=lifespan,
+    )
+
+    # Profiler — added first, so innermost: a request profile covers the app, not the middleware
+    if settings.profiler_enabled:
+        app.add_middleware(
+            ProfileRequestMiddleware,
+            signing_key=settings.profiler_signing_key,
+            interval_ms=settings.profiler_interval_ms,
+        )
+        app.include_router(
+            profiler_router(
+                require_role(settings.profiler_role),
+                signing_key=settings.profiler_signing_key,
+                interval_ms=settings.profiler_interval_ms,
+                max_seconds=settings.profiler_max_seconds,
+            ),
+            prefix="/admin",
+            tags=["admin"],
+        )
+
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=settings.cors_origins,
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
+
+    # Metrics — added last, so outermost: latency covers the other middleware, sizes are bytes as sent
+    if settings.metrics_enabled:
+        app.add_middleware(MetricsMiddleware)
+        app.add_route("/metrics", metrics_endpoint, include_in_schema=False)
+
+    app.add_exception_handler(StarletteHTTPException, http_exception_handler)
+    app.add_exception_handler(RequestValidationError, validation_exception_handler)
+    app.add_exception_handler(Exception, unhandled_exception_handler)
+
+    app.add_api_route("/health", health, methods=["GET"], tags=["system"])
+    app.add_api_route("/", root, methods=["GET"], tags=["system"])
+
+    # Routers — prefixed and tagged for OpenAPI grouping, imported here so
+    # their dependencies load with the app, not with this module
+    from routers import bible as bible_router
+
+    app.include_router(bible_router.router, prefix="/api/bible", tags=["bible"])
+    return app
 
-from routers import bible as bible_router  # noqa: E402
 
-app.include_router(bible_router.router, prefix="/api/bible", tags=["bible"])
+def __getattr__(name: str) -> FastAPI:
+    """`main.app`, built by create_app() on first access (uvicorn main:app) and kept."""
+    if name != "app":
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    app = globals()["app"] = create_app()
+    return app
@@ -2,7 +2,10 @@
 Bible router — public read-only endpoints.
 
 All endpoints are public (no auth required).
-Optional JWT is accepted for future user-settings features.
+Optional JWT is accepted for future user-settings features; it is only verified
+if a handler reads it (LazyOptionalUser).
+Handlers are plain `def`: the service layer blocks on the database, so FastAPI
+runs them on its threadpool and the event loop keeps serving other requests.
 
 Routes:
     GET /api/bible/books                          → list all books
@@ -14,7 +17,7 @@ Routes:
 from fastapi import APIRouter, Path, Query
 from typing import Optional
 
-from auth.jwt_optional import OptionalUser
+from auth.jwt_optional import LazyOptionalUser
 from schemas.bible_schemas import (
     BooksListResponse,
     BookWithChaptersResponse,
@@ -33,7 +36,7 @@ router = APIRouter()
     summary="List all books",
     description="Returns all 39 Tanakh books ordered by canonical id.",
 )
-async def list_books(user: OptionalUser = None):
+def list_books(user: LazyOptionalUser = None):
     return bible_service.get_books()
 
 
@@ -43,9 +46,9 @@ async def list_books(user: OptionalUser = None):
     summary="Get book with chapters",
     description="Returns a book and its chapter list by OSIS id (e.g. Gen, Exod).",
 )
-async def get_book(
+def get_book(
     osis_id: str = Path(..., description="OSIS book id, e.g. 'Gen'"),
-    user: OptionalUser = None,
+    user: LazyOptionalUser = None,
 ):
     return bible_service.get_book(osis_id)
 
@@ -56,10 +59,10 @@ async def get_book(
     summary="Get chapter with verse list",
     description="Returns a chapter and its verse numbers.",
 )
-async def get_chapter(
+def get_chapter(
     osis_id: str = Path(..., description="OSIS book id"),
     chapter_num: int = Path(..., ge=1, description="Chapter number"),
-    user: OptionalUser = None,
+    user: LazyOptionalUser = None,
 ):
     return bible_service.get_chapter(osis_id, chapter_num)
 
@@ -70,10 +73,10 @@ async def get_chapter(
     summary="Get verses with words",
     description="Returns all verses in a chapter, each with their Hebrew words.",
 )
-async def get_verses(
+def get_verses(
     osis_id: str = Path(..., description="OSIS book id"),
     chapter_num: int = Path(..., ge=1, description="Chapter number"),
-    user: OptionalUser = None,
+    user: LazyOptionalUser = None,
 ):
     return bible_service.get_verses(osis_id, chapter_num)
 
@@ -88,8 +91,8 @@ async def get_verses(
         "verb stem, verb aspect, and person where applicable."
     ),
 )
-async def get_word_morphology(
+def get_word_morphology(
     word_id: int = Path(..., ge=1, description="Word id"),
-    user: OptionalUser = None,
+    user: LazyOptionalUser = None,
 ):
     return bible_service.get_word_morphology(word_id)
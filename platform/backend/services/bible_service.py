@@ -3,13 +3,17 @@ Bible service — data access layer for the bible schema.
 
 All queries use the Supabase service-role client (reads from bible.* tables).
 Bible data is public read-only reference data — no auth required for reads.
+
+One client serves every query. It is created by main.py's lifespan, which is
+also when supabase-py is imported: importing the API does not pay for it.
 """
 from __future__ import annotations
-from typing import Optional
-from supabase import create_client, Client
+from functools import lru_cache
+from typing import TYPE_CHECKING, Optional
 
 from config import settings
 from errors import NotFoundError
+from metrics import observe_upstream
 from schemas.bible_schemas import (
     BookResponse,
     BookWithChaptersResponse,
@@ -24,22 +28,39 @@ from schemas.bible_schemas import (
     VersesListResponse,
 )
 
+if TYPE_CHECKING:
+    from supabase import Client
+
+
+@lru_cache(maxsize=1)
+def get_client() -> Client:
+    from supabase import create_client
 
-def _get_client() -> Client:
     return create_client(settings.supabase_url, settings.supabase_secret_key)
 
 
+def _execute(table: str, query):
+    """
+    Run a PostgREST query. With settings.metrics_enabled it is recorded as a
+    "supabase" upstream call on `table`.
+    """
+    if not settings.metrics_enabled:
+        return query.execute()
+    with observe_upstream("supabase", table):
+        return query.execute()
+
+
 # ── Books ─────────────────────────────────────────────────────────────────────
 
 def get_books() -> BooksListResponse:
     """Return all books ordered by testament + book_order."""
-    sb = _get_client()
-    resp = (
+    sb = get_client()
+    resp = _execute(
+        "book_read",
         sb.schema("scribeswell")
         .table("book_read")
         .select("*")
         .order("id")
-        .execute()
     )
     books = [BookResponse(**row) for row in resp.data]
     return BooksListResponse(data=books, total=len(books))
@@ -47,26 +68,26 @@ def get_books() -> BooksListResponse:
 
 def get_book(osis_id: str) -> BookWithChaptersResponse:
     """Return a single book with its chapter list."""
-    sb = _get_client()
+    sb = get_client()
 
-    book_resp = (
+    book_resp = _execute(
+        "book_read",
         sb.schema("scribeswell")
         .table("book_read")
         .select("*")
         .eq("osis_id", osis_id)
         .single()
-        .execute()
     )
     if not book_resp.data:
         raise NotFoundError("Book", osis_id)
 
-    ch_resp = (
+    ch_resp = _execute(
+        "chapter_read",
         sb.schema("scribeswell")
         .table("chapter_read")
         .select("id,chapter_num")
         .eq("book_id", book_resp.data["id"])
         .order("chapter_num")
-        .execute()
     )
 
     chapters = [ChapterSummary(**row) for row in ch_resp.data]
@@ -77,43 +98,43 @@ def get_book(osis_id: str) -> BookWithChaptersResponse:
 
 def get_chapter(osis_id: str, chapter_num: int) -> ChapterWithVersesResponse:
     """Return a chapter with its verse list."""
-    sb = _get_client()
+    sb = get_client()
 
     # Resolve book
-    book_resp = (
+    book_resp = _execute(
+        "book_read",
         sb.schema("scribeswell")
         .table("book_read")
         .select("id")
         .eq("osis_id", osis_id)
         .single()
-        .execute()
     )
     if not book_resp.data:
         raise NotFoundError("Book", osis_id)
 
     book_id = book_resp.data["id"]
 
-    ch_resp = (
+    ch_resp = _execute(
+        "chapter_read",
         sb.schema("scribeswell")
         .table("chapter_read")
         .select("id,book_id,chapter_num")
         .eq("book_id", book_id)
         .eq("chapter_num", chapter_num)
         .single()
-        .execute()
     )
     if not ch_resp.data:
         raise NotFoundError("Chapter", f"{osis_id} {chapter_num}")
 
     chapter_id = ch_resp.data["id"]
 
-    v_resp = (
+    v_resp = _execute(
+        "verse_read",
         sb.schema("scribeswell")
         .table("verse_read")
         .select("id,verse_num")
         .eq("chapter_id", chapter_id)
         .order("verse_num")
-        .execute()
     )
 
     verses = [VerseSummary(**row) for row in v_resp.data]
@@ -124,16 +145,16 @@ def get_chapter(osis_id: str, chapter_num: int) -> ChapterWithVersesResponse:
 
 def get_verses(osis_id: str, chapter_num: int) -> VersesListResponse:
     """Return all verses with words for a given chapter."""
-    sb = _get_client()
+    sb = get_client()
 
     # Resolve book
-    book_resp = (
+    book_resp = _execute(
+        "book_read",
         sb.schema("scribeswell")
         .table("book_read")
         .select("id")
         .eq("osis_id", osis_id)
         .single()
-        .execute()
     )
     if not book_resp.data:
         raise NotFoundError("Book", osis_id)
@@ -141,14 +162,14 @@ def get_verses(osis_id: str, chapter_num: int) -> VersesListResponse:
     book_id = book_resp.data["id"]
 
     # Get verses for this chapter (using denorm columns for speed)
-    v_resp = (
+    v_resp = _execute(
+        "verse_read",
         sb.schema("scribeswell")
         .table("verse_read")
         .select("id,verse_num,book_id,chapter_num")
         .eq("book_id", book_id)
         .eq("chapter_num", chapter_num)
         .order("verse_num")
-        .execute()
     )
 
     if not v_resp.data:
@@ -157,13 +178,13 @@ def get_verses(osis_id: str, chapter_num: int) -> VersesListResponse:
     verse_ids = [row["id"] for row in v_resp.data]
 
     # Fetch all words for these verses in one query
-    w_resp = (
+    w_resp = _execute(
+        "word_read",
         sb.schema("scribeswell")
         .table("word_read")
         .select("id,verse_id,position,surface_he,display_he,lemma_strong,morph_code")
         .in_("verse_id", verse_ids)
         .order("position")
-        .execute()
     )
 
     # Group words by verse_id
@@ -188,20 +209,21 @@ def get_verses(osis_id: str, chapter_num: int) -> VersesListResponse:
 
 def get_word_morphology(word_id: int) -> WordWithMorphologyResponse:
     """Return a word with its decoded morpheme breakdown."""
-    sb = _get_client()
+    sb = get_client()
 
-    w_resp = (
+    w_resp = _execute(
+        "word_read",
         sb.schema("scribeswell")
         .table("word_read")
         .select("id,verse_id,position,surface_he,display_he,lemma_strong,morph_code")
         .eq("id", word_id)
         .single()
-        .execute()
     )
     if not w_resp.data:
         raise NotFoundError("Word", word_id)
 
-    m_resp = (
+    m_resp = _execute(
+        "morpheme_read",
         sb.schema("scribeswell")
         .table("morpheme_read")
         .select(
@@ -210,7 +232,6 @@ def get_word_morphology(word_id: int) -> WordWithMorphologyResponse:
         )
         .eq("word_id", word_id)
         .order("segment_index")
-        .execute()
     )
 
     morphemes = [MorphemeResponse(**row) for row in m_resp.data]
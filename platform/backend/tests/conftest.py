@@ -0,0 +1,22 @@
+"""
+Shared test setup: the backend's modules importable, and settings that
+need no Supabase project (environment variables win over .env files).
+
+Run:
+    cd platform/backend
+    pip install -r requirements-dev.txt
+    python -m pytest -q
+"""
+import os
+import sys
+from pathlib import Path
+
+BACKEND = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(BACKEND))
+
+os.environ.update({
+    "SUPABASE_URL": "https://test.supabase.invalid",
+    "SUPABASE_SECRET_KEY": "test",
+    "SUPABASE_JWT_SECRET": "test-secret",
+    "JWT_JWKS_URL": "",
+})
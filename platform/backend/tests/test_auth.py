@@ -0,0 +1,67 @@
+"""
+Auth wiring of this backend: the bible routes take LazyOptionalUser and
+never verify a token they do not read; /admin requires profiler_role. The
+verification itself (auth/jwt_optional.py) is tested with the template it is
+vendored from, platform/builder-cli/templates/backend/tests.
+"""
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+from jose import jwt
+
+import main
+from auth import jwt_optional
+from config import settings
+from schemas.bible_schemas import BooksListResponse
+from services import bible_service
+
+SIGN = "/admin/profile/sign?path=/health"
+
+
+def _bearer(*roles: str, secret: str = "test-secret") -> dict[str, str]:
+    claims = {"sub": "user-1", "user_roles": list(roles), "exp": int(time.time()) + 3600}
+    return {"Authorization": f"Bearer {jwt.encode(claims, secret, algorithm='HS256')}"}
+
+
+@pytest.fixture
+def decodes(monkeypatch):
+    """Tokens jwt_optional was asked to verify."""
+    calls = []
+    real = jwt_optional._decode_token
+    monkeypatch.setattr(jwt_optional, "_decode_token", lambda token: calls.append(token) or real(token))
+    return calls
+
+
+@pytest.fixture
+def client(monkeypatch):
+    """The app without its lifespan (no supabase client), bible_service answering empty."""
+    monkeypatch.setattr(bible_service, "get_books", lambda: BooksListResponse(data=[], total=0))
+    return TestClient(main.create_app())
+
+
+@pytest.fixture
+def admin(monkeypatch):
+    """The app with the profiler routes, for profiler_role "admin"."""
+    monkeypatch.setattr(settings, "profiler_enabled", True)
+    monkeypatch.setattr(settings, "profiler_role", "admin")
+    monkeypatch.setattr(settings, "profiler_signing_key", "test-signing-key")
+    return TestClient(main.create_app())
+
+
+@pytest.mark.parametrize("headers", [{}, _bearer("reader"), _bearer("reader", secret="forged")])
+def test_bible_routes_do_not_verify_tokens(client, decodes, headers):
+    response = client.get("/api/bible/books", headers=headers)
+
+    assert response.status_code == 200
+    assert decodes == []
+
+
+@pytest.mark.parametrize("headers, status", [
+    ({}, 401),
+    (_bearer("admin", secret="forged"), 401),
+    (_bearer("reader"), 403),
+    (_bearer("reader", "admin"), 200),
+])
+def test_admin_routes_require_the_profiler_role(admin, headers, status):
+    assert admin.get(SIGN, headers=headers).status_code == status
@@ -9,21 +9,53 @@ Usage:
             return {"message": f"Hello {user['email']}"}
         return {"message": "Hello anonymous"}
 
+    # Public endpoint that may never look at the user — verified on first use
+    @router.get("/books")
+    async def books(user: LazyOptionalUser):
+        claims = user.get()  # None when anonymous; no verification until here
+
     # Required endpoint — must be signed in
     @router.get("/private")
     async def private_endpoint(user: RequiredUser = Depends(get_required_user)):
         return {"message": f"Hello {user['email']}"}
 
-Token format: Supabase-issued JWT in Authorization: Bearer <token>
+    # Role-gated endpoint — signed in, with the role in the token
+    @router.get("/admin", dependencies=[Depends(require_role("admin"))])
+    async def admin_endpoint(): ...
+
+Token format: Supabase-issued JWT in Authorization: Bearer <token>, signed
+with the project JWT secret (HS256) or an asymmetric signing key (ES256 /
+RS256, verified against the JWKS at jwt_jwks_url; see auth/jwks.py)
+Verified claims are cached per token (jwt_cache_size entries, at most
+jwt_cache_ttl_seconds and never past exp), so a burst from one client
+verifies the signature once.
+Roles: the `user_roles` claim (and `user_role`), set by the custom access
+token hook (identity.custom_access_token_hook)
 """
-from typing import Annotated, Optional
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Annotated, Any, Callable, Optional
 from fastapi import Depends, Request
-from jose import JWTError, jwt
 
+from auth.jwks import SUPPORTED, JWKSCache
 from config import settings
 
 ALGORITHM = "HS256"
 
+# Asymmetric tokens (ES256 / RS256): keys from jwt_jwks_url, kept fresh in the
+# background (main.py starts it), so verification never waits on the network
+jwks: Optional[JWKSCache] = (
+    JWKSCache(
+        settings.jwt_jwks_url,
+        ttl_seconds=settings.jwt_jwks_ttl_seconds,
+        max_stale_seconds=settings.jwt_jwks_max_stale_seconds,
+    )
+    if settings.jwt_jwks_url
+    else None
+)
+
 
 def _extract_token(request: Request) -> Optional[str]:
     auth = request.headers.get("Authorization", "")
@@ -32,19 +64,68 @@ def _extract_token(request: Request) -> Optional[str]:
     return None
 
 
+# Verified claims by token hash → (claims, cached until). Only valid tokens
+# are cached; an entry lives until the token's exp, at most jwt_cache_ttl_seconds.
+_verified: OrderedDict[bytes, tuple[dict, float]] = OrderedDict()
+_verified_lock = threading.Lock()
+
+
+def _verification_key(token: str) -> Optional[tuple[Any, str]]:
+    """
+    (key, algorithm) for `token`, from its header: the shared secret for
+    HS256, the JWKS key with its `kid` for ES256 / RS256. None if unusable.
+    """
+    from jose import JWTError, jwt
+
+    try:
+        header = jwt.get_unverified_header(token)
+    except JWTError:
+        return None
+    alg = header.get("alg")
+    if alg == ALGORITHM:
+        return (settings.supabase_jwt_secret, alg) if settings.supabase_jwt_secret else None
+    if alg in SUPPORTED and jwks is not None:
+        entry = jwks.get(header.get("kid"))
+        if entry is not None and entry[1] == alg:
+            return entry
+    return None
+
+
 def _decode_token(token: str) -> Optional[dict]:
-    if not settings.supabase_jwt_secret:
+    if not settings.supabase_jwt_secret and jwks is None:
+        return None
+    key = hashlib.sha256(token.encode()).digest()
+    now = time.time()
+    with _verified_lock:
+        hit = _verified.get(key)
+        if hit is not None:
+            if now < hit[1]:
+                _verified.move_to_end(key)
+                return dict(hit[0])
+            del _verified[key]
+    from jose import JWTError, jwt  # on a cache miss only: requests that verify nothing never load it
+
+    verification = _verification_key(token)
+    if verification is None:
         return None
     try:
         payload = jwt.decode(
             token,
-            settings.supabase_jwt_secret,
-            algorithms=[ALGORITHM],
+            verification[0],
+            algorithms=[verification[1]],
             options={"verify_aud": False},
         )
-        return payload
     except JWTError:
         return None
+    if settings.jwt_cache_size > 0:
+        until = now + settings.jwt_cache_ttl_seconds
+        if isinstance(payload.get("exp"), (int, float)):
+            until = min(until, payload["exp"])
+        with _verified_lock:
+            _verified[key] = (payload, until)
+            if len(_verified) > settings.jwt_cache_size:
+                _verified.popitem(last=False)
+    return dict(payload)
 
 
 async def get_optional_user(request: Request) -> Optional[dict]:
@@ -58,6 +139,39 @@ async def get_optional_user(request: Request) -> Optional[dict]:
     return _decode_token(token)
 
 
+class LazyUser:
+    """
+    The request's JWT claims, verified on first use: `user.get()` returns
+    them (or None), `if user:` tells whether the request is signed in.
+    Handlers that never look cost no token verification at all.
+    """
+
+    __slots__ = ("_request", "_claims", "_resolved")
+
+    def __init__(self, request: Request):
+        self._request = request
+        self._claims: Optional[dict] = None
+        self._resolved = False
+
+    def get(self) -> Optional[dict]:
+        if not self._resolved:
+            token = _extract_token(self._request)
+            self._claims = _decode_token(token) if token else None
+            self._resolved = True
+        return self._claims
+
+    def __bool__(self) -> bool:
+        return self.get() is not None
+
+
+async def get_lazy_user(request: Request) -> LazyUser:
+    """
+    Dependency: a LazyUser for the request. Never raises; the token is
+    only read and verified if the handler asks for it.
+    """
+    return LazyUser(request)
+
+
 async def get_required_user(request: Request) -> dict:
     """
     Dependency: returns decoded JWT payload or raises 401.
@@ -74,6 +188,25 @@ async def get_required_user(request: Request) -> dict:
     return payload
 
 
+def require_role(*roles: str) -> Callable:
+    """
+    Dependency factory: get_required_user, plus one of `roles` in the
+    token's role claims. Raises 401 without a valid token, 403 without a role.
+    """
+    async def dependency(user: dict = Depends(get_required_user)) -> dict:
+        from errors import ForbiddenError
+
+        claimed = set(user.get("user_roles") or ())
+        if user.get("user_role"):
+            claimed.add(user["user_role"])
+        if claimed.isdisjoint(roles):
+            raise ForbiddenError(f"Requires role: {' or '.join(roles)}")
+        return user
+
+    return dependency
+
+
 # Type aliases for cleaner endpoint signatures
 OptionalUser = Annotated[Optional[dict], Depends(get_optional_user)]
 RequiredUser = Annotated[dict, Depends(get_required_user)]
+LazyOptionalUser = Annotated[LazyUser, Depends(get_lazy_user)]
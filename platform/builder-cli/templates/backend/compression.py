@@ -0,0 +1,197 @@
+"""
+Response compression — Brotli / gzip by Accept-Encoding.
+
+Two pieces:
+
+    CompressionMiddleware   compresses responses at or above a size threshold,
+                            per request (Brotli when the client accepts it and
+                            `brotli` is installed, else gzip).
+    Precompressed           identity, gzip and Brotli variants of an immutable
+                            payload, compressed once (precompress()) and served
+                            by precompressed_response() with no per-request
+                            compression.
+
+Usage:
+    app.add_middleware(CompressionMiddleware, minimum_size=settings.compress_min_bytes)
+
+    payload = precompress(body, "application/json")            # once, cached
+    return precompressed_response(payload, request, headers)   # per request
+
+The middleware leaves alone responses that already carry Content-Encoding
+(precompressed ones), responses marked `Cache-Control: no-transform`,
+streaming responses, and media types that do not compress (images,
+archives). Every response it could compress carries `Vary: Accept-Encoding`,
+whether or not this one was: small and identity responses too, so a shared
+cache does not serve them to a client that asked for gzip, or the reverse.
+"""
+import gzip
+from typing import NamedTuple, Optional
+
+from fastapi import Request, Response
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+# Media types worth compressing: text, JSON and the binary wire formats
+# (renderers.py), whose repeated keys and strings compress well too.
+COMPRESSIBLE_TYPES = (
+    "text/",
+    "application/json",
+    "application/msgpack",
+    "application/cbor",
+    "application/javascript",
+    "application/xml",
+)
+
+
+def choose_encoding(accept_encoding: Optional[str]) -> Optional[str]:
+    """
+    "br", "gzip" or None (identity) for an Accept-Encoding header. Brotli wins
+    a tie; an encoding with q=0 is never chosen.
+    """
+    if not accept_encoding:
+        return None
+    offered = {"gzip"} | ({"br"} if brotli is not None else set())
+    best, best_q = None, 0.0
+    for item in accept_encoding.split(","):
+        coding, _, params = item.partition(";")
+        coding = coding.strip().lower()
+        if coding == "*":
+            coding = "br" if brotli is not None else "gzip"
+        if coding not in offered:
+            continue
+        q = 1.0
+        name, _, value = params.partition("=")
+        if name.strip().lower() == "q":
+            try:
+                q = float(value)
+            except ValueError:
+                q = 0.0
+        if q > 0 and (q > best_q or (q == best_q and coding == "br")):
+            best, best_q = coding, q
+    return best
+
+
+def _compress(body: bytes, encoding: str, gzip_level: int, brotli_quality: int) -> bytes:
+    if encoding == "br":
+        return brotli.compress(body, quality=brotli_quality)
+    return gzip.compress(body, compresslevel=gzip_level, mtime=0)
+
+
+class CompressionMiddleware:
+    """Compress complete responses of at least `minimum_size` bytes."""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        gzip_level: int = 6,
+        brotli_quality: int = 4,
+    ) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = choose_encoding(Headers(scope=scope).get("accept-encoding"))
+
+        start: Optional[Message] = None
+        passthrough = False
+
+        async def send_compressed(message: Message) -> None:
+            nonlocal start, passthrough
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(raw=message["headers"])
+                if not _compressible(headers):
+                    passthrough = True
+                    await send(message)
+                    return
+                headers.add_vary_header("Accept-Encoding")
+                if encoding is None:
+                    passthrough = True
+                    await send(message)
+                    return
+                start = message
+                return
+            if message["type"] != "http.response.body" or passthrough:
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            if message.get("more_body", False) or len(body) < self.minimum_size:
+                # Streaming or small: as is
+                passthrough = True
+                await send(start)
+                await send(message)
+                return
+
+            body = _compress(body, encoding, self.gzip_level, self.brotli_quality)
+            headers = MutableHeaders(raw=start["headers"])
+            headers["Content-Encoding"] = encoding
+            headers["Content-Length"] = str(len(body))
+            await send(start)
+            await send({"type": "http.response.body", "body": body})
+
+        await self.app(scope, receive, send_compressed)
+
+
+def _compressible(headers: Headers) -> bool:
+    """A media type worth compressing, not yet encoded, and not marked no-transform."""
+    cache_control = {d.strip().lower() for d in headers.get("cache-control", "").split(",")}
+    return (
+        "content-encoding" not in headers
+        and "no-transform" not in cache_control
+        and headers.get("content-type", "").startswith(COMPRESSIBLE_TYPES)
+    )
+
+
+# ── Precompressed payloads ────────────────────────────────────────────────────
+
+class Precompressed(NamedTuple):
+    media_type: str
+    identity: bytes
+    gzip: bytes
+    br: Optional[bytes]        # None when brotli is not installed
+
+
+def precompress(
+    body: bytes,
+    media_type: str,
+    gzip_level: int = 9,
+    brotli_quality: int = 9,
+) -> Precompressed:
+    """Every encoding of an immutable payload, compressed once at high levels."""
+    return Precompressed(
+        media_type=media_type,
+        identity=body,
+        gzip=gzip.compress(body, compresslevel=gzip_level, mtime=0),
+        br=brotli.compress(body, quality=brotli_quality) if brotli is not None else None,
+    )
+
+
+def precompressed_response(
+    payload: Precompressed,
+    request: Request,
+    headers: Optional[dict[str, str]] = None,
+    status_code: int = 200,
+) -> Response:
+    """The variant of `payload` the request's Accept-Encoding asks for."""
+    encoding = choose_encoding(request.headers.get("accept-encoding"))
+    body = payload.identity
+    if encoding == "br" and payload.br is not None:
+        body = payload.br
+    elif encoding in ("br", "gzip"):
+        encoding, body = "gzip", payload.gzip
+    response = Response(body, status_code=status_code, headers=headers, media_type=payload.media_type)
+    if encoding is not None:
+        response.headers["Content-Encoding"] = encoding
+    response.headers.add_vary_header("Accept-Encoding")
+    return response
@@ -22,10 +22,50 @@ class Settings(BaseSettings):
 
     # JWT — Supabase signs JWTs with the project JWT secret
     supabase_jwt_secret: str = ""
+    # Verified tokens kept in memory (0 turns the cache off), and for how long
+    # at most — a rotated secret takes effect within jwt_cache_ttl_seconds
+    jwt_cache_size: int = 1024
+    jwt_cache_ttl_seconds: float = 300.0
+    # Asymmetric signing keys (ES256 / RS256) — the project's JWKS endpoint,
+    # https://<project>.supabase.co/auth/v1/.well-known/jwks.json. Refreshed in
+    # the background; cached keys stay in use for up to
+    # jwt_jwks_max_stale_seconds past expiry while the endpoint is unreachable.
+    jwt_jwks_url: str = ""
+    jwt_jwks_ttl_seconds: float = 600.0
+    jwt_jwks_max_stale_seconds: float = 86400.0
 
     # App
     app_env: str = "development"
     cors_origins: list[str] = ["http://localhost:5174", "http://localhost:3000"]
 
+    # Response compression — responses of at least compress_min_bytes are
+    # compressed per request (gzip level / Brotli quality)
+    compress_min_bytes: int = 1024
+    compress_gzip_level: int = 6
+    compress_brotli_quality: int = 4
+
+    # Prometheus metrics (metrics.py) on GET /metrics. Off by default: the
+    # endpoint has no auth, so turn it on only where the network keeps it
+    # from the public (scraped on an internal address). For several workers
+    # set PROMETHEUS_MULTIPROC_DIR to an empty directory before they start.
+    metrics_enabled: bool = False
+
+    # Request timing (server_timing.py) — spans per request, sent as a
+    # Server-Timing header (server_timing_header) and logged as JSON lines.
+    # Off by default: the header shows internals to any client.
+    server_timing: bool = False
+    server_timing_header: bool = True
+
+    # On-demand profiler (profiling.py) — GET /admin/profile and signed
+    # ?__profile=1 requests, for tokens with profiler_role. Off by default:
+    # turn it on to investigate, and off again after. Set
+    # profiler_signing_key when running several workers (empty: a random
+    # key per process, so a link only works on the worker that signed it).
+    profiler_enabled: bool = False
+    profiler_role: str = "admin"
+    profiler_signing_key: str = ""
+    profiler_interval_ms: float = 1.0
+    profiler_max_seconds: int = 60
+
 
 settings = Settings()
@@ -0,0 +1,242 @@
+"""
+Prometheus metrics — request, upstream and cache metrics on GET /metrics.
+
+Usage:
+    app.add_middleware(MetricsMiddleware)                  # outermost
+    app.add_route("/metrics", metrics_endpoint, include_in_schema=False)
+
+    with observe_upstream("supabase", "book_read"):        # one upstream call
+        resp = query.execute()
+    repo = UpstreamProxy(repo, "asyncpg")                  # every method call
+
+    @counted_lru_cache("reader_payload", maxsize=256)      # functools.lru_cache
+    def build(...): ...                                    # + lookup/miss counts
+    record_cache("lexicon", hit=lexicon is not None)       # any other cache
+
+Exposed:
+    http_request_duration_seconds{method,route,status}   histogram
+    http_request_size_bytes{method,route}                 histogram (request body)
+    http_response_size_bytes{method,route}                histogram (body as sent)
+    http_requests_in_flight                               gauge
+    upstream_request_duration_seconds{upstream,operation} histogram
+    upstream_errors_total{upstream,operation}             counter
+    cache_requests_total{cache}, cache_misses_total{cache} counters
+
+`route` is the route template (/api/bible/books/{osis_id}), never the raw
+path, so label cardinality is bounded; unmatched paths share one label.
+Histogram counts (_count) double as request counters; p99 comes from
+histogram_quantile() over the buckets.
+
+Recording a value takes prometheus_client's per-value lock, uncontended in
+practice, and an add; labelled children are looked up once where the labels
+are fixed (UpstreamProxy, counted_lru_cache).
+
+Multi-worker (gunicorn / uvicorn --workers): point PROMETHEUS_MULTIPROC_DIR
+at an empty directory before the workers start. Each process then writes its
+values to memory-mapped files there and /metrics aggregates all of them (the
+in-flight gauge sums live processes).
+"""
+import functools
+import os
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, Optional
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+)
+from prometheus_client import multiprocess
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Latency buckets (seconds): fine below 100 ms, where the API should live
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+
+UNMATCHED_ROUTE = "<unmatched>"
+
+REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds", "HTTP request latency",
+    ["method", "route", "status"], buckets=LATENCY_BUCKETS,
+)
+REQUEST_SIZE = Histogram(
+    "http_request_size_bytes", "HTTP request body size",
+    ["method", "route"], buckets=SIZE_BUCKETS,
+)
+RESPONSE_SIZE = Histogram(
+    "http_response_size_bytes", "HTTP response body size as sent (after compression)",
+    ["method", "route"], buckets=SIZE_BUCKETS,
+)
+IN_FLIGHT = Gauge(
+    "http_requests_in_flight", "HTTP requests being handled",
+    multiprocess_mode="livesum",
+)
+UPSTREAM_DURATION = Histogram(
+    "upstream_request_duration_seconds", "Latency of calls to upstream services",
+    ["upstream", "operation"], buckets=LATENCY_BUCKETS,
+)
+UPSTREAM_ERRORS = Counter(
+    "upstream_errors_total", "Upstream calls that raised",
+    ["upstream", "operation"],
+)
+CACHE_REQUESTS = Counter("cache_requests_total", "Cache lookups", ["cache"])
+CACHE_MISSES = Counter("cache_misses_total", "Cache lookups that had to compute or fetch", ["cache"])
+
+
+# ── HTTP ──────────────────────────────────────────────────────────────────────
+
+class MetricsMiddleware:
+    """Record latency, sizes and concurrency of every HTTP request."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_bytes = 0
+        response_bytes = 0
+        status = 500
+
+        async def receive_counted() -> Message:
+            nonlocal request_bytes
+            message = await receive()
+            if message["type"] == "http.request":
+                request_bytes += len(message.get("body", b""))
+            return message
+
+        async def send_counted(message: Message) -> None:
+            nonlocal response_bytes, status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            elif message["type"] == "http.response.body":
+                response_bytes += len(message.get("body", b""))
+            await send(message)
+
+        IN_FLIGHT.inc()
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive_counted, send_counted)
+        finally:
+            elapsed = time.perf_counter() - start
+            IN_FLIGHT.dec()
+            route = _route_template(scope)
+            method = scope["method"]
+            REQUEST_DURATION.labels(method, route, str(status)).observe(elapsed)
+            REQUEST_SIZE.labels(method, route).observe(request_bytes)
+            RESPONSE_SIZE.labels(method, route).observe(response_bytes)
+
+
+def _route_template(scope: Scope) -> str:
+    """The matched route's full path template, set on the shared scope by the router."""
+    route = scope.get("route")
+    path = getattr(route, "path_format", None)
+    if path is None:
+        return UNMATCHED_ROUTE
+    if route.path_regex.match(scope["path"]):
+        return path
+    # Newer FastAPI resolves included routers in place: scope["route"] then
+    # carries the router-relative path, and the prefixed one is only on the
+    # private effective route context (requirements.txt caps fastapi at the
+    # versions checked to set it). Unknown prefix: one label for the router.
+    context = scope.get("fastapi", {}).get("effective_route_context")
+    return getattr(context, "path", None) or UNMATCHED_ROUTE
+
+
+def metrics_endpoint(request: Request) -> Response:
+    """GET /metrics — Prometheus text format, across workers in multiprocess mode."""
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return Response(generate_latest(registry), media_type=CONTENT_TYPE_LATEST)
+
+
+# ── Upstream calls ────────────────────────────────────────────────────────────
+
+@contextmanager
+def observe_upstream(upstream: str, operation: str) -> Iterator[None]:
+    """Time one call to `upstream`; an exception also counts as an error."""
+    start = time.perf_counter()
+    try:
+        yield
+    except BaseException:
+        UPSTREAM_ERRORS.labels(upstream, operation).inc()
+        raise
+    finally:
+        UPSTREAM_DURATION.labels(upstream, operation).observe(time.perf_counter() - start)
+
+
+class UpstreamProxy:
+    """Wraps `target` so that every method call is observed as an `upstream` call."""
+
+    def __init__(self, target: Any, upstream: str):
+        self._target = target
+        self._upstream = upstream
+
+    def __getattr__(self, attr: str) -> Any:
+        value = getattr(self._target, attr)
+        if not callable(value):
+            return value
+        duration = UPSTREAM_DURATION.labels(self._upstream, attr)
+        errors = UPSTREAM_ERRORS.labels(self._upstream, attr)
+
+        @functools.wraps(value)
+        def observed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return value(*args, **kwargs)
+            except BaseException:
+                errors.inc()
+                raise
+            finally:
+                duration.observe(time.perf_counter() - start)
+
+        setattr(self, attr, observed)  # looked up once per method
+        return observed
+
+
+# ── Caches ────────────────────────────────────────────────────────────────────
+
+def record_cache(cache: str, hit: bool) -> None:
+    """Count one lookup of `cache`."""
+    CACHE_REQUESTS.labels(cache).inc()
+    if not hit:
+        CACHE_MISSES.labels(cache).inc()
+
+
+def counted_lru_cache(cache: str, maxsize: Optional[int] = 128) -> Callable[[Callable], Callable]:
+    """
+    functools.lru_cache that counts lookups and misses as `cache`. A miss is
+    a call that reaches the wrapped function; cache_info() / cache_clear()
+    are kept.
+    """
+    requests = CACHE_REQUESTS.labels(cache)
+    misses = CACHE_MISSES.labels(cache)
+
+    def decorate(fn: Callable) -> Callable:
+        @functools.lru_cache(maxsize=maxsize)
+        def compute(*args, **kwargs):
+            misses.inc()
+            return fn(*args, **kwargs)
+
+        @functools.wraps(fn)
+        def lookup(*args, **kwargs):
+            requests.inc()
+            return compute(*args, **kwargs)
+
+        lookup.cache_info = compute.cache_info
+        lookup.cache_clear = compute.cache_clear
+        return lookup
+
+    return decorate
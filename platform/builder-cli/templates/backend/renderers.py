@@ -0,0 +1,134 @@
+"""
+Response content negotiation — JSON, MessagePack, CBOR.
+
+The client picks the wire format with the Accept header:
+    Accept: application/json      → JSON (also the answer to */*, no header, or
+                                    nothing we can produce)
+    Accept: application/msgpack   → MessagePack (also application/vnd.msgpack,
+                                    application/x-msgpack)
+    Accept: application/cbor      → CBOR
+
+Usage:
+    router = APIRouter(route_class=NegotiatedRoute)
+
+    @app.exception_handler(...)
+    async def handler(request: Request, exc: ...):
+        return error_response(404, "Not found", request=request)   # errors.py
+
+JSON responses keep FastAPI's own path (response model → JSON bytes in
+pydantic-core), unchanged. For the binary formats each route gets a second
+handler whose response class renders the response model's JSON-mode data
+with msgpack / cbor2 — no JSON is produced and re-parsed. Both libraries are
+optional: a format whose library is not installed is never chosen. Every
+response from a negotiated route carries `Vary: Accept`.
+"""
+import copy
+from typing import Any, Callable, Coroutine, Optional
+
+from fastapi import Request, Response
+from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - optional dependency
+    msgpack = None
+
+try:
+    import cbor2
+except ImportError:  # pragma: no cover - optional dependency
+    cbor2 = None
+
+JSON_MEDIA_TYPE = "application/json"
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+CBOR_MEDIA_TYPE = "application/cbor"
+
+
+class MsgPackResponse(Response):
+    media_type = MSGPACK_MEDIA_TYPE
+
+    def render(self, content: Any) -> bytes:
+        return msgpack.packb(content, use_bin_type=True)
+
+
+class CBORResponse(Response):
+    media_type = CBOR_MEDIA_TYPE
+
+    def render(self, content: Any) -> bytes:
+        return cbor2.dumps(content)
+
+
+# Binary formats whose library is installed, by the media type they answer with
+BINARY_RESPONSES: dict[str, type[Response]] = {}
+if msgpack is not None:
+    BINARY_RESPONSES[MSGPACK_MEDIA_TYPE] = MsgPackResponse
+if cbor2 is not None:
+    BINARY_RESPONSES[CBOR_MEDIA_TYPE] = CBORResponse
+
+# Accept media ranges → the media type we answer with
+_ACCEPTED: dict[str, str] = {
+    JSON_MEDIA_TYPE: JSON_MEDIA_TYPE,
+    "application/*": JSON_MEDIA_TYPE,
+    "*/*": JSON_MEDIA_TYPE,
+}
+if msgpack is not None:
+    for _alias in (MSGPACK_MEDIA_TYPE, "application/vnd.msgpack", "application/x-msgpack"):
+        _ACCEPTED[_alias] = MSGPACK_MEDIA_TYPE
+if cbor2 is not None:
+    _ACCEPTED[CBOR_MEDIA_TYPE] = CBOR_MEDIA_TYPE
+
+
+def negotiate(accept: Optional[str]) -> str:
+    """
+    The media type to answer an Accept header with: highest q-value first,
+    then the order the client listed them. JSON when nothing matches.
+    """
+    if not accept:
+        return JSON_MEDIA_TYPE
+    best, best_q = JSON_MEDIA_TYPE, 0.0
+    for media_range in accept.split(","):
+        media_type, _, params = media_range.partition(";")
+        chosen = _ACCEPTED.get(media_type.strip().lower())
+        if chosen is None:
+            continue
+        q = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        if q > best_q:
+            best, best_q = chosen, q
+    return best
+
+
+def render(content: Any, status_code: int, media_type: str) -> Response:
+    """A response for JSON-compatible `content` in a negotiated media type."""
+    response_class = BINARY_RESPONSES.get(media_type, JSONResponse)
+    response = response_class(content=content, status_code=status_code)
+    response.headers.append("Vary", "Accept")
+    return response
+
+
+class NegotiatedRoute(APIRoute):
+    """APIRoute that answers in the format the Accept header asks for."""
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        json_handler = super().get_route_handler()
+        binary_handlers = {}
+        for media_type, response_class in BINARY_RESPONSES.items():
+            # Same route, other response class: FastAPI serialises the
+            # response model to JSON-compatible data and the class renders it.
+            route = copy.copy(self)
+            route.response_class = response_class
+            binary_handlers[media_type] = APIRoute.get_route_handler(route)
+
+        async def negotiated_handler(request: Request) -> Response:
+            handler = binary_handlers.get(negotiate(request.headers.get("accept")), json_handler)
+            response = await handler(request)
+            response.headers.append("Vary", "Accept")
+            return response
+
+        return negotiated_handler
@@ -0,0 +1,23 @@
+"""
+Shared test setup: the template's modules importable, and settings that
+need no Supabase project (environment variables win over .env files).
+
+These are the tests of the shared modules themselves; each service that
+vendors them tests only its own wiring (its tests/test_auth.py).
+
+Run:
+    cd platform/builder-cli/templates/backend
+    pip install -r requirements-dev.txt
+    python -m pytest -q
+"""
+import os
+import sys
+from pathlib import Path
+
+BACKEND = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(BACKEND))
+
+os.environ.update({
+    "SUPABASE_JWT_SECRET": "test-secret",
+    "JWT_JWKS_URL": "",
+})
@@ -0,0 +1,159 @@
+"""Verified-claims cache in auth/jwt_optional.py: hits, expiry at exp or jwt_cache_ttl_seconds, LRU bound."""
+import time
+from collections import OrderedDict
+from types import SimpleNamespace
+
+import pytest
+from jose import JWTError, jwt
+
+from auth import jwt_optional
+from config import settings
+
+SECRET = "test-secret"
+
+
+class Clock:
+    """jwt_optional's view of time.time(), moved by hand."""
+
+    def __init__(self):
+        self.now = time.time()
+
+    def time(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(jwt_optional, "time", SimpleNamespace(time=clock.time))
+    return clock
+
+
+@pytest.fixture
+def decodes(monkeypatch):
+    """Signature checks made by jose; a cache hit makes none."""
+    calls = []
+    real = jwt.decode
+    monkeypatch.setattr(jwt, "decode", lambda *args, **kwargs: calls.append(args[0]) or real(*args, **kwargs))
+    monkeypatch.setattr(jwt_optional, "_verified", OrderedDict())
+    monkeypatch.setattr(jwt_optional, "jwks", None)
+    monkeypatch.setattr(settings, "supabase_jwt_secret", SECRET)
+    monkeypatch.setattr(settings, "jwt_cache_size", 1024)
+    monkeypatch.setattr(settings, "jwt_cache_ttl_seconds", 300.0)
+    return calls
+
+
+def _token(sub: str = "user-1", expires_in=3600, secret: str = SECRET) -> str:
+    claims = {"sub": sub, "user_roles": ["reader"]}
+    if expires_in is not None:
+        claims["exp"] = int(time.time()) + expires_in
+    return jwt.encode(claims, secret, algorithm="HS256")
+
+
+def test_verified_token_is_served_from_the_cache(decodes, clock):
+    token = _token()
+
+    first = jwt_optional._decode_token(token)
+    second = jwt_optional._decode_token(token)
+
+    assert first == second
+    assert first["sub"] == "user-1"
+    assert len(decodes) == 1
+
+
+def test_cached_claims_are_a_copy(decodes, clock):
+    token = _token()
+    jwt_optional._decode_token(token)["sub"] = "someone-else"
+
+    assert jwt_optional._decode_token(token)["sub"] == "user-1"
+
+
+def test_entry_expires_with_the_token(decodes, clock):
+    token = _token(expires_in=60)
+    exp = jwt.get_unverified_claims(token)["exp"]
+    jwt_optional._decode_token(token)
+
+    clock.now = exp - 1
+    jwt_optional._decode_token(token)
+    assert len(decodes) == 1
+
+    clock.now = exp
+    jwt_optional._decode_token(token)  # verified again: jose's own clock still says valid
+    assert len(decodes) == 2
+
+
+def test_entry_lives_at_most_the_cache_ttl(decodes, clock, monkeypatch):
+    monkeypatch.setattr(settings, "jwt_cache_ttl_seconds", 30.0)
+    token = _token(expires_in=3600)
+    start = clock.now
+    jwt_optional._decode_token(token)
+
+    clock.now = start + 29
+    jwt_optional._decode_token(token)
+    assert len(decodes) == 1
+
+    clock.now = start + 30
+    jwt_optional._decode_token(token)
+    assert len(decodes) == 2
+
+
+def test_token_without_exp_is_kept_for_the_ttl(decodes, clock):
+    token = _token(expires_in=None)
+    jwt_optional._decode_token(token)
+
+    (claims, until), = jwt_optional._verified.values()
+
+    assert claims["sub"] == "user-1"
+    assert until == clock.now + settings.jwt_cache_ttl_seconds
+
+
+def test_expired_entry_is_removed(decodes, clock, monkeypatch):
+    token = _token(expires_in=60)
+    jwt_optional._decode_token(token)
+    clock.now += 3600
+
+    def expired(*args, **kwargs):
+        raise JWTError("Signature has expired.")
+
+    monkeypatch.setattr(jwt, "decode", expired)
+
+    assert jwt_optional._decode_token(token) is None
+    assert not jwt_optional._verified
+
+
+def test_invalid_tokens_are_not_cached(decodes, clock):
+    forged = _token(secret="not-the-secret")
+
+    assert jwt_optional._decode_token(forged) is None
+    assert jwt_optional._decode_token(forged) is None
+    assert len(decodes) == 2
+    assert not jwt_optional._verified
+
+
+def test_cache_is_bounded_least_recently_used_first(decodes, clock, monkeypatch):
+    monkeypatch.setattr(settings, "jwt_cache_size", 2)
+    a, b, c = (_token(sub) for sub in "abc")
+
+    jwt_optional._decode_token(a)
+    jwt_optional._decode_token(b)
+    jwt_optional._decode_token(a)  # a is now the most recently used
+    jwt_optional._decode_token(c)  # evicts b
+
+    assert len(jwt_optional._verified) == 2
+    decodes.clear()
+    jwt_optional._decode_token(a)
+    jwt_optional._decode_token(c)
+    assert decodes == []
+    jwt_optional._decode_token(b)
+    assert decodes == [b]
+
+
+def test_cache_size_zero_turns_the_cache_off(decodes, clock, monkeypatch):
+    monkeypatch.setattr(settings, "jwt_cache_size", 0)
+    token = _token()
+
+    jwt_optional._decode_token(token)
+    jwt_optional._decode_token(token)
+
+    assert len(decodes) == 2
+    assert not jwt_optional._verified
@@ -17,6 +17,17 @@ class Settings(BaseSettings):
 
     # Supabase (used for JWT verification only — no data CRUD)
     supabase_jwt_secret: str = ""
+    # Verified tokens kept in memory (0 turns the cache off), and for how long
+    # at most — a rotated secret takes effect within jwt_cache_ttl_seconds
+    jwt_cache_size: int = 1024
+    jwt_cache_ttl_seconds: float = 300.0
+    # Asymmetric signing keys (ES256 / RS256) — the project's JWKS endpoint,
+    # https://<project>.supabase.co/auth/v1/.well-known/jwks.json. Refreshed in
+    # the background; cached keys stay in use for up to
+    # jwt_jwks_max_stale_seconds past expiry while the endpoint is unreachable.
+    jwt_jwks_url: str = ""
+    jwt_jwks_ttl_seconds: float = 600.0
+    jwt_jwks_max_stale_seconds: float = 86400.0
 
     # App
     app_env: str = "development"
@@ -26,6 +37,18 @@ class Settings(BaseSettings):
         "http://localhost:3000",
     ]
 
+    # Response compression — responses of at least compress_min_bytes are
+    # compressed per request (gzip level / Brotli quality)
+    compress_min_bytes: int = 1024
+    compress_gzip_level: int = 6
+    compress_brotli_quality: int = 4
+
+    # Prometheus metrics (metrics.py) on GET /metrics. Off by default: the
+    # endpoint has no auth, so turn it on only where the network keeps it
+    # from the public (scraped on an internal address). For several workers
+    # set PROMETHEUS_MULTIPROC_DIR to an empty directory before they start.
+    metrics_enabled: bool = False
+
     # App URLs (override in production via env vars)
     app_url_scribeswell: str = "http://localhost:5174"
     app_url_system_engineering: str = "http://localhost:5175"
@@ -33,5 +56,16 @@ class Settings(BaseSettings):
     app_url_school_management: str = "http://localhost:5177"
     app_url_modelling_simulation: str = "http://localhost:5178"
 
+    # On-demand profiler (profiling.py) — GET /admin/profile and signed
+    # ?__profile=1 requests, for tokens with profiler_role. Off by default:
+    # turn it on to investigate, and off again after. Set
+    # profiler_signing_key when running several workers (empty: a random
+    # key per process, so a link only works on the worker that signed it).
+    profiler_enabled: bool = False
+    profiler_role: str = "admin"
+    profiler_signing_key: str = ""
+    profiler_interval_ms: float = 1.0
+    profiler_max_seconds: int = 60
+
 
 settings = Settings()
@@ -3,11 +3,13 @@ Consistent error payload shape — platform contract.
 Error shape: { "error": str, "code"?: int, "details"?: any }
 Vendored from platform/builder-cli/templates/backend/errors.py.
 """
-from fastapi import HTTPException
+from fastapi import HTTPException, Request, Response
 from fastapi.responses import JSONResponse
 from pydantic import BaseModel
 from typing import Any, Optional
 
+from renderers import negotiate, render
+
 
 class ErrorPayload(BaseModel):
     error: str
@@ -20,13 +22,15 @@ def error_response(
     message: str,
     code: Optional[int] = None,
     details: Optional[Any] = None,
-) -> JSONResponse:
-    return JSONResponse(
-        status_code=status_code,
-        content=ErrorPayload(error=message, code=code, details=details).model_dump(
-            exclude_none=True
-        ),
+    request: Optional[Request] = None,
+) -> Response:
+    """The error as JSON, or in the format `request` negotiated (renderers.py)."""
+    content = ErrorPayload(error=message, code=code, details=details).model_dump(
+        exclude_none=True
     )
+    if request is not None:
+        return render(content, status_code, negotiate(request.headers.get("accept")))
+    return JSONResponse(status_code=status_code, content=content)
 
 
 class NotFoundError(HTTPException):
@@ -40,3 +44,8 @@ class NotFoundError(HTTPException):
 class UnauthorizedError(HTTPException):
     def __init__(self, message: str = "Unauthorized"):
         super().__init__(status_code=401, detail=message)
+
+
+class ForbiddenError(HTTPException):
+    def __init__(self, message: str = "Forbidden"):
+        super().__init__(status_code=403, detail=message)
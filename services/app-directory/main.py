@@ -4,77 +4,130 @@ services/app-directory/main.py — App Directory FastAPI service.
 Run locally:
     cd services/app-directory
     uvicorn main:app --reload --port 8001
+    uvicorn main:create_app --factory --port 8001     # same app, built by uvicorn
 
 OpenAPI docs:
     http://localhost:8001/docs
+
+`main.app` is built by create_app() on first access, not at import; the
+--factory form has uvicorn call create_app() itself. The JWKS refresh starts
+in the app's lifespan, not at import, and python-jose loads on the first
+token to verify.
 """
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
 from fastapi.exceptions import RequestValidationError
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
+from auth.jwt_optional import jwks, require_role
+from compression import CompressionMiddleware
 from config import settings
-from routers import apps as apps_router
+from errors import error_response
+from metrics import MetricsMiddleware, metrics_endpoint
+from profiling import ProfileRequestMiddleware, profiler_router
 
-# ── App ───────────────────────────────────────────────────────────────────────
+# ── Lifespan ──────────────────────────────────────────────────────────────────
 
-app = FastAPI(
-    title="App Directory API",
-    description="Cross-app entitlement and discovery service. Returns the apps a user can access.",
-    version="0.1.0",
-    docs_url="/docs",
-    redoc_url="/redoc",
-    openapi_url="/openapi.json",
-)
-
-# ── CORS ──────────────────────────────────────────────────────────────────────
-
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=settings.cors_origins,
-    allow_credentials=True,
-    allow_methods=["GET", "OPTIONS"],
-    allow_headers=["*"],
-)
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    # Asymmetric tokens (JWT_JWKS_URL): fetch the key set now, refresh it in the background
+    if jwks is not None:
+        jwks.start()
+    yield
 
 # ── Error handlers ────────────────────────────────────────────────────────────
 
-@app.exception_handler(StarletteHTTPException)
 async def http_exception_handler(request: Request, exc: StarletteHTTPException):
-    return JSONResponse(
-        status_code=exc.status_code,
-        content={"error": str(exc.detail)},
-    )
+    return error_response(exc.status_code, str(exc.detail), request=request)
 
 
-@app.exception_handler(RequestValidationError)
 async def validation_exception_handler(request: Request, exc: RequestValidationError):
-    return JSONResponse(
-        status_code=422,
-        content={"error": "Validation error", "details": exc.errors()},
-    )
+    return error_response(422, "Validation error", details=exc.errors(), request=request)
 
 
-@app.exception_handler(Exception)
 async def unhandled_exception_handler(request: Request, exc: Exception):
-    return JSONResponse(
-        status_code=500,
-        content={"error": "Internal server error"},
-    )
+    return error_response(500, "Internal server error", request=request)
 
 # ── Health ────────────────────────────────────────────────────────────────────
 
-@app.get("/health", tags=["system"])
 async def health():
     """Liveness probe."""
     return {"status": "ok", "env": settings.app_env, "service": "app-directory"}
 
 
-@app.get("/", tags=["system"])
 async def root():
     return {"message": "App Directory API", "docs": "/docs"}
 
-# ── Routers ───────────────────────────────────────────────────────────────────
+# ── App ───────────────────────────────────────────────────────────────────────
+
+def create_app() -> FastAPI:
+    app = FastAPI(
+        title="App Directory API",
+        description="Cross-app entitlement and discovery service. Returns the apps a user can access.",
+        version="0.1.0",
+        docs_url="/docs",
+        redoc_url="/redoc",
+        openapi_url="/openapi.json",
+        lifespan=lifespan,
+    )
+
+    # Profiler — added first, so innermost: a request profile covers the app, not the middleware
+    if settings.profiler_enabled:
+        app.add_middleware(
+            ProfileRequestMiddleware,
+            signing_key=settings.profiler_signing_key,
+            interval_ms=settings.profiler_interval_ms,
+        )
+        app.include_router(
+            profiler_router(
+                require_role(settings.profiler_role),
+                signing_key=settings.profiler_signing_key,
+                interval_ms=settings.profiler_interval_ms,
+                max_seconds=settings.profiler_max_seconds,
+            ),
+            prefix="/admin",
+            tags=["admin"],
+        )
+
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=settings.cors_origins,
+        allow_credentials=True,
+        allow_methods=["GET", "OPTIONS"],
+        allow_headers=["*"],
+    )
+
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=settings.compress_min_bytes,
+        gzip_level=settings.compress_gzip_level,
+        brotli_quality=settings.compress_brotli_quality,
+    )
+
+    # Metrics — added last, so outermost: latency includes compression, sizes are as sent
+    if settings.metrics_enabled:
+        app.add_middleware(MetricsMiddleware)
+        app.add_route("/metrics", metrics_endpoint, include_in_schema=False)
+
+    app.add_exception_handler(StarletteHTTPException, http_exception_handler)
+    app.add_exception_handler(RequestValidationError, validation_exception_handler)
+    app.add_exception_handler(Exception, unhandled_exception_handler)
+
+    app.add_api_route("/health", health, methods=["GET"], tags=["system"])
+    app.add_api_route("/", root, methods=["GET"], tags=["system"])
+
+    from routers import apps as apps_router
+
+    app.include_router(apps_router.router, prefix="/api")
+    return app
+
 
-app.include_router(apps_router.router, prefix="/api")
+def __getattr__(name: str) -> FastAPI:
+    """`main.app`, built by create_app() on first access (uvicorn main:app) and kept."""
+    if name != "app":
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    app = globals()["app"] = create_app()
+    return app
@@ -0,0 +1,357 @@
+"""
+On-demand sampling profiler — where a live worker spends its CPU time.
+
+Usage:
+    app.add_middleware(ProfileRequestMiddleware, signing_key=..., interval_ms=1.0)
+    app.include_router(
+        profiler_router(require_role("admin"), signing_key=...),
+        prefix="/admin", tags=["admin"],
+    )
+
+Endpoints (admin only — the guard dependency):
+    GET /admin/profile?seconds=10           sample the worker for N seconds:
+        [&interval_ms=1&threads=loop|all]   the event loop (and the threadpool
+                                            running sync endpoints), or every thread
+        [&format=collapsed|svg]
+    GET /admin/profile/sign?path=/api/...   a signed query string for one request
+        [&method=GET&ttl=300]               (path may carry its own query string)
+
+    GET /api/...?__profile=1&__profile_exp=..&__profile_sig=..
+        runs the request as usual, discards its response and answers with
+        the request's profile instead (__profile=svg for a flamegraph)
+
+Output is collapsed stacks (text/plain, one `frame;frame;frame count` line
+per distinct stack, root first — flamegraph.pl, inferno and speedscope read
+it) or a self-contained SVG flamegraph to open in a browser.
+
+The sampler is a daemon thread that wakes every interval and records the
+target thread's stack from sys._current_frames(), along with the stacks of
+the threadpool workers (anyio's) that run sync endpoints, while they are in
+app code. Nothing is hooked into the profiled code (no sys.setprofile), so
+it runs at full speed between samples.
+A thread only gets the GIL when it is handed over, every
+sys.getswitchinterval() (5 ms by default), so while a profile runs the
+switch interval is lowered to the sampling interval, and restored after.
+One profile runs at a time per worker; another one gets 409.
+
+A request profile keeps only the event-loop samples whose stack passes
+through that request's own middleware frame: other requests on the same
+event loop do not leak in. A sync endpoint runs on a worker thread, outside
+that frame, so worker samples are kept whenever they are in app code; a
+sync endpoint of a concurrent request shows up too. It shows time on the
+CPU; time awaiting I/O is not sampled (Server-Timing covers that), nor is
+work handed to other threads.
+
+Signed links are HMAC-SHA256 with signing_key over the method, path, query
+(sorted, without the __profile parameters), output format and expiry: a
+link profiles the one request it was signed for, and cannot be moved to
+another endpoint, another query or a POST. With several workers, set the
+same key on all of them; an empty key means a random one per process.
+
+Vendored from platform/builder-cli/templates/backend/profiling.py.
+"""
+import asyncio
+import hashlib
+import hmac
+import os
+import secrets
+import site
+import sys
+import sysconfig
+import threading
+import time
+from collections import Counter
+from html import escape
+from types import CodeType, FrameType
+from typing import Callable, Literal, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from errors import error_response
+
+Format = Literal["collapsed", "svg"]
+
+PROFILE_PARAM = "__profile"
+EXPIRES_PARAM = "__profile_exp"
+SIGNATURE_PARAM = "__profile_sig"
+
+_PROCESS_KEY = secrets.token_bytes(32)
+_busy = threading.Lock()
+_labels: dict[CodeType, str] = {}
+# Shown relative: installed packages, then the stdlib, then the app
+_ROOTS = sorted(
+    {os.path.join(p, "") for p in (*site.getsitepackages(), sysconfig.get_paths()["stdlib"], os.getcwd())},
+    key=len, reverse=True,
+)
+
+
+# Threadpool threads running sync endpoints (anyio.to_thread, via FastAPI)
+WORKER_THREAD_NAME = "AnyIO worker thread"
+_APP_ROOT = os.path.join(os.getcwd(), "")
+_app_code: dict[CodeType, bool] = {}
+
+
+def _is_app_code(code: CodeType) -> bool:
+    """True for code under the working directory, except installed packages there (a venv)."""
+    app = _app_code.get(code)
+    if app is None:
+        path = code.co_filename
+        app = _app_code[code] = path.startswith(_APP_ROOT) and not any(
+            path.startswith(root) for root in _ROOTS if len(root) > len(_APP_ROOT)
+        )
+    return app
+
+
+def _frame_label(code: CodeType) -> str:
+    label = _labels.get(code)
+    if label is None:
+        path = code.co_filename
+        for root in _ROOTS:
+            if path.startswith(root):
+                path = path[len(root):]
+                break
+        # ';' separates frames in collapsed stacks
+        name = getattr(code, "co_qualname", code.co_name).replace(";", ":")
+        label = _labels[code] = f"{name} ({path}:{code.co_firstlineno})"
+    return label
+
+
+class Sampler:
+    """
+    Counts the stacks of `thread_ids` (None: all threads) every `interval_ms`,
+    and with `workers`, those of threadpool workers while they run app code.
+    """
+
+    def __init__(
+        self,
+        thread_ids: Optional[set[int]] = None,
+        interval_ms: float = 1.0,
+        anchor: Optional[FrameType] = None,
+        workers: bool = False,
+    ):
+        self.thread_ids = thread_ids
+        self.interval = interval_ms / 1000
+        self.anchor = anchor  # keep only stacks of thread_ids through this frame
+        self.workers = workers
+        self.stacks: Counter[tuple[str, ...]] = Counter()
+        self.seconds = 0.0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="profiler", daemon=True)
+
+    def __enter__(self) -> "Sampler":
+        if not _busy.acquire(blocking=False):
+            raise HTTPException(status_code=409, detail="A profile is already running in this worker")
+        self._switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(min(self._switch_interval, self.interval))
+        self._started = time.perf_counter()
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._stop.set()
+        self._thread.join()
+        self.seconds = time.perf_counter() - self._started
+        sys.setswitchinterval(self._switch_interval)
+        self.anchor = None
+        _busy.release()
+
+    def _is_worker(self, thread_id: int, known: dict[int, bool]) -> bool:
+        worker = known.get(thread_id)
+        if worker is None:
+            names = {t.ident: t.name for t in threading.enumerate()}
+            worker = known[thread_id] = self.workers and names.get(thread_id, "").startswith(WORKER_THREAD_NAME)
+        return worker
+
+    def _run(self) -> None:
+        me = threading.get_ident()
+        workers: dict[int, bool] = {}
+        while not self._stop.wait(self.interval):
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == me:
+                    continue
+                worker = self.thread_ids is not None and thread_id not in self.thread_ids
+                if worker and not self._is_worker(thread_id, workers):
+                    continue
+                stack = []
+                keep = self.anchor is None and not worker
+                while frame is not None:
+                    code = frame.f_code
+                    keep = keep or (_is_app_code(code) if worker else frame is self.anchor)
+                    stack.append(_frame_label(code))
+                    frame = frame.f_back
+                if keep:
+                    stack.reverse()
+                    self.stacks[tuple(stack)] += 1
+
+    def collapsed(self) -> str:
+        """One `root;...;leaf count` line per stack, most samples first."""
+        return "".join(f"{';'.join(stack)} {count}\n" for stack, count in self.stacks.most_common())
+
+    def response(self, fmt: Format, headers: Optional[dict[str, str]] = None) -> Response:
+        headers = {
+            "X-Profile-Samples": str(sum(self.stacks.values())),
+            "X-Profile-Seconds": f"{self.seconds:.3f}",
+            **(headers or {}),
+        }
+        if fmt == "svg":
+            return Response(flamegraph_svg(self.stacks), media_type="image/svg+xml", headers=headers)
+        return Response(self.collapsed(), media_type="text/plain", headers=headers)
+
+
+def flamegraph_svg(stacks: Counter, width: int = 1200, row: int = 16) -> str:
+    """A flamegraph of collapsed `stacks`: root at the bottom, width ∝ samples."""
+    total = sum(stacks.values())
+    tree: dict = {"": [0, {}]}  # label → [samples, children]
+    for stack, count in stacks.items():
+        level = tree[""]
+        level[0] += count
+        for label in stack:
+            level = level[1].setdefault(label, [0, {}])
+            level[0] += count
+
+    boxes: list[tuple[float, int, float, str, int]] = []  # x, depth, w, label, samples
+
+    def place(children: dict, x: float, depth: int) -> int:
+        deepest = depth
+        for label, (count, grandchildren) in sorted(children.items()):
+            w = width * count / total
+            if w >= 0.5:
+                boxes.append((x, depth, w, label, count))
+                deepest = max(deepest, place(grandchildren, x, depth + 1))
+            x += w
+        return deepest
+
+    depth = place(tree[""][1], 0.0, 0) + 1 if total else 1
+    height = depth * row + 24
+    parts = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" '
+        f'font-family="monospace" font-size="11">',
+        f'<text x="4" y="14">{total} samples</text>',
+    ]
+    for x, level, w, label, count in boxes:
+        y = height - (level + 1) * row
+        shade = int(hashlib.md5(label.encode()).hexdigest()[:2], 16)
+        fill = f"rgb(230,{80 + shade * 120 // 255},{40 + shade * 40 // 255})"
+        text = label if len(label) * 7 <= w - 4 else label[: max(int((w - 4) / 7) - 2, 0)] + ".."
+        parts.append(
+            f'<g><title>{escape(label)} — {count} samples ({100 * count / total:.1f}%)</title>'
+            f'<rect x="{x:.1f}" y="{y}" width="{w:.1f}" height="{row - 1}" fill="{fill}"/>'
+            + (f'<text x="{x + 2:.1f}" y="{y + row - 4}">{escape(text)}</text>' if w > 20 else "")
+            + "</g>"
+        )
+    parts.append("</svg>")
+    return "\n".join(parts)
+
+
+def _signature(key: bytes, method: str, path: str, params: list[tuple[str, str]], flag: str, expires: int) -> str:
+    # Parameter order does not matter to the endpoint, so none to the signature
+    query = urlencode(sorted(params))
+    message = f"{method.upper()}\n{path}\n{query}\n{flag}\n{expires}"
+    return hmac.new(key, message.encode(), hashlib.sha256).hexdigest()
+
+
+def sign_profile_query(
+    signing_key: str, path: str, ttl: int = 300, fmt: Format = "collapsed", method: str = "GET"
+) -> str:
+    """
+    The query string that profiles one `method` request to `path` (which may
+    carry its own query string), valid `ttl` seconds. It includes the path's
+    own parameters: append it to the bare path.
+    """
+    key = signing_key.encode() if signing_key else _PROCESS_KEY
+    url = urlsplit(path)
+    params = parse_qsl(url.query, keep_blank_values=True)
+    flag = "svg" if fmt == "svg" else "1"
+    expires = int(time.time()) + ttl
+    return urlencode(params + [
+        (PROFILE_PARAM, flag),
+        (EXPIRES_PARAM, str(expires)),
+        (SIGNATURE_PARAM, _signature(key, method, url.path, params, flag, expires)),
+    ])
+
+
+class ProfileRequestMiddleware:
+    """
+    Answer requests carrying a valid signed `__profile` flag with their
+    profile. Requests without the flag cost one bytes search.
+    """
+
+    def __init__(self, app: ASGIApp, signing_key: str = "", interval_ms: float = 1.0) -> None:
+        self.app = app
+        self.key = signing_key.encode() if signing_key else _PROCESS_KEY
+        self.interval_ms = interval_ms
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or PROFILE_PARAM.encode() not in scope["query_string"]:
+            await self.app(scope, receive, send)
+            return
+
+        params = parse_qsl(scope["query_string"].decode("latin-1"), keep_blank_values=True)
+        flags = {k: v for k, v in params if k.startswith(PROFILE_PARAM)}
+        params = [(k, v) for k, v in params if not k.startswith(PROFILE_PARAM)]
+        try:
+            expires = int(flags.get(EXPIRES_PARAM, ""))
+        except ValueError:
+            expires = 0
+        expected = _signature(self.key, scope["method"], scope["path"], params, flags.get(PROFILE_PARAM, ""), expires)
+        if expires < time.time() or not hmac.compare_digest(expected, flags.get(SIGNATURE_PARAM, "")):
+            await error_response(403, "Invalid or expired profile signature")(scope, receive, send)
+            return
+
+        scope = dict(scope, query_string=urlencode(params).encode("latin-1"))
+        status = 500
+
+        async def discard(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+
+        try:
+            with Sampler(
+                {threading.get_ident()}, self.interval_ms, anchor=sys._getframe(), workers=True
+            ) as sampler:
+                await self.app(scope, receive, discard)
+        except HTTPException as e:  # profile already running
+            await error_response(e.status_code, e.detail)(scope, receive, send)
+            return
+        fmt: Format = "svg" if flags.get(PROFILE_PARAM) == "svg" else "collapsed"
+        await sampler.response(fmt, {"X-Profiled-Status": str(status)})(scope, receive, send)
+
+
+def profiler_router(
+    guard: Callable,
+    signing_key: str = "",
+    interval_ms: float = 1.0,
+    max_seconds: int = 60,
+) -> APIRouter:
+    """/profile and /profile/sign, behind the `guard` dependency."""
+    router = APIRouter(dependencies=[Depends(guard)])
+    default_interval = interval_ms
+
+    @router.get("/profile", summary="Sample this worker for N seconds", response_class=Response)
+    async def profile(
+        seconds: float = Query(10, gt=0, le=max_seconds),
+        interval_ms: float = Query(default_interval, ge=0.1, le=100),
+        threads: Literal["loop", "all"] = "loop",
+        format: Format = "collapsed",
+    ) -> Response:
+        thread_ids = {threading.get_ident()} if threads == "loop" else None
+        with Sampler(thread_ids, interval_ms, workers=True) as sampler:
+            await asyncio.sleep(seconds)
+        return sampler.response(format)
+
+    @router.get("/profile/sign", summary="Sign a query string that profiles one request")
+    async def sign(
+        path: str = Query(..., pattern="^/", description="Path of the request, with its query string if any"),
+        method: str = Query("GET", pattern="^[A-Za-z]+$"),
+        ttl: int = Query(300, ge=1, le=3600),
+        format: Format = "collapsed",
+    ) -> dict:
+        query = sign_profile_query(signing_key, path, ttl, format, method)
+        url = f"{urlsplit(path).path}?{query}"
+        return {"url": url, "method": method.upper(), "query": query, "expires_in": ttl}
+
+    return router
@@ -6,13 +6,16 @@ Phase 2 entitlement rule:
   - Authenticated (valid JWT): returns all enabled apps + resolved context.
 
 Extension point (Phase 3+): filter apps by org/role/license.
+
+Responses are JSON, or MessagePack / CBOR per the Accept header (renderers.py).
 """
 from fastapi import APIRouter
 from auth.jwt_optional import OptionalUser
 from catalog import get_enabled_apps, get_all_apps
+from renderers import NegotiatedRoute
 from schemas.app_schemas import AppEntry, MeContext, MeAppsResponse
 
-router = APIRouter()
+router = APIRouter(route_class=NegotiatedRoute)
 
 
 def _resolve_context(user: dict | None) -> MeContext:
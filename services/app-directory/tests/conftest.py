@@ -0,0 +1,33 @@
+"""
+Shared test setup: the service's modules importable, and settings that
+need no Supabase project (environment variables win over .env files).
+
+Run:
+    cd services/app-directory
+    pip install -r requirements-dev.txt
+    python -m pytest -q
+"""
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+SERVICE = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(SERVICE))
+
+os.environ.update({
+    "SUPABASE_JWT_SECRET": "test-secret",
+    "JWT_JWKS_URL": "",
+})
+
+
+@pytest.fixture
+def client():
+    """A TestClient (lifespan run) of a freshly built app."""
+    from fastapi.testclient import TestClient
+
+    import main
+
+    with TestClient(main.create_app()) as client:
+        yield client
@@ -0,0 +1,57 @@
+"""
+Auth wiring of this service: /api/me/* take OptionalUser, so a missing or
+invalid token is an anonymous caller, not an error; /admin requires
+profiler_role. The verification itself (auth/jwt_optional.py) is tested with
+the template it is vendored from, platform/builder-cli/templates/backend/tests.
+"""
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+from jose import jwt
+
+import main
+from config import settings
+
+SIGN = "/admin/profile/sign?path=/health"
+
+
+def _bearer(*roles: str, secret: str = "test-secret") -> dict[str, str]:
+    claims = {"sub": "user-1", "user_roles": list(roles), "exp": int(time.time()) + 3600}
+    return {"Authorization": f"Bearer {jwt.encode(claims, secret, algorithm='HS256')}"}
+
+
+@pytest.fixture
+def admin(monkeypatch):
+    """The service with the profiler routes, for profiler_role "admin"."""
+    monkeypatch.setattr(settings, "profiler_enabled", True)
+    monkeypatch.setattr(settings, "profiler_role", "admin")
+    monkeypatch.setattr(settings, "profiler_signing_key", "test-signing-key")
+    return TestClient(main.create_app())
+
+
+@pytest.mark.parametrize("headers", [{}, _bearer("member", secret="forged")])
+def test_me_apps_without_a_valid_token_is_anonymous(client, headers):
+    response = client.get("/api/me/apps", headers=headers)
+
+    assert response.status_code == 200
+    assert response.json()["apps"] == []
+    assert response.json()["context"]["roles"] == []
+
+
+def test_me_apps_with_a_token_reads_its_claims(client):
+    response = client.get("/api/me/apps", headers=_bearer("member"))
+
+    assert response.status_code == 200
+    assert response.json()["apps"]
+    assert response.json()["context"]["roles"] == ["member"]
+
+
+@pytest.mark.parametrize("headers, status", [
+    ({}, 401),
+    (_bearer("admin", secret="forged"), 401),
+    (_bearer("member"), 403),
+    (_bearer("member", "admin"), 200),
+])
+def test_admin_routes_require_the_profiler_role(admin, headers, status):
+    assert admin.get(SIGN, headers=headers).status_code == status
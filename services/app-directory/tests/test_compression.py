@@ -0,0 +1,141 @@
+"""Response compression (compression.py): CompressionMiddleware and precompressed responses."""
+import gzip
+
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.responses import PlainTextResponse, Response, StreamingResponse
+from fastapi.testclient import TestClient
+
+from compression import CompressionMiddleware, choose_encoding, precompress, precompressed_response
+
+brotli = pytest.importorskip("brotli")
+
+TEXT = "agriplatform " * 200  # 2600 bytes
+PAYLOAD = precompress(TEXT.encode(), "text/plain")
+
+
+@pytest.fixture
+def bare():
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, minimum_size=1024)
+
+    @app.get("/text")
+    def text(size: int = len(TEXT)):
+        return PlainTextResponse(TEXT[:size])
+
+    @app.get("/png")
+    def png():
+        return Response(b"\x89PNG" + bytes(4000), media_type="image/png")
+
+    @app.get("/stream")
+    def stream():
+        return StreamingResponse(iter([TEXT.encode()] * 3), media_type="text/plain")
+
+    @app.get("/no-transform")
+    def no_transform():
+        return PlainTextResponse(TEXT, headers={"Cache-Control": "public, no-transform"})
+
+    @app.get("/precompressed")
+    def precompressed(request: Request):
+        return precompressed_response(PAYLOAD, request, {"Cache-Control": "max-age=60"})
+
+    return TestClient(app)
+
+
+def _raw(client, url: str, **headers):
+    """(response, body as sent): httpx would otherwise decode it."""
+    with client.stream("GET", url, headers=headers) as response:
+        return response, b"".join(response.iter_raw())
+
+
+@pytest.mark.parametrize("accept_encoding, expected", [
+    (None, None),
+    ("gzip, deflate, br", "br"),
+    ("br;q=0.5, gzip", "gzip"),
+    ("br;q=0", None),
+    ("*", "br"),
+])
+def test_choose_encoding(accept_encoding, expected):
+    assert choose_encoding(accept_encoding) == expected
+
+
+@pytest.mark.parametrize("accept_encoding, decompress", [
+    ("br", brotli.decompress),
+    ("gzip", gzip.decompress),
+])
+def test_large_text_is_compressed(bare, accept_encoding, decompress):
+    response, body = _raw(bare, "/text", **{"Accept-Encoding": accept_encoding})
+
+    assert response.headers["content-encoding"] == accept_encoding
+    assert int(response.headers["content-length"]) == len(body)
+    assert decompress(body).decode() == TEXT
+    assert "Accept-Encoding" in response.headers["vary"]
+
+
+@pytest.mark.parametrize("url, size", [
+    ("/text?size=1023", 1023),  # under minimum_size
+    ("/png", 4004),             # not a compressible media type
+    ("/stream", 3 * len(TEXT)),  # more_body: never buffered
+])
+def test_small_incompressible_and_streamed_responses_pass_through(bare, url, size):
+    response, body = _raw(bare, url, **{"Accept-Encoding": "br, gzip"})
+
+    assert response.status_code == 200
+    assert "content-encoding" not in response.headers
+    assert len(body) == size
+
+
+@pytest.mark.parametrize("url, accept_encoding", [
+    ("/text", "identity"),
+    ("/text", ""),  # no encoding acceptable
+    ("/text?size=1023", "gzip"),
+])
+def test_uncompressed_text_still_varies_on_accept_encoding(bare, url, accept_encoding):
+    response, body = _raw(bare, url, **{"Accept-Encoding": accept_encoding})
+
+    assert "content-encoding" not in response.headers
+    assert TEXT.startswith(body.decode())
+    assert response.headers["vary"] == "Accept-Encoding"
+
+
+def test_incompressible_type_does_not_vary(bare):
+    response, _ = _raw(bare, "/png", **{"Accept-Encoding": "gzip"})
+
+    assert "vary" not in response.headers
+
+
+def test_no_transform_is_passed_through(bare):
+    response, body = _raw(bare, "/no-transform", **{"Accept-Encoding": "br, gzip"})
+
+    assert "content-encoding" not in response.headers
+    assert "vary" not in response.headers
+    assert body.decode() == TEXT
+
+
+@pytest.mark.parametrize("accept_encoding, encoding, variant", [
+    ("br, gzip", "br", "br"),
+    ("gzip", "gzip", "gzip"),
+    ("identity", None, "identity"),
+])
+def test_precompressed_variant_is_sent_as_is(bare, accept_encoding, encoding, variant):
+    response, body = _raw(bare, "/precompressed", **{"Accept-Encoding": accept_encoding})
+
+    assert response.headers.get("content-encoding") == encoding
+    assert body == getattr(PAYLOAD, variant)  # not compressed a second time by the middleware
+    assert response.headers["cache-control"] == "max-age=60"
+    assert "Accept-Encoding" in response.headers["vary"]
+
+
+def test_service_compresses_at_its_configured_threshold(monkeypatch):
+    import main
+    from config import settings
+
+    monkeypatch.setattr(settings, "compress_min_bytes", 256)  # /api/apps is about 900 bytes
+    client = TestClient(main.create_app())
+
+    response, body = _raw(client, "/api/apps", **{"Accept-Encoding": "gzip"})
+    small, _ = _raw(client, "/health", **{"Accept-Encoding": "gzip"})
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert gzip.decompress(body) == client.get("/api/apps", headers={"Accept-Encoding": "identity"}).content
+    assert "content-encoding" not in small.headers
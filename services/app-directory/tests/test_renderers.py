@@ -0,0 +1,60 @@
+"""Content negotiation (renderers.py): JSON, MessagePack or CBOR per the Accept header."""
+import cbor2
+import msgpack
+import pytest
+
+from renderers import CBOR_MEDIA_TYPE, JSON_MEDIA_TYPE, MSGPACK_MEDIA_TYPE, negotiate
+
+
+@pytest.mark.parametrize("accept, expected", [
+    (None, JSON_MEDIA_TYPE),
+    ("*/*", JSON_MEDIA_TYPE),
+    ("text/html", JSON_MEDIA_TYPE),  # nothing we produce: JSON anyway
+    ("application/vnd.msgpack", MSGPACK_MEDIA_TYPE),
+    ("application/cbor, application/msgpack", CBOR_MEDIA_TYPE),  # tie: listed first wins
+    ("application/json;q=0.5, application/msgpack", MSGPACK_MEDIA_TYPE),
+    ("application/msgpack;q=0", JSON_MEDIA_TYPE),  # q=0: not acceptable
+])
+def test_negotiate(accept, expected):
+    assert negotiate(accept) == expected
+
+
+def test_json_by_default(client):
+    response = client.get("/api/apps")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == JSON_MEDIA_TYPE
+    assert "Accept" in response.headers["vary"]
+
+
+@pytest.mark.parametrize("media_type, decode", [
+    (MSGPACK_MEDIA_TYPE, lambda body: msgpack.unpackb(body, raw=False)),
+    (CBOR_MEDIA_TYPE, cbor2.loads),
+])
+def test_binary_formats_carry_the_json_body(client, media_type, decode):
+    expected = client.get("/api/apps").json()
+
+    response = client.get("/api/apps", headers={"Accept": media_type})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == media_type
+    assert "Accept" in response.headers["vary"]
+    assert decode(response.content) == expected
+    assert {app["id"] for app in expected} >= {"scribeswell"}
+
+
+def test_response_model_is_applied_to_binary_formats(client):
+    response = client.get("/api/me/apps", headers={"Accept": CBOR_MEDIA_TYPE})
+
+    assert cbor2.loads(response.content) == {
+        "apps": [],
+        "context": {"org_id": None, "member_id": None, "roles": []},
+    }
+
+
+def test_errors_are_negotiated_too(client):
+    response = client.get("/api/nope", headers={"Accept": CBOR_MEDIA_TYPE})
+
+    assert response.status_code == 404
+    assert response.headers["content-type"] == CBOR_MEDIA_TYPE
+    assert cbor2.loads(response.content) == {"error": "Not Found"}